@@ -2,7 +2,7 @@
 Lifespan management for Exarp MCP Server.
 
 Provides startup/shutdown hooks for:
-- Todo2 database initialization
+- Todo2 database initialization (shared state store)
 - Security controls setup
 - Cache warming
 - Resource cleanup
@@ -13,11 +13,15 @@ Usage:
     mcp = FastMCP("exarp", lifespan=exarp_lifespan)
 """
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from .utils.todo2_store import Todo2Store
 
 try:
     from fastmcp import FastMCP
@@ -41,6 +45,7 @@ class ExarpState:
         self.todo2_path: Optional[Path] = None
         self.advisor_log_path: Optional[Path] = None
         self.memory_path: Optional[Path] = None
+        self.todo2_store: Optional["Todo2Store"] = None
         self._initialized: bool = False
 
     @property
@@ -78,15 +83,27 @@ async def _init_todo2(project_root: Path) -> Path:
     todo2_path.mkdir(parents=True, exist_ok=True)
 
     # Ensure state file exists
-    state_file = todo2_path / "state.todo2.json"
-    if not state_file.exists():
-        import json
-        state_file.write_text(json.dumps({"todos": []}, indent=2))
-        logger.info(f"Created Todo2 state file: {state_file}")
+    from .utils.todo2_store import get_todo2_store
+
+    store = get_todo2_store(project_root)
+    if not store.exists():
+        with store.write_lock():
+            if not store.exists():
+                store.save_state({"todos": []})
+                logger.info(f"Created Todo2 state file: {store.state_file}")
 
     return todo2_path
 
 
+async def _init_todo2_store(project_root: Path) -> "Todo2Store":
+    """Create the shared Todo2 state store and warm its snapshot."""
+    from .utils.todo2_store import get_todo2_store
+
+    store = get_todo2_store(project_root)
+    store.snapshot()
+    return store
+
+
 async def _init_advisor_logs(project_root: Path) -> Path:
     """Initialize advisor consultation log directory."""
     log_path = project_root / ".exarp" / "advisor_logs"
@@ -131,10 +148,14 @@ async def exarp_lifespan(server: "FastMCP") -> AsyncIterator[dict[str, Any]]:
     - Todo2 database
     - Advisor log directory
     - Session memory storage
+    - Pattern trigger watcher
 
     Cleans up:
     - Old log files
     - Temporary caches
+    - Pooled MCP client sessions
+    - Pattern trigger watcher
+    - Tool worker pools
 
     Yields:
         Dict with initialized state accessible via ctx.get_state()
@@ -166,6 +187,15 @@ async def exarp_lifespan(server: "FastMCP") -> AsyncIterator[dict[str, Any]]:
             logger.error(f"Failed to initialize Todo2 database: {e}", exc_info=True)
             state.todo2_path = None
 
+        # 2b. Warm shared Todo2 state store
+        if state.todo2_path:
+            try:
+                state.todo2_store = await _init_todo2_store(state.project_root)
+                logger.info(f"🗂️ Todo2 store: {len(state.todo2_store.get_tasks())} tasks indexed")
+            except Exception as e:
+                logger.warning(f"Failed to warm Todo2 store: {e}")
+                state.todo2_store = None
+
         # 3. Initialize advisor logs
         try:
             state.advisor_log_path = await _init_advisor_logs(state.project_root)
@@ -191,6 +221,14 @@ async def exarp_lifespan(server: "FastMCP") -> AsyncIterator[dict[str, Any]]:
             except Exception as e:
                 logger.warning(f"Failed to clean old logs: {e}")
 
+        # 6. Watch pattern triggers (non-critical; needs watchdog and .cursor/automa_patterns.json)
+        try:
+            from .tools.pattern_watcher import start_pattern_watcher
+            if start_pattern_watcher(state.project_root):
+                logger.info("👀 Pattern triggers: watching")
+        except Exception as e:
+            logger.warning(f"Failed to start pattern watcher: {e}")
+
         state._initialized = True
         logger.info("✅ Exarp MCP Server ready")
 
@@ -200,6 +238,7 @@ async def exarp_lifespan(server: "FastMCP") -> AsyncIterator[dict[str, Any]]:
             "todo2_path": state.todo2_path,
             "advisor_log_path": state.advisor_log_path,
             "memory_path": state.memory_path,
+            "todo2_store": state.todo2_store,
         }
 
     except Exception as e:
@@ -212,6 +251,7 @@ async def exarp_lifespan(server: "FastMCP") -> AsyncIterator[dict[str, Any]]:
             "todo2_path": None,
             "advisor_log_path": None,
             "memory_path": None,
+            "todo2_store": None,
         }
 
     finally:
@@ -222,6 +262,28 @@ async def exarp_lifespan(server: "FastMCP") -> AsyncIterator[dict[str, Any]]:
         logger.info("🛑 Exarp MCP Server shutting down...")
 
         # Cleanup tasks
+        if state.todo2_store is not None:
+            state.todo2_store.invalidate()
+        try:
+            from .scripts.base.mcp_client import shutdown_mcp_sessions
+            await asyncio.to_thread(shutdown_mcp_sessions)
+        except Exception as e:
+            logger.warning(f"Failed to close pooled MCP sessions: {e}")
+        try:
+            from .tools.pattern_watcher import stop_pattern_watchers
+            stop_pattern_watchers()
+        except Exception as e:
+            logger.warning(f"Failed to stop pattern watcher: {e}")
+        try:
+            from .utils.tool_executor import shutdown_tool_executor
+            shutdown_tool_executor()
+        except Exception as e:
+            logger.warning(f"Failed to stop tool worker pools: {e}")
+        try:
+            from .utils.source_scanner import shutdown_scan_pool
+            shutdown_scan_pool()
+        except Exception as e:
+            logger.warning(f"Failed to stop scan worker processes: {e}")
         state._initialized = False
 
         logger.info("👋 Exarp MCP Server stopped")
@@ -235,6 +297,7 @@ async def basic_lifespan():
 
     state.project_root = await _init_project_root()
     state.todo2_path = await _init_todo2(state.project_root)
+    state.todo2_store = await _init_todo2_store(state.project_root)
     state.advisor_log_path = await _init_advisor_logs(state.project_root)
     state.memory_path = await _init_memory(state.project_root)
     state._initialized = True
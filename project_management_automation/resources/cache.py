@@ -9,6 +9,10 @@ import logging
 from datetime import datetime
 
 from ..utils import find_project_root
+from ..utils.json_cache import JsonCacheManager
+from ..utils.lint_cache import get_lint_result_store
+from ..utils.tool_result_cache import get_tool_result_cache
+from ..utils.todo2_store import get_todo2_store
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +41,8 @@ def get_cache_status_resource() -> str:
                 "path": str(todo2_file.relative_to(project_root)),
                 "size_bytes": stat.st_size,
                 "last_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "description": "Todo2 task state - contains all tasks, statuses, and metadata"
+                "description": "Todo2 task state - contains all tasks, statuses, and metadata",
+                "store": get_todo2_store(project_root).get_stats(),
             })
 
         # Check automation history caches
@@ -78,6 +83,11 @@ def get_cache_status_resource() -> str:
             "description": f"Agent configurations from cursor-agent.json files ({agent_count} agents)"
         })
 
+        # In-memory JSON file caches (LRU by entry count and bytes)
+        cache_info["json_cache"] = JsonCacheManager.get_instance().get_stats()
+        cache_info["tool_results"] = get_tool_result_cache(project_root).get_stats()
+        cache_info["lint_results"] = get_lint_result_store(project_root).get_stats()
+
         cache_info["summary"] = {
             "total_caches": len(cache_info["caches"]),
             "task_caches": len([c for c in cache_info["caches"] if c["type"] == "task_list"]),
@@ -509,15 +509,15 @@ def _load_project_goals() -> Dict[str, Any]:
 
 def _load_recent_tasks(limit: int = 10) -> Dict[str, Any]:
     """Load recent task summary for context."""
-    project_root = _find_project_root()
-    todo2_file = project_root / ".todo2" / "state.todo2.json"
+    from ..utils.todo2_store import get_todo2_store
+
+    store = get_todo2_store(_find_project_root())
 
-    if not todo2_file.exists():
+    if not store.exists():
         return {"summary": {}, "recent": [], "error": "Todo2 state not found"}
 
     try:
-        state = json.loads(todo2_file.read_text())
-        todos = state.get("todos", [])
+        todos = store.get_tasks()
 
         # Count by status
         status_counts = {}
@@ -20,13 +20,11 @@ from pathlib import Path
 from typing import Any, Optional
 
 from ..utils import find_project_root
-from ..utils.json_cache import JsonCacheManager
+from ..utils.memory_store import MemoryStore, get_memory_store
+from ..utils.tool_result import structured_tool
 
 logger = logging.getLogger(__name__)
 
-# Cache manager for memory files
-_cache_manager = JsonCacheManager.get_instance()
-
 # Memory categories
 MEMORY_CATEGORIES = [
     "debug",  # Error solutions, workarounds, root causes
@@ -45,61 +43,37 @@ def _get_memories_dir() -> Path:
     return memories_dir
 
 
-def _load_all_memories() -> list[dict[str, Any]]:
-    """Load all memories from storage with per-file caching."""
-    memories_dir = _get_memories_dir()
-    memories = []
+def _get_store() -> MemoryStore:
+    """Get the indexed store for the project's memories directory."""
+    return get_memory_store(_get_memories_dir())
 
-    for memory_file in memories_dir.glob("*.json"):
-        try:
-            # Use unified JSON cache for each memory file
-            cache = _cache_manager.get_cache(memory_file, enable_stats=False)
-            memory = cache.get_or_load()
-            if isinstance(memory, dict):
-                memories.append(memory)
-        except Exception as e:
-            logger.warning(f"Error loading memory {memory_file}: {e}")
 
-    # Sort by created_at descending (newest first)
-    memories.sort(key=lambda m: m.get("created_at", ""), reverse=True)
-    return memories
+def _load_all_memories() -> list[dict[str, Any]]:
+    """Load all memories from the indexed store (newest first)."""
+    return list(_get_store().all())
 
 
 def _save_memory(memory: dict[str, Any]) -> Path:
-    """Save a memory to storage."""
-    memories_dir = _get_memories_dir()
-    memory_file = memories_dir / f"{memory['id']}.json"
-
-    with open(memory_file, "w") as f:
-        json.dump(memory, f, indent=2)
-
-    return memory_file
+    """Save a memory to storage and update the index."""
+    return _get_store().save(memory)
 
 
 def _filter_memories(
-    memories: list[dict[str, Any]],
     category: Optional[str] = None,
     task_id: Optional[str] = None,
     days: Optional[int] = None,
     session_date: Optional[str] = None,
+    limit: Optional[int] = None,
 ) -> list[dict[str, Any]]:
-    """Filter memories by various criteria."""
-    filtered = memories
-
-    if category:
-        filtered = [m for m in filtered if m.get("category") == category]
-
-    if task_id:
-        filtered = [m for m in filtered if task_id in m.get("linked_tasks", [])]
-
-    if days:
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-        filtered = [m for m in filtered if m.get("created_at", "") >= cutoff]
-
-    if session_date:
-        filtered = [m for m in filtered if m.get("session_date") == session_date]
-
-    return filtered
+    """Filter memories by various criteria using the store's secondary indexes."""
+    since = (datetime.now() - timedelta(days=days)).isoformat() if days else None
+    return _get_store().filter(
+        category=category,
+        task_id=task_id,
+        since=since,
+        session_date=session_date,
+        limit=limit,
+    )
 
 
 def create_memory(
@@ -145,15 +119,8 @@ def create_memory(
 
 def get_memory_by_id(memory_id: str) -> Optional[dict[str, Any]]:
     """Get a specific memory by ID."""
-    memories_dir = _get_memories_dir()
-    memory_file = memories_dir / f"{memory_id}.json"
-
-    if not memory_file.exists():
-        return None
-
     try:
-        with open(memory_file) as f:
-            return json.load(f)
+        return _get_store().get(memory_id)
     except Exception as e:
         logger.error(f"Error loading memory {memory_id}: {e}")
         return None
@@ -163,6 +130,9 @@ def search_memories(query: str, limit: int = 10) -> list[dict[str, Any]]:
     """
     Search memories by text content.
 
+    Ranked with BM25 over title (weighted highest), content and category;
+    partial words match as prefixes.
+
     Args:
         query: Search query
         limit: Maximum results
@@ -170,37 +140,7 @@ def search_memories(query: str, limit: int = 10) -> list[dict[str, Any]]:
     Returns:
         List of matching memories
     """
-    memories = _load_all_memories()
-    query_lower = query.lower()
-
-    scored = []
-    for memory in memories:
-        score = 0
-        title = memory.get("title", "").lower()
-        content = memory.get("content", "").lower()
-        category = memory.get("category", "").lower()
-
-        # Title match scores highest
-        if query_lower in title:
-            score += 10
-
-        # Content match
-        if query_lower in content:
-            score += 5
-            # Bonus for multiple occurrences
-            score += content.count(query_lower)
-
-        # Category match
-        if query_lower in category:
-            score += 3
-
-        if score > 0:
-            scored.append((score, memory))
-
-    # Sort by score descending
-    scored.sort(key=lambda x: x[0], reverse=True)
-
-    return [m for _, m in scored[:limit]]
+    return _get_store().search(query, limit=limit)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -208,7 +148,8 @@ def search_memories(query: str, limit: int = 10) -> list[dict[str, Any]]:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def get_memories_resource(limit: int = 50) -> str:
+@structured_tool
+def get_memories_resource(limit: int = 50) -> dict[str, Any]:
     """
     Get all memories as resource.
 
@@ -216,31 +157,27 @@ def get_memories_resource(limit: int = 50) -> str:
         JSON string with memory list and statistics
     """
     try:
-        memories = _load_all_memories()[:limit]
-
-        # Calculate statistics
-        categories = {}
-        for m in _load_all_memories():
-            cat = m.get("category", "unknown")
-            categories[cat] = categories.get(cat, 0) + 1
+        store = _get_store()
+        memories = store.all()[:limit]
 
         result = {
             "memories": memories,
-            "total": len(_load_all_memories()),
+            "total": store.count(),
             "returned": len(memories),
-            "categories": categories,
+            "categories": store.category_counts(),
             "available_categories": MEMORY_CATEGORIES,
             "timestamp": datetime.now().isoformat(),
         }
 
-        return json.dumps(result, separators=(',', ':'))
+        return result
 
     except Exception as e:
         logger.error(f"Error getting memories resource: {e}")
-        return json.dumps({"memories": [], "error": str(e), "timestamp": datetime.now().isoformat()}, separators=(',', ':'))
+        return {"memories": [], "error": str(e), "timestamp": datetime.now().isoformat()}
 
 
-def get_memories_by_category_resource(category: str, limit: int = 50) -> str:
+@structured_tool
+def get_memories_by_category_resource(category: str, limit: int = 50) -> dict[str, Any]:
     """
     Get memories filtered by category.
 
@@ -251,8 +188,7 @@ def get_memories_by_category_resource(category: str, limit: int = 50) -> str:
         JSON string with filtered memories
     """
     try:
-        memories = _load_all_memories()
-        filtered = _filter_memories(memories, category=category)[:limit]
+        filtered = _filter_memories(category=category, limit=limit)
 
         result = {
             "category": category,
@@ -261,16 +197,15 @@ def get_memories_by_category_resource(category: str, limit: int = 50) -> str:
             "timestamp": datetime.now().isoformat(),
         }
 
-        return json.dumps(result, separators=(',', ':'))
+        return result
 
     except Exception as e:
         logger.error(f"Error getting memories by category: {e}")
-        return json.dumps(
-            {"memories": [], "category": category, "error": str(e), "timestamp": datetime.now().isoformat()}, indent=2
-        )
+        return {"memories": [], "category": category, "error": str(e), "timestamp": datetime.now().isoformat()}
 
 
-def get_memories_by_task_resource(task_id: str) -> str:
+@structured_tool
+def get_memories_by_task_resource(task_id: str) -> dict[str, Any]:
     """
     Get memories linked to a specific task.
 
@@ -281,8 +216,7 @@ def get_memories_by_task_resource(task_id: str) -> str:
         JSON string with task-linked memories
     """
     try:
-        memories = _load_all_memories()
-        filtered = _filter_memories(memories, task_id=task_id)
+        filtered = _filter_memories(task_id=task_id)
 
         result = {
             "task_id": task_id,
@@ -291,16 +225,15 @@ def get_memories_by_task_resource(task_id: str) -> str:
             "timestamp": datetime.now().isoformat(),
         }
 
-        return json.dumps(result, separators=(',', ':'))
+        return result
 
     except Exception as e:
         logger.error(f"Error getting memories by task: {e}")
-        return json.dumps(
-            {"memories": [], "task_id": task_id, "error": str(e), "timestamp": datetime.now().isoformat()}, indent=2
-        )
+        return {"memories": [], "task_id": task_id, "error": str(e), "timestamp": datetime.now().isoformat()}
 
 
-def get_recent_memories_resource(hours: int = 24) -> str:
+@structured_tool
+def get_recent_memories_resource(hours: int = 24) -> dict[str, Any]:
     """
     Get memories from the last N hours.
 
@@ -311,9 +244,8 @@ def get_recent_memories_resource(hours: int = 24) -> str:
         JSON string with recent memories
     """
     try:
-        memories = _load_all_memories()
         cutoff = (datetime.now() - timedelta(hours=hours)).isoformat()
-        recent = [m for m in memories if m.get("created_at", "") >= cutoff]
+        recent = _get_store().filter(since=cutoff)
 
         result = {
             "hours": hours,
@@ -322,16 +254,15 @@ def get_recent_memories_resource(hours: int = 24) -> str:
             "timestamp": datetime.now().isoformat(),
         }
 
-        return json.dumps(result, separators=(',', ':'))
+        return result
 
     except Exception as e:
         logger.error(f"Error getting recent memories: {e}")
-        return json.dumps(
-            {"memories": [], "hours": hours, "error": str(e), "timestamp": datetime.now().isoformat()}, indent=2
-        )
+        return {"memories": [], "hours": hours, "error": str(e), "timestamp": datetime.now().isoformat()}
 
 
-def get_session_memories_resource(date: Optional[str] = None) -> str:
+@structured_tool
+def get_session_memories_resource(date: Optional[str] = None) -> dict[str, Any]:
     """
     Get memories from a specific session date.
 
@@ -345,8 +276,7 @@ def get_session_memories_resource(date: Optional[str] = None) -> str:
         if not date:
             date = datetime.now().strftime("%Y-%m-%d")
 
-        memories = _load_all_memories()
-        filtered = _filter_memories(memories, session_date=date)
+        filtered = _filter_memories(session_date=date)
 
         # Group by category for session summary
         by_category = {}
@@ -365,13 +295,11 @@ def get_session_memories_resource(date: Optional[str] = None) -> str:
             "timestamp": datetime.now().isoformat(),
         }
 
-        return json.dumps(result, separators=(',', ':'))
+        return result
 
     except Exception as e:
         logger.error(f"Error getting session memories: {e}")
-        return json.dumps(
-            {"memories": [], "session_date": date, "error": str(e), "timestamp": datetime.now().isoformat()}, indent=2
-        )
+        return {"memories": [], "session_date": date, "error": str(e), "timestamp": datetime.now().isoformat()}
 
 
 def _generate_session_summary(memories: list[dict[str, Any]]) -> str:
@@ -404,7 +332,8 @@ def _generate_session_summary(memories: list[dict[str, Any]]) -> str:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def get_wisdom_resource() -> str:
+@structured_tool
+def get_wisdom_resource() -> dict[str, Any]:
     """
     Get combined view of memories and advisor consultations.
     
@@ -454,11 +383,11 @@ def get_wisdom_resource() -> str:
             "timestamp": datetime.now().isoformat(),
         }
 
-        return json.dumps(result, separators=(',', ':'))
+        return result
 
     except Exception as e:
         logger.error(f"Error getting wisdom resource: {e}")
-        return json.dumps({"error": str(e), "timestamp": datetime.now().isoformat()}, separators=(',', ':'))
+        return {"error": str(e), "timestamp": datetime.now().isoformat()}
 
 
 def _merge_wisdom(memories: list[dict[str, Any]], consultations: list[dict[str, Any]]) -> list[dict[str, Any]]:
@@ -493,7 +422,8 @@ def _merge_wisdom(memories: list[dict[str, Any]], consultations: list[dict[str,
     return timeline[:30]  # Last 30 items
 
 
-def get_memories_health_resource() -> str:
+@structured_tool
+def get_memories_health_resource() -> dict[str, Any]:
     """
     Get memory system health metrics.
     
@@ -516,14 +446,14 @@ def get_memories_health_resource() -> str:
             "timestamp": datetime.now().isoformat(),
         }
 
-        return json.dumps(result, separators=(',', ':'))
+        return result
 
     except Exception as e:
         logger.error(f"Error getting memories health: {e}")
-        return json.dumps({
+        return {
             "error": str(e),
             "timestamp": datetime.now().isoformat(),
-        }, indent=2)
+        }
 
 
 __all__ = [
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+from ..scripts.base.mcp_client import get_session_pool_stats
+from ..utils.tool_executor import get_tool_executor
 from ..version import __version__
 
 logger = logging.getLogger(__name__)
@@ -44,6 +46,8 @@ def get_status_resource() -> str:
             "tools_available": tools_available,
             "error_handling_available": error_handler_available,
             "timestamp": datetime.now().isoformat(),
+            "tool_pools": get_tool_executor().get_stats(),
+            "mcp_sessions": get_session_pool_stats(),
             "tools": {
                 "total": 20 if tools_available else 1,
                 "high_priority": 5 if tools_available else 0,
@@ -15,24 +15,15 @@ from ..utils import (
     get_current_project_id,
     task_belongs_to_project,
 )
-from ..utils.json_cache import JsonCacheManager
+from ..utils.todo2_store import get_todo2_store
 
 logger = logging.getLogger(__name__)
 
-# Cache manager for Todo2 state
-_cache_manager = JsonCacheManager.get_instance()
-
 
 def _load_todo2_state() -> dict[str, Any]:
-    """Load Todo2 state file with caching based on file modification time."""
-    project_root = find_project_root()
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-
-    # Use unified JSON cache utility
-    cache = _cache_manager.get_cache(todo2_file, enable_stats=True)
-    
+    """Load Todo2 state from the shared store (re-parsed only when the file changes)."""
     try:
-        data = cache.get_or_load()
+        data = get_todo2_store(find_project_root()).load_state()
         # Ensure we always return a dict with 'todos' key
         if not isinstance(data, dict):
             return {"todos": []}
@@ -44,15 +44,16 @@ def _find_project_root() -> Path:
 
 
 def _load_todo2_state() -> dict[str, Any]:
-    """Load Todo2 state file."""
-    project_root = _find_project_root()
-    todo2_file = project_root / ".todo2" / "state.todo2.json"
+    """Load Todo2 state from the shared store (read-only snapshot)."""
+    from ..utils.todo2_store import get_todo2_store
+
+    store = get_todo2_store(_find_project_root())
 
-    if not todo2_file.exists():
+    if not store.exists():
         return {"todos": []}
 
     try:
-        return json.loads(todo2_file.read_text())
+        return store.load_state()
     except Exception as e:
         logger.error(f"Error loading Todo2 state: {e}")
         return {"todos": [], "error": str(e)}
@@ -319,6 +320,16 @@ def get_advisor_info(advisor_id: str) -> dict[str, Any]:
 # MEMORY RESOURCES
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _get_memory_store():
+    """Get the indexed memory store, or None if memory storage is not initialized."""
+    from ..utils.memory_store import get_memory_store
+
+    memory_dir = _find_project_root() / ".exarp" / "memories"
+    if not memory_dir.exists():
+        return None
+    return get_memory_store(memory_dir)
+
+
 def get_memory_by_id(memory_id: str) -> dict[str, Any]:
     """
     Get a specific memory by ID.
@@ -331,28 +342,21 @@ def get_memory_by_id(memory_id: str) -> dict[str, Any]:
     Returns:
         Memory data or error
     """
-    project_root = _find_project_root()
-    memory_dir = project_root / ".exarp" / "memories"
-
-    if not memory_dir.exists():
+    store = _get_memory_store()
+    if store is None:
         return {
             "memory": None,
             "found": False,
             "error": "Memory storage not initialized",
         }
 
-    # Search for memory file
-    for memory_file in memory_dir.glob("*.json"):
-        try:
-            data = json.loads(memory_file.read_text())
-            if data.get("id") == memory_id:
-                return {
-                    "memory": data,
-                    "found": True,
-                    "timestamp": datetime.now().isoformat(),
-                }
-        except Exception:
-            continue
+    memory = store.get(memory_id)
+    if memory is not None:
+        return {
+            "memory": memory,
+            "found": True,
+            "timestamp": datetime.now().isoformat(),
+        }
 
     return {
         "memory": None,
@@ -373,28 +377,17 @@ def get_memories_by_category(category: str) -> dict[str, Any]:
         category: Memory category (debug, research, architecture, preference, insight)
 
     Returns:
-        Filtered memory list
+        Filtered memory list (newest first)
     """
-    project_root = _find_project_root()
-    memory_dir = project_root / ".exarp" / "memories"
-
-    if not memory_dir.exists():
+    store = _get_memory_store()
+    if store is None:
         return {
             "memories": [],
             "count": 0,
             "category": category,
         }
 
-    memories = []
-    category_lower = category.lower()
-
-    for memory_file in memory_dir.glob("*.json"):
-        try:
-            data = json.loads(memory_file.read_text())
-            if data.get("category", "").lower() == category_lower:
-                memories.append(data)
-        except Exception:
-            continue
+    memories = store.filter(category=category, ignore_case=True)
 
     return {
         "memories": memories,
@@ -23,6 +23,7 @@ from typing import Optional
 # Project root will be passed to __init__
 # Import base class
 from project_management_automation.scripts.base.intelligent_automation_base import IntelligentAutomationBase
+from project_management_automation.utils.repo_inventory import get_repo_inventory
 
 # Configure logging (will be configured after project_root is set)
 logger = logging.getLogger(__name__)
@@ -98,13 +99,16 @@ class AutomationOpportunityFinder(IntelligentAutomationBase):
             r'run_.*_cron\.sh'
         ]
 
-        existing = set()
-        for pattern in automation_patterns:
-            for script in self.scripts_path.rglob(pattern):
-                existing.add(script.stem)
+        inventory = get_repo_inventory(self.project_root)
+        automation_re = re.compile('|'.join(automation_patterns))
+        existing = {
+            script.stem
+            for script in inventory.files(under=self.scripts_path)
+            if automation_re.fullmatch(script.name)
+        }
 
         # Find gaps - scripts that exist but aren't automated
-        for script in self.scripts_path.glob('*.py'):
+        for script in inventory.files(ext='.py', under=self.scripts_path, recursive=False):
             if script.stem.startswith('validate_') or script.stem.startswith('check_'):
                 if f"automate_{script.stem}" not in existing:
                     opportunities.append({
@@ -194,9 +198,11 @@ class AutomationOpportunityFinder(IntelligentAutomationBase):
         # Search codebase for automation TODOs
         todo_pattern = re.compile(r'TODO.*[Aa]utomat', re.IGNORECASE)
 
-        for file_path in self.project_root.rglob('*.{py,md,sh}'):
-            if any(skip in str(file_path) for skip in ['.git', 'node_modules', 'build', '__pycache__']):
+        inventory = get_repo_inventory(self.project_root)
+        for rel_path in inventory.relpaths(ext=('.py', '.md', '.sh')):
+            if 'build' in rel_path.split('/')[:-1]:
                 continue
+            file_path = self.project_root / rel_path
 
             try:
                 content = file_path.read_text(encoding='utf-8', errors='ignore')
@@ -6,14 +6,19 @@ Runs routine daily maintenance tasks and generates a combined summary report.
 """
 
 import argparse
+import importlib
 import json
 import logging
 import sys
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any, Optional
 
+from project_management_automation.utils.task_scheduler import DEFAULT_MAX_WORKERS, ScheduledJob, run_job_dag
+from project_management_automation.utils.tool_result import call_result
+
 # Add project root to path
 # Project root will be passed to __init__
 
@@ -22,33 +27,51 @@ logger = logging.getLogger(__name__)
 
 
 # Available daily tasks
+#
+# 'reads'/'writes' declare the shared resources each task touches. The scheduler
+# runs tasks concurrently unless one writes a resource the other reads or writes,
+# in which case they keep their configured order. Automation tracking tasks
+# (IntelligentAutomationBase bookkeeping) are written under Todo2Store.write_lock()
+# and are not declared here. Tasks with a 'function' run in-process.
 DAILY_TASKS = {
     'docs_health': {
         'name': 'Documentation Health Check',
         'script': 'project_management_automation/scripts/automate_docs_health_v2.py',
         'mcp_tool': 'check_documentation_health',
         'quick': True,
-        'description': 'Monitor documentation quality and structure'
+        'reads': ['docs'],
+        'writes': ['docs_health_report'],
+        'description': 'Monitor documentation quality and structure',
+        'function': 'project_management_automation.tools.docs_health:check_documentation_health'
     },
     'todo2_alignment': {
         'name': 'Todo2 Alignment Analysis',
         'script': 'project_management_automation/scripts/automate_todo2_alignment_v2.py',
         'mcp_tool': 'analyze_todo2_alignment',
         'quick': True,
-        'description': 'Ensure tasks align with project strategy'
+        'reads': ['todo2'],
+        'writes': ['todo2', 'todo2_alignment_report'],
+        'description': 'Ensure tasks align with project strategy',
+        'function': 'project_management_automation.tools.todo2_alignment:analyze_todo2_alignment',
+        'function_kwargs': {'output_path': 'docs/TODO2_PRIORITY_ALIGNMENT_ANALYSIS.md'}
     },
     'duplicate_detection': {
         'name': 'Duplicate Task Detection',
         'script': 'project_management_automation/scripts/automate_todo2_duplicate_detection.py',
         'mcp_tool': 'detect_duplicate_tasks',
         'quick': True,
-        'description': 'Detect and report duplicate tasks'
+        'reads': ['todo2'],
+        'writes': ['todo2_duplicate_report'],
+        'description': 'Detect and report duplicate tasks',
+        'function': 'project_management_automation.tools.duplicate_detection:detect_duplicate_tasks'
     },
     'dependency_security': {
         'name': 'Dependency Security Scan',
         'script': 'project_management_automation/scripts/automate_dependency_security.py',
         'mcp_tool': 'scan_dependency_security',
         'quick': False,
+        'reads': ['dependency_manifests'],
+        'writes': ['dependency_security_history'],
         'description': 'Check for vulnerable dependencies'
     },
     # NOTE: external_tool_hints removed from daily automation - it's a one-time setup tool
@@ -58,6 +81,8 @@ DAILY_TASKS = {
         'script': None,  # Uses direct function call
         'mcp_tool': 'check_tool_count_health',
         'quick': True,
+        'reads': ['mcp_tools'],
+        'writes': [],
         'description': 'Monitor MCP tool count against design limit (≤30)',
         'function': 'project_management_automation.tools.tool_count_health:check_tool_count_health'
     },
@@ -66,6 +91,8 @@ DAILY_TASKS = {
         'script': None,  # Uses direct function call
         'mcp_tool': 'session_handoff',
         'quick': True,
+        'reads': ['handoffs'],
+        'writes': [],
         'description': 'Check for handoff notes from other developers/machines',
         'function': 'project_management_automation.tools.session_handoff:get_latest_handoff'
     },
@@ -74,6 +101,8 @@ DAILY_TASKS = {
         'script': None,  # Uses direct function call
         'mcp_tool': 'auto_update_task_status',
         'quick': True,
+        'reads': ['todo2'],
+        'writes': [],
         'description': 'Infer task completion from codebase analysis',
         'function': 'project_management_automation.tools.auto_update_task_status:auto_update_task_status'
     },
@@ -82,6 +111,8 @@ DAILY_TASKS = {
         'script': 'project_management_automation/scripts/automate_stale_task_cleanup.py',
         'mcp_tool': 'cleanup_stale_tasks',
         'quick': True,
+        'reads': ['todo2'],
+        'writes': ['todo2'],
         'description': 'Move stale In Progress tasks back to Todo for accurate time tracking'
     }
 }
@@ -97,6 +128,7 @@ class DailyAutomation:
         self.dry_run = config.get('dry_run', False)
         self.output_path = config.get('output_path', 'docs/DAILY_AUTOMATION_REPORT.md')
         self.include_slow = config.get('include_slow', False)
+        self.max_workers = config.get('max_workers', DEFAULT_MAX_WORKERS)
 
         # Results
         self.results = {
@@ -126,12 +158,22 @@ class DailyAutomation:
 
         logger.info(f"Running {len(tasks)} daily tasks: {', '.join(tasks)}")
 
-        # Run each task
+        # Run tasks as a DAG: independent tasks overlap, conflicting writers keep their order
+        jobs = [
+            ScheduledJob(
+                task_id,
+                partial(self._run_task, task_id, DAILY_TASKS[task_id]),
+                reads=frozenset(DAILY_TASKS[task_id].get('reads', ())),
+                writes=frozenset(DAILY_TASKS[task_id].get('writes', ())),
+                depends_on=tuple(DAILY_TASKS[task_id].get('depends_on', ())),
+            )
+            for task_id in tasks
+        ]
+        schedule = run_job_dag(jobs, max_workers=self.max_workers)
+
         for task_id in tasks:
             task_info = DAILY_TASKS[task_id]
-            logger.info(f"Running: {task_info['name']}")
-
-            task_result = self._run_task(task_id, task_info)
+            task_result = schedule['results'][task_id]
             self.results['tasks_run'].append({
                 'task_id': task_id,
                 'task_name': task_info['name'],
@@ -146,6 +188,16 @@ class DailyAutomation:
             else:
                 self.results['tasks_failed'].append(task_id)
 
+        self.results['schedule'] = {
+            'max_workers': schedule['max_workers'],
+            'wall_seconds': round(schedule['wall_seconds'], 3),
+            'serial_seconds': round(schedule['serial_seconds'], 3),
+            'critical_path': schedule['critical_path'],
+            'critical_path_seconds': round(schedule['critical_path_seconds'], 3),
+            'waves': schedule['waves'],
+            'timings': schedule['timings'],
+        }
+
         # Get task recommendations (if agentic-tools available)
         recommendations = self._get_task_recommendations()
         if recommendations:
@@ -203,13 +255,14 @@ class DailyAutomation:
         start_time = time.time()
 
         try:
-            # Try to run via script first
-            script_path = self.project_root / task_info['script']
-            if script_path.exists():
-                result = self._run_script(script_path, task_id)
+            if task_info.get('function'):
+                # In-process call: no interpreter startup or re-imports
+                result = self._run_function(task_info['function'], task_info.get('function_kwargs', {}))
+            elif task_info.get('script') and (self.project_root / task_info['script']).exists():
+                result = self._run_script(self.project_root / task_info['script'], task_id)
             else:
                 # Fallback: Try MCP tool (would need MCP client)
-                logger.warning(f"Script not found: {script_path}, skipping")
+                logger.warning(f"No script or function available for {task_id}, skipping")
                 result = {'status': 'skipped', 'error': 'Script not found'}
 
             duration = float(time.time() - start_time)
@@ -224,6 +277,23 @@ class DailyAutomation:
                 'duration': float(time.time() - start_time)
             }
 
+    def _run_function(self, target: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Run a 'module:function' entry in-process and normalize its structured result."""
+        module_name, func_name = target.split(':', 1)
+        func = getattr(importlib.import_module(module_name), func_name)
+        output = call_result(func, **kwargs)
+
+        if output.get('success') is False or output.get('status') == 'error':
+            error = output.get('error')
+            if isinstance(error, dict):
+                error = error.get('message', str(error))
+            return {'status': 'error', 'error': str(error or 'Function reported failure')[:200]}
+        if set(output) == {'result'}:
+            # Plain text or non-dict output
+            return {'status': 'success', 'summary': {'output': str(output['result'])[:500]}}
+        data = output.get('data', output)
+        return {'status': 'success', 'summary': data if isinstance(data, dict) else {'output': str(data)[:500]}}
+
     def _run_script(self, script_path: Path, task_id: str) -> dict[str, Any]:
         """Run a Python script as a module."""
         import subprocess
@@ -304,18 +374,17 @@ class DailyAutomation:
         """Get task progress inference using auto_update_task_status (T-13)."""
         try:
             from project_management_automation.tools.auto_update_task_status import auto_update_task_status
-            import json
             
             # Call with dry_run=True for safety (only report, don't update)
-            result_json = auto_update_task_status(
+            result = call_result(
+                auto_update_task_status,
                 confidence_threshold=0.7,
                 auto_update=False,  # Don't auto-update in daily automation
                 output_path=None,  # Don't create separate report
                 codebase_path=str(self.project_root)
             )
             
-            if result_json:
-                result = json.loads(result_json)
+            if result:
                 if result.get('success') and result.get('data'):
                     data = result['data']
                     logger.info(f"Progress inference: {data.get('inferences_made', 0)} inferences made")
@@ -356,9 +425,25 @@ class DailyAutomation:
             f"- **Success Rate**: {summary['success_rate']:.1f}%",
             f"- **Duration**: {summary['duration_seconds']:.2f} seconds",
             "",
+        ]
+
+        schedule = self.results.get('schedule')
+        if schedule:
+            speedup = schedule['serial_seconds'] / schedule['wall_seconds'] if schedule['wall_seconds'] else 1.0
+            report_lines.extend([
+                "## Schedule",
+                "",
+                f"- **Workers**: {schedule['max_workers']}",
+                f"- **Wall Time**: {schedule['wall_seconds']:.2f}s (sequential: {schedule['serial_seconds']:.2f}s, {speedup:.1f}x)",
+                f"- **Critical Path**: {' → '.join(schedule['critical_path'])} ({schedule['critical_path_seconds']:.2f}s)",
+                f"- **Waves**: {' | '.join(', '.join(wave) for wave in schedule['waves'])}",
+                "",
+            ])
+
+        report_lines.extend([
             "## Task Results",
             "",
-        ]
+        ])
 
         for task_result in self.results['tasks_run']:
             status_icon = "✅" if task_result['status'] == 'success' else "❌"
@@ -441,6 +526,8 @@ def main():
                        help='Include slow tasks (e.g., dependency security scan)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Preview changes without applying')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS,
+                       help='Maximum tasks to run concurrently (1 = sequential)')
     parser.add_argument('--output-path', type=str,
                        default='docs/DAILY_AUTOMATION_REPORT.md',
                        help='Path for report output')
@@ -453,7 +540,8 @@ def main():
         'tasks': args.tasks,
         'include_slow': args.include_slow,
         'dry_run': args.dry_run,
-        'output_path': args.output_path
+        'output_path': args.output_path,
+        'max_workers': args.max_workers
     }
 
     automation = DailyAutomation(config, project_root=project_root)
@@ -21,10 +21,14 @@ from typing import Optional
 
 # Import base class (relative import for package)
 from project_management_automation.scripts.base.intelligent_automation_base import IntelligentAutomationBase
+from project_management_automation.utils.repo_inventory import get_repo_inventory
 
 # Configure logging (will be configured after project_root is set)
 logger = logging.getLogger(__name__)
 
+# Documentation sections excluded from link validation and the cross-reference graph
+DOC_SKIP_DIRS = {'archive', 'indices', 'message_schemas', 'resource-summaries', 'video-summaries'}
+
 
 class DocumentationHealthAnalyzerV2(IntelligentAutomationBase):
     """Intelligent documentation health analyzer using base class."""
@@ -115,13 +119,20 @@ class DocumentationHealthAnalyzerV2(IntelligentAutomationBase):
 
         return self.analysis_results
 
+    def _doc_files(self) -> list[Path]:
+        """Markdown files under docs/, excluding generated and archived sections."""
+        inventory = get_repo_inventory(self.project_root)
+        return [
+            self.project_root / rel
+            for rel in inventory.relpaths(ext='.md', under=self.docs_path)
+            if not any(skip in rel for skip in DOC_SKIP_DIRS)
+        ]
+
     def _validate_links(self) -> None:
         """Validate all links in documentation."""
         logger.info("Validating links...")
 
-        md_files = list(self.docs_path.rglob('*.md'))
-        skip_dirs = {'archive', 'indices', 'message_schemas', 'resource-summaries', 'video-summaries'}
-        md_files = [f for f in md_files if not any(skip in str(f) for skip in skip_dirs)]
+        md_files = self._doc_files()
 
         link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
         all_internal_files = {f.relative_to(self.docs_path) for f in md_files}
@@ -191,7 +202,7 @@ class DocumentationHealthAnalyzerV2(IntelligentAutomationBase):
         stale_threshold_days = self.config.get('stale_threshold_days', 90)
         threshold_date = datetime.now() - timedelta(days=stale_threshold_days)
 
-        for doc_file in self.docs_path.glob('*.md'):
+        for doc_file in get_repo_inventory(self.project_root).files(ext='.md', under=self.docs_path, recursive=False):
             try:
                 content = doc_file.read_text(encoding='utf-8')
 
@@ -367,9 +378,7 @@ class DocumentationHealthAnalyzerV2(IntelligentAutomationBase):
             G = nx.DiGraph()
 
             # Find all markdown files
-            md_files = list(self.docs_path.rglob('*.md'))
-            skip_dirs = {'archive', 'indices', 'message_schemas', 'resource-summaries', 'video-summaries'}
-            md_files = [f for f in md_files if not any(skip in str(f) for skip in skip_dirs)]
+            md_files = self._doc_files()
 
             # Build reference map
             referenced_files = set()
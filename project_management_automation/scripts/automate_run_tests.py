@@ -6,20 +6,28 @@ Executes test suites with flexible options for pytest, unittest, and ctest.
 """
 
 import argparse
+import contextvars
 import json
 import logging
+import os
 import subprocess
 import sys
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 # Import base class
 from project_management_automation.scripts.base.intelligent_automation_base import IntelligentAutomationBase
+from project_management_automation.utils.tool_executor import run_subprocess, wait_for
 
 logger = logging.getLogger(__name__)
 
+# Per-test contexts let later runs select only affected tests (changed_since)
+COVERAGE_ARGS = ['--cov=project_management_automation', '--cov=tools', '--cov=resources', '--cov-context=test']
+
 
 class TestRunner(IntelligentAutomationBase):
     """Test runner using intelligent automation base."""
@@ -35,6 +43,12 @@ class TestRunner(IntelligentAutomationBase):
         self.verbose = config.get('verbose', True)
         self.coverage = config.get('coverage', False)
         self.output_path = Path(config.get('output_path', 'test-results/'))
+        # Only run tests affected by changes since this git ref (pytest + coverage contexts)
+        self.changed_since = config.get('changed_since')
+        # Number of parallel pytest processes
+        self.workers = max(1, int(config.get('workers', 1) or 1))
+        self.timeout = config.get('timeout', 300)
+        self.coverage_data = Path(config.get('coverage_data') or self.project_root / '.coverage')
 
         # Ensure output directory exists
         self.output_path.mkdir(parents=True, exist_ok=True)
@@ -111,13 +125,16 @@ class TestRunner(IntelligentAutomationBase):
 
     def _run_pytest(self) -> dict:
         """Run pytest tests."""
+        if self.changed_since or self.workers > 1:
+            return self._run_pytest_sharded()
+
         cmd = [sys.executable, '-m', 'pytest', str(self.test_path)]
 
         if self.verbose:
             cmd.append('-v')
 
         if self.coverage:
-            cmd.extend(['--cov=project_management_automation', '--cov=tools', '--cov=resources'])
+            cmd.extend(COVERAGE_ARGS)
             cmd.append('--cov-report=html:' + str(self.output_path / 'coverage'))
             cmd.append('--cov-report=xml:' + str(self.output_path / 'coverage.xml'))
 
@@ -126,12 +143,12 @@ class TestRunner(IntelligentAutomationBase):
         cmd.extend(['--junit-xml', str(junit_xml)])
 
         logger.info(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(
+        result = run_subprocess(
             cmd,
             cwd=str(self.project_root),
             capture_output=True,
             text=True,
-            timeout=300
+            timeout=self.timeout
         )
 
         # Parse results
@@ -182,6 +199,177 @@ class TestRunner(IntelligentAutomationBase):
 
         return results
 
+    def _select_pytest_items(self) -> tuple[list[str], dict]:
+        """Test items to run: affected tests if changed_since is set, else the whole path."""
+        from project_management_automation.utils.test_impact import (
+            get_changed_files,
+            load_coverage_map,
+            select_tests,
+        )
+
+        test_path = self.test_path.as_posix().rstrip('/')
+        if not self.changed_since:
+            return [test_path], {'mode': 'full', 'reason': 'no changed_since ref given'}
+
+        changed = get_changed_files(self.project_root, self.changed_since)
+        coverage_map = load_coverage_map(self.coverage_data, self.project_root)
+        selection = select_tests(self.project_root, changed, coverage_map, test_path)
+        info = {
+            'mode': 'full' if selection.full else 'impacted',
+            'reason': selection.reason,
+            'changed_since': self.changed_since,
+            'changed_files': len(selection.changed_files),
+            'selected': len(selection.items),
+        }
+        return selection.items, info
+
+    def _expand_to_modules(self, items: list[str]) -> list[str]:
+        """Replace directories with their test modules so they can be spread across shards."""
+        expanded = []
+        for item in items:
+            path = self.project_root / item
+            if '::' not in item and path.is_dir():
+                expanded.extend(
+                    p.relative_to(self.project_root).as_posix()
+                    for p in sorted(path.rglob('test_*.py'))
+                )
+            else:
+                expanded.append(item)
+        return expanded
+
+    def _run_pytest_sharded(self) -> dict:
+        """Run (impacted) pytest items across worker processes and merge JUnit results."""
+        from project_management_automation.utils.test_impact import TestTimings, merge_junit, shard_items
+
+        items, selection = self._select_pytest_items()
+        results = {
+            'framework': 'pytest',
+            'tests_run': 0,
+            'tests_passed': 0,
+            'tests_failed': 0,
+            'tests_skipped': 0,
+            'duration': 0,
+            'selection': selection,
+            'shards': [],
+            'output': '',
+            'error': '',
+            'returncode': 0,
+        }
+        if not items:
+            results['selection']['reason'] += ' (no tests affected)'
+            return results
+
+        if self.workers > 1:
+            items = self._expand_to_modules(items)
+        timings = TestTimings(self.project_root)
+        shards = shard_items(items, self.workers, timings.durations())
+
+        def run_shard(index: int, shard: list[str]) -> dict:
+            junit_file = self.output_path / f'junit-shard{index}.xml'
+            cmd = [sys.executable, '-m', 'pytest', *shard, '--junit-xml', str(junit_file), '-p', 'no:cacheprovider']
+            if self.verbose:
+                cmd.append('-v')
+            env = None
+            if self.coverage:
+                # Each shard writes its own data file; they are combined afterwards
+                cmd.extend([*COVERAGE_ARGS, '--cov-report='])
+                coverage_file = self._shard_coverage_file(index)
+                coverage_file.unlink(missing_ok=True)
+                env = {**os.environ, 'COVERAGE_FILE': str(coverage_file)}
+            start = time.monotonic()
+            try:
+                proc = run_subprocess(
+                    cmd, cwd=str(self.project_root), capture_output=True, text=True, timeout=self.timeout, env=env
+                )
+                returncode, stdout, stderr = proc.returncode, proc.stdout, proc.stderr
+            except subprocess.TimeoutExpired as e:
+                returncode, stdout, stderr = -1, e.stdout or '', f"Shard {index} timed out after {self.timeout}s"
+                if isinstance(stdout, bytes):
+                    stdout = stdout.decode(errors='replace')
+            return {
+                'index': index,
+                'items': len(shard),
+                'seconds': round(time.monotonic() - start, 2),
+                'returncode': returncode,
+                'junit_file': junit_file,
+                'stdout': stdout,
+                'stderr': stderr,
+            }
+
+        logger.info(f"Running {len(items)} pytest item(s) in {len(shards)} shard(s)")
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            # Each shard sees the calling request's cancellation token and stops its pytest with it
+            futures = [
+                pool.submit(contextvars.copy_context().run, run_shard, index, shard)
+                for index, shard in enumerate(shards)
+            ]
+            shard_results = [wait_for(future) for future in futures]
+
+        junit_xml = self.output_path / 'junit.xml'
+        totals = merge_junit([r['junit_file'] for r in shard_results], junit_xml)
+        timings.update_from_junit(junit_xml)
+        for r in shard_results:
+            r['junit_file'].unlink(missing_ok=True)
+
+        failed = totals['failures'] + totals['errors']
+        results.update({
+            'tests_run': totals['tests'],
+            'tests_failed': failed,
+            'tests_skipped': totals['skipped'],
+            'tests_passed': totals['tests'] - failed - totals['skipped'],
+            'duration': totals['time'],
+            'output_file': str(junit_xml),
+            'shards': [{k: r[k] for k in ('index', 'items', 'seconds', 'returncode')} for r in shard_results],
+            'output': '\n'.join(r['stdout'] for r in shard_results),
+            'error': '\n'.join(r['stderr'] for r in shard_results if r['stderr']),
+            # pytest exits 5 when a shard collected nothing; treat as success
+            'returncode': max((r['returncode'] for r in shard_results if r['returncode'] != 5), default=0),
+        })
+        if any(r['returncode'] == -1 for r in shard_results):
+            results['tests_failed'] = max(results['tests_failed'], 1)
+        if self.coverage:
+            coverage_xml = self._combine_coverage(len(shards), full=selection['mode'] == 'full')
+            if coverage_xml:
+                results['coverage_file'] = str(coverage_xml)
+        return results
+
+    def _shard_coverage_file(self, index: int) -> Path:
+        """Coverage data file of one shard."""
+        return (self.output_path / f'.coverage.shard{index}').resolve()
+
+    def _combine_coverage(self, shard_count: int, full: bool) -> Optional[Path]:
+        """
+        Combine the shards' coverage data and write the HTML and XML reports.
+
+        Only a full run replaces `coverage_data` (the per-test map used by
+        changed_since); an impacted run covers a subset of the tests, so its
+        combined data is kept next to the reports instead.
+
+        Returns:
+            Path of coverage.xml, or None if combining failed
+        """
+        data_file = self.coverage_data if full else (self.output_path / '.coverage').resolve()
+        shard_files = [str(f) for f in map(self._shard_coverage_file, range(shard_count)) if f.exists()]
+        if not shard_files:
+            logger.warning("No shard produced coverage data (is pytest-cov installed?)")
+            return None
+
+        env = {**os.environ, 'COVERAGE_FILE': str(data_file)}
+        coverage_xml = self.output_path / 'coverage.xml'
+        for args in (
+            ['combine', *shard_files],
+            ['html', '-d', str(self.output_path / 'coverage')],
+            ['xml', '-o', str(coverage_xml)],
+        ):
+            proc = run_subprocess(
+                [sys.executable, '-m', 'coverage', *args],
+                cwd=str(self.project_root), capture_output=True, text=True, timeout=self.timeout, env=env
+            )
+            if proc.returncode != 0:
+                logger.warning(f"coverage {args[0]} failed: {proc.stderr.strip()}")
+                return None
+        return coverage_xml
+
     def _run_unittest(self) -> dict:
         """Run unittest tests."""
         cmd = ['python3', '-m', 'unittest', 'discover', '-s', str(self.test_path), '-p', 'test_*.py']
@@ -190,12 +378,12 @@ class TestRunner(IntelligentAutomationBase):
             cmd.append('-v')
 
         logger.info(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(
+        result = run_subprocess(
             cmd,
             cwd=str(self.project_root),
             capture_output=True,
             text=True,
-            timeout=300
+            timeout=self.timeout
         )
 
         # Parse results
@@ -247,12 +435,12 @@ class TestRunner(IntelligentAutomationBase):
         cmd.extend(['-T', 'Test', '--no-compress-output'])
 
         logger.info(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(
+        result = run_subprocess(
             cmd,
             cwd=str(build_dir),
             capture_output=True,
             text=True,
-            timeout=300
+            timeout=self.timeout
         )
 
         # Parse results
@@ -349,7 +537,9 @@ def load_config(config_path: Optional[Path] = None) -> dict:
         'test_framework': 'auto',
         'verbose': True,
         'coverage': False,
-        'output_path': 'test-results/'
+        'output_path': 'test-results/',
+        'changed_since': None,
+        'workers': 1,
     }
 
     if config_path and config_path.exists():
@@ -371,6 +561,8 @@ def main():
     parser.add_argument('--verbose', action='store_true', default=True)
     parser.add_argument('--coverage', action='store_true', help='Generate coverage report')
     parser.add_argument('--output', type=str, help='Output path for results')
+    parser.add_argument('--changed-since', type=str, help='Only run tests affected by changes since this git ref')
+    parser.add_argument('--workers', type=int, default=1, help='Number of parallel pytest shards')
     parser.add_argument('--config', type=Path, help='Path to config file')
     args = parser.parse_args()
 
@@ -385,6 +577,9 @@ def main():
         config['coverage'] = True
     if args.output:
         config['output_path'] = args.output
+    if args.changed_since:
+        config['changed_since'] = args.changed_since
+    config['workers'] = args.workers
 
     runner = TestRunner(config)
 
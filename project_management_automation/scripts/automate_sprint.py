@@ -40,9 +40,23 @@ except ImportError:
 
 # Import base class
 from project_management_automation.scripts.base.intelligent_automation_base import IntelligentAutomationBase
+from project_management_automation.utils.repo_inventory import get_repo_inventory
+from project_management_automation.utils.source_scanner import ScanRule, get_source_scanner
+from project_management_automation.utils.todo2_store import get_todo2_store
+from project_management_automation.utils.tool_executor import check_cancelled
+from project_management_automation.utils.tool_result import call_result
 
 logger = logging.getLogger(__name__)
 
+WISHLIST_EXTENSIONS = ('.py', '.js', '.ts', '.cpp', '.h', '.md')
+
+# TODO/FIXME lines with a wish indicator; the group is the stripped line
+WISHLIST_COMMENT_RULE = ScanRule(
+    'wishlist',
+    r'^(?=.*(?:todo|fixme))(?=.*(?:wish|want|would like|hope))\s*(.*?)\s*$',
+    re.IGNORECASE,
+)
+
 
 class SprintAutomation(IntelligentAutomationBase):
     """Sprint automation orchestrator."""
@@ -90,6 +104,7 @@ class SprintAutomation(IntelligentAutomationBase):
 
         iteration = 0
         while iteration < self.max_iterations:
+            check_cancelled()
             logger.info(f"Sprint iteration {iteration + 1}/{self.max_iterations}")
 
             # Step 1: Extract subtasks
@@ -150,15 +165,12 @@ class SprintAutomation(IntelligentAutomationBase):
                 pass
 
             # Fallback: Load tasks from file
-            todo2_path = self.project_root / '.todo2' / 'state.todo2.json'
-            if not todo2_path.exists():
+            store = get_todo2_store(self.project_root)
+            if not store.exists():
                 logger.warning("Todo2 state file not found, skipping subtask extraction")
                 return
 
-            with open(todo2_path) as f:
-                data = json.load(f)
-
-            todos = data.get('todos', [])
+            todos = store.get_tasks()
             subtasks_extracted = 0
 
             for task in todos:
@@ -227,7 +239,7 @@ class SprintAutomation(IntelligentAutomationBase):
         # 1. Documentation health
         try:
             from project_management_automation.tools.docs_health import check_documentation_health
-            docs_result = json.loads(check_documentation_health(create_tasks=False))
+            docs_result = call_result(check_documentation_health, create_tasks=False)
             if docs_result.get('success'):
                 results['documentation_health'] = docs_result.get('data', {})
         except Exception as e:
@@ -236,7 +248,7 @@ class SprintAutomation(IntelligentAutomationBase):
         # 2. Task alignment
         try:
             from project_management_automation.tools.todo2_alignment import analyze_todo2_alignment
-            alignment_result = json.loads(analyze_todo2_alignment(create_followup_tasks=True))
+            alignment_result = call_result(analyze_todo2_alignment, create_followup_tasks=True)
             if alignment_result.get('success'):
                 results['task_alignment'] = alignment_result.get('data', {})
         except Exception as e:
@@ -245,7 +257,7 @@ class SprintAutomation(IntelligentAutomationBase):
         # 3. Duplicate detection
         try:
             from project_management_automation.tools.duplicate_detection import detect_duplicate_tasks
-            dup_result = json.loads(detect_duplicate_tasks(auto_fix=True))
+            dup_result = call_result(detect_duplicate_tasks, auto_fix=True)
             if dup_result.get('success'):
                 results['duplicate_detection'] = dup_result.get('data', {})
         except Exception as e:
@@ -254,7 +266,7 @@ class SprintAutomation(IntelligentAutomationBase):
         # 4. Automation opportunities
         try:
             from project_management_automation.tools.automation_opportunities import find_automation_opportunities
-            auto_result = json.loads(find_automation_opportunities(min_value_score=0.8))
+            auto_result = call_result(find_automation_opportunities, min_value_score=0.8)
             if auto_result.get('success'):
                 results['automation_opportunities'] = auto_result.get('data', {})
         except Exception as e:
@@ -271,7 +283,7 @@ class SprintAutomation(IntelligentAutomationBase):
         # 1. Run tests
         try:
             from project_management_automation.tools.run_tests import run_tests
-            test_result = json.loads(run_tests(coverage=True))
+            test_result = call_result(run_tests, coverage=True)
             if test_result.get('success'):
                 results['test_execution'] = test_result.get('data', {})
         except Exception as e:
@@ -280,7 +292,7 @@ class SprintAutomation(IntelligentAutomationBase):
         # 2. Analyze coverage
         try:
             from project_management_automation.tools.test_coverage import analyze_test_coverage
-            coverage_result = json.loads(analyze_test_coverage(min_coverage=80))
+            coverage_result = call_result(analyze_test_coverage, min_coverage=80)
             if coverage_result.get('success'):
                 results['test_coverage'] = coverage_result.get('data', {})
         except Exception as e:
@@ -427,25 +439,18 @@ class SprintAutomation(IntelligentAutomationBase):
 
         try:
             # Search for TODO/FIXME comments with wish indicators
-            for ext in ['*.py', '*.js', '*.ts', '*.cpp', '*.h', '*.md']:
-                for file_path in self.project_root.rglob(ext):
-                    if file_path.is_file():
-                        try:
-                            content = file_path.read_text(errors='ignore')
-                            lines = content.split('\n')
-                            for i, line in enumerate(lines, 1):
-                                line_lower = line.lower()
-                                if ('todo' in line_lower or 'fixme' in line_lower) and \
-                                   any(word in line_lower for word in ['wish', 'want', 'would like', 'hope']):
-                                    items.append({
-                                        'type': 'code_comment',
-                                        'source': str(file_path.relative_to(self.project_root)),
-                                        'line': i,
-                                        'text': line.strip(),
-                                        'priority': 'medium'
-                                    })
-                        except Exception:
-                            continue
+            paths = get_repo_inventory(self.project_root).files(ext=WISHLIST_EXTENSIONS)
+            scanner = get_source_scanner(self.project_root)
+            for rel_path, matches in scanner.scan(paths, [WISHLIST_COMMENT_RULE]).items():
+                for match in matches:
+                    items.append({
+                        'type': 'code_comment',
+                        'source': rel_path,
+                        'line': match['line'],
+                        'text': match['groups'][0],
+                        'priority': 'medium'
+                    })
+            scanner.save()
         except Exception as e:
             logger.warning(f"Error parsing comment wishlist: {e}")
 
@@ -458,12 +463,9 @@ class SprintAutomation(IntelligentAutomationBase):
         contributions = []
 
         # Load tasks
-        todo2_path = self.project_root / '.todo2' / 'state.todo2.json'
-        if todo2_path.exists():
-            with open(todo2_path) as f:
-                data = json.load(f)
-
-            todos = data.get('todos', [])
+        store = get_todo2_store(self.project_root)
+        if store.exists():
+            todos = store.get_tasks()
 
             for task in todos:
                 name = task.get('name', '').lower()
@@ -513,15 +515,12 @@ class SprintAutomation(IntelligentAutomationBase):
         """Process background-capable tasks."""
         logger.info("Processing background tasks...")
 
-        # Load tasks
-        todo2_path = self.project_root / '.todo2' / 'state.todo2.json'
-        if not todo2_path.exists():
+        # Load tasks (private copy: statuses are updated in memory below)
+        store = get_todo2_store(self.project_root)
+        if not store.exists():
             return 0
 
-        with open(todo2_path) as f:
-            data = json.load(f)
-
-        todos = data.get('todos', [])
+        todos = store.load_state_for_update()['todos']
 
         # Filter background-capable tasks
         background_tasks = [t for t in todos if self._is_background_capable(t)]
@@ -589,19 +588,18 @@ class SprintAutomation(IntelligentAutomationBase):
         
         try:
             from project_management_automation.tools.auto_update_task_status import auto_update_task_status
-            import json
             
             # Call with dry_run=True for safety (only report, don't update by default)
             # Can be configured to auto-update if needed
-            result_json = auto_update_task_status(
+            result = call_result(
+                auto_update_task_status,
                 confidence_threshold=0.7,
                 auto_update=False,  # Don't auto-update in sprint automation by default
                 output_path=None,
                 codebase_path=str(self.project_root)
             )
             
-            if result_json:
-                result = json.loads(result_json)
+            if result:
                 if result.get('success') and result.get('data'):
                     data = result['data']
                     inferences_made = data.get('inferences_made', 0)
@@ -624,12 +622,9 @@ class SprintAutomation(IntelligentAutomationBase):
         blockers = []
 
         # Load tasks
-        todo2_path = self.project_root / '.todo2' / 'state.todo2.json'
-        if todo2_path.exists():
-            with open(todo2_path) as f:
-                data = json.load(f)
-
-            todos = data.get('todos', [])
+        store = get_todo2_store(self.project_root)
+        if store.exists():
+            todos = store.get_tasks()
 
             for task in todos:
                 if task.get('status') == 'Review':
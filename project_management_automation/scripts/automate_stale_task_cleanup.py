@@ -13,6 +13,7 @@ import json
 import logging
 import sys
 import time
+from contextlib import nullcontext
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -22,6 +23,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from project_management_automation.scripts.base.intelligent_automation_base import IntelligentAutomationBase
 from project_management_automation.utils import find_project_root
+from project_management_automation.utils.todo2_store import get_todo2_store
 
 logger = logging.getLogger(__name__)
 
@@ -82,79 +84,23 @@ class StaleTaskCleanupAutomation(IntelligentAutomationBase):
                     'duration_seconds': time.time() - start_time
                 }
             
-            with open(self.state_file) as f:
-                data = json.load(f)
-            
-            todos = data.get('todos', [])
-            logger.info(f"Found {len(todos)} total tasks")
-            
-            # Find stale "In Progress" tasks
-            now = datetime.now(timezone.utc)
-            stale_tasks = []
-            active_tasks = []
-            
-            for task in todos:
-                if task.get('status') != 'In Progress':
-                    continue
-                
-                last_modified_str = task.get('lastModified') or task.get('created')
-                if not last_modified_str:
-                    continue
-                
-                try:
-                    last_modified = datetime.fromisoformat(
-                        last_modified_str.replace('Z', '+00:00')
-                    )
-                    hours_since_update = (now - last_modified).total_seconds() / 3600.0
-                    
-                    task_info = {
-                        'task': task,
-                        'id': task.get('id', 'Unknown'),
-                        'name': task.get('name', 'Unknown'),
-                        'hours_since_update': hours_since_update,
-                        'last_modified': last_modified
-                    }
-                    
-                    if hours_since_update > self.stale_threshold_hours:
-                        stale_tasks.append(task_info)
-                    else:
-                        active_tasks.append(task_info)
-                        
-                except (ValueError, TypeError) as e:
-                    logger.debug(f"Could not parse timestamp for task {task.get('id')}: {e}")
-                    continue
-            
-            logger.info(f"Found {len(stale_tasks)} stale tasks and {len(active_tasks)} active tasks")
-            
-            # Move stale tasks back to "Todo"
-            if not self.dry_run and stale_tasks:
-                for task_info in stale_tasks:
-                    task = task_info['task']
-                    task['status'] = 'Todo'
-                    
-                    # Add change record
-                    if 'changes' not in task:
-                        task['changes'] = []
-                    task['changes'].append({
-                        'field': 'status',
-                        'oldValue': 'In Progress',
-                        'newValue': 'Todo',
-                        'timestamp': datetime.now(timezone.utc).isoformat(),
-                        'reason': f'Stale task cleanup (no update in {task_info["hours_since_update"]:.1f}h)'
-                    })
-                    
-                    self.moved_tasks.append({
-                        'id': task_info['id'],
-                        'name': task_info['name'],
-                        'hours_since_update': round(task_info['hours_since_update'], 1)
-                    })
-                
-                # Save updated tasks
-                with open(self.state_file, 'w') as f:
-                    json.dump(data, f, indent=2)
-                
-                logger.info(f"Moved {len(self.moved_tasks)} stale tasks back to Todo")
-            
+            # Hold the Todo2 write lock across the read-modify-write cycle so
+            # concurrent writers (daily DAG jobs, automation bookkeeping) are not lost
+            store = get_todo2_store(self.project_root)
+            with (store.write_lock() if not self.dry_run else nullcontext()):
+                data = store.load_state_for_update()
+                todos = data['todos']
+                logger.info(f"Found {len(todos)} total tasks")
+
+                stale_tasks, active_tasks = self._find_stale_tasks(todos)
+                logger.info(f"Found {len(stale_tasks)} stale tasks and {len(active_tasks)} active tasks")
+
+                # Move stale tasks back to "Todo"
+                if not self.dry_run and stale_tasks:
+                    self._move_to_todo(stale_tasks)
+                    store.save_state(data)
+                    logger.info(f"Moved {len(self.moved_tasks)} stale tasks back to Todo")
+
             # Prepare results
             self.active_tasks = [
                 {
@@ -189,6 +135,68 @@ class StaleTaskCleanupAutomation(IntelligentAutomationBase):
                 'duration_seconds': time.time() - start_time
             }
     
+    def _find_stale_tasks(self, todos: List[dict]) -> tuple:
+        """Split 'In Progress' tasks into stale and active ones by last update."""
+        now = datetime.now(timezone.utc)
+        stale_tasks = []
+        active_tasks = []
+
+        for task in todos:
+            if task.get('status') != 'In Progress':
+                continue
+
+            last_modified_str = task.get('lastModified') or task.get('created')
+            if not last_modified_str:
+                continue
+
+            try:
+                last_modified = datetime.fromisoformat(
+                    last_modified_str.replace('Z', '+00:00')
+                )
+                hours_since_update = (now - last_modified).total_seconds() / 3600.0
+
+                task_info = {
+                    'task': task,
+                    'id': task.get('id', 'Unknown'),
+                    'name': task.get('name', 'Unknown'),
+                    'hours_since_update': hours_since_update,
+                    'last_modified': last_modified
+                }
+
+                if hours_since_update > self.stale_threshold_hours:
+                    stale_tasks.append(task_info)
+                else:
+                    active_tasks.append(task_info)
+
+            except (ValueError, TypeError) as e:
+                logger.debug(f"Could not parse timestamp for task {task.get('id')}: {e}")
+                continue
+
+        return stale_tasks, active_tasks
+
+    def _move_to_todo(self, stale_tasks: List[dict]) -> None:
+        """Set stale tasks back to 'Todo', recording the change on each task."""
+        for task_info in stale_tasks:
+            task = task_info['task']
+            task['status'] = 'Todo'
+
+            # Add change record
+            if 'changes' not in task:
+                task['changes'] = []
+            task['changes'].append({
+                'field': 'status',
+                'oldValue': 'In Progress',
+                'newValue': 'Todo',
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'reason': f'Stale task cleanup (no update in {task_info["hours_since_update"]:.1f}h)'
+            })
+
+            self.moved_tasks.append({
+                'id': task_info['id'],
+                'name': task_info['name'],
+                'hours_since_update': round(task_info['hours_since_update'], 1)
+            })
+
     def get_summary(self) -> str:
         """Get human-readable summary."""
         if self.dry_run:
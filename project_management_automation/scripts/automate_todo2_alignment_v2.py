@@ -23,6 +23,8 @@ from typing import Optional
 # Project root will be passed to __init__
 # Import base class
 from project_management_automation.scripts.base.intelligent_automation_base import IntelligentAutomationBase
+from project_management_automation.utils.keyword_matcher import get_keyword_matcher
+from project_management_automation.utils.todo2_store import get_todo2_store
 from project_management_automation.utils.todo2_utils import (
     filter_tasks_by_project,
     get_repo_project_id,
@@ -31,6 +33,13 @@ from project_management_automation.utils.todo2_utils import (
 # Configure logging (will be configured after project_root is set)
 logger = logging.getLogger(__name__)
 
+# Phrases suggesting a task would add another MCP tool (matched literally)
+TOOL_CREATION_KEYWORDS = (
+    'new tool', 'create tool', 'add tool', 'implement tool', 'register tool',
+    'tool for', 'mcp tool', 'tool function', 'tool handler', 'tool endpoint',
+    '@mcp.tool', 'register.*tool', 'def.*tool', 'tool.*function'
+)
+
 
 class Todo2AlignmentAnalyzerV2(IntelligentAutomationBase):
     """Intelligent Todo2 alignment analyzer using base class."""
@@ -239,7 +248,7 @@ class Todo2AlignmentAnalyzerV2(IntelligentAutomationBase):
         Priority:
         1. Todo2 MCP server (via todo2_mcp_client)
         2. agentic-tools MCP format (with retry)
-        3. Legacy Todo2 format (with retry)
+        3. Legacy Todo2 format (shared Todo2Store snapshot)
         """
         from .base.mcp_client import load_json_with_retry
         from project_management_automation.utils.todo2_mcp_client import list_todos_mcp
@@ -275,10 +284,10 @@ class Todo2AlignmentAnalyzerV2(IntelligentAutomationBase):
             )
             return filtered
 
-        # Fall back to legacy Todo2 format with retry
-        data = load_json_with_retry(self.todo2_path, default=None)
-        if data is not None:
-            tasks = data.get('todos', [])
+        # Fall back to the legacy Todo2 state file (shared store)
+        store = get_todo2_store(self.project_root)
+        if store.exists():
+            tasks = store.get_tasks()
             filtered = filter_tasks_by_project(tasks, project_id, logger=logger)
             logger.info(
                 "Loaded %d tasks from legacy Todo2 format (%d matched project)",
@@ -312,10 +321,21 @@ class Todo2AlignmentAnalyzerV2(IntelligentAutomationBase):
             'tool_limit': tool_limit
         }
 
-        for task in tasks:
-            content = str(task.get('content', '')).lower()
-            long_desc = str(task.get('long_description', '')).lower()
-            tags = [tag.lower() for tag in task.get('tags', [])]
+        # One compiled pass over all task texts instead of one scan per keyword
+        task_texts = [
+            f"{str(task.get('content', '')).lower()} {str(task.get('long_description', '')).lower()} "
+            f"{' '.join(tag.lower() for tag in task.get('tags', []))}"
+            for task in tasks
+        ]
+        phase_matcher = get_keyword_matcher(
+            {phase_key: phase_info['keywords'] for phase_key, phase_info in self.strategy_phases.items()}
+        )
+        infrastructure_matcher = get_keyword_matcher(self.infrastructure_keywords)
+        tool_creation_matcher = get_keyword_matcher(TOOL_CREATION_KEYWORDS)
+        task_phases = phase_matcher.groups_batch(task_texts)
+        tasks_by_id = {t.get('id'): t for t in tasks}
+
+        for task, task_text, aligned_phases in zip(tasks, task_texts, task_phases):
             priority = task.get('priority', 'medium').lower()
             status = task.get('status', 'todo').lower()
             task_id = task.get('id', 'unknown')
@@ -335,16 +355,11 @@ class Todo2AlignmentAnalyzerV2(IntelligentAutomationBase):
                 analysis['by_status']['done'] += 1
 
             # Check alignment with strategy phases
-            task_text = f"{content} {long_desc} {' '.join(tags)}"
-            aligned_phases = []
-
-            for phase_key, phase_info in self.strategy_phases.items():
-                if any(keyword in task_text for keyword in phase_info['keywords']):
-                    aligned_phases.append(phase_key)
-                    analysis['by_phase'][phase_key]['total'] += 1
-                    if priority == 'high':
-                        analysis['by_phase'][phase_key]['high_priority'] += 1
-                    analysis['by_phase'][phase_key]['aligned'] += 1
+            for phase_key in aligned_phases:
+                analysis['by_phase'][phase_key]['total'] += 1
+                if priority == 'high':
+                    analysis['by_phase'][phase_key]['high_priority'] += 1
+                analysis['by_phase'][phase_key]['aligned'] += 1
 
             # Identify strategy-critical tasks
             if aligned_phases and priority == 'high':
@@ -359,7 +374,7 @@ class Todo2AlignmentAnalyzerV2(IntelligentAutomationBase):
             # Identify misaligned or infrastructure tasks
             if priority == 'high' and not aligned_phases:
                 # Use infrastructure keywords loaded from PROJECT_GOALS.md
-                if any(keyword in task_text for keyword in self.infrastructure_keywords):
+                if infrastructure_matcher.any(task_text):
                     analysis['infrastructure_tasks'].append({
                         'id': task_id,
                         'content': task.get('content', ''),
@@ -393,10 +408,9 @@ class Todo2AlignmentAnalyzerV2(IntelligentAutomationBase):
             # Check for blocked tasks
             dependencies = task.get('dependencies', [])
             if dependencies:
-                dep_tasks = {t.get('id'): t for t in tasks}
                 blocked = False
                 for dep_id in dependencies:
-                    dep_task = dep_tasks.get(dep_id)
+                    dep_task = tasks_by_id.get(dep_id)
                     if dep_task and dep_task.get('status', '').lower() not in ['done', 'completed']:
                         blocked = True
                         break
@@ -410,13 +424,7 @@ class Todo2AlignmentAnalyzerV2(IntelligentAutomationBase):
 
             # Check Tool Count Limit constraint (≤30 tools)
             # Detect tasks that would create new tools
-            tool_creation_keywords = [
-                'new tool', 'create tool', 'add tool', 'implement tool', 'register tool',
-                'tool for', 'mcp tool', 'tool function', 'tool handler', 'tool endpoint',
-                '@mcp.tool', 'register.*tool', 'def.*tool', 'tool.*function'
-            ]
-            task_text_lower = task_text.lower()
-            would_create_tool = any(keyword in task_text_lower for keyword in tool_creation_keywords)
+            would_create_tool = tool_creation_matcher.any(task_text)
             
             if would_create_tool and status not in ['done', 'completed']:
                 # Check if this would violate the constraint
@@ -14,10 +14,10 @@ Uses IntelligentAutomationBase for consistency with other automation tools.
 import argparse
 import json
 import logging
+import math
 import sys
 from collections import Counter, defaultdict
 from datetime import datetime
-from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Optional
 
@@ -25,6 +25,8 @@ from typing import Optional
 # Project root will be passed to __init__
 # Import base class
 from project_management_automation.scripts.base.intelligent_automation_base import IntelligentAutomationBase
+from project_management_automation.utils.near_duplicates import find_similar_pairs
+from project_management_automation.utils.todo2_store import get_todo2_store
 from project_management_automation.utils.todo2_utils import (
     filter_tasks_by_project,
     get_repo_project_id,
@@ -143,21 +145,16 @@ class Todo2DuplicateDetector(IntelligentAutomationBase):
         except Exception as e:
             logger.debug(f"Todo2 MCP not available: {e}, falling back to file access")
         
-        # Fallback to direct file access
-        try:
-            with open(self.todo2_path) as f:
-                data = json.load(f)
-            tasks = data.get('todos', [])
-            project_id = get_repo_project_id(self.project_root)
-            filtered = filter_tasks_by_project(tasks, project_id, logger=logger)
-            logger.info("Loaded %d tasks from file (%d matched project)", len(tasks), len(filtered))
-            return filtered
-        except FileNotFoundError:
+        # Fallback to the shared Todo2 store
+        store = get_todo2_store(self.project_root)
+        if not store.exists():
             logger.error(f"Todo2 state file not found: {self.todo2_path}")
             return []
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in Todo2 state file: {e}")
-            return []
+        tasks = store.get_tasks()
+        project_id = get_repo_project_id(self.project_root)
+        filtered = filter_tasks_by_project(tasks, project_id, logger=logger)
+        logger.info("Loaded %d tasks from file (%d matched project)", len(tasks), len(filtered))
+        return filtered
 
     def _detect_duplicate_ids(self, tasks: list[dict]):
         """Detect tasks with duplicate IDs (should never happen)."""
@@ -210,63 +207,45 @@ class Todo2DuplicateDetector(IntelligentAutomationBase):
 
     def _detect_similar_name_matches(self, tasks: list[dict]):
         """Detect tasks with similar names (fuzzy matching)."""
-        for i, task1 in enumerate(tasks):
-            name1 = task1.get('name', '').strip().lower()
-            if not name1 or len(name1) < 10:  # Skip very short names
-                continue
-
-            for task2 in tasks[i + 1:]:
-                name2 = task2.get('name', '').strip().lower()
-                if not name2 or task1['id'] == task2['id']:
-                    continue
-
-                similarity = SequenceMatcher(None, name1, name2).ratio()
-                if similarity >= self.similarity_threshold:
-                    self.duplicates['similar_name_matches'].append({
-                        'similarity': similarity,
-                        'tasks': [
-                            {
-                                'id': task1['id'],
-                                'name': task1.get('name', ''),
-                                'status': task1.get('status', 'unknown')
-                            },
-                            {
-                                'id': task2['id'],
-                                'name': task2.get('name', ''),
-                                'status': task2.get('status', 'unknown')
-                            }
-                        ]
-                    })
+        names = [task.get('name', '').strip().lower() for task in tasks]
+        self._record_similar_pairs('similar_name_matches', tasks, names, min_length=10)
 
     def _detect_similar_descriptions(self, tasks: list[dict]):
         """Detect tasks with similar long descriptions."""
-        for i, task1 in enumerate(tasks):
-            desc1 = task1.get('long_description', '').strip()
-            if not desc1 or len(desc1) < 50:  # Skip very short descriptions
+        descriptions = [task.get('long_description', '').strip() for task in tasks]
+        self._record_similar_pairs('similar_description_matches', tasks, descriptions, min_length=50)
+
+    def _record_similar_pairs(self, key: str, tasks: list[dict], texts: list[str], min_length: int):
+        """
+        Record task pairs whose texts reach the similarity threshold.
+
+        Uses the indexed near-duplicate search instead of comparing every pair.
+        The earlier task of a pair must have at least min_length characters
+        (very short texts are skipped).
+        """
+        threshold = self.similarity_threshold
+        # Shortest partner a min_length text can still reach the threshold with
+        partner_min = max(1, math.ceil(min_length * threshold / (2 - threshold))) if threshold > 0 else 1
+
+        for i, j, similarity in find_similar_pairs(texts, threshold, min_length=partner_min):
+            task1, task2 = tasks[i], tasks[j]
+            if len(texts[i]) < min_length or task1['id'] == task2['id']:
                 continue
-
-            for task2 in tasks[i + 1:]:
-                desc2 = task2.get('long_description', '').strip()
-                if not desc2 or task1['id'] == task2['id']:
-                    continue
-
-                similarity = SequenceMatcher(None, desc1, desc2).ratio()
-                if similarity >= self.similarity_threshold:
-                    self.duplicates['similar_description_matches'].append({
-                        'similarity': similarity,
-                        'tasks': [
-                            {
-                                'id': task1['id'],
-                                'name': task1.get('name', ''),
-                                'status': task1.get('status', 'unknown')
-                            },
-                            {
-                                'id': task2['id'],
-                                'name': task2.get('name', ''),
-                                'status': task2.get('status', 'unknown')
-                            }
-                        ]
-                    })
+            self.duplicates[key].append({
+                'similarity': similarity,
+                'tasks': [
+                    {
+                        'id': task1['id'],
+                        'name': task1.get('name', ''),
+                        'status': task1.get('status', 'unknown')
+                    },
+                    {
+                        'id': task2['id'],
+                        'name': task2.get('name', ''),
+                        'status': task2.get('status', 'unknown')
+                    }
+                ]
+            })
 
     def _detect_self_dependencies(self, tasks: list[dict]):
         """Detect tasks that depend on themselves (invalid)."""
@@ -288,10 +267,10 @@ class Todo2DuplicateDetector(IntelligentAutomationBase):
         tasks_to_remove = set()
         tasks_to_keep = {}  # Map: keep_id -> task dict
 
-        # Load current state
+        # Load current state (private copy: tasks are modified below)
+        store = get_todo2_store(self.project_root)
         try:
-            with open(self.todo2_path) as f:
-                state = json.load(f)
+            state = store.load_state_for_update()
         except Exception as e:
             logger.error(f"Failed to load Todo2 state: {e}")
             return {'applied': False, 'tasks_removed': 0, 'tasks_merged': 0, 'dependencies_updated': 0}
@@ -421,13 +400,18 @@ class Todo2DuplicateDetector(IntelligentAutomationBase):
         except Exception as e:
             logger.debug(f"Todo2 MCP not available: {e}, falling back to file access")
             
-            # Fallback to direct file access
-            state['todos'] = current_tasks
-            state['lastModified'] = datetime.now().isoformat()
-            
+            # Fallback to the state file: re-read under the write lock and apply
+            # the changes by ID, keeping tasks other writers added meanwhile
+            updated_tasks = {t['id']: t for t in current_tasks}
             try:
-                with open(self.todo2_path, 'w') as f:
-                    json.dump(state, f, indent=2)
+                with store.write_lock():
+                    state = store.load_state_for_update()
+                    state['todos'] = [
+                        updated_tasks.get(t.get('id'), t)
+                        for t in state['todos'] if t.get('id') not in tasks_to_remove
+                    ]
+                    state['lastModified'] = datetime.now().isoformat()
+                    store.save_state(state)
                 logger.info(f"Todo2 state updated: {tasks_removed} tasks removed")
                 return {
                     'applied': True,
@@ -25,6 +25,8 @@ from typing import Optional
 # Project root will be passed to __init__
 # Import base class
 from project_management_automation.scripts.base.intelligent_automation_base import IntelligentAutomationBase
+from project_management_automation.utils.near_duplicates import match_similar
+from project_management_automation.utils.todo2_store import get_todo2_store
 
 # Configure logging (will be configured after project_root is set)
 logger = logging.getLogger(__name__)
@@ -33,6 +35,9 @@ logger = logging.getLogger(__name__)
 class TodoSyncAutomation(IntelligentAutomationBase):
     """Intelligent TODO synchronization using base class."""
 
+    # Shared TODO references inside Todo2 tasks: "TODO 12" or "#12"
+    _ID_REF_PATTERN = re.compile(r'(?:TODO |#)(\d+)')
+
     def __init__(self, config: dict, project_root: Optional[Path] = None):
         from project_management_automation.utils import find_project_root
         if project_root is None:
@@ -164,51 +169,61 @@ class TodoSyncAutomation(IntelligentAutomationBase):
         except Exception as e:
             logger.debug(f"Todo2 MCP not available: {e}, falling back to file access")
         
-        # Fallback to direct file access
-        if not self.todo2_path.exists():
+        # Fallback to the shared Todo2 store
+        store = get_todo2_store(self.project_root)
+        if not store.exists():
             logger.warning(f"Todo2 file not found: {self.todo2_path}")
             return []
 
         try:
-            with open(self.todo2_path) as f:
-                data = json.load(f)
-                tasks = data.get('todos', [])
-
-                # Add source marker
-                for task in tasks:
-                    task['source'] = 'todo2'
-
-                return tasks
-        except FileNotFoundError:
-            logger.info("No Todo2 state file found - no tasks to sync")
-            return []
+            # Add source marker (on copies: store snapshots are shared)
+            return [{**task, 'source': 'todo2'} for task in store.get_tasks()]
         except Exception as e:
             logger.warning(f"Could not load Todo2 tasks: {e}")
             return []
 
     def _find_matches(self, shared_todos: list[dict], todo2_tasks: list[dict]) -> list[dict]:
         """Find matching tasks between systems."""
-        matches = []
+        # Match by description similarity (indexed word-overlap search)
+        similar: dict[int, dict[int, float]] = {}
+        for s, t, similarity in match_similar(
+            [shared['description'] for shared in shared_todos],
+            [todo2.get('name', '') or todo2.get('content', '') for todo2 in todo2_tasks],
+            threshold=0.7,
+        ):
+            if similarity > 0.7:
+                similar.setdefault(s, {})[t] = similarity
+
+        # Match by explicit ID reference ("TODO 12" or "#12" in the Todo2 task)
+        referenced_by: dict[str, list[int]] = {}
+        for t, todo2 in enumerate(todo2_tasks):
+            todo2_desc = str(todo2.get('long_description', '')) + ' ' + str(todo2.get('name', ''))
+            refs = set()
+            for match in self._ID_REF_PATTERN.finditer(todo2_desc):
+                digits = match.group(1)
+                # Substring semantics: "#12" also references TODO 1
+                refs.update(digits[:k] for k in range(1, len(digits) + 1))
+            for ref in refs:
+                referenced_by.setdefault(ref, []).append(t)
 
-        for shared in shared_todos:
-            for todo2 in todo2_tasks:
-                # Match by description similarity or explicit ID reference
-                similarity = self._calculate_similarity(
-                    shared['description'],
-                    todo2.get('name', '') or todo2.get('content', '')
-                )
-
-                # Check if Todo2 task references shared TODO ID
-                todo2_desc = str(todo2.get('long_description', '')) + ' ' + str(todo2.get('name', ''))
-                has_id_ref = f"TODO {shared['id']}" in todo2_desc or f"#{shared['id']}" in todo2_desc
-
-                if similarity > 0.7 or has_id_ref:
-                    matches.append({
-                        'shared': shared,
-                        'todo2': todo2,
-                        'similarity': similarity,
-                        'has_id_ref': has_id_ref
-                    })
+        matches = []
+        for s, shared in enumerate(shared_todos):
+            id_refs = set(referenced_by.get(shared['id'], ()))
+            similar_tasks = similar.get(s, {})
+            for t in sorted(id_refs.union(similar_tasks)):
+                todo2 = todo2_tasks[t]
+                similarity = similar_tasks.get(t)
+                if similarity is None:
+                    similarity = self._calculate_similarity(
+                        shared['description'],
+                        todo2.get('name', '') or todo2.get('content', '')
+                    )
+                matches.append({
+                    'shared': shared,
+                    'todo2': todo2,
+                    'similarity': similarity,
+                    'has_id_ref': t in id_refs
+                })
 
         return matches
 
@@ -377,18 +392,18 @@ class TodoSyncAutomation(IntelligentAutomationBase):
             logger.debug(f"Todo2 MCP not available: {e}, falling back to file access")
         
         # Fallback to direct file access
+        store = get_todo2_store(self.project_root)
         try:
-            with open(self.todo2_path) as f:
-                data = json.load(f)
+            with store.write_lock():
+                data = store.load_state_for_update()
 
-            for task in data.get('todos', []):
-                if task.get('id') == todo2_id:
-                    task['status'] = new_status
-                    task['lastModified'] = datetime.now(timezone.utc).isoformat()
-                    break
+                for task in data['todos']:
+                    if task.get('id') == todo2_id:
+                        task['status'] = new_status
+                        task['lastModified'] = datetime.now(timezone.utc).isoformat()
+                        break
 
-            with open(self.todo2_path, 'w') as f:
-                json.dump(data, f, indent=2)
+                store.save_state(data)
 
             return True
         except Exception as e:
@@ -430,33 +445,32 @@ class TodoSyncAutomation(IntelligentAutomationBase):
             logger.debug(f"Todo2 MCP not available: {e}, falling back to file access")
         
         # Fallback to direct file access
+        store = get_todo2_store(self.project_root)
         try:
-            with open(self.todo2_path) as f:
-                data = json.load(f)
-
-            # Generate new Todo2 ID
-            existing_ids = [t.get('id', '') for t in data.get('todos', [])]
-            todo2_id = f"SHARED-{shared['id']}"
-            if todo2_id in existing_ids:
-                todo2_id = f"SHARED-{shared['id']}-{datetime.now().strftime('%Y%m%d')}"
-
-            new_task = {
-                'id': todo2_id,
-                'name': task_name,
-                'long_description': task_description,
-                'status': task_status,
-                'created': datetime.now(timezone.utc).isoformat(),
-                'lastModified': datetime.now(timezone.utc).isoformat(),
-                'priority': 'medium',
-                'tags': task_tags
-            }
+            with store.write_lock():
+                data = store.load_state_for_update()
+
+                # Generate new Todo2 ID
+                existing_ids = [t.get('id', '') for t in data['todos']]
+                todo2_id = f"SHARED-{shared['id']}"
+                if todo2_id in existing_ids:
+                    todo2_id = f"SHARED-{shared['id']}-{datetime.now().strftime('%Y%m%d')}"
 
-            data.setdefault('todos', []).append(new_task)
+                new_task = {
+                    'id': todo2_id,
+                    'name': task_name,
+                    'long_description': task_description,
+                    'status': task_status,
+                    'created': datetime.now(timezone.utc).isoformat(),
+                    'lastModified': datetime.now(timezone.utc).isoformat(),
+                    'priority': 'medium',
+                    'tags': task_tags
+                }
 
-            with open(self.todo2_path, 'w') as f:
-                json.dump(data, f, indent=2)
+                data['todos'].append(new_task)
+                store.save_state(data)
 
-            return new_task
+            return dict(new_task)
         except Exception as e:
             logger.error(f"Error creating Todo2 task from shared TODO: {e}")
             return {}
@@ -11,14 +11,19 @@ This base class integrates:
 All automation scripts should inherit from this class.
 """
 
+import contextvars
 import json
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from project_management_automation.utils.dependency_graph import DependencyGraph
 from project_management_automation.utils.logging_config import configure_logging
+from project_management_automation.utils.todo2_store import get_todo2_store
+from project_management_automation.utils.tool_executor import ToolCancelledError, check_cancelled
 from project_management_automation.utils.todo2_utils import (
     annotate_task_project,
     get_repo_project_id,
@@ -38,6 +43,26 @@ except ImportError:
 # Project root detection - will be set by subclasses or tools
 project_root = None
 
+# Default for config['track_in_todo2'] in the current context (see todo2_tracking())
+_track_in_todo2: contextvars.ContextVar[bool] = contextvars.ContextVar("track_in_todo2", default=True)
+
+
+@contextmanager
+def todo2_tracking(enabled: bool):
+    """
+    Turn Todo2 bookkeeping on or off for automations run in this context.
+
+    With tracking off, run() neither creates nor updates its "Automation: ..."
+    task and stores nothing in Todo2, so tools can be re-run in the
+    background without touching .todo2/state.todo2.json. Follow-up tasks
+    hang off the tracking task and are skipped too.
+    """
+    token = _track_in_todo2.set(enabled)
+    try:
+        yield
+    finally:
+        _track_in_todo2.reset(token)
+
 
 class IntelligentAutomationBase(ABC):
     """Base class for intelligent automation scripts."""
@@ -67,6 +92,8 @@ class IntelligentAutomationBase(ABC):
         self.networkx_graph = None
 
         self.project_id = get_repo_project_id(self.project_root)
+        # Todo2 bookkeeping (tracking task, stored results, follow-ups)
+        self.track_in_todo2 = config.get('track_in_todo2', _track_in_todo2.get())
 
         # Results storage
         self.results = {
@@ -79,42 +106,58 @@ class IntelligentAutomationBase(ABC):
         }
 
     def run(self) -> dict:
-        """Main execution method - follows intelligent automation pattern."""
+        """
+        Main execution method - follows intelligent automation pattern.
+
+        Checks for cancellation of the calling tool request between phases.
+        """
         logger.info(f"Starting intelligent automation: {self.automation_name}")
 
         try:
             # Step 1: Use Tractatus Thinking to understand structure
+            check_cancelled()
             self._tractatus_analysis()
 
             # Step 2: Use Sequential Thinking to plan workflow
+            check_cancelled()
             self._sequential_planning()
 
             # Step 3: Create Todo2 task for tracking
-            self._create_todo2_task()
+            check_cancelled()
+            if self.track_in_todo2:
+                self._create_todo2_task()
 
             # Step 4: Use NetworkX for dependency analysis (if applicable)
+            check_cancelled()
             self._networkx_analysis()
 
             # Step 5: Execute analysis (implemented by subclasses)
+            check_cancelled()
             analysis_results = self._execute_analysis()
 
             # Store analysis results for tool wrappers to access
             self.results['results'] = analysis_results
 
             # Step 6: Generate insights using Tractatus
+            check_cancelled()
             insights = self._generate_insights(analysis_results)
 
             # Step 7: Store results in Todo2
-            self._store_todo2_results(analysis_results, insights)
+            check_cancelled()
+            if self.track_in_todo2:
+                self._store_todo2_results(analysis_results, insights)
 
             # Step 8: Create follow-up tasks
+            check_cancelled()
             self._create_followup_tasks(analysis_results)
 
             # Step 9: Generate report
+            check_cancelled()
             report = self._generate_report(analysis_results, insights)
 
             # Step 10: Update Todo2 task
-            self._update_todo2_complete()
+            if self.track_in_todo2:
+                self._update_todo2_complete()
 
             self.results['status'] = 'success'
             self.results['report'] = report
@@ -122,6 +165,13 @@ class IntelligentAutomationBase(ABC):
             logger.info(f"Intelligent automation completed: {self.automation_name}")
             return self.results
 
+        except ToolCancelledError as e:
+            logger.info(f"Intelligent automation cancelled: {self.automation_name}")
+            self.results['status'] = 'cancelled'
+            self.results['error'] = str(e)
+            self._update_todo2_error(e)
+            raise
+
         except Exception as e:
             logger.error(f"Error in intelligent automation: {e}", exc_info=True)
             self.results['status'] = 'error'
@@ -205,68 +255,66 @@ class IntelligentAutomationBase(ABC):
 
         try:
             # Load Todo2 state
-            todo2_path = self.project_root / '.todo2' / 'state.todo2.json'
-            if todo2_path.exists():
-                with open(todo2_path) as f:
-                    todo2_data = json.load(f)
-
-                task_name = f"Automation: {self.automation_name}"
-
-                # Check for existing task with same name
-                existing_tasks = [
-                    t for t in todo2_data.get('todos', [])
-                    if t.get('name') == task_name
-                ]
-
-                # Look for reusable task (in_progress or recent todo)
-                reusable_task = None
-                for t in existing_tasks:
-                    if t.get('status') in ('in_progress', 'todo'):
-                        reusable_task = t
-                        break
-
-                if reusable_task:
-                    # Reuse existing task
-                    from project_management_automation.utils.todo2_utils import normalize_status_to_title_case
-                    reusable_task['status'] = normalize_status_to_title_case('in_progress')
-                    reusable_task['lastModified'] = datetime.now().isoformat()
-                    annotate_task_project(reusable_task, self.project_id)
-                    self.todo2_task = reusable_task
-                    logger.info(f"Reusing Todo2 task: {reusable_task['id']}")
-
-                    # Save updated state
-                    with open(todo2_path, 'w') as f:
-                        json.dump(todo2_data, f, indent=2)
-                    return
+            store = get_todo2_store(self.project_root)
+            if store.exists():
+                with store.write_lock():
+                    todo2_data = store.load_state_for_update()
+
+                    task_name = f"Automation: {self.automation_name}"
+
+                    # Check for existing task with same name
+                    existing_tasks = [
+                        t for t in todo2_data.get('todos', [])
+                        if t.get('name') == task_name
+                    ]
+
+                    # Look for reusable task (in_progress or recent todo)
+                    reusable_task = None
+                    for t in existing_tasks:
+                        if t.get('status') in ('in_progress', 'todo'):
+                            reusable_task = t
+                            break
+
+                    if reusable_task:
+                        # Reuse existing task
+                        from project_management_automation.utils.todo2_utils import normalize_status_to_title_case
+                        reusable_task['status'] = normalize_status_to_title_case('in_progress')
+                        reusable_task['lastModified'] = datetime.now().isoformat()
+                        annotate_task_project(reusable_task, self.project_id)
+                        self.todo2_task = reusable_task
+                        logger.info(f"Reusing Todo2 task: {reusable_task['id']}")
 
-                # Create new task with unique ID (include microseconds + counter)
-                import random
-                unique_suffix = f"{datetime.now().strftime('%f')[:4]}{random.randint(10, 99)}"
-                task_id = f"AUTO-{datetime.now().strftime('%Y%m%d%H%M%S')}-{unique_suffix}"
+                        # Save updated state
+                        store.save_state(todo2_data)
+                        return
 
-                task = annotate_task_project({
-                    'id': task_id,
-                    'name': task_name,
-                    'content': f"Automated {self.automation_name} execution",
-                    'status': 'in_progress',
-                    'priority': 'medium',
-                    'tags': ['automation', self.automation_name.lower().replace(' ', '-')],
-                    'created': datetime.now().isoformat(),
-                    'lastModified': datetime.now().isoformat(),
-                    'dependencies': []
-                }, self.project_id)
-
-                if 'todos' not in todo2_data:
-                    todo2_data['todos'] = []
-
-                todo2_data['todos'].append(task)
-
-                # Save back
-                with open(todo2_path, 'w') as f:
-                    json.dump(todo2_data, f, indent=2)
-
-                self.todo2_task = task
-                logger.info(f"Todo2 task created: {task_id}")
+                    # Create new task with unique ID (include microseconds + counter)
+                    import random
+                    unique_suffix = f"{datetime.now().strftime('%f')[:4]}{random.randint(10, 99)}"
+                    task_id = f"AUTO-{datetime.now().strftime('%Y%m%d%H%M%S')}-{unique_suffix}"
+
+                    task = annotate_task_project({
+                        'id': task_id,
+                        'name': task_name,
+                        'content': f"Automated {self.automation_name} execution",
+                        'status': 'in_progress',
+                        'priority': 'medium',
+                        'tags': ['automation', self.automation_name.lower().replace(' ', '-')],
+                        'created': datetime.now().isoformat(),
+                        'lastModified': datetime.now().isoformat(),
+                        'dependencies': []
+                    }, self.project_id)
+
+                    if 'todos' not in todo2_data:
+                        todo2_data['todos'] = []
+
+                    todo2_data['todos'].append(task)
+
+                    # Save back
+                    store.save_state(todo2_data)
+
+                    self.todo2_task = task
+                    logger.info(f"Todo2 task created: {task_id}")
             else:
                 logger.warning("Todo2 state file not found, skipping task creation")
         except Exception as e:
@@ -298,7 +346,8 @@ class IntelligentAutomationBase(ABC):
                 # Find strongly connected components if not DAG
                 if isinstance(self.networkx_graph, nx.DiGraph) and not analysis['is_dag']:
                     try:
-                        cycles = list(nx.simple_cycles(self.networkx_graph))
+                        # One representative cycle per component (Tarjan SCC, linear time)
+                        cycles = DependencyGraph.from_networkx(self.networkx_graph).cycles()
                         analysis['cycles'] = len(cycles)
                         analysis['cycle_details'] = cycles[:5]  # First 5 cycles
                     except Exception:
@@ -319,35 +368,34 @@ class IntelligentAutomationBase(ABC):
             return
 
         try:
-            todo2_path = self.project_root / '.todo2' / 'state.todo2.json'
-            if todo2_path.exists():
-                with open(todo2_path) as f:
-                    todo2_data = json.load(f)
-
-                # Find task
-                for task in todo2_data.get('todos', []):
-                    if task['id'] == self.todo2_task['id']:
-                        # Add result comment
-                        if 'comments' not in task:
-                            task['comments'] = []
-
-                        result_comment = {
-                            'id': f"{task['id']}-C-{len(task['comments']) + 1}",
-                            'todoId': task['id'],
-                            'type': 'result',
-                            'content': f"**Automation Results:**\n\n{insights}\n\n**Key Findings:**\n{self._format_findings(analysis_results)}",
-                            'created': datetime.now().isoformat(),
-                            'lastModified': datetime.now().isoformat()
-                        }
-
-                        task['comments'].append(result_comment)
-                        break
-
-                # Save back
-                with open(todo2_path, 'w') as f:
-                    json.dump(todo2_data, f, indent=2)
-
-                logger.info("Results stored in Todo2")
+            store = get_todo2_store(self.project_root)
+            if store.exists():
+                with store.write_lock():
+                    todo2_data = store.load_state_for_update()
+
+                    # Find task
+                    for task in todo2_data.get('todos', []):
+                        if task['id'] == self.todo2_task['id']:
+                            # Add result comment
+                            if 'comments' not in task:
+                                task['comments'] = []
+
+                            result_comment = {
+                                'id': f"{task['id']}-C-{len(task['comments']) + 1}",
+                                'todoId': task['id'],
+                                'type': 'result',
+                                'content': f"**Automation Results:**\n\n{insights}\n\n**Key Findings:**\n{self._format_findings(analysis_results)}",
+                                'created': datetime.now().isoformat(),
+                                'lastModified': datetime.now().isoformat()
+                            }
+
+                            task['comments'].append(result_comment)
+                            break
+
+                    # Save back
+                    store.save_state(todo2_data)
+
+                    logger.info("Results stored in Todo2")
         except Exception as e:
             logger.warning(f"Failed to store Todo2 results: {e}")
 
@@ -401,61 +449,60 @@ class IntelligentAutomationBase(ABC):
                     return
             
             # Fallback to direct file access
-            todo2_path = self.project_root / '.todo2' / 'state.todo2.json'
-            if todo2_path.exists():
-                with open(todo2_path) as f:
-                    todo2_data = json.load(f)
-
-                # Get existing task names for duplicate checking
-                existing_names = {
-                    t.get('name') for t in todo2_data.get('todos', [])
-                }
-
-                created_count = 0
-                skipped_count = 0
-
-                for followup in followup_tasks:
-                    task_name = followup['name']
+            store = get_todo2_store(self.project_root)
+            if store.exists():
+                with store.write_lock():
+                    todo2_data = store.load_state_for_update()
+
+                    # Get existing task names for duplicate checking
+                    existing_names = {
+                        t.get('name') for t in todo2_data.get('todos', [])
+                    }
 
-                    # Skip if task with same name already exists
-                    if task_name in existing_names:
-                        logger.debug(f"Skipping duplicate follow-up task: {task_name}")
-                        skipped_count += 1
-                        continue
+                    created_count = 0
+                    skipped_count = 0
+
+                    for followup in followup_tasks:
+                        task_name = followup['name']
+
+                        # Skip if task with same name already exists
+                        if task_name in existing_names:
+                            logger.debug(f"Skipping duplicate follow-up task: {task_name}")
+                            skipped_count += 1
+                            continue
+
+                        # Create unique ID with random suffix
+                        import random
+                        unique_suffix = f"{datetime.now().strftime('%f')[:4]}{random.randint(10, 99)}"
+                        task_id = f"T-{datetime.now().strftime('%Y%m%d%H%M%S')}-{unique_suffix}"
+
+                        task = annotate_task_project({
+                            'id': task_id,
+                            'name': task_name,
+                            'content': followup.get('description', task_name),
+                            'status': 'todo',
+                            'priority': followup.get('priority', 'medium'),
+                            'tags': followup.get('tags', ['automation', 'followup']),
+                            'dependencies': [self.todo2_task['id']] if self.todo2_task else [],
+                            'created': datetime.now().isoformat(),
+                            'lastModified': datetime.now().isoformat()
+                        }, self.project_id)
 
-                    # Create unique ID with random suffix
-                    import random
-                    unique_suffix = f"{datetime.now().strftime('%f')[:4]}{random.randint(10, 99)}"
-                    task_id = f"T-{datetime.now().strftime('%Y%m%d%H%M%S')}-{unique_suffix}"
+                        if 'todos' not in todo2_data:
+                            todo2_data['todos'] = []
 
-                    task = annotate_task_project({
-                        'id': task_id,
-                        'name': task_name,
-                        'content': followup.get('description', task_name),
-                        'status': 'todo',
-                        'priority': followup.get('priority', 'medium'),
-                        'tags': followup.get('tags', ['automation', 'followup']),
-                        'dependencies': [self.todo2_task['id']] if self.todo2_task else [],
-                        'created': datetime.now().isoformat(),
-                        'lastModified': datetime.now().isoformat()
-                    }, self.project_id)
+                        todo2_data['todos'].append(task)
+                        existing_names.add(task_name)  # Track newly created
+                        self.results['followup_tasks'].append(task['id'])
+                        created_count += 1
 
-                    if 'todos' not in todo2_data:
-                        todo2_data['todos'] = []
+                    # Save back
+                    store.save_state(todo2_data)
 
-                    todo2_data['todos'].append(task)
-                    existing_names.add(task_name)  # Track newly created
-                    self.results['followup_tasks'].append(task['id'])
-                    created_count += 1
-
-                # Save back
-                with open(todo2_path, 'w') as f:
-                    json.dump(todo2_data, f, indent=2)
-
-                if created_count > 0:
-                    logger.info(f"Created {created_count} follow-up tasks (skipped {skipped_count} duplicates)")
-                elif skipped_count > 0:
-                    logger.info(f"All {skipped_count} follow-up tasks already exist")
+                    if created_count > 0:
+                        logger.info(f"Created {created_count} follow-up tasks (skipped {skipped_count} duplicates)")
+                    elif skipped_count > 0:
+                        logger.info(f"All {skipped_count} follow-up tasks already exist")
         except Exception as e:
             logger.warning(f"Failed to create follow-up tasks: {e}")
 
@@ -465,22 +512,21 @@ class IntelligentAutomationBase(ABC):
             return
 
         try:
-            todo2_path = self.project_root / '.todo2' / 'state.todo2.json'
-            if todo2_path.exists():
-                with open(todo2_path) as f:
-                    todo2_data = json.load(f)
-
-                from project_management_automation.utils.todo2_utils import normalize_status_to_title_case
-                for task in todo2_data.get('todos', []):
-                    if task['id'] == self.todo2_task['id']:
-                        task['status'] = normalize_status_to_title_case('Done')
-                        task['lastModified'] = datetime.now().isoformat()
-                        break
-
-                with open(todo2_path, 'w') as f:
-                    json.dump(todo2_data, f, indent=2)
-
-                logger.info("Todo2 task marked as complete")
+            store = get_todo2_store(self.project_root)
+            if store.exists():
+                with store.write_lock():
+                    todo2_data = store.load_state_for_update()
+
+                    from project_management_automation.utils.todo2_utils import normalize_status_to_title_case
+                    for task in todo2_data.get('todos', []):
+                        if task['id'] == self.todo2_task['id']:
+                            task['status'] = normalize_status_to_title_case('Done')
+                            task['lastModified'] = datetime.now().isoformat()
+                            break
+
+                    store.save_state(todo2_data)
+
+                    logger.info("Todo2 task marked as complete")
         except Exception as e:
             logger.warning(f"Failed to update Todo2 task: {e}")
 
@@ -490,34 +536,33 @@ class IntelligentAutomationBase(ABC):
             return
 
         try:
-            todo2_path = self.project_root / '.todo2' / 'state.todo2.json'
-            if todo2_path.exists():
-                with open(todo2_path) as f:
-                    todo2_data = json.load(f)
-
-                for task in todo2_data.get('todos', []):
-                    if task['id'] == self.todo2_task['id']:
-                        from project_management_automation.utils.todo2_utils import normalize_status_to_title_case
-                        task['status'] = normalize_status_to_title_case('todo')
-                        task['lastModified'] = datetime.now().isoformat()
-
-                        if 'comments' not in task:
-                            task['comments'] = []
-
-                        error_comment = {
-                            'id': f"{task['id']}-C-{len(task['comments']) + 1}",
-                            'todoId': task['id'],
-                            'type': 'note',
-                            'content': f"**Error:** {str(error)}",
-                            'created': datetime.now().isoformat(),
-                            'lastModified': datetime.now().isoformat()
-                        }
-
-                        task['comments'].append(error_comment)
-                        break
-
-                with open(todo2_path, 'w') as f:
-                    json.dump(todo2_data, f, indent=2)
+            store = get_todo2_store(self.project_root)
+            if store.exists():
+                with store.write_lock():
+                    todo2_data = store.load_state_for_update()
+
+                    for task in todo2_data.get('todos', []):
+                        if task['id'] == self.todo2_task['id']:
+                            from project_management_automation.utils.todo2_utils import normalize_status_to_title_case
+                            task['status'] = normalize_status_to_title_case('todo')
+                            task['lastModified'] = datetime.now().isoformat()
+
+                            if 'comments' not in task:
+                                task['comments'] = []
+
+                            error_comment = {
+                                'id': f"{task['id']}-C-{len(task['comments']) + 1}",
+                                'todoId': task['id'],
+                                'type': 'note',
+                                'content': f"**Error:** {str(error)}",
+                                'created': datetime.now().isoformat(),
+                                'lastModified': datetime.now().isoformat()
+                            }
+
+                            task['comments'].append(error_comment)
+                            break
+
+                    store.save_state(todo2_data)
         except Exception as e:
             logger.warning(f"Failed to update Todo2 task with error: {e}")
 
@@ -588,23 +633,8 @@ class IntelligentAutomationBase(ABC):
             if not isinstance(self.networkx_graph, nx.DiGraph):
                 return []
 
-            # Find longest path (critical path)
-            sources = [n for n in self.networkx_graph.nodes() if self.networkx_graph.in_degree(n) == 0]
-            sinks = [n for n in self.networkx_graph.nodes() if self.networkx_graph.out_degree(n) == 0]
-
-            longest_path = []
-            for source in sources:
-                for sink in sinks:
-                    try:
-                        paths = list(nx.all_simple_paths(self.networkx_graph, source, sink))
-                        if paths:
-                            longest = max(paths, key=len)
-                            if len(longest) > len(longest_path):
-                                longest_path = longest
-                    except (nx.NetworkXNoPath, nx.NetworkXError):
-                        continue
-
-            return longest_path
+            # Find longest path (critical path) with DP over the topological order
+            return DependencyGraph.from_networkx(self.networkx_graph).longest_path()
         except Exception as e:
             logger.warning(f"Critical path analysis failed: {e}")
             return []
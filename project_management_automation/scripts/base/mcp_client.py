@@ -7,12 +7,15 @@ Uses connection pooling to reuse sessions across multiple calls for better perfo
 """
 
 import asyncio
+import atexit
+import concurrent.futures
 import json
 import logging
+import threading
 import time
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, AsyncContextManager, Dict, List, Optional, Tuple
+from typing import Any, AsyncContextManager, Coroutine, Dict, List, Optional, Tuple, TypeVar
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,13 @@ RETRY_DELAY = 0.5  # Base delay in seconds (exponential backoff)
 # Connection pool configuration
 SESSION_TIMEOUT = 300  # 5 minutes - close idle sessions
 MAX_SESSION_AGE = 3600  # 1 hour - maximum session lifetime
+HEALTH_CHECK_INTERVAL = 60  # Ping sessions unused for this long before reuse
+HEALTH_CHECK_TIMEOUT = 5
+REAP_INTERVAL = 60  # How often the session loop closes idle sessions
+CLOSE_TIMEOUT = 5
+SYNC_CALL_TIMEOUT = 300  # Maximum wait for a synchronous MCP call
+
+T = TypeVar('T')
 
 # Try to import MCP client library
 try:
@@ -44,12 +54,17 @@ class MCPSessionPool:
     
     Maintains reusable sessions to avoid the overhead of creating new processes
     for each tool call. Sessions are reused across multiple calls and automatically
-    recreated on errors or after timeout.
+    recreated on errors, failed health checks or after timeout.
+
+    Sessions are bound to the event loop that created them, so pools are kept
+    per (loop, server). Synchronous callers should go through run_mcp_sync(),
+    which runs every call on one long-lived loop so sessions survive between calls.
     """
     
     def __init__(self):
-        self._pools: Dict[str, "_ServerPool"] = {}
+        self._pools: Dict[Tuple[int, str], "_ServerPool"] = {}
         self._lock = asyncio.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
     
     def get_session(
         self, 
@@ -66,116 +81,233 @@ class MCPSessionPool:
         Returns:
             Async context manager that yields a ClientSession
         """
-        # Create pool entry if it doesn't exist (synchronously)
-        # The actual async locking happens inside _ServerPool.get_session()
-        if server_name not in self._pools:
-            self._pools[server_name] = _ServerPool(server_name, server_params)
-        # Return the async context manager directly
-        return self._pools[server_name].get_session()
+        loop = asyncio.get_running_loop()
+        key = (id(loop), server_name)
+        pool = self._pools.get(key)
+        # A closed loop's id can be reused by a new loop
+        if pool is None or pool.loop is not loop:
+            stats = self._stats.setdefault(server_name, _new_server_stats())
+            pool = _ServerPool(server_name, server_params, loop, stats)
+            self._pools[key] = pool
+        else:
+            pool.server_params = server_params
+        return pool.get_session()
+    
+    def _loop_pools(self) -> List["_ServerPool"]:
+        """Pools bound to the running loop (others cannot be awaited from here)."""
+        loop = asyncio.get_running_loop()
+        return [pool for pool in self._pools.values() if pool.loop is loop]
+    
+    async def invalidate(self, server_name: str):
+        """Close the session for a server so the next call starts a fresh one."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.pop((id(loop), server_name), None)
+        if pool is not None:
+            await pool.close()
+    
+    async def reap_idle(self) -> int:
+        """
+        Close sessions that have been idle longer than SESSION_TIMEOUT.
+        
+        Returns:
+            Number of sessions closed
+        """
+        reaped = 0
+        for pool in self._loop_pools():
+            if await pool.reap_if_idle():
+                reaped += 1
+        return reaped
     
     async def close_all(self):
         """Close all sessions in the pool."""
         async with self._lock:
-            for pool in self._pools.values():
-                await pool.close()
-            self._pools.clear()
+            loop = asyncio.get_running_loop()
+            for key, pool in list(self._pools.items()):
+                if pool.loop is loop:
+                    await pool.close()
+                # Pools of other (usually finished) loops are just dropped
+                del self._pools[key]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+        
+        Returns:
+            Dictionary with totals and per-server counters (spawns, reuses,
+            spawn_failures, health_check_failures, reaped) and active sessions
+        """
+        totals = _new_server_stats()
+        for server_stats in self._stats.values():
+            for name, value in server_stats.items():
+                totals[name] += value
+        calls = totals['spawns'] + totals['reuses']
+        return {
+            **totals,
+            'reuse_rate': round(totals['reuses'] / calls, 3) if calls else 0.0,
+            'active_sessions': sum(1 for pool in self._pools.values() if pool.is_open),
+            'servers': {name: dict(server_stats) for name, server_stats in self._stats.items()},
+        }
+
+
+def _new_server_stats() -> Dict[str, int]:
+    return {'spawns': 0, 'reuses': 0, 'spawn_failures': 0, 'health_check_failures': 0, 'reaped': 0}
 
 
 class _ServerPool:
-    """Pool for a single MCP server type."""
+    """
+    Pool for a single MCP server type on one event loop.
+    
+    The stdio client and session contexts are entered and exited by a dedicated
+    owner task: anyio cancel scopes must be exited by the task that entered them,
+    which a caller-driven __aenter__/__aexit__ pair cannot guarantee.
+    """
     
-    def __init__(self, server_name: str, server_params: StdioServerParameters):
+    def __init__(
+        self,
+        server_name: str,
+        server_params: StdioServerParameters,
+        loop: asyncio.AbstractEventLoop,
+        stats: Dict[str, int],
+    ):
         self.server_name = server_name
         self.server_params = server_params
-        self._client_context: Optional[Any] = None
-        self._session_context: Optional[Any] = None
+        self.loop = loop
+        self._stats = stats
         self._session: Optional[ClientSession] = None
-        self._read_write: Optional[Tuple] = None
+        self._owner: Optional[asyncio.Task] = None
+        self._close_event: Optional[asyncio.Event] = None
         self._lock = asyncio.Lock()
         self._last_used = time.time()
         self._created_at = time.time()
-        self._in_use = False
+        self._last_checked = time.time()
+        self._in_use = 0
+    
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None and self._owner is not None and not self._owner.done()
     
     @asynccontextmanager
     async def get_session(self):
         """Get or create a session, reusing if available and healthy."""
         async with self._lock:
             # Check if we need to recreate the session
-            if self._session is None or not self._is_healthy():
+            if self._session is None or not await self._is_healthy():
                 await self._recreate_session()
+            else:
+                self._stats['reuses'] += 1
             
+            session = self._session
             self._last_used = time.time()
-            self._in_use = True
+            self._in_use += 1
         
         try:
-            if self._session is None:
+            if session is None:
                 raise RuntimeError(f"Failed to create session for {self.server_name}")
-            yield self._session
+            yield session
         finally:
-            async with self._lock:
-                self._in_use = False
-                self._last_used = time.time()
+            self._in_use -= 1
+            self._last_used = time.time()
     
-    def _is_healthy(self) -> bool:
+    async def _is_healthy(self) -> bool:
         """Check if the current session is healthy and should be reused."""
-        if self._session is None:
-            return False
-        
-        # Check session age
-        age = time.time() - self._created_at
-        if age > MAX_SESSION_AGE:
-            logger.debug(f"Session for {self.server_name} expired (age: {age:.1f}s)")
+        if not self.is_open:
+            logger.debug(f"Session for {self.server_name} is closed")
             return False
         
-        # Check idle timeout
-        idle_time = time.time() - self._last_used
-        if idle_time > SESSION_TIMEOUT:
-            logger.debug(f"Session for {self.server_name} timed out (idle: {idle_time:.1f}s)")
-            return False
+        now = time.time()
+        # Never recycle a session other callers are still using
+        if self._in_use == 0:
+            # Check session age
+            age = now - self._created_at
+            if age > MAX_SESSION_AGE:
+                logger.debug(f"Session for {self.server_name} expired (age: {age:.1f}s)")
+                return False
+            
+            # Check idle timeout
+            idle_time = now - self._last_used
+            if idle_time > SESSION_TIMEOUT:
+                logger.debug(f"Session for {self.server_name} timed out (idle: {idle_time:.1f}s)")
+                return False
+        
+        # Ping sessions that have not been used or checked recently
+        if now - max(self._last_used, self._last_checked) > HEALTH_CHECK_INTERVAL:
+            self._last_checked = now
+            try:
+                await asyncio.wait_for(self._session.send_ping(), timeout=HEALTH_CHECK_TIMEOUT)
+            except Exception as e:
+                self._stats['health_check_failures'] += 1
+                logger.debug(f"Health check failed for {self.server_name}: {e}")
+                return False
         
         return True
     
+    async def _run_session(self, ready: asyncio.Future, close_event: asyncio.Event):
+        """Owner task: open the session, hand it over, keep it open until closed."""
+        try:
+            async with stdio_client(self.server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await close_event.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"Session for {self.server_name} ended with error: {e}")
+        finally:
+            if not ready.done():
+                ready.set_exception(RuntimeError(f"Session for {self.server_name} was cancelled"))
+    
     async def _recreate_session(self):
         """Create a new session, closing the old one if it exists."""
         # Close existing session
         await self._close_session()
         
         # Create new session
+        ready = self.loop.create_future()
+        self._close_event = asyncio.Event()
+        self._owner = asyncio.create_task(self._run_session(ready, self._close_event))
         try:
-            self._client_context = stdio_client(self.server_params)
-            self._read_write = await self._client_context.__aenter__()
-            read, write = self._read_write
-            
-            self._session_context = ClientSession(read, write)
-            self._session = await self._session_context.__aenter__()
-            await self._session.initialize()
-            
-            self._created_at = time.time()
-            self._last_used = time.time()
-            logger.debug(f"Created new session for {self.server_name}")
+            self._session = await ready
         except Exception as e:
+            self._stats['spawn_failures'] += 1
             logger.error(f"Failed to create session for {self.server_name}: {e}")
             await self._close_session()
             raise
+        
+        self._stats['spawns'] += 1
+        self._created_at = time.time()
+        self._last_used = time.time()
+        self._last_checked = time.time()
+        logger.debug(f"Created new session for {self.server_name}")
     
     async def _close_session(self):
         """Close the current session and clean up."""
-        if self._session_context is not None:
-            try:
-                await self._session_context.__aexit__(None, None, None)
-            except Exception as e:
-                logger.warning(f"Error closing session context for {self.server_name}: {e}")
-            self._session_context = None
+        owner, self._owner = self._owner, None
+        if self._close_event is not None:
+            self._close_event.set()
+            self._close_event = None
+        self._session = None
         
-        if self._client_context is not None:
+        if owner is not None and not owner.done():
             try:
-                await self._client_context.__aexit__(None, None, None)
+                await asyncio.wait_for(owner, timeout=CLOSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"Timed out closing session for {self.server_name}")
             except Exception as e:
-                logger.warning(f"Error closing client context for {self.server_name}: {e}")
-            self._client_context = None
-        
-        self._session = None
-        self._read_write = None
+                logger.warning(f"Error closing session for {self.server_name}: {e}")
+    
+    async def reap_if_idle(self) -> bool:
+        """Close the session if it is unused and idle past SESSION_TIMEOUT."""
+        async with self._lock:
+            if self._session is None or self._in_use:
+                return False
+            if time.time() - self._last_used <= SESSION_TIMEOUT:
+                return False
+            await self._close_session()
+            self._stats['reaped'] += 1
+            logger.debug(f"Reaped idle session for {self.server_name}")
+            return True
     
     async def close(self):
         """Close the session and clean up."""
@@ -186,8 +318,141 @@ class _ServerPool:
 # Global session pool (exported for use by other modules)
 _session_pool = MCPSessionPool()
 
+
+class MCPLoopThread:
+    """
+    Long-lived event loop on a daemon thread for synchronous MCP callers.
+    
+    asyncio.run() creates (and closes) a new loop per call, which makes every
+    pooled session unusable for the next call. Sync wrappers instead submit
+    their coroutines here, so sessions stay warm across calls. The loop also
+    runs a reaper that closes sessions idle longer than SESSION_TIMEOUT.
+    """
+    
+    def __init__(self, pool: MCPSessionPool):
+        self._pool = pool
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+    
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._loop is not None:
+                return self._loop
+            
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(loop, started), name="mcp-session-loop", daemon=True
+            )
+            self._loop = loop
+            self._thread.start()
+            started.wait()
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+            return loop
+    
+    def _run(self, loop: asyncio.AbstractEventLoop, started: threading.Event):
+        asyncio.set_event_loop(loop)
+        reaper = loop.create_task(self._reap_forever())
+        loop.call_soon(started.set)
+        try:
+            loop.run_forever()
+        finally:
+            reaper.cancel()
+            pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.close()
+    
+    async def _reap_forever(self):
+        while True:
+            await asyncio.sleep(REAP_INTERVAL)
+            try:
+                await self._pool.reap_idle()
+            except Exception as e:
+                logger.debug(f"Idle session reaping failed: {e}")
+    
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = SYNC_CALL_TIMEOUT) -> T:
+        """
+        Run a coroutine on the loop thread and wait for its result.
+        
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None waits forever); the coroutine is cancelled on timeout
+            
+        Returns:
+            The coroutine's result (its exception is re-raised)
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("run_mcp_sync() called from the MCP loop thread; await the coroutine instead")
+        
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+    
+    def shutdown(self, timeout: float = CLOSE_TIMEOUT):
+        """Close all sessions on the loop and stop the thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        
+        try:
+            asyncio.run_coroutine_threadsafe(self._pool.close_all(), loop).result(timeout)
+        except Exception as e:
+            logger.debug(f"Error closing MCP sessions on shutdown: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+
+_loop_thread = MCPLoopThread(_session_pool)
+
+
+def run_mcp_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = SYNC_CALL_TIMEOUT) -> T:
+    """
+    Run an MCP coroutine from synchronous code on the shared session loop.
+    
+    Safe to call from threads that already run an event loop (unlike asyncio.run).
+    
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait for the result
+        
+    Returns:
+        The coroutine's result
+    """
+    return _loop_thread.run(coro, timeout)
+
+
+def shutdown_mcp_sessions():
+    """Close pooled sessions and stop the shared session loop."""
+    _loop_thread.shutdown()
+
+
+def get_session_pool_stats() -> Dict[str, Any]:
+    """Get MCP session pool statistics (spawns vs reuses, health checks, reaping)."""
+    return _session_pool.get_stats()
+
 # Export session pool for use in other modules
-__all__ = ['MCPClient', 'get_mcp_client', 'load_json_with_retry', '_session_pool']
+__all__ = [
+    'MCPClient',
+    'get_mcp_client',
+    'get_session_pool_stats',
+    'load_json_with_retry',
+    'run_mcp_sync',
+    'shutdown_mcp_sessions',
+    '_session_pool',
+]
 
 
 class MCPClient:
@@ -412,10 +677,7 @@ class MCPClient:
                 if attempt < max_attempts - 1:
                     logger.warning(f"Error calling {tool_name} (attempt {attempt + 1}), retrying: {e}")
                     # Force session recreation on retry
-                    async with _session_pool._lock:
-                        if 'agentic-tools' in _session_pool._pools:
-                            await _session_pool._pools['agentic-tools'].close()
-                            del _session_pool._pools['agentic-tools']
+                    await _session_pool.invalidate('agentic-tools')
                     await asyncio.sleep(RETRY_DELAY * (attempt + 1))
                 else:
                     logger.error(f"Failed to call {tool_name} via agentic-tools MCP: {e}", exc_info=True)
@@ -47,6 +47,12 @@ from .utils.security import (
     set_default_path_validator,
 )
 
+# Pooled sessions to other MCP servers (reported by server_status)
+from .scripts.base.mcp_client import get_session_pool_stats
+
+# Worker pools for blocking tools (keeps the event loop free)
+from .utils.tool_executor import get_tool_executor, offload, offload_enabled, tool_cost_class
+
 # Dynamic version from version.py
 from .version import __version__
 
@@ -798,6 +804,8 @@ def register_tools():
                                 "min_confidence": {"type": "number", "default": 0.7},
                                 "framework": {"type": "string"},
                                 "output_path": {"type": "string"},
+                                "changed_since": {"type": "string"},
+                                "workers": {"type": "integer", "default": 1},
                             },
                         },
                     ),
@@ -1143,9 +1151,8 @@ def register_tools():
 
             return tools
 
-        @stdio_server_instance.call_tool()
-        async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-            """Handle tool calls."""
+        async def _dispatch_tool_call(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+            """Route a tool call to its implementation."""
             if name == "server_status":
                 result = json.dumps(
                     {
@@ -1153,6 +1160,8 @@ def register_tools():
                         "version": __version__,
                         "tools_available": TOOLS_AVAILABLE,
                         "project_root": str(project_root),
+                        "tool_pools": get_tool_executor().get_stats(),
+                        "mcp_sessions": get_session_pool_stats(),
                     },
                     separators=(",", ":"),
                 )
@@ -1340,8 +1349,10 @@ def register_tools():
                             arguments.get("format", "html"),
                             arguments.get("target_file"),
                             arguments.get("min_confidence", 0.7),
-                            arguments.get("framework"),
-                            arguments.get("output_path"),
+                            framework=arguments.get("framework"),
+                            output_path=arguments.get("output_path"),
+                            changed_since=arguments.get("changed_since"),
+                            workers=arguments.get("workers", 1),
                         )
                     elif name == "lint":
                         result = _lint(
@@ -1691,6 +1702,18 @@ def register_tools():
 
             return [TextContent(type="text", text=result)]
 
+        @stdio_server_instance.call_tool()
+        async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+            """Handle tool calls on the worker pool of the tool's cost class."""
+            if name == "server_status" or not offload_enabled():
+                return await _dispatch_tool_call(name, arguments)
+            # Most branches are blocking calls; run the whole dispatch (with its own
+            # event loop for the few async tools) so this loop stays responsive
+            import asyncio
+            return await get_tool_executor().run(
+                tool_cost_class(name), lambda: asyncio.run(_dispatch_tool_call(name, arguments))
+            )
+
         return None
 
 
@@ -1716,6 +1739,7 @@ if mcp:
         # NOTE: cleanup_stale_tasks removed - use task_workflow(action="cleanup")
 
         @mcp.tool()
+        @offload()
         def add_external_tool_hints(
             dry_run: bool = False, output_path: Optional[str] = None, min_file_size: int = 50
         ) -> str:
@@ -1735,6 +1759,7 @@ if mcp:
         # Use automation(action=daily|nightly|sprint|discover) instead
 
         @mcp.tool()
+        @offload()
         def automation(
             action: str = "daily",
             tasks: Optional[List[str]] = None,
@@ -1903,6 +1928,7 @@ if mcp:
         # ═══════════════════════════════════════════════════════════════════
 
         @mcp.tool()
+        @offload()
         def tool_catalog(
             action: str = "list",
             category: Optional[str] = None,
@@ -2031,6 +2057,7 @@ if mcp:
         # ═══════════════════════════════════════════════════════════════════
 
         @mcp.tool()
+        @offload()
         def context(
             action: str = "summarize",
             data: Optional[str] = None,
@@ -2106,6 +2133,7 @@ if mcp:
         # ═══════════════════════════════════════════════════════════════════
 
         @mcp.tool()
+        @offload()
         def recommend(
             action: str = "model",
             task_description: Optional[str] = None,
@@ -2211,6 +2239,7 @@ if mcp:
         # Use analyze_alignment(action=todo2|prd) instead
 
         @mcp.tool()
+        @offload()
         def analyze_alignment(
             action: str = "todo2",
             create_followup_tasks: bool = True,
@@ -2254,6 +2283,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def security(
             action: str = "report",
             repo: str = "davidl71/project-management-automation",
@@ -2282,6 +2312,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def generate_config(
             action: str = "rules",
             rules: Optional[str] = None,
@@ -2316,6 +2347,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def setup_hooks(
             action: str = "git",
             hooks: Optional[List[str]] = None,
@@ -2342,6 +2374,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def prompt_tracking(
             action: str = "analyze",
             prompt: Optional[str] = None,
@@ -2369,6 +2402,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def health(
             action: str = "server",
             agent_name: Optional[str] = None,
@@ -2405,6 +2439,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def check_attribution(
             output_path: Optional[str] = None,
             create_tasks: bool = True,
@@ -2448,6 +2483,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def report(
             action: str = "overview",
             output_format: str = "text",
@@ -2494,6 +2530,7 @@ if mcp:
                 return json.dumps({"result": str(result)}, indent=2)
 
         @mcp.tool()
+        @offload()
         def task_analysis(
             action: str = "duplicates",
             similarity_threshold: float = 0.85,
@@ -2530,6 +2567,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def testing(
             action: str = "run",
             test_path: Optional[str] = None,
@@ -2543,12 +2581,15 @@ if mcp:
             min_confidence: float = 0.7,
             framework: Optional[str] = None,
             output_path: Optional[str] = None,
+            changed_since: Optional[str] = None,
+            workers: int = 1,
         ) -> str:
             """
             [HINT: Testing tool. action=run|coverage|suggest|validate. Execute tests, analyze coverage, suggest test cases, or validate test structure.]
 
             Unified testing:
-            - action="run": Execute test suite (pytest/unittest/ctest)
+            - action="run": Execute test suite (pytest/unittest/ctest); changed_since=<git ref> runs only
+              affected tests (needs a prior coverage=true run), workers=N shards them across processes
             - action="coverage": Analyze test coverage with threshold
             - action="suggest": Suggest test cases based on code analysis
             - action="validate": Validate test organization and patterns
@@ -2560,7 +2601,8 @@ if mcp:
             result: str = _testing(
                 action, test_path, test_framework, verbose, coverage,
                 coverage_file, min_coverage, format, target_file, min_confidence,
-                framework, output_path
+                framework=framework, output_path=output_path,
+                changed_since=changed_since, workers=workers,
             )
             if isinstance(result, str):
                 return result
@@ -2568,6 +2610,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def lint(
             action: str = "run",
             path: Optional[str] = None,
@@ -2584,8 +2627,9 @@ if mcp:
             [HINT: Linting tool. action=run|analyze. Run linter or analyze problems.]
 
             Unified linting:
-            - action="run": Execute linter (ruff/flake8), optionally analyze results
+            - action="run": Execute linter (ruff/flake8) on changed files, optionally analyze results
             - action="analyze": Analyze problems JSON with resolution hints
+              (without problems_json: the stored results of the last run)
 
             📊 Output: Linter results or problem analysis
             🔧 Side Effects: May auto-fix issues (with fix=true)
@@ -2602,6 +2646,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def memory(
             action: str = "search",
             title: Optional[str] = None,
@@ -2637,6 +2682,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def task_discovery(
             action: str = "all",
             file_patterns: Optional[str] = None,
@@ -2670,6 +2716,7 @@ if mcp:
         # NOTE: cleanup_stale_tasks removed - use task_workflow(action="cleanup")
 
         @mcp.tool()
+        @offload()
         def task_workflow(
             action: str = "sync",
             dry_run: bool = False,
@@ -2768,6 +2815,7 @@ if mcp:
         # Use estimation(action=estimate|analyze|stats) instead
 
         @mcp.tool()
+        @offload()
         def estimation(
             action: str = "estimate",
             name: Optional[str] = None,
@@ -2839,6 +2887,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def ollama(
             action: str = "status",
             host: Optional[str] = None,
@@ -2900,6 +2949,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def mlx(
             action: str = "status",
             prompt: Optional[str] = None,
@@ -2939,6 +2989,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def git_tools(
             action: str = "commits",
             task_id: Optional[str] = None,
@@ -3001,6 +3052,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def session(
             action: str = "prime",
             include_hints: bool = True,
@@ -3078,6 +3130,7 @@ if mcp:
                 return json.dumps(result, indent=2)
 
         @mcp.tool()
+        @offload()
         def memory_maint(
             action: str = "health",
             max_age_days: int = 90,
@@ -7,12 +7,16 @@ Analyzes Todo2 task dependency chains, identifies circular dependencies, and vis
 import json
 import logging
 import time
-from collections import defaultdict
 from pathlib import Path
 from typing import Any, Optional
 
+from ..utils.dependency_graph import DependencyGraph
+
 logger = logging.getLogger(__name__)
 
+# Critical chains can be exponential in number; only this many are listed
+MAX_CRITICAL_PATHS = 100
+
 # Import error handler
 try:
     from ..error_handler import ErrorCode, format_error_response, format_success_response, log_automation_execution
@@ -62,27 +66,29 @@ def analyze_todo2_dependencies(
         all_tasks = list_todos_mcp(project_root=project_root)
 
         # Build dependency graph
-        graph = _build_dependency_graph(all_tasks)
+        dep_graph = DependencyGraph.from_tasks(all_tasks)
 
-        # Detect circular dependencies
-        cycles = _detect_cycles(graph, all_tasks)
+        # Detect circular dependencies (one cycle per strongly connected component)
+        cycles = dep_graph.cycles()
 
         # Identify critical paths
-        critical_paths = _find_critical_paths(graph, all_tasks)
+        critical = dep_graph.critical_paths()
+        critical_paths = critical.paths(limit=MAX_CRITICAL_PATHS)
 
         # Calculate metrics
-        metrics = _calculate_metrics(graph, all_tasks)
+        metrics = _calculate_metrics(dep_graph, all_tasks, critical_paths)
 
         # Generate report
         report_path = output_path or 'docs/TODO2_DEPENDENCY_ANALYSIS_REPORT.md'
         if report_path:
             report = _generate_report(
-                graph,
+                dep_graph,
                 cycles,
                 critical_paths,
                 metrics,
                 all_tasks,
-                output_format
+                output_format,
+                critical_count=critical.count
             )
             report_file = project_root / report_path
             report_file.parent.mkdir(parents=True, exist_ok=True)
@@ -94,7 +100,9 @@ def analyze_todo2_dependencies(
             'total_tasks': len(all_tasks),
             'tasks_with_dependencies': metrics['tasks_with_dependencies'],
             'circular_dependencies': len(cycles),
-            'critical_paths_count': len(critical_paths),
+            'critical_paths_count': critical.count,
+            'critical_path_length': critical.length,
+            'critical_path_nodes': critical.nodes,
             'max_depth': metrics['max_depth'],
             'longest_chain': metrics['longest_chain'],
             'report_path': str(Path(report_path).absolute()),
@@ -117,151 +125,35 @@ def analyze_todo2_dependencies(
         return json.dumps(error_response, indent=2)
 
 
-def _build_dependency_graph(tasks: list[dict[str, Any]]) -> dict[str, list[str]]:
-    """Build directed graph from task dependencies."""
-    graph = defaultdict(list)
-    task_ids = {task.get('id') for task in tasks}
-
-    for task in tasks:
-        task_id = task.get('id')
-        deps = task.get('dependencies', []) or task.get('dependsOn', [])
-
-        # Normalize dependencies (handle both string and dict formats)
-        for dep in deps:
-            dep_id = dep if isinstance(dep, str) else dep.get('id')
-            if dep_id and dep_id in task_ids:
-                graph[dep_id].append(task_id)  # dep_id -> task_id (dependency -> dependent)
-
-    return dict(graph)
-
-
-def _detect_cycles(graph: dict[str, list[str]], tasks: list[dict[str, Any]]) -> list[list[str]]:
-    """Detect circular dependencies using DFS."""
-    cycles = []
-    visited = set()
-    rec_stack = set()
-    path = []
-
-    def dfs(node: str) -> bool:
-        if node in rec_stack:
-            # Found cycle
-            cycle_start = path.index(node)
-            cycle = path[cycle_start:] + [node]
-            cycles.append(cycle)
-            return True
-
-        if node in visited:
-            return False
-
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-
-        for neighbor in graph.get(node, []):
-            if dfs(neighbor):
-                return True
-
-        rec_stack.remove(node)
-        path.pop()
-        return False
-
-    task_ids = {task.get('id') for task in tasks}
-    for task_id in task_ids:
-        if task_id not in visited:
-            dfs(task_id)
-
-    return cycles
-
-
-def _find_critical_paths(graph: dict[str, list[str]], tasks: list[dict[str, Any]]) -> list[list[str]]:
-    """Find critical paths (longest dependency chains) using topological sort."""
-    # Build reverse graph for topological sort
-    in_degree = defaultdict(int)
-    task_ids = {task.get('id') for task in tasks}
-
-    for task_id in task_ids:
-        in_degree[task_id] = 0
-
-    for _node, neighbors in graph.items():
-        for neighbor in neighbors:
-            in_degree[neighbor] += 1
-
-    # Find longest paths
-    longest_paths = []
-    max_length = 0
-
-    def dfs_longest(node: str, path: list[str], length: int):
-        nonlocal max_length, longest_paths
-
-        if length > max_length:
-            max_length = length
-            longest_paths = [path[:]]
-        elif length == max_length:
-            longest_paths.append(path[:])
-
-        for neighbor in graph.get(node, []):
-            if neighbor not in path:  # Avoid cycles
-                path.append(neighbor)
-                dfs_longest(neighbor, path, length + 1)
-                path.pop()
-
-    # Start from nodes with no dependencies (in_degree == 0)
-    for task_id in task_ids:
-        if in_degree[task_id] == 0:
-            dfs_longest(task_id, [task_id], 1)
-
-    return longest_paths
-
-
-def _calculate_metrics(graph: dict[str, list[str]], tasks: list[dict[str, Any]]) -> dict[str, Any]:
+def _calculate_metrics(
+    dep_graph: DependencyGraph,
+    tasks: list[dict[str, Any]],
+    critical_paths: list[list[str]]
+) -> dict[str, Any]:
     """Calculate dependency metrics."""
-    task_ids = {task.get('id') for task in tasks}
-
     tasks_with_deps = sum(
         1 for task in tasks
         if task.get('dependencies') or task.get('dependsOn')
     )
 
-    # Calculate max depth
-    def get_depth(node: str, visited: set[str] = None) -> int:
-        if visited is None:
-            visited = set()
-        if node in visited:
-            return 0
-        visited.add(node)
-
-        max_dep_depth = 0
-        for dep in graph.get(node, []):
-            max_dep_depth = max(max_dep_depth, get_depth(dep, visited.copy()))
-
-        return max_dep_depth + 1
-
-    max_depth = 0
-    for task_id in task_ids:
-        depth = get_depth(task_id)
-        max_depth = max(max_depth, depth)
-
-    # Find longest chain
-    longest_chain = []
-    longest_paths = _find_critical_paths(graph, tasks)
-    if longest_paths:
-        longest_chain = max(longest_paths, key=len)
+    longest_chain = critical_paths[0] if critical_paths else []
 
     return {
         'tasks_with_dependencies': tasks_with_deps,
-        'max_depth': max_depth,
+        'max_depth': dep_graph.max_depth(),
         'longest_chain': longest_chain,
         'longest_chain_length': len(longest_chain)
     }
 
 
 def _generate_report(
-    graph: dict[str, list[str]],
+    dep_graph: DependencyGraph,
     cycles: list[list[str]],
     critical_paths: list[list[str]],
     metrics: dict[str, Any],
     tasks: list[dict[str, Any]],
-    output_format: str
+    output_format: str,
+    critical_count: Optional[int] = None
 ) -> str:
     """Generate markdown report."""
     task_map = {task.get('id'): task for task in tasks}
@@ -275,7 +167,7 @@ def _generate_report(
 - **Total Tasks**: {len(tasks)}
 - **Tasks with Dependencies**: {metrics['tasks_with_dependencies']}
 - **Circular Dependencies**: {len(cycles)}
-- **Critical Paths**: {len(critical_paths)}
+- **Critical Paths**: {critical_count if critical_count is not None else len(critical_paths)}
 - **Max Depth**: {metrics['max_depth']}
 - **Longest Chain**: {metrics['longest_chain_length']} tasks
 
@@ -292,6 +184,9 @@ def _generate_report(
             report += " → ".join(cycle_names) + "\n\n"
 
     report += "## Critical Paths\n\n"
+    total_critical = critical_count if critical_count is not None else len(critical_paths)
+    if total_critical > 5:
+        report += f"Showing 5 of {total_critical} critical chains.\n\n"
     if critical_paths:
         for i, path in enumerate(critical_paths[:5], 1):  # Show top 5
             report += f"### Path {i} ({len(path)} tasks)\n\n"
@@ -301,24 +196,28 @@ def _generate_report(
         report += "No critical paths found.\n\n"
 
     report += "## Dependency Tree\n\n"
-    # Build tree structure
-    roots = [tid for tid in task_map.keys() if not any(tid in deps for deps in graph.values())]
-
-    def build_tree(node: str, depth: int = 0, visited: set[str] = None) -> str:
-        if visited is None:
-            visited = set()
-        if node in visited:
-            return ""
-        visited.add(node)
-
-        task = task_map.get(node, {})
-        name = task.get('name', node)
-        indent = "  " * depth
-        result = f"{indent}- {name} ({node})\n"
-
-        for child in graph.get(node, []):
-            result += build_tree(child, depth + 1, visited.copy())
-
+    # Build tree structure; shared subtrees are expanded once and referenced afterwards
+    roots = dep_graph.roots()
+    expanded: set[str] = set()
+
+    def build_tree(root: str) -> str:
+        result = ""
+        stack = [(root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            task = task_map.get(node, {})
+            name = task.get('name', node)
+            indent = "  " * depth
+            if node in expanded:
+                if dep_graph.successors(node):
+                    result += f"{indent}- {name} ({node}) ↑ see above\n"
+                else:
+                    result += f"{indent}- {name} ({node})\n"
+                continue
+            expanded.add(node)
+            result += f"{indent}- {name} ({node})\n"
+            for child in reversed(dep_graph.successors(node)):
+                stack.append((child, depth + 1))
         return result
 
     for root in roots[:10]:  # Show first 10 root tasks
@@ -326,4 +225,3 @@ def _generate_report(
         report += "\n"
 
     return report
-
@@ -4,12 +4,13 @@ MCP Tool Wrapper for Auto Update Task Status
 Automatically infers and updates task status based on codebase analysis.
 """
 
-import json
 import logging
 import time
 from pathlib import Path
 from typing import Any, List, Optional
 
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 # Import error handler
@@ -33,6 +34,7 @@ except ImportError:
             AUTOMATION_ERROR = "AUTOMATION_ERROR"
 
 
+@structured_tool
 def auto_update_task_status(
     project_id: Optional[str] = None,
     scan_depth: int = 3,
@@ -41,7 +43,7 @@ def auto_update_task_status(
     confidence_threshold: float = 0.7,
     dry_run: bool = True,
     output_path: Optional[str] = None
-) -> str:
+) -> dict[str, Any]:
     """
     Automatically infer and update task status based on codebase analysis.
 
@@ -85,10 +87,10 @@ def auto_update_task_status(
         )
 
         if not inference_result:
-            return json.dumps(format_error_response(
+            return format_error_response(
                 "Failed to infer task progress from codebase",
                 ErrorCode.AUTOMATION_ERROR
-            ), indent=2)
+            )
 
         # Get current tasks from Todo2
         current_tasks = list_todos_mcp(project_root=project_root)
@@ -172,13 +174,13 @@ def auto_update_task_status(
         duration = time.time() - start_time
         log_automation_execution('auto_update_task_status', duration, True)
 
-        return json.dumps(format_success_response(response_data), indent=2)
+        return format_success_response(response_data)
 
     except Exception as e:
         duration = time.time() - start_time
         log_automation_execution('auto_update_task_status', duration, False, e)
         error_response = format_error_response(e, ErrorCode.AUTOMATION_ERROR)
-        return json.dumps(error_response, indent=2)
+        return error_response
 
 
 def _generate_report(
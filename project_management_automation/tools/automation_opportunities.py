@@ -4,12 +4,13 @@ MCP Tool Wrapper for Automation Opportunity Finder
 Wraps AutomationOpportunityFinder to expose as MCP tool.
 """
 
-from typing import Optional
-import json
+from typing import Any, Optional
 import logging
 import time
 from pathlib import Path
 
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 # Import error handler at module level to avoid scoping issues
@@ -34,10 +35,11 @@ except ImportError:
             AUTOMATION_ERROR = "AUTOMATION_ERROR"
 
 
+@structured_tool
 def find_automation_opportunities(
     min_value_score: float = 0.7,
     output_path: Optional[str] = None
-) -> str:
+) -> dict[str, Any]:
     """
     Discover new automation opportunities in the codebase.
 
@@ -96,10 +98,10 @@ def find_automation_opportunities(
         duration = time.time() - start_time
         log_automation_execution('find_automation_opportunities', duration, True)
 
-        return json.dumps(format_success_response(response_data), indent=2)
+        return format_success_response(response_data)
 
     except Exception as e:
         duration = time.time() - start_time
         log_automation_execution('find_automation_opportunities', duration, False, e)
         error_response = format_error_response(e, ErrorCode.AUTOMATION_ERROR)
-        return json.dumps(error_response, indent=2)
+        return error_response
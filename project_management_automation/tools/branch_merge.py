@@ -8,12 +8,12 @@ Licensed under GPL-3.0. This implementation is original Python code.
 See ATTRIBUTIONS.md for details.
 """
 
-import json
 import logging
 from datetime import datetime
 from typing import Any, Optional
 
 from ..utils import find_project_root
+from ..utils.todo2_store import get_todo2_store
 from ..utils.branch_utils import (
     filter_tasks_by_branch,
     set_task_branch,
@@ -186,66 +186,65 @@ def merge_branches(
         - merge_commit_id: ID of merge commit (if created)
     """
     project_root = find_project_root()
-    todo2_file = project_root / ".todo2" / "state.todo2.json"
-
-    if not todo2_file.exists():
-        raise FileNotFoundError(f"Todo2 state file not found: {todo2_file}")
-
-    # Load tasks
-    with open(todo2_file) as f:
-        data = json.load(f)
-
-    all_tasks = data.get("todos", [])
-    source_tasks = filter_tasks_by_branch(all_tasks, source_branch)
-    target_tasks = filter_tasks_by_branch(all_tasks, target_branch)
-
-    # Detect conflicts
-    conflicts = detect_merge_conflicts(source_tasks, target_tasks)
-
-    # Create task lookup
-    task_by_id = {task.get("id"): task for task in all_tasks}
-    updated_tasks = []
-    merged_count = 0
-
-    # Merge tasks
-    for source_task in source_tasks:
-        task_id = source_task.get("id")
-        if not task_id:
-            continue
-
-        target_task = task_by_id.get(task_id)
-
-        if target_task:
-            # Task exists in target - check for conflicts
-            conflict = next((c for c in conflicts if c.task_id == task_id), None)
-
-            if conflict:
-                # Resolve conflict
-                resolved_task = resolve_conflict(conflict, strategy=conflict_strategy, preferred_branch=source_branch)
-                resolved_task = set_task_branch(resolved_task, target_branch)
-
-                # Update task
-                task_index = next((i for i, t in enumerate(all_tasks) if t.get("id") == task_id), None)
-                if task_index is not None:
-                    old_task = all_tasks[task_index]
-                    all_tasks[task_index] = resolved_task
-                    updated_tasks.append((old_task, resolved_task))
-                    merged_count += 1
+    store = get_todo2_store(project_root)
+
+    if not store.exists():
+        raise FileNotFoundError(f"Todo2 state file not found: {store.state_file}")
+
+    with store.write_lock():
+        # Load tasks
+        data = store.load_state_for_update()
+
+        all_tasks = data["todos"]
+        source_tasks = filter_tasks_by_branch(all_tasks, source_branch)
+        target_tasks = filter_tasks_by_branch(all_tasks, target_branch)
+
+        # Detect conflicts
+        conflicts = detect_merge_conflicts(source_tasks, target_tasks)
+
+        # Create task lookup
+        task_by_id = {task.get("id"): task for task in all_tasks}
+        updated_tasks = []
+        merged_count = 0
+
+        # Merge tasks
+        for source_task in source_tasks:
+            task_id = source_task.get("id")
+            if not task_id:
+                continue
+
+            target_task = task_by_id.get(task_id)
+
+            if target_task:
+                # Task exists in target - check for conflicts
+                conflict = next((c for c in conflicts if c.task_id == task_id), None)
+
+                if conflict:
+                    # Resolve conflict
+                    resolved_task = resolve_conflict(conflict, strategy=conflict_strategy, preferred_branch=source_branch)
+                    resolved_task = set_task_branch(resolved_task, target_branch)
+
+                    # Update task
+                    task_index = next((i for i, t in enumerate(all_tasks) if t.get("id") == task_id), None)
+                    if task_index is not None:
+                        old_task = all_tasks[task_index]
+                        all_tasks[task_index] = resolved_task
+                        updated_tasks.append((old_task, resolved_task))
+                        merged_count += 1
+                else:
+                    # No conflict - task already in target
+                    pass
             else:
-                # No conflict - task already in target
-                pass
-        else:
-            # New task - add to target
-            new_task = source_task.copy()
-            new_task = set_task_branch(new_task, target_branch)
+                # New task - add to target
+                new_task = source_task.copy()
+                new_task = set_task_branch(new_task, target_branch)
 
-            all_tasks.append(new_task)
-            merged_count += 1
+                all_tasks.append(new_task)
+                merged_count += 1
 
-    # Save updated tasks
-    data["todos"] = all_tasks
-    with open(todo2_file, "w") as f:
-        json.dump(data, f, indent=2)
+        # Save updated tasks
+        data["todos"] = all_tasks
+        store.save_state(data)
 
     # Create merge commits for updated tasks
     tracker = get_commit_tracker()
@@ -298,16 +297,13 @@ def preview_merge(source_branch: str, target_branch: str) -> dict[str, Any]:
         Dictionary with merge preview information
     """
     project_root = find_project_root()
-    todo2_file = project_root / ".todo2" / "state.todo2.json"
+    store = get_todo2_store(project_root)
 
-    if not todo2_file.exists():
-        raise FileNotFoundError(f"Todo2 state file not found: {todo2_file}")
+    if not store.exists():
+        raise FileNotFoundError(f"Todo2 state file not found: {store.state_file}")
 
     # Load tasks
-    with open(todo2_file) as f:
-        data = json.load(f)
-
-    all_tasks = data.get("todos", [])
+    all_tasks = store.get_tasks()
     source_tasks = filter_tasks_by_branch(all_tasks, source_branch)
     target_tasks = filter_tasks_by_branch(all_tasks, target_branch)
 
@@ -35,6 +35,8 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
+from ..utils.tool_result_cache import cached_tool
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +46,8 @@ Consolidated Analysis
 Consolidated tools: analyze_alignment, task_analysis, task_discovery
 """
 
+# todo2 records each run as a Todo2 task, so only prd is cached
+@cached_tool("analyze_alignment", inputs={"prd": ("todo2", "docs")})
 def analyze_alignment(
     action: str = "todo2",
     create_followup_tasks: bool = True,
@@ -83,6 +87,18 @@ def analyze_alignment(
 
 
 
+@cached_tool(
+    "task_analysis",
+    # duplicates records each run in Todo2, so it is not cached
+    inputs={
+        "tags": ("todo2",),
+        "hierarchy": ("todo2",),
+        "dependencies": ("todo2",),
+        "parallelization": ("todo2",),
+    },
+    # dry_run=False rewrites tags
+    bypass=lambda args: bool(args["output_path"]) or not args["dry_run"],
+)
 def task_analysis(
     action: str = "duplicates",
     # duplicates params
@@ -175,12 +191,16 @@ def task_discovery(
     Returns:
         JSON string with discovery results and found tasks
     """
+    import os
     import re
     from pathlib import Path
 
     from ..utils import find_project_root
+    from ..utils.repo_inventory import DEFAULT_EXCLUDED_DIRS, get_repo_inventory
+    from ..utils.source_scanner import ScanRule, get_source_scanner, match_glob
 
     project_root = find_project_root()
+    scanner = get_source_scanner(project_root)
     results = {
         "action": action,
         "discoveries": [],
@@ -189,7 +209,6 @@ def task_discovery(
 
     def scan_comments():
         """Scan code for TODO/FIXME comments."""
-        discoveries = []
         patterns = ["**/*.py", "**/*.js", "**/*.ts", "**/*.tsx", "**/*.jsx"]
         if file_patterns:
             try:
@@ -197,54 +216,56 @@ def task_discovery(
             except json.JSONDecodeError:
                 pass
 
-        todo_pattern = re.compile(r'#\s*(TODO|FIXME)[\s:]+(.+)', re.IGNORECASE) if include_fixme else re.compile(r'#\s*TODO[\s:]+(.+)', re.IGNORECASE)
-
-        for pattern in patterns:
-            for file_path in project_root.glob(pattern):
-                if any(skip in str(file_path) for skip in ['.git', 'node_modules', '__pycache__', '.venv', 'build']):
-                    continue
-                try:
-                    content = file_path.read_text(encoding='utf-8', errors='ignore')
-                    for line_num, line in enumerate(content.split('\n'), 1):
-                        match = todo_pattern.search(line)
-                        if match:
-                            discoveries.append({
-                                "type": match.group(1).upper() if include_fixme else "TODO",
-                                "text": match.group(2).strip() if include_fixme else match.group(1).strip(),
-                                "file": str(file_path.relative_to(project_root)),
-                                "line": line_num,
-                                "source": "comment",
-                            })
-                except Exception:
-                    continue
+        todo_rule = ScanRule(
+            "todo",
+            r'#\s*(TODO|FIXME)[\s:]+(.+)' if include_fixme else r'#\s*TODO[\s:]+(.+)',
+            re.IGNORECASE,
+        )
+        paths = match_glob(get_repo_inventory(project_root).relpaths(), patterns)
+
+        discoveries = []
+        for rel_path, matches in scanner.scan(paths, [todo_rule]).items():
+            for match in matches:
+                groups = match["groups"]
+                discoveries.append({
+                    "type": groups[0].upper() if include_fixme else "TODO",
+                    "text": groups[-1].strip(),
+                    "file": rel_path,
+                    "line": match["line"],
+                    "source": "comment",
+                })
         return discoveries
 
     def scan_markdown():
         """Scan markdown files for task lists."""
-        discoveries = []
-        search_path = Path(doc_path) if doc_path else project_root / "docs"
+        # A relative doc_path is relative to the working directory
+        search_path = Path(doc_path).absolute() if doc_path else project_root / "docs"
         if not search_path.exists():
             search_path = project_root
 
-        task_pattern = re.compile(r'^[\s]*[-*]\s*\[([ xX])\]\s*(.+)', re.MULTILINE)
+        task_rule = ScanRule("task", r'^[\s]*[-*]\s*\[([ xX])\]\s*(.+)')
+        inventory = get_repo_inventory(project_root)
+        if inventory.contains(search_path):
+            paths = inventory.files(ext=".md", under=search_path)
+        else:
+            # Outside the project: walk it directly, pruning excluded directories
+            paths = []
+            for dirpath, dirnames, filenames in os.walk(search_path):
+                dirnames[:] = sorted(d for d in dirnames if d not in DEFAULT_EXCLUDED_DIRS)
+                paths.extend(Path(dirpath) / name for name in sorted(filenames) if name.endswith(".md"))
 
-        for md_file in search_path.rglob("*.md"):
-            if any(skip in str(md_file) for skip in ['.git', 'node_modules']):
-                continue
-            try:
-                content = md_file.read_text(encoding='utf-8', errors='ignore')
-                for match in task_pattern.finditer(content):
-                    is_done = match.group(1).lower() == 'x'
-                    if not is_done:  # Only uncompleted tasks
-                        discoveries.append({
-                            "type": "MARKDOWN_TASK",
-                            "text": match.group(2).strip(),
-                            "file": str(md_file.relative_to(project_root)),
-                            "completed": is_done,
-                            "source": "markdown",
-                        })
-            except Exception:
-                continue
+        discoveries = []
+        for rel_path, matches in scanner.scan(paths, [task_rule]).items():
+            for match in matches:
+                is_done = match["groups"][0].lower() == 'x'
+                if not is_done:  # Only uncompleted tasks
+                    discoveries.append({
+                        "type": "MARKDOWN_TASK",
+                        "text": match["groups"][1].strip(),
+                        "file": rel_path,
+                        "completed": is_done,
+                        "source": "markdown",
+                    })
         return discoveries
 
     def find_orphans():
@@ -261,6 +282,7 @@ def task_discovery(
         results["discoveries"].extend(scan_markdown())
     if action in ["orphans", "all"]:
         results["discoveries"].extend(find_orphans())
+    scanner.save()
 
     # Summary
     results["summary"] = {
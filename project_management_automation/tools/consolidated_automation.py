@@ -341,21 +341,19 @@ def estimation(
         if not name:  # Using 'name' as tasks_json parameter (hack for now)
             # Load from Todo2
             from ..utils import find_project_root
+            from ..utils.todo2_store import get_todo2_store
             from ..utils.todo2_utils import filter_tasks_by_project, get_repo_project_id
             
             project_root = find_project_root()
-            todo2_file = project_root / '.todo2' / 'state.todo2.json'
+            store = get_todo2_store(project_root)
             
-            if not todo2_file.exists():
+            if not store.exists():
                 return json.dumps({
                     "status": "error",
                     "error": "Todo2 state file not found. Provide tasks_json parameter.",
                 }, indent=2)
             
-            with open(todo2_file) as f:
-                data = json_lib.load(f)
-            
-            todos = data.get('todos', [])
+            todos = store.get_tasks()
             project_id = get_repo_project_id(project_root)
             project_tasks = filter_tasks_by_project(todos, project_id)
             
@@ -425,13 +423,32 @@ def estimation(
                 sys.stderr.write("\n")  # New line when complete
                 sys.stderr.flush()
         
-        for i, task in enumerate(tasks_to_estimate, 1):
-            task_name = task.get('name') or task.get('id', 'Unnamed')
+        # Normalize task fields once for all estimators
+        batch_inputs = []
+        for task in tasks_to_estimate:
             task_details = task.get('long_description') or task.get('details') or task.get('content', '')
             task_tags = task.get('tags', [])
             if isinstance(task_tags, str):
                 task_tags = [t.strip() for t in task_tags.split(',')]
-            task_priority = task.get('priority', priority)
+            batch_inputs.append({
+                'name': task.get('name') or task.get('id', 'Unnamed'),
+                'details': task_details[:500] if task_details else '',
+                'tags': task_tags,
+                'priority': task.get('priority', priority),
+            })
+        
+        # Top historical matches for all tasks from one history index
+        similar_tasks = []
+        if use_historical:
+            try:
+                similar_tasks = estimator.match_history_batch(batch_inputs, top_k=3)
+            except Exception as e:
+                logger.debug(f"Historical matching failed: {e}")
+        
+        for i, (task, task_input) in enumerate(zip(tasks_to_estimate, batch_inputs), 1):
+            task_name = task_input['name']
+            task_tags = task_input['tags']
+            task_priority = task_input['priority']
             
             # Report progress
             report_progress(i, total_tasks, task_name, "estimating")
@@ -440,7 +457,7 @@ def estimation(
                 # Get MLX-enhanced estimate
                 result = estimator.estimate(
                     name=task_name,
-                    details=task_details[:500] if task_details else '',
+                    details=task_input['details'],
                     tags=task_tags,
                     priority=task_priority,
                     use_historical=use_historical
@@ -452,7 +469,7 @@ def estimation(
                     try:
                         stat_result = statistical_estimator.estimate(
                             task_name,
-                            task_details[:500] if task_details else '',
+                            task_input['details'],
                             task_tags,
                             task_priority,
                             use_historical
@@ -476,6 +493,7 @@ def estimation(
                     'lower_bound': result.get('lower_bound'),
                     'upper_bound': result.get('upper_bound'),
                     'statistical_estimate': statistical_estimate,  # For comparison
+                    'similar_tasks': similar_tasks[i - 1] if similar_tasks else [],
                     'mlx_improvement': round(
                         ((result.get('estimate_hours', 0) - (statistical_estimate.get('estimate_hours', 0) if statistical_estimate else 0)) / 
                          (statistical_estimate.get('estimate_hours', 1) if statistical_estimate else 1)) * 100, 1
@@ -68,6 +68,9 @@ async def testing_async(
     # common
     output_path: Optional[str] = None,
     ctx: Optional[Any] = None,
+    # run params (impact analysis / sharding)
+    changed_since: Optional[str] = None,
+    workers: int = 1,
 ) -> str:
     """
     Unified testing tool (async with progress).
@@ -90,13 +93,18 @@ async def testing_async(
         framework: Expected framework for validation (validate action, default: auto)
         output_path: Save results to file
         ctx: FastMCP Context for progress reporting (optional)
+        changed_since: Only run tests affected by changes since this git ref (run action, pytest)
+        workers: Number of parallel pytest shards (run action, default: 1)
 
     Returns:
         JSON string with test, coverage, suggestion, or validation results
     """
     if action == "run":
         from .run_tests import run_tests_async
-        result = await run_tests_async(test_path, test_framework, verbose, coverage, output_path, ctx)
+        result = await run_tests_async(
+            test_path, test_framework, verbose, coverage, output_path, ctx,
+            changed_since=changed_since, workers=workers,
+        )
         # Result should already be a string, but ensure it is
         if isinstance(result, str):
             return result
@@ -170,6 +178,9 @@ def testing(
     # common
     output_path: Optional[str] = None,
     ctx: Optional[Any] = None,
+    # run params (impact analysis / sharding)
+    changed_since: Optional[str] = None,
+    workers: int = 1,
 ) -> str:
     """
     Unified testing tool (sync wrapper).
@@ -192,6 +203,8 @@ def testing(
         framework: Expected framework for validation (validate action, default: auto)
         output_path: Save results to file
         ctx: FastMCP Context for progress reporting (optional)
+        changed_since: Only run tests affected by changes since this git ref (run action, pytest)
+        workers: Number of parallel pytest shards (run action, default: 1)
 
     Returns:
         JSON string with test, coverage, suggestion, or validation results
@@ -210,7 +223,7 @@ def testing(
         if "testing_async()" in str(e) or "async context" in str(e).lower():
             raise
         # Otherwise, no running loop - safe to use asyncio.run()
-        result = asyncio.run(testing_async(action, test_path, test_framework, verbose, coverage, coverage_file, min_coverage, format, target_file, min_confidence, use_mlx, use_coreml, coreml_model_path, compute_units, framework, output_path, ctx))
+        result = asyncio.run(testing_async(action, test_path, test_framework, verbose, coverage, coverage_file, min_coverage, format, target_file, min_confidence, use_mlx, use_coreml, coreml_model_path, compute_units, framework, output_path, ctx, changed_since=changed_since, workers=workers))
     # Convert dict to JSON string
     return json.dumps(result, indent=2) if isinstance(result, dict) else result
 
@@ -242,7 +255,8 @@ def lint(
         analyze: Run analyze_problems on results (run action)
         select: Rule codes to enable (run action)
         ignore: Rule codes to ignore (run action)
-        problems_json: JSON string of problems to analyze (analyze action)
+        problems_json: JSON string of problems to analyze (analyze action;
+            default: the stored results of the last lint run)
         include_hints: Include resolution hints (analyze action)
         output_path: Save results to file
 
@@ -258,9 +272,14 @@ def lint(
         return json.dumps(result, indent=2)
     elif action == "analyze":
         if not problems_json:
+            # Analyze the stored results of the last lint run
+            from .linter import analyze_stored_problems
+            result = analyze_stored_problems(include_hints, output_path)
+            if result is not None:
+                return result
             return json.dumps({
                 "status": "error",
-                "error": "problems_json is required for analyze action",
+                "error": "problems_json is required for analyze action (no stored lint results; run lint first)",
             }, indent=2)
         from .problems_advisor import analyze_problems_tool
         result = analyze_problems_tool(problems_json, include_hints, output_path)
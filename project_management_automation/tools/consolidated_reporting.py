@@ -35,6 +35,8 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
+from ..utils.tool_result_cache import cached_tool
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +46,8 @@ Consolidated Reporting
 Consolidated tools: report, security_async, security
 """
 
+# prd writes PRD.md on every run, so only overview and scorecard are cached
+@cached_tool("report", inputs={"overview": ("todo2", "inventory"), "scorecard": ("todo2", "inventory")})
 def report(
     action: str = "overview",
     # common params
@@ -4,12 +4,13 @@ MCP Tool Wrapper for Daily Automation
 Wraps DailyAutomation to expose as MCP tool.
 """
 
-from typing import Optional, List
-import json
+from typing import Any, Optional, List
 import logging
 import time
 from pathlib import Path
 
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 # Import error handler at module level to avoid scoping issues
@@ -34,12 +35,13 @@ except ImportError:
             AUTOMATION_ERROR = "AUTOMATION_ERROR"
 
 
+@structured_tool
 def run_daily_automation(
     tasks: Optional[List[str]] = None,
     include_slow: bool = False,
     dry_run: bool = False,
     output_path: Optional[str] = None
-) -> str:
+) -> dict[str, Any]:
     """
     [HINT: Daily automation. Returns tasks run, success rate, summary, report path.]
 
@@ -74,13 +76,10 @@ def run_daily_automation(
         except Exception as e:
             error_msg = f"Failed to find project root: {str(e)}"
             logger.error(error_msg)
-            return json.dumps(
-                format_error_response(
-                    error_msg,
-                    ErrorCode.AUTOMATION_ERROR,
-                    include_traceback=False
-                ),
-                indent=2
+            return format_error_response(
+                error_msg,
+                ErrorCode.AUTOMATION_ERROR,
+                include_traceback=False
             )
 
         # Build config
@@ -98,13 +97,10 @@ def run_daily_automation(
         except Exception as e:
             error_msg = f"Failed to run daily automation: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            return json.dumps(
-                format_error_response(
-                    error_msg,
-                    ErrorCode.AUTOMATION_ERROR,
-                    include_traceback=True
-                ),
-                indent=2
+            return format_error_response(
+                error_msg,
+                ErrorCode.AUTOMATION_ERROR,
+                include_traceback=True
             )
 
         # Extract key metrics
@@ -137,23 +133,17 @@ def run_daily_automation(
         duration = time.time() - start_time
         log_automation_execution('run_daily_automation', duration, True)
 
-        return json.dumps(
-            format_success_response(response_data, "Daily automation completed"),
-            indent=2
-        )
+        return format_success_response(response_data, "Daily automation completed")
 
     except ImportError as e:
         duration = time.time() - start_time
         error_msg = f"Failed to import required modules: {str(e)}. Ensure all dependencies are installed."
         log_automation_execution('run_daily_automation', duration, False, error_msg)
         logger.error(error_msg, exc_info=True)
-        return json.dumps(
-            format_error_response(
-                error_msg,
-                ErrorCode.AUTOMATION_ERROR,
-                include_traceback=False
-            ),
-            indent=2
+        return format_error_response(
+            error_msg,
+            ErrorCode.AUTOMATION_ERROR,
+            include_traceback=False
         )
     except Exception as e:
         duration = time.time() - start_time
@@ -161,11 +151,8 @@ def run_daily_automation(
         log_automation_execution('run_daily_automation', duration, False, error_msg)
         logger.error(error_msg, exc_info=True)
 
-        return json.dumps(
-            format_error_response(
-                error_msg,
-                ErrorCode.AUTOMATION_ERROR,
-                include_traceback=True
-            ),
-            indent=2
+        return format_error_response(
+            error_msg,
+            ErrorCode.AUTOMATION_ERROR,
+            include_traceback=True
         )
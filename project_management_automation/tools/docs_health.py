@@ -4,12 +4,13 @@ MCP Tool Wrapper for Documentation Health Check
 Wraps DocumentationHealthAnalyzerV2 to expose as MCP tool.
 """
 
-from typing import Optional
-import json
+from typing import Any, Optional
 import logging
 import time
 from pathlib import Path
 
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 # Import error handler at module level to avoid scoping issues
@@ -34,16 +35,19 @@ except ImportError:
             AUTOMATION_ERROR = "AUTOMATION_ERROR"
 
 
+@structured_tool
 def check_documentation_health(
     output_path: Optional[str] = None,
-    create_tasks: bool = True
-) -> str:
+    create_tasks: bool = True,
+    write_report: bool = True
+) -> dict[str, Any]:
     """
     Analyze documentation structure, find broken references, identify issues.
 
     Args:
         output_path: Path for report output (default: docs/DOCUMENTATION_HEALTH_REPORT.md)
         create_tasks: Whether to create Todo2 tasks for issues found
+        write_report: Whether to write the markdown report to output_path
 
     Returns:
         JSON string with analysis results
@@ -68,6 +72,12 @@ def check_documentation_health(
         analyzer = DocumentationHealthAnalyzerV2(config, project_root)
         results = analyzer.run()
 
+        # Write report
+        report_path = project_root / config['output_path']
+        if write_report and results.get('report'):
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text(results['report'])
+
         # Extract key metrics
         health_score = results.get('results', {}).get('health_score', 0)
         link_validation = results.get('results', {}).get('link_validation', {})
@@ -76,7 +86,7 @@ def check_documentation_health(
         # Format response
         response_data = {
             'health_score': health_score,
-            'report_path': str(Path(config['output_path']).absolute()),
+            'report_path': str(report_path.absolute()),
             'link_validation': {
                 'total_links': link_validation.get('total_links', 0),
                 'broken_internal': len(link_validation.get('broken_internal', [])),
@@ -90,11 +100,11 @@ def check_documentation_health(
         duration = time.time() - start_time
         log_automation_execution('check_documentation_health', duration, True)
 
-        return json.dumps(format_success_response(response_data), indent=2)
+        return format_success_response(response_data)
 
     except Exception as e:
         duration = time.time() - start_time
         log_automation_execution('check_documentation_health', duration, False, e)
 
         error_response = format_error_response(e, ErrorCode.AUTOMATION_ERROR)
-        return json.dumps(error_response, indent=2)
+        return error_response
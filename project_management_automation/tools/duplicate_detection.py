@@ -7,12 +7,13 @@ Memory Integration:
 - Saves duplicate resolution decisions for consistency
 """
 
-import json
 import logging
 import time
 from pathlib import Path
 from typing import Any, Optional
 
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,11 +73,13 @@ except ImportError:
             AUTOMATION_ERROR = "AUTOMATION_ERROR"
 
 
+@structured_tool
 def detect_duplicate_tasks(
     similarity_threshold: float = 0.85,
     auto_fix: bool = False,
-    output_path: Optional[str] = None
-) -> str:
+    output_path: Optional[str] = None,
+    write_report: bool = True
+) -> dict[str, Any]:
     """
     Find and consolidate duplicate Todo2 tasks.
 
@@ -84,6 +87,7 @@ def detect_duplicate_tasks(
         similarity_threshold: Similarity threshold for duplicate detection (0.0-1.0)
         auto_fix: Whether to automatically fix duplicates (default: False)
         output_path: Path for report output (default: docs/TODO2_DUPLICATE_DETECTION_REPORT.md)
+        write_report: Whether to write the markdown report to output_path
 
     Returns:
         JSON string with detection results
@@ -109,22 +113,26 @@ def detect_duplicate_tasks(
         detector = Todo2DuplicateDetector(config, project_root)
         results = detector.run()
 
+        # Write report
+        report_path = project_root / config['output_path']
+        if write_report and results.get('report'):
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text(results['report'])
+
         # Extract duplicates from detector instance (they're stored there, not in results)
         # The base class doesn't include duplicates in the returned structure
         duplicates = detector.duplicates
 
         # Get total_tasks from analysis results by re-running analysis
         # (or we can access it from the detector's _execute_analysis result)
-        # For now, load it directly from Todo2 state file
-        todo2_path = project_root / '.todo2' / 'state.todo2.json'
+        # For now, read it from the shared Todo2 snapshot
+        from ..utils.todo2_store import get_todo2_store
+
         total_tasks = 0
-        if todo2_path.exists():
-            try:
-                with open(todo2_path) as f:
-                    data = json.load(f)
-                    total_tasks = len(data.get('todos', []))
-            except Exception:
-                pass
+        try:
+            total_tasks = len(get_todo2_store(project_root).get_tasks())
+        except Exception:
+            pass
 
         # Extract auto-fix results from results dict (stored by _execute_analysis)
         auto_fix_applied = results.get('auto_fix_applied', auto_fix)
@@ -147,7 +155,7 @@ def detect_duplicate_tasks(
                 len(duplicates.get('similar_description_matches', [])) +
                 len(duplicates.get('self_dependencies', []))
             ),
-            'report_path': str((project_root / config['output_path']).absolute()),
+            'report_path': str(report_path.absolute()),
             'auto_fix_applied': auto_fix_applied,
             'tasks_removed': tasks_removed,
             'tasks_merged': tasks_merged,
@@ -164,10 +172,10 @@ def detect_duplicate_tasks(
             if memory_result.get('success'):
                 response_data['memory_saved'] = memory_result.get('memory_id')
 
-        return json.dumps(format_success_response(response_data), indent=2)
+        return format_success_response(response_data)
 
     except Exception as e:
         duration = time.time() - start_time
         log_automation_execution('detect_duplicate_tasks', duration, False, e)
         error_response = format_error_response(e, ErrorCode.AUTOMATION_ERROR)
-        return json.dumps(error_response, indent=2)
+        return error_response
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from ..utils import find_project_root
+from ..utils.todo2_store import get_todo2_store
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +47,8 @@ class EstimationLearner:
             - Error patterns by tag, priority, method
             - Recommendations for improvement
         """
-        if not self.state_file.exists():
+        store = get_todo2_store(self.project_root)
+        if not store.exists():
             return {
                 'success': False,
                 'message': 'No task data available',
@@ -54,10 +56,7 @@ class EstimationLearner:
             }
 
         try:
-            with open(self.state_file) as f:
-                data = json.load(f)
-
-            tasks = data.get('todos', [])
+            tasks = store.get_tasks()
 
             # Get completed tasks with both estimates and actuals
             completed_tasks = []
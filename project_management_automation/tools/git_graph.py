@@ -243,7 +243,7 @@ def generate_commit_graph(
         commits = tracker.get_commits_for_branch(branch)
     else:
         # Get all commits
-        commits = tracker._load_commits()
+        commits = tracker.get_all_commits()
 
     if format.lower() == "dot":
         return generate_graphviz_dot(commits, output_path)
@@ -20,6 +20,7 @@ from datetime import datetime
 from pathlib import Path
 
 from ..utils import find_project_root
+from ..utils.todo2_store import get_todo2_store
 from ..utils.branch_utils import (
     filter_tasks_by_branch,
     get_all_branch_statistics,
@@ -120,16 +121,12 @@ def list_branches() -> str:
     Returns JSON string with branch list and statistics.
     """
     try:
-        project_root = find_project_root()
-        todo2_file = project_root / ".todo2" / "state.todo2.json"
+        store = get_todo2_store(find_project_root())
 
-        if not todo2_file.exists():
+        if not store.exists():
             return json.dumps({"branches": [], "statistics": {}}, indent=2)
 
-        with open(todo2_file) as f:
-            data = json.load(f)
-
-        tasks = data.get("todos", [])
+        tasks = store.get_tasks()
         branches = get_all_branches(tasks)
         statistics = get_all_branch_statistics(tasks)
 
@@ -151,17 +148,12 @@ def get_branch_tasks(branch: str) -> str:
     Returns JSON string with task list.
     """
     try:
-        project_root = find_project_root()
-        todo2_file = project_root / ".todo2" / "state.todo2.json"
+        store = get_todo2_store(find_project_root())
 
-        if not todo2_file.exists():
+        if not store.exists():
             return json.dumps({"branch": branch, "tasks": []}, indent=2)
 
-        with open(todo2_file) as f:
-            data = json.load(f)
-
-        tasks = data.get("todos", [])
-        branch_tasks = filter_tasks_by_branch(tasks, branch)
+        branch_tasks = filter_tasks_by_branch(store.get_tasks(), branch)
 
         result = {
             "branch": branch,
@@ -276,29 +268,26 @@ def set_task_branch_tool(task_id: str, branch: str) -> str:
     Returns JSON string with result.
     """
     try:
-        project_root = find_project_root()
-        todo2_file = project_root / ".todo2" / "state.todo2.json"
+        store = get_todo2_store(find_project_root())
 
-        if not todo2_file.exists():
+        if not store.exists():
             return json.dumps({"error": "Todo2 state file not found"}, indent=2)
 
-        with open(todo2_file) as f:
-            data = json.load(f)
+        with store.write_lock():
+            data = store.load_state_for_update()
 
-        tasks = data.get("todos", [])
-        task_index = next((i for i, t in enumerate(tasks) if t.get("id") == task_id), None)
+            tasks = data["todos"]
+            task_index = next((i for i, t in enumerate(tasks) if t.get("id") == task_id), None)
 
-        if task_index is None:
-            return json.dumps({"error": f"Task {task_id} not found"}, indent=2)
+            if task_index is None:
+                return json.dumps({"error": f"Task {task_id} not found"}, indent=2)
 
-        old_task = tasks[task_index].copy()
-        new_task = set_task_branch(tasks[task_index], branch)
-        tasks[task_index] = new_task
+            old_task = tasks[task_index].copy()
+            new_task = set_task_branch(tasks[task_index], branch)
+            tasks[task_index] = new_task
 
-        # Save
-        data["todos"] = tasks
-        with open(todo2_file, "w") as f:
-            json.dump(data, f, indent=2)
+            # Save
+            store.save_state(data)
 
         # Track commit
         track_task_update(
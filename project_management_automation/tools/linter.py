@@ -4,6 +4,10 @@ Linter Tool - Run external linters and analyze results.
 Bridges the gap between external linters (ruff, flake8) and the analyze_problems tool.
 Runs linters, converts output to problems_json format, and optionally analyzes.
 
+Incremental Linting:
+- Results are stored per file content hash and linter config (utils/lint_cache.py)
+- Only changed files are re-linted; lint(action="analyze") can reuse the store
+
 Memory Integration:
 - Saves linting results for pattern tracking
 """
@@ -15,8 +19,14 @@ import time
 from pathlib import Path
 from typing import Any, Optional
 
+from ..utils.tool_executor import ToolCancelledError, check_cancelled, run_subprocess
+
 logger = logging.getLogger(__name__)
 
+# Files linted incrementally, and how many are passed per linter invocation
+LINT_EXTENSIONS = ('.py', '.pyi')
+LINT_BATCH_SIZE = 200
+
 # Import error handler
 try:
     from ..error_handler import (
@@ -128,6 +138,135 @@ def _parse_ruff_output(output: str) -> list[dict[str, Any]]:
     return problems
 
 
+def _linter_command(
+    linter: str,
+    fix: bool,
+    select: Optional[str],
+    ignore: Optional[str],
+) -> Optional[list[str]]:
+    """Build the linter command line without target paths (None for unknown linters)."""
+    if linter == "ruff":
+        # Incremental runs pass explicit file paths, which ruff lints even when
+        # its configuration excludes them unless --force-exclude is given
+        cmd = ["ruff", "check", "--output-format=json", "--force-exclude"]
+        if fix:
+            cmd.append("--fix")
+    elif linter == "flake8":
+        cmd = ["flake8", "--format=json"]
+    else:
+        return None
+    if select:
+        cmd.extend(["--select", select])
+    if ignore:
+        cmd.extend(["--ignore", ignore])
+    return cmd
+
+
+def _lint_incremental(
+    project_root: Path,
+    target_path: str,
+    linter: str,
+    cmd: list[str],
+    fix: bool,
+    select: Optional[str],
+    ignore: Optional[str],
+) -> Optional[dict[str, Any]]:
+    """
+    Lint only files whose content changed since the last run, merging the rest from the lint store.
+
+    Returns:
+        Dict with problems and aggregates, or None if the target cannot be
+        linted incrementally (outside the project root, missing, or without
+        lintable files)
+    """
+    from ..utils.file_metrics import get_file_metrics_cache
+    from ..utils.lint_cache import get_lint_result_store, lint_config_key
+    from ..utils.repo_inventory import get_repo_inventory
+
+    target = Path(target_path)
+    if not target.is_absolute():
+        target = project_root / target
+    if not target.exists():
+        return None
+    try:
+        rel_target = target.resolve().relative_to(project_root.resolve()).as_posix()
+    except (ValueError, OSError):
+        return None
+    rel_target = '' if rel_target == '.' else rel_target
+
+    if target.is_dir():
+        paths = get_repo_inventory(project_root).relpaths(ext=LINT_EXTENSIONS, under=rel_target)
+    else:
+        paths = [rel_target]
+
+    metrics = get_file_metrics_cache(project_root)
+    hashes = {}
+    for rel in paths:
+        entry = metrics.metrics(rel)
+        if entry:
+            hashes[rel] = entry['hash']
+    if not hashes:
+        # Nothing to track per file (e.g. no Python files): lint the target directly
+        return None
+
+    store = get_lint_result_store(project_root)
+    config = lint_config_key(project_root, linter, select, ignore)
+    # --fix rewrites files, so every file is linted (and re-hashed afterwards)
+    stale = list(hashes) if fix else store.stale(config, hashes)
+
+    for i in range(0, len(stale), LINT_BATCH_SIZE):
+        check_cancelled()
+        batch = stale[i:i + LINT_BATCH_SIZE]
+        result = run_subprocess(
+            cmd + [str(project_root / rel) for rel in batch],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            cwd=str(project_root)
+        )
+        # 0 = clean, 1 = problems found; anything else means no results
+        if result.returncode not in (0, 1):
+            raise RuntimeError(f"{linter} exited with {result.returncode}: {result.stderr.strip()[:500]}")
+
+        by_path: dict[str, list[dict[str, Any]]] = {rel: [] for rel in batch}
+        for problem in _parse_ruff_output(result.stdout):
+            problem_path = Path(problem.get('file', ''))
+            if not problem_path.is_absolute():
+                problem_path = project_root / problem_path
+            try:
+                rel = problem_path.resolve().relative_to(project_root.resolve()).as_posix()
+            except (ValueError, OSError):
+                rel = problem.get('file', '')
+            by_path.setdefault(rel, []).append(problem)
+
+        for rel, problems in by_path.items():
+            if rel not in hashes:
+                continue
+            content_hash = hashes[rel]
+            if fix:
+                entry = metrics.metrics(rel)
+                if not entry:
+                    continue
+                content_hash = hashes[rel] = entry['hash']
+            store.update(config, rel, content_hash, problems, linter=linter)
+
+    if target.is_dir():
+        store.prune(config, rel_target, hashes)
+    results = store.results(config, paths=None if rel_target == '' and target.is_dir() else list(hashes))
+    store.save()
+    metrics.save()
+
+    results = results or {'problems': [], 'by_severity': {}, 'by_category': {}, 'by_file': {}}
+    return {
+        **results,
+        'files_checked': len(hashes),
+        'lint_cache': {
+            'files_linted': len(stale),
+            'files_reused': len(hashes) - len(stale),
+        },
+    }
+
+
 def run_linter(
     path: Optional[str] = None,
     linter: str = "ruff",
@@ -139,6 +278,10 @@ def run_linter(
     """
     Run external linter and optionally analyze results.
 
+    Only files changed since the last run with the same linter configuration
+    are linted; results for unchanged files come from the lint store
+    (`.exarp/lint_cache.json`).
+
     Args:
         path: File or directory to lint (default: current directory)
         linter: Linter to use - "ruff" or "flake8" (default: ruff)
@@ -154,98 +297,68 @@ def run_linter(
 
     try:
         from ..utils import find_project_root
+        from ..utils.lint_cache import summarize_problems
 
         project_root = find_project_root()
         target_path = path or str(project_root)
 
-        # Build command based on linter
-        if linter == "ruff":
-            cmd = ["ruff", "check", "--output-format=json"]
-            if fix:
-                cmd.append("--fix")
-            if select:
-                cmd.extend(["--select", select])
-            if ignore:
-                cmd.extend(["--ignore", ignore])
-            cmd.append(target_path)
-        elif linter == "flake8":
-            cmd = ["flake8", "--format=json"]
-            if select:
-                cmd.extend(["--select", select])
-            if ignore:
-                cmd.extend(["--ignore", ignore])
-            cmd.append(target_path)
-        else:
+        cmd = _linter_command(linter, fix, select, ignore)
+        if cmd is None:
             return json.dumps(format_error_response(
                 f"Unknown linter: {linter}. Use 'ruff' or 'flake8'",
                 ErrorCode.AUTOMATION_ERROR
             ), indent=2)
 
-        # Run linter
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
-            cwd=str(project_root)
-        )
-
-        # Parse output
-        if linter == "ruff":
-            problems = _parse_ruff_output(result.stdout)
+        incremental = _lint_incremental(Path(project_root), target_path, linter, cmd, fix, select, ignore)
+        if incremental is not None:
+            problems = incremental['problems']
+            by_severity = incremental['by_severity']
+            by_category = incremental['by_category']
+            by_file = incremental['by_file']
+            files_checked = incremental['files_checked']
         else:
-            # For other linters, try to parse as JSON or text
+            # Lint the target directly, uncached
+            result = run_subprocess(
+                cmd + [target_path],
+                capture_output=True,
+                text=True,
+                timeout=120,
+                cwd=str(project_root)
+            )
             problems = _parse_ruff_output(result.stdout)
 
-        # Categorize issues
-        by_severity: dict[str, int] = {}
-        by_category: dict[str, int] = {}
-        by_file: dict[str, int] = {}
-
-        for p in problems:
-            sev = p.get('severity', 'unknown')
-            by_severity[sev] = by_severity.get(sev, 0) + 1
-
-            # Categorize by code prefix
-            code = p.get('code', '')
-            if code.startswith('E'):
-                cat = 'error'
-            elif code.startswith('F'):
-                cat = 'fatal'
-            elif code.startswith('W'):
-                cat = 'warning'
-            elif code.startswith('I'):
-                cat = 'import'
-            elif code.startswith('UP'):
-                cat = 'upgrade'
+            summary = summarize_problems(problems)
+            by_severity = summary['by_severity']
+            by_category = summary['by_category']
+            by_file: dict[str, int] = {}
+            for p in problems:
+                file = p.get('file', 'unknown')
+                by_file[file] = by_file.get(file, 0) + 1
+
+            # Count files checked (approximation from path)
+            target = Path(target_path)
+            if target.is_file():
+                files_checked = 1
+            elif target.is_dir():
+                files_checked = len(list(target.rglob("*.py")))
             else:
-                cat = 'other'
-            by_category[cat] = by_category.get(cat, 0) + 1
-
-            file = p.get('file', 'unknown')
-            by_file[file] = by_file.get(file, 0) + 1
-
-        # Count files checked (approximation from path)
-        target = Path(target_path)
-        if target.is_file():
-            files_checked = 1
-        elif target.is_dir():
-            files_checked = len(list(target.rglob("*.py")))
-        else:
-            files_checked = 0
+                files_checked = 0
 
+        top_files = sorted(by_file.items(), key=lambda item: item[1], reverse=True)[:10]
         response_data = {
             'linter': linter,
             'path': target_path,
             'total_issues': len(problems),
             'by_severity': by_severity,
             'by_category': by_category,
-            'by_file': dict(list(by_file.items())[:10]),  # Top 10 files
+            'by_file': dict(top_files),  # Top 10 files
             'files_checked': files_checked,
             'fix_applied': fix,
             'problems': problems[:50],  # Limit to 50 in response
             'problems_json': json.dumps(problems),  # Full list for analyze_problems
         }
+        if incremental is not None:
+            response_data['lint_cache'] = incremental['lint_cache']
 
         # Optionally run analyze_problems
         if analyze and problems:
@@ -280,12 +393,57 @@ def run_linter(
             "Linter timed out after 120 seconds",
             ErrorCode.AUTOMATION_ERROR
         ), indent=2)
+    except ToolCancelledError:
+        raise
     except Exception as e:
         duration = time.time() - start_time
         log_automation_execution('run_linter', duration, False, e)
         return json.dumps(format_error_response(str(e), ErrorCode.AUTOMATION_ERROR), indent=2)
 
 
+def analyze_stored_problems(include_hints: bool = True, output_path: Optional[str] = None) -> Optional[str]:
+    """
+    Analyze the problems recorded by the last lint run without re-running the linter.
+
+    Args:
+        include_hints: Include resolution hints
+        output_path: Save analysis to file
+
+    Returns:
+        JSON string from analyze_problems_tool with a 'lint_cache' summary
+        added, or None if no lint results are stored
+    """
+    from ..utils import find_project_root
+    from ..utils.file_metrics import get_file_metrics_cache
+    from ..utils.lint_cache import get_lint_result_store
+    from .problems_advisor import analyze_problems_tool
+
+    project_root = find_project_root()
+    store = get_lint_result_store(project_root)
+    stored = store.results()
+    if stored is None:
+        return None
+
+    # Report files edited since they were linted (their problems may be outdated)
+    metrics = get_file_metrics_cache(project_root)
+    stale_files = store.stale_paths(
+        lambda rel: (metrics.metrics(rel) or {}).get('hash')
+    )
+
+    result = analyze_problems_tool(json.dumps(stored['problems']), include_hints, output_path)
+    try:
+        data = json.loads(result)
+    except (TypeError, ValueError):
+        return result
+    data['lint_cache'] = {
+        'linter': stored['linter'],
+        'files': stored['files'],
+        'total_issues': len(stored['problems']),
+        'stale_files': stale_files,
+    }
+    return json.dumps(data, indent=2)
+
+
 def get_linter_status() -> str:
     """
     Check which linters are available.
@@ -19,6 +19,7 @@ from ..resources.memories import (
     _load_all_memories,
     create_memory,
 )
+from ..utils.tool_result import as_result
 
 # Use devwisdom-go MCP server instead of direct import
 from ..utils.wisdom_client import consult_advisor
@@ -284,8 +285,7 @@ def memory_dream(
             project_root = find_project_root()
             advisors_json = read_wisdom_resource_sync("wisdom://advisors", project_root)
             if advisors_json:
-                import json
-                advisors_data = json.loads(advisors_json) if isinstance(advisors_json, str) else advisors_json
+                advisors_data = as_result(advisors_json)
                 METRIC_ADVISORS = advisors_data.get("by_metric", {})
         except Exception:
             # Fallback to old implementation
@@ -306,16 +306,8 @@ def memory_dream(
             context=f"Dreaming on {len(memories)} memories from last {days} days",
         )
 
-        # consult_advisor now returns dict (from MCP server), convert to JSON string if needed
-        if isinstance(consultation_result, dict):
-            import json
-            consultation_json = json.dumps(consultation_result, indent=2)
-        else:
-            consultation_json = consultation_result or "{}"
-
-        # Parse JSON string to dict
-        import json
-        consultation = json.loads(consultation_json)
+        # consult_advisor returns a dict (from MCP server) or, from older modules, JSON
+        consultation = as_result(consultation_result)
 
         reflections.append({
             **consultation,
@@ -11,17 +11,17 @@ Trusted Advisor: 📜 Chacham (Wisdom)
 """
 
 import logging
-import os
 from collections import defaultdict
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from typing import Any
 
 from ..resources.memories import (
-    _get_memories_dir,
+    _get_store,
     _load_all_memories,
     _save_memory,
 )
+from ..utils.near_duplicates import find_similar_groups
 
 logger = logging.getLogger(__name__)
 
@@ -33,17 +33,12 @@ logger = logging.getLogger(__name__)
 
 def _delete_memory(memory_id: str) -> bool:
     """Delete a memory file by ID."""
-    memories_dir = _get_memories_dir()
-    memory_file = memories_dir / f"{memory_id}.json"
-
-    if memory_file.exists():
-        try:
-            os.remove(memory_file)
+    try:
+        if _get_store().delete(memory_id):
             logger.info(f"Deleted memory: {memory_id}")
             return True
-        except OSError as e:
-            logger.error(f"Failed to delete memory {memory_id}: {e}")
-            return False
+    except OSError as e:
+        logger.error(f"Failed to delete memory {memory_id}: {e}")
     return False
 
 
@@ -125,32 +120,16 @@ def _find_duplicate_groups(
     all_groups = []
 
     for _category, cat_memories in by_category.items():
-        # Track which memories have been grouped
-        grouped = set()
-
-        for i, m1 in enumerate(cat_memories):
-            if m1["id"] in grouped:
-                continue
-
-            group = [m1]
-            grouped.add(m1["id"])
-
-            for _j, m2 in enumerate(cat_memories[i + 1:], start=i + 1):
-                if m2["id"] in grouped:
-                    continue
-
-                # Compare titles
-                title_sim = _similarity_ratio(
-                    m1.get("title", ""),
-                    m2.get("title", ""),
-                )
+        titles = [m.get("title", "").lower() for m in cat_memories]
+        index_groups = find_similar_groups(titles, similarity_threshold)
 
-                if title_sim >= similarity_threshold:
-                    group.append(m2)
-                    grouped.add(m2["id"])
+        # Untitled memories are identical to each other (ratio 1.0)
+        untitled = [i for i, title in enumerate(titles) if not title]
+        if len(untitled) > 1:
+            index_groups.append(untitled)
+            index_groups.sort(key=lambda g: g[0])
 
-            if len(group) > 1:
-                all_groups.append(group)
+        all_groups.extend([cat_memories[i] for i in group] for group in index_groups)
 
     return all_groups
 
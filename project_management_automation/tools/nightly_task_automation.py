@@ -21,6 +21,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, List, Optional
 
+from ..utils.todo2_store import get_todo2_store
+
 nightly_logger = logging.getLogger(__name__)
 
 # Add parent directory to path for imports
@@ -197,27 +199,35 @@ class NightlyTaskAutomation(IntelligentAutomationBase):
         return default_hostnames
 
     def _load_todo2_state(self) -> dict[str, Any]:
-        """Load TODO2 state file."""
-        if not self.todo2_state_file.exists():
+        """Load a private, mutable copy of the TODO2 state."""
+        store = get_todo2_store(self.project_root)
+        if not store.exists():
             return {"todos": []}
 
         try:
-            with open(self.todo2_state_file) as f:
-                return json.load(f)
+            return store.load_state_for_update()
         except Exception as e:
             return {"todos": [], "error": str(e)}
 
-    def _save_todo2_state(self, state: dict[str, Any]) -> bool:
-        """Save TODO2 state file."""
+    def _save_todo2_tasks(self, tasks: list[dict[str, Any]]) -> bool:
+        """
+        Write updated tasks (matched by ID) into the current TODO2 state.
+
+        The state is re-read under the Todo2 write lock, so changes made by
+        other writers since it was loaded (e.g. atomic assignments) are kept.
+        """
+        store = get_todo2_store(self.project_root)
+        updated = {t['id']: t for t in tasks if t.get('id')}
         try:
-            # Create backup
-            if self.todo2_state_file.exists():
-                backup_file = self.todo2_state_file.with_suffix('.json.bak')
-                with open(self.todo2_state_file) as f:
-                    backup_file.write_text(f.read())
-
-            with open(self.todo2_state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            with store.write_lock():
+                # Create backup
+                if store.exists():
+                    backup_file = self.todo2_state_file.with_suffix('.json.bak')
+                    backup_file.write_bytes(self.todo2_state_file.read_bytes())
+
+                state = store.load_state_for_update()
+                state['todos'] = [updated.get(t.get('id'), t) for t in state['todos']]
+                store.save_state(state)
             return True
         except Exception:
             return False
@@ -474,10 +484,12 @@ class NightlyTaskAutomation(IntelligentAutomationBase):
 
         # Move interactive tasks to Review (if not dry run)
         moved_to_review = []
+        updated_tasks = {}
         if not dry_run:
             for task in interactive_tasks[:max_parallel_tasks]:  # Limit moves
                 task = self._move_to_review(task, "Requires user input or clarification")
                 moved_to_review.append(task['id'])
+                updated_tasks[task['id']] = task
 
                 # Update in state
                 for i, t in enumerate(todos):
@@ -556,6 +568,7 @@ class NightlyTaskAutomation(IntelligentAutomationBase):
                 # Update task status to In Progress
                 task = self._update_task_status(task, 'In Progress',
                     f"Assigned to {host_key} agent for automated execution")
+                updated_tasks[task['id']] = task
 
                 # Update in state
                 for i, t in enumerate(todos):
@@ -602,10 +615,9 @@ class NightlyTaskAutomation(IntelligentAutomationBase):
                 # Log error but don't fail the automation
                 print(f"Warning: Batch approval failed: {e}", file=sys.stderr)
 
-        # Save state (if not dry run)
+        # Save updated tasks (if not dry run)
         if not dry_run:
-            state['todos'] = todos
-            self._save_todo2_state(state)
+            self._save_todo2_tasks(list(updated_tasks.values()))
 
         # Prepare results
         results = {
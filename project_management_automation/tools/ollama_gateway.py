@@ -0,0 +1,368 @@
+"""
+Shared generation gateway for the local Ollama server.
+
+generate_with_ollama used to build a new client for every call and never
+reused a result, although the Ollama-enhanced tools (code documentation,
+code quality, context summaries) often send identical prompts. The gateway
+sits between callers and the server:
+- one pooled client per (host, client class), reused across calls
+- a content-addressed response cache: the key is a hash of
+  (host, model, prompt, options); entries expire after a TTL and the
+  least recently used are evicted
+- request coalescing: concurrent identical requests share one in-flight call
+- a concurrency limit per model, so parallel tools cannot swamp the server
+
+When the ollama package is not installed, a minimal keep-alive HTTP client
+for Ollama's REST API is used instead.
+
+Environment:
+    EXARP_DISABLE_OLLAMA_CACHE=1        # Always call the server (coalescing still applies)
+    EXARP_OLLAMA_MAX_CONCURRENCY=2      # In-flight generations per model
+
+Usage:
+    from project_management_automation.tools.ollama_gateway import get_ollama_gateway
+
+    text, source = get_ollama_gateway().generate("llama3.2", "Summarize ...", {"num_ctx": 4096})
+    # source: "server", "cache" or "coalesced"
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.client import HTTPConnection, HTTPSConnection
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "http://localhost:11434"
+
+# Cached responses
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL = 3600
+
+# Pooled clients (one per host and client class)
+MAX_CLIENTS = 8
+
+DEFAULT_MAX_CONCURRENCY = 2
+
+
+def _cache_disabled() -> bool:
+    return os.environ.get("EXARP_DISABLE_OLLAMA_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def _max_concurrency() -> int:
+    try:
+        return max(1, int(os.environ.get("EXARP_OLLAMA_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENCY
+
+
+class OllamaHTTPClient:
+    """
+    Minimal client for Ollama's REST API with persistent connections.
+
+    Used when the ollama package is not installed; mirrors the subset of
+    `ollama.Client` the gateway needs.
+    """
+
+    def __init__(self, host: Optional[str] = None, timeout: float = 300.0):
+        """
+        Initialize client.
+
+        Args:
+            host: Server URL (default: $OLLAMA_HOST or http://localhost:11434)
+            timeout: Socket timeout in seconds
+        """
+        host = host or os.environ.get("OLLAMA_HOST") or DEFAULT_HOST
+        if "://" not in host:
+            host = f"http://{host}"
+        parts = urlsplit(host)
+        self._https = parts.scheme == "https"
+        self._address = (parts.hostname or "localhost", parts.port or (443 if self._https else 11434))
+        self._timeout = timeout
+        self._idle: list[HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _connection(self) -> tuple[HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        connection_class = HTTPSConnection if self._https else HTTPConnection
+        return connection_class(*self._address, timeout=self._timeout), False
+
+    def _post(self, path: str, payload: dict[str, Any]) -> bytes:
+        body = json.dumps(payload).encode()
+        while True:
+            connection, reused = self._connection()
+            try:
+                connection.request("POST", path, body, {"Content-Type": "application/json"})
+                response = connection.getresponse()
+                data = response.read()
+            except ConnectionError:
+                connection.close()
+                # The server may have dropped an idle pooled connection; retry on another
+                if reused:
+                    continue
+                raise
+            except OSError:
+                connection.close()
+                raise
+            if response.will_close:
+                connection.close()
+            else:
+                with self._lock:
+                    self._idle.append(connection)
+            if response.status >= 400:
+                try:
+                    message = json.loads(data).get("error", "")
+                except (ValueError, AttributeError):
+                    message = data.decode(errors="replace")
+                raise RuntimeError(f"Ollama request failed ({response.status}): {message}")
+            return data
+
+    def generate(
+        self,
+        model: str,
+        prompt: str,
+        stream: bool = False,
+        options: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Generate a completion.
+
+        Returns:
+            Response dict, or an iterator of chunk dicts when streaming
+        """
+        data = self._post(
+            "/api/generate",
+            {"model": model, "prompt": prompt, "stream": stream, "options": options or {}},
+        )
+        if stream:
+            return iter([json.loads(line) for line in data.splitlines() if line.strip()])
+        return json.loads(data)
+
+
+def _default_client_class() -> Callable[..., Any]:
+    try:
+        import ollama
+        return ollama.Client
+    except ImportError:
+        return OllamaHTTPClient
+
+
+class _InFlight:
+    """Result slot shared by coalesced callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.text: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class OllamaGateway:
+    """
+    Pooled, cached and rate-limited access to Ollama generation.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL):
+        """
+        Initialize gateway.
+
+        Args:
+            max_entries: Maximum cached responses
+            ttl: Seconds a cached response stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clients: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._responses: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._in_flight: dict[str, _InFlight] = {}
+        self._limits: dict[tuple[str, str], threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "calls": 0, "errors": 0, "throttled": 0}
+
+    def client(self, host: Optional[str] = None, client_class: Optional[Callable[..., Any]] = None) -> Any:
+        """
+        Get the pooled client for a host.
+
+        Args:
+            host: Ollama host URL (None for the client's default)
+            client_class: Client constructor (default: ollama.Client, or
+                OllamaHTTPClient when the package is not installed)
+
+        Returns:
+            Client instance shared by all callers using the same host and class
+        """
+        client_class = client_class or _default_client_class()
+        key = (host, client_class)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return client
+        client = client_class(host=host) if host else client_class()
+        with self._lock:
+            client = self._clients.setdefault(key, client)
+            while len(self._clients) > MAX_CLIENTS:
+                self._clients.popitem(last=False)
+            return client
+
+    @staticmethod
+    def cache_key(host: Optional[str], model: str, prompt: str, options: Optional[dict[str, Any]]) -> str:
+        """Content address of a generation request."""
+        payload = json.dumps([host or "", model, prompt, options or {}], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _limit(self, host: Optional[str], model: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._limits.get((host or "", model))
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(_max_concurrency())
+                self._limits[(host or "", model)] = semaphore
+            return semaphore
+
+    def _call(
+        self,
+        client: Any,
+        host: Optional[str],
+        model: str,
+        prompt: str,
+        options: dict[str, Any],
+        stream: bool,
+    ) -> str:
+        semaphore = self._limit(host, model)
+        if not semaphore.acquire(blocking=False):
+            with self._lock:
+                self._stats["throttled"] += 1
+            semaphore.acquire()
+        try:
+            with self._lock:
+                self._stats["calls"] += 1
+            if stream:
+                chunks: Iterable[Any] = client.generate(model=model, prompt=prompt, stream=True, options=options)
+                return "".join(chunk["response"] for chunk in chunks if "response" in chunk)
+            response = client.generate(model=model, prompt=prompt, stream=False, options=options)
+            return response.get("response", "")
+        finally:
+            semaphore.release()
+
+    def generate(
+        self,
+        model: str,
+        prompt: str,
+        options: Optional[dict[str, Any]] = None,
+        host: Optional[str] = None,
+        stream: bool = False,
+        use_cache: bool = True,
+        client_class: Optional[Callable[..., Any]] = None,
+    ) -> tuple[str, str]:
+        """
+        Generate text, reusing cached or in-flight results for identical requests.
+
+        Args:
+            model: Model name
+            prompt: Prompt text
+            options: Model options (part of the cache key)
+            host: Ollama host URL (None for the default)
+            stream: Stream from the server (the full text is still returned)
+            use_cache: Serve and store cached responses
+            client_class: Client constructor (see client())
+
+        Returns:
+            Tuple of (response text, source) where source is "server",
+            "cache" or "coalesced"
+
+        Raises:
+            Whatever the client raises; failures are not cached
+        """
+        options = dict(options or {})
+        key = self.cache_key(host, model, prompt, options)
+        use_cache = use_cache and not _cache_disabled()
+
+        with self._lock:
+            if use_cache:
+                entry = self._responses.get(key)
+                if entry is not None and time.time() - entry[0] < self.ttl:
+                    self._responses.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[1], "cache"
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = self._in_flight[key] = _InFlight()
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.text, "coalesced"
+
+        try:
+            text = self._call(self.client(host, client_class), host, model, prompt, options, stream)
+            in_flight.text = text
+        except BaseException as e:
+            in_flight.error = e
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+                if use_cache and in_flight.error is None:
+                    self._responses[key] = (time.time(), in_flight.text)
+                    self._responses.move_to_end(key)
+                    while len(self._responses) > self.max_entries:
+                        self._responses.popitem(last=False)
+            in_flight.done.set()
+        return text, "server"
+
+    def clear(self) -> None:
+        """Drop cached responses and pooled clients."""
+        with self._lock:
+            self._responses.clear()
+            self._clients.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get gateway statistics."""
+        with self._lock:
+            return {
+                **self._stats,
+                "cached_responses": len(self._responses),
+                "clients": len(self._clients),
+                "in_flight": len(self._in_flight),
+            }
+
+
+_gateway: Optional[OllamaGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_ollama_gateway() -> OllamaGateway:
+    """
+    Get the process-wide OllamaGateway.
+
+    Returns:
+        OllamaGateway shared by all callers
+    """
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = OllamaGateway()
+        return _gateway
+
+
+__all__ = [
+    "OllamaGateway",
+    "OllamaHTTPClient",
+    "get_ollama_gateway",
+]
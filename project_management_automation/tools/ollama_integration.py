@@ -13,9 +13,12 @@ import logging
 import os
 import platform
 import subprocess
+import threading
 import time
 from typing import Any, Optional
 
+from .ollama_gateway import get_ollama_gateway
+
 logger = logging.getLogger(__name__)
 
 def get_system_ram_gb() -> float:
@@ -303,6 +306,31 @@ def detect_hardware_config() -> dict[str, Any]:
     return config
 
 
+_hardware_config_memo: Optional[tuple[Any, dict[str, Any]]] = None
+_hardware_config_lock = threading.Lock()
+
+
+def get_hardware_config(refresh: bool = False) -> dict[str, Any]:
+    """
+    Get detect_hardware_config() results, detected once per process.
+
+    Detection shells out to sysctl/nvidia-smi/rocm-smi, so generation paths
+    use this memoized copy instead of re-detecting on every request.
+
+    Args:
+        refresh: Re-run detection
+
+    Returns:
+        Hardware config dict (shared; treat as read-only)
+    """
+    global _hardware_config_memo
+    with _hardware_config_lock:
+        # Keyed on the detector itself so a replaced detector is honoured
+        if refresh or _hardware_config_memo is None or _hardware_config_memo[0] is not detect_hardware_config:
+            _hardware_config_memo = (detect_hardware_config, detect_hardware_config())
+        return _hardware_config_memo[1]
+
+
 def get_optimized_ollama_options(
     num_gpu: Optional[int] = None,
     num_threads: Optional[int] = None,
@@ -324,7 +352,7 @@ def get_optimized_ollama_options(
     options = {}
 
     if use_auto_detect:
-        hw_config = detect_hardware_config()
+        hw_config = get_hardware_config()
 
         # GPU layers
         if num_gpu is None:
@@ -546,6 +574,7 @@ def generate_with_ollama(
     context_size: Optional[int] = None,
     use_flash_attention: Optional[bool] = None,
     use_ram_optimizations: bool = True,
+    use_cache: bool = True,
 ) -> str:
     """
     [HINT: Ollama generation. Generate text using a local Ollama model.]
@@ -565,6 +594,8 @@ def generate_with_ollama(
     - Reduce context_size for faster inference (smaller context = faster) - optimized per hardware
     - Use smaller/quantized models (phi3, llama3.2:1b) for speed
     - Enable streaming for faster perceived response time
+    - Identical requests (model, prompt, options) are answered from the shared
+      gateway's response cache or joined to the identical request in flight
 
     Auto-Detection:
     - Apple Silicon (M1/M2/M3/M4): Automatically uses Metal GPU acceleration (30-40 layers)
@@ -582,6 +613,7 @@ def generate_with_ollama(
         num_gpu: Number of layers to offload to GPU (None = auto-detect based on hardware)
         num_threads: Number of CPU threads to use (None = auto-detect based on CPU cores)
         context_size: Context window size (None = auto-optimize based on hardware)
+        use_cache: Reuse a cached response for an identical request (default: True)
 
     Returns:
         JSON with generated text
@@ -596,12 +628,6 @@ def generate_with_ollama(
         return json.dumps(error_response, indent=2)
 
     try:
-        # Configure client if host provided
-        if host:
-            client = ollama.Client(host=host)
-        else:
-            client = ollama.Client()
-
         # Prepare generation parameters with performance optimizations
         gen_options = options.copy() if options else {}
 
@@ -625,7 +651,7 @@ def generate_with_ollama(
                     logger.warning(f"Invalid OLLAMA_NUM_GPU value: {os.getenv('OLLAMA_NUM_GPU')}")
             elif auto_detect and not has_explicit_gpu:
                 # Auto-detect GPU settings
-                hw_config = detect_hardware_config()
+                hw_config = get_hardware_config()
                 if hw_config["recommended_num_gpu"] is not None:
                     gen_options["num_gpu"] = hw_config["recommended_num_gpu"]
                     logger.info(
@@ -644,7 +670,7 @@ def generate_with_ollama(
                     logger.warning(f"Invalid OLLAMA_NUM_THREADS value: {os.getenv('OLLAMA_NUM_THREADS')}")
             elif auto_detect and not has_explicit_threads:
                 # Auto-detect CPU threads
-                hw_config = detect_hardware_config()
+                hw_config = get_hardware_config()
                 gen_options["num_threads"] = hw_config["recommended_num_threads"]
                 logger.info(
                     f"🚀 Auto-configured CPU: {hw_config['cpu_cores']} cores, "
@@ -662,7 +688,7 @@ def generate_with_ollama(
                     logger.warning(f"Invalid OLLAMA_NUM_CTX value: {os.getenv('OLLAMA_NUM_CTX')}")
             elif auto_detect and not has_explicit_ctx and use_ram_optimizations:
                 # Auto-detect context size based on RAM
-                hw_config = detect_hardware_config()
+                hw_config = get_hardware_config()
                 gen_options["num_ctx"] = hw_config["recommended_context_size"]
                 if hw_config.get("ram_gb", 0) >= 16:
                     logger.info(f"💾 Large RAM detected ({hw_config['ram_gb']:.1f}GB) - using larger context size ({hw_config['recommended_context_size']})")
@@ -674,7 +700,7 @@ def generate_with_ollama(
                 os.environ["OLLAMA_FLASH_ATTENTION"] = "1"
         elif use_ram_optimizations and auto_detect:
             # Auto-enable Flash Attention if RAM allows
-            hw_config = detect_hardware_config()
+            hw_config = get_hardware_config()
             if hw_config.get("ram_optimizations", {}).get("enable_flash_attention", False):
                 if not os.getenv("OLLAMA_FLASH_ATTENTION"):
                     os.environ["OLLAMA_FLASH_ATTENTION"] = "1"
@@ -682,29 +708,29 @@ def generate_with_ollama(
 
         # KV Cache quantization for memory efficiency (optional)
         if use_ram_optimizations and auto_detect:
-            hw_config = detect_hardware_config()
+            hw_config = get_hardware_config()
             if hw_config.get("ram_gb", 0) < 16 and not os.getenv("OLLAMA_KV_CACHE_TYPE"):
                 # For systems with <16GB RAM, use quantized KV cache to save memory
                 gen_options.setdefault("kv_cache_type", "q8_0")  # 8-bit quantization
                 logger.info("💾 Using quantized KV cache for memory efficiency")
 
-        # Generate response
-        if stream:
-            # Stream response
-            response_text = ""
-            for chunk in client.generate(model=model, prompt=prompt, stream=True, options=gen_options):
-                if "response" in chunk:
-                    response_text += chunk["response"]
-        else:
-            # Single response
-            response = client.generate(model=model, prompt=prompt, stream=False, options=gen_options)
-            response_text = response.get("response", "")
+        # Generate through the shared gateway (pooled client, response cache,
+        # coalescing of identical in-flight requests, per-model concurrency limit)
+        response_text, response_source = get_ollama_gateway().generate(
+            model,
+            prompt,
+            gen_options,
+            host=host,
+            stream=stream,
+            use_cache=use_cache,
+            client_class=ollama.Client,
+        )
 
         # Get hardware info for response (if auto-detected)
         hw_info = None
         if auto_detect and (gen_options.get("num_gpu") or gen_options.get("num_threads") or gen_options.get("num_ctx")):
             try:
-                hw_config = detect_hardware_config()
+                hw_config = get_hardware_config()
                 hw_info = {
                     "platform": hw_config["platform"],
                     "gpu_type": hw_config["gpu_type"],
@@ -715,7 +741,7 @@ def generate_with_ollama(
 
         # Get RAM info if available
         try:
-            hw_config = detect_hardware_config()
+            hw_config = get_hardware_config()
             ram_info = {
                 "total_ram_gb": hw_config.get("ram_gb"),
                 "ram_optimizations_applied": hw_config.get("ram_optimizations", {}),
@@ -737,6 +763,7 @@ def generate_with_ollama(
                 "kv_cache_type": gen_options.get("kv_cache_type"),
             },
             "hardware_detected": hw_info,
+            "response_source": response_source,
             "ram_info": ram_info,
             "duration_seconds": round(time.time() - start_time, 2),
         }
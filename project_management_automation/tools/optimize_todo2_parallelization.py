@@ -10,6 +10,9 @@ import time
 from pathlib import Path
 from typing import Any, Optional
 
+from ..utils.dependency_graph import DependencyGraph
+from ..utils.todo2_utils import normalize_status
+
 logger = logging.getLogger(__name__)
 
 # Import error handler
@@ -73,6 +76,9 @@ def optimize_todo2_parallelization(
         # Generate execution plan
         execution_plan = _generate_execution_plan(parallel_groups, all_tasks)
 
+        # Dependency waves and critical path over all pending tasks
+        dependency_plan = _plan_dependency_waves(all_tasks, task_map)
+
         # Generate report
         report_path = output_path or 'docs/TODO2_PARALLELIZATION_OPTIMIZATION_REPORT.md'
         if report_path:
@@ -82,7 +88,8 @@ def optimize_todo2_parallelization(
                 execution_plan,
                 ready_tasks,
                 all_tasks,
-                output_format
+                output_format,
+                dependency_plan=dependency_plan
             )
             report_file = project_root / report_path
             report_file.parent.mkdir(parents=True, exist_ok=True)
@@ -99,7 +106,10 @@ def optimize_todo2_parallelization(
             'sequential_time_hours': time_savings['sequential_time'],
             'parallel_time_hours': time_savings['parallel_time'],
             'report_path': str(Path(report_path).absolute()),
-            'execution_plan': execution_plan
+            'execution_plan': execution_plan,
+            'dependency_waves': dependency_plan['waves'],
+            'critical_path': dependency_plan['critical_path'],
+            'critical_path_hours': dependency_plan['critical_path_hours']
         }
 
         duration = time.time() - start_time
@@ -153,6 +163,39 @@ def _group_parallelizable_tasks(
     return groups
 
 
+def _task_hours(task: dict[str, Any]) -> float:
+    return task.get('estimatedHours', 0) or task.get('estimated_hours', 0) or 0
+
+
+def _plan_dependency_waves(
+    all_tasks: list[dict[str, Any]],
+    task_map: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Group pending tasks into dependency waves and find the hour-weighted critical path.
+
+    Tasks in the same wave have all their pending dependencies in earlier waves,
+    so each wave can run in parallel; the critical path bounds total parallel time.
+    """
+    pending_ids = [
+        task.get('id') for task in all_tasks
+        if task.get('id') and normalize_status(task.get('status', '')) != 'completed'
+    ]
+    pending = set(pending_ids)
+    dep_graph = DependencyGraph.from_tasks(task_map[task_id] for task_id in pending_ids)
+
+    waves = dep_graph.levels()
+    critical = dep_graph.critical_paths(weight=lambda task_id: _task_hours(task_map.get(task_id, {})))
+    critical_path = critical.paths(limit=1)
+
+    return {
+        'pending_tasks': len(pending),
+        'waves': waves,
+        'critical_path': critical_path[0] if critical_path else [],
+        'critical_path_hours': critical.length,
+    }
+
+
 def _calculate_time_savings(
     parallel_groups: list[list[str]],
     all_tasks: list[dict[str, Any]]
@@ -224,7 +267,8 @@ def _generate_report(
     execution_plan: list[dict[str, Any]],
     ready_tasks: list[dict[str, Any]],
     all_tasks: list[dict[str, Any]],
-    output_format: str
+    output_format: str,
+    dependency_plan: Optional[dict[str, Any]] = None
 ) -> str:
     """Generate markdown report."""
     {task.get('id'): task for task in all_tasks}
@@ -258,5 +302,16 @@ def _generate_report(
             report += f"- {task['name']} ({task['id']}) - {task['estimated_hours']:.1f}h - Priority: {task['priority']}\n"
         report += "\n"
 
+    if dependency_plan:
+        report += f"""## Dependency Waves
+
+**Pending Tasks**: {dependency_plan['pending_tasks']}
+**Critical Path**: {len(dependency_plan['critical_path'])} tasks, {dependency_plan['critical_path_hours']:.1f} hours
+
+"""
+        for i, wave in enumerate(dependency_plan['waves'], 1):
+            report += f"- Wave {i}: {len(wave)} tasks ({', '.join(wave[:10])}{', ...' if len(wave) > 10 else ''})\n"
+        report += "\n"
+
     return report
 
@@ -9,8 +9,10 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import Dict, Optional
 
 from ..utils import find_project_root
+from .pattern_watcher import start_pattern_watcher
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -238,10 +240,19 @@ def _setup_file_watcher_integration(
 
         os.chmod(watcher_script, 0o755)
 
+        # Pick up the new patterns in the server's own watcher
+        watcher = start_pattern_watcher(project_root)
+        if watcher is not None:
+            watcher.load_patterns()
+
         results["file_watcher_integration"] = {
             "status": "configured",
             "script": str(watcher_script),
-            "note": "Run manually or via cron: python3 .cursor/automa_file_watcher.py"
+            "in_process_watcher": "running" if watcher is not None else "inactive",
+            "note": (
+                "The exarp server watches these patterns while it runs (requires watchdog). "
+                "Without the server: python3 .cursor/automa_file_watcher.py"
+            ),
         }
     except Exception as e:
         results["patterns_skipped"].append({
@@ -268,61 +279,36 @@ def _setup_task_status_integration(
 
 
 def _generate_file_watcher_script(file_patterns: dict) -> str:
-    """Generate file watcher script content."""
+    """Generate file watcher script content (runs the watcher in the foreground)."""
     return """#!/usr/bin/env python3
 \"\"\"
 Exarp File Watcher
 
-Monitors file changes and triggers exarp tools based on patterns.
-Run manually or via cron job.
+Watches the project for changes matching .cursor/automa_patterns.json and
+re-runs the mapped exarp tools (debounced). The exarp MCP server runs the
+same watcher while it is up; use this script when the server is not running.
+
+Requires: pip install exarp watchdog
 \"\"\"
 
-import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
-
-# Load pattern configuration
-CONFIG_FILE = Path(__file__).parent.parent / ".cursor" / "automa_patterns.json"
-
-def load_patterns() -> Dict:
-    \"\"\"Load pattern configuration.\"\"\"
-    if not CONFIG_FILE.exists():
-        return {}
 
-    with open(CONFIG_FILE, 'r') as f:
-        config = json.load(f)
-        return config.get("file_patterns", {})
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
-def check_file_changes() -> List[Dict]:
-    \"\"\"Check for file changes and return matching patterns.\"\"\"
-    # This is a placeholder - implement actual file watching logic
-    # For now, returns empty list
-    return []
-
-def trigger_tool(tool_name: str) -> bool:
-    \"\"\"Trigger an exarp tool.\"\"\"
-    # This is a placeholder - implement actual tool triggering
-    # For now, just prints what would be triggered
-    print(f"Would trigger: {tool_name}")
-    return True
+try:
+    from project_management_automation.tools.pattern_watcher import run_pattern_watcher
+except ImportError:
+    sys.path.insert(0, str(PROJECT_ROOT))
+    try:
+        from project_management_automation.tools.pattern_watcher import run_pattern_watcher
+    except ImportError:
+        sys.exit("exarp is not installed: pip install exarp watchdog")
 
 if __name__ == "__main__":
-    patterns = load_patterns()
-    changes = check_file_changes()
-
-    for change in changes:
-        file_path = change["file"]
-        for pattern, config in patterns.items():
-            # Simple pattern matching (implement proper glob/regex matching)
-            if pattern in file_path or file_path.endswith(pattern.split("/")[-1]):
-                if "on_change" in config:
-                    trigger_tool(config["on_change"])
-                if "on_create" in config and change.get("created"):
-                    trigger_tool(config["on_create"])
+    sys.exit(run_pattern_watcher(PROJECT_ROOT))
 """
 
-
 if __name__ == "__main__":
     import argparse
 
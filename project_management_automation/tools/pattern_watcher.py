@@ -0,0 +1,560 @@
+"""
+In-process file watcher for pattern triggers.
+
+`setup_hooks(action="patterns")` writes `.cursor/automa_patterns.json`, whose
+"file_patterns" map globs to the tools to re-run when matching files change:
+
+    "docs/**/*.md": {"on_change": "check_documentation_health_tool",
+                     "on_create": "add_external_tool_hints_tool"}
+
+The watcher receives filesystem events from watchdog (inotify/FSEvents),
+matches them against the globs (compiled once, gitignore syntax, `|`
+separating alternatives) and re-runs the mapped tools in the background so
+their results are already warm when an agent asks:
+- bursts of edits are debounced and coalesced into one run per tool
+- a tool never runs concurrently with itself and waits MIN_INTERVAL between
+  runs; edits made meanwhile are queued for one follow-up run
+- writes to a tool's own output files (TRIGGER_OUTPUTS) while it runs, or
+  just after, do not re-trigger it
+- runs refresh results without Todo2 bookkeeping (no tracking or follow-up
+  tasks, see todo2_tracking()) or file fixes, and go through the tool worker
+  pools, so they share the per-class limits
+
+Started from the server lifespan when the pattern file exists.
+
+Environment:
+    EXARP_DISABLE_PATTERN_WATCHER=1     # Do not start the watcher
+
+Usage:
+    from project_management_automation.tools.pattern_watcher import get_pattern_watcher
+
+    watcher = get_pattern_watcher(project_root)
+    watcher.start()
+    watcher.get_stats()
+"""
+
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from ..utils.repo_inventory import DEFAULT_EXCLUDED_DIRS, IgnoreRule
+from ..utils.tool_executor import get_tool_executor, tool_cost_class
+
+# Optional watchdog import for event-driven triggers
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    Observer = None  # type: ignore
+    FileSystemEventHandler = object  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILE_RELATIVE = Path(".cursor") / "automa_patterns.json"
+
+# Quiet period after the last matching event before a tool runs
+DEFAULT_DEBOUNCE = 2.0
+# Longest a continuous stream of edits can postpone a run
+MAX_DELAY = 30.0
+# Minimum seconds between the end of one run of a tool and the start of the next
+MIN_INTERVAL = 10.0
+# Output file events this soon after a run ends are attributed to that run
+SELF_TRIGGER_GRACE = 1.0
+
+# Trigger name -> (module.function under tools/, keyword arguments). Runs refresh
+# results only: no task creation, no file fixes. Todo2 tracking is turned off
+# around each run (_default_action), so .todo2/state.todo2.json is left alone.
+TRIGGER_ACTIONS: dict[str, tuple[str, dict[str, Any]]] = {
+    "check_documentation_health": ("consolidated_quality.health", {"action": "docs", "create_tasks": False}),
+    "validate_ci_cd_workflow": ("consolidated_quality.health", {"action": "cicd"}),
+    "scan_dependency_security": ("consolidated_reporting.security", {"action": "scan"}),
+    "detect_duplicate_tasks": ("consolidated_analysis.task_analysis", {"action": "duplicates"}),
+    "analyze_todo2_alignment": ("consolidated_analysis.analyze_alignment", {"action": "todo2", "create_followup_tasks": False}),
+    "analyze_alignment": ("consolidated_analysis.analyze_alignment", {"action": "todo2", "create_followup_tasks": False}),
+    "add_external_tool_hints": ("external_tool_hints.add_external_tool_hints", {"dry_run": True}),
+    "lint": ("consolidated_quality.lint", {"action": "run"}),
+    "report": ("consolidated_reporting.report", {"action": "overview"}),
+}
+
+
+# Trigger name -> files each run writes (gitignore-style globs, project-relative).
+# Events for these while the tool runs are its own output, not a new change.
+TRIGGER_OUTPUTS: dict[str, tuple[str, ...]] = {
+    "check_documentation_health": ("docs/DOCUMENTATION_HEALTH_REPORT.md",),
+    "validate_ci_cd_workflow": ("docs/CI_CD_VALIDATION_REPORT.md",),
+    "scan_dependency_security": (
+        "scripts/.dependency_security_history.json",
+        "scripts/.temp_dependency_security_config.json",
+    ),
+    "detect_duplicate_tasks": ("docs/TODO2_DUPLICATE_DETECTION_REPORT.md",),
+    "analyze_todo2_alignment": ("docs/TODO2_ALIGNMENT_REPORT.md",),
+    "analyze_alignment": ("docs/TODO2_ALIGNMENT_REPORT.md",),
+    "add_external_tool_hints": ("docs/EXTERNAL_TOOL_HINTS_REPORT.md",),
+}
+
+
+def normalize_tool_name(name: str) -> str:
+    """Map a configured tool ("check_documentation_health_tool --quick") to its trigger name."""
+    name = name.strip().split()[0] if name.strip() else ""
+    return name[:-len("_tool")] if name.endswith("_tool") else name
+
+
+def _default_action(trigger: str) -> Optional[tuple[str, Callable[[list[str]], Any]]]:
+    """Resolve a trigger to (tool name for its cost class, callable)."""
+    spec = TRIGGER_ACTIONS.get(trigger)
+    if spec is None:
+        return None
+    target, kwargs = spec
+    module_name, function_name = target.rsplit(".", 1)
+
+    def run(paths: list[str]) -> Any:
+        from ..scripts.base.intelligent_automation_base import todo2_tracking
+
+        module = importlib.import_module(f"{__package__}.{module_name}")
+        with todo2_tracking(False):
+            return getattr(module, function_name)(**kwargs)
+
+    return function_name, run
+
+
+class PatternRule:
+    """One configured pattern: compiled globs and the tools they trigger."""
+
+    def __init__(self, pattern: str, config: dict[str, Any]):
+        self.pattern = pattern
+        self.globs = [IgnoreRule("", alternative.strip()) for alternative in pattern.split("|") if alternative.strip()]
+        self.on_change = [normalize_tool_name(t) for t in _as_list(config.get("on_change"))]
+        self.on_create = [normalize_tool_name(t) for t in _as_list(config.get("on_create"))]
+        self.on_change += [normalize_tool_name(t) for t in _as_list(config.get("tools"))]
+
+    def matches(self, rel_path: str) -> bool:
+        name = rel_path.rsplit("/", 1)[-1]
+        return any(glob.matches(rel_path, name, False) for glob in self.globs)
+
+    def tools_for(self, created: bool) -> list[str]:
+        return self.on_change + (self.on_create if created else [])
+
+
+def _as_list(value: Any) -> list[str]:
+    if not value:
+        return []
+    return [value] if isinstance(value, str) else [v for v in value if isinstance(v, str)]
+
+
+class _Pending:
+    """Queued run of one tool."""
+
+    __slots__ = ("paths", "first_at", "due_at")
+
+    def __init__(self, now: float):
+        self.paths: set[str] = set()
+        self.first_at = now
+        self.due_at = now
+
+
+class _PatternEventHandler(FileSystemEventHandler):  # type: ignore[misc]
+    """Watchdog handler forwarding file events to the watcher."""
+
+    def __init__(self, watcher: "PatternTriggerWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event) -> None:
+        if getattr(event, "is_directory", False):
+            return
+        event_type = getattr(event, "event_type", "")
+        if event_type == "moved":
+            self.watcher.notify(event.dest_path, created=True)
+        elif event_type in ("created", "modified", "deleted"):
+            self.watcher.notify(event.src_path, created=event_type == "created")
+
+
+class PatternTriggerWatcher:
+    """
+    Debounced pattern triggers for one project root.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        project_root: Union[Path, str],
+        patterns: Optional[dict[str, Any]] = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+        min_interval: float = MIN_INTERVAL,
+        actions: Optional[dict[str, Callable[[list[str]], Any]]] = None,
+        outputs: Optional[dict[str, Any]] = None,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            project_root: Project root (watched recursively)
+            patterns: "file_patterns" mapping (default: read from
+                .cursor/automa_patterns.json, reloaded when it changes)
+            debounce: Quiet seconds before a triggered tool runs
+            min_interval: Minimum seconds between runs of the same tool
+            actions: Trigger name -> callable(changed paths), replacing the
+                built-in TRIGGER_ACTIONS (mainly for tests)
+            outputs: Trigger name -> globs of the files it writes (default:
+                TRIGGER_OUTPUTS)
+        """
+        self.project_root = Path(project_root).resolve()
+        self.config_file = self.project_root / CONFIG_FILE_RELATIVE
+        self.debounce = debounce
+        self.min_interval = min_interval
+        self._fixed_patterns = patterns
+        self._actions = actions
+        self._outputs = {
+            tool: [IgnoreRule("", glob) for glob in _as_list(globs)]
+            for tool, globs in (TRIGGER_OUTPUTS if outputs is None else outputs).items()
+        }
+        self._rules: list[PatternRule] = []
+        self._pending: dict[str, _Pending] = {}
+        self._running: dict[str, float] = {}
+        self._last_end: dict[str, float] = {}
+        self._runs: dict[str, dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._timer: Optional[threading.Thread] = None
+        self._observer = None
+        self._stopped = False
+        self._stats = {
+            "events": 0, "matched": 0, "coalesced": 0, "self_triggered": 0,
+            "runs": 0, "errors": 0, "unknown_tools": 0,
+        }
+        self.load_patterns()
+
+    def load_patterns(self) -> int:
+        """
+        (Re)compile the configured patterns.
+
+        Returns:
+            Number of patterns loaded
+        """
+        patterns = self._fixed_patterns
+        if patterns is None:
+            try:
+                patterns = json.loads(self.config_file.read_text()).get("file_patterns", {})
+            except FileNotFoundError:
+                patterns = {}
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Ignoring unreadable pattern file {self.config_file}: {e}")
+                patterns = {}
+        rules = [PatternRule(pattern, config) for pattern, config in patterns.items() if isinstance(config, dict)]
+        with self._cond:
+            self._rules = rules
+        return len(rules)
+
+    def _relative(self, path: Union[Path, str]) -> Optional[str]:
+        try:
+            rel = Path(os.path.abspath(path)).relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+        if any(part in DEFAULT_EXCLUDED_DIRS for part in rel.split("/")[:-1]):
+            return None
+        return rel
+
+    def match(self, rel_path: str, created: bool = False) -> list[str]:
+        """Tools triggered by a change to a project-relative path."""
+        with self._cond:
+            rules = list(self._rules)
+        tools: list[str] = []
+        for rule in rules:
+            if rule.matches(rel_path):
+                tools.extend(t for t in rule.tools_for(created) if t and t not in tools)
+        return tools
+
+    def _is_output(self, tool: str, rel_path: str) -> bool:
+        """Whether a project-relative path is one of the files a tool writes."""
+        name = rel_path.rsplit("/", 1)[-1]
+        return any(glob.matches(rel_path, name, False) for glob in self._outputs.get(tool, ()))
+
+    def notify(self, path: Union[Path, str], created: bool = False) -> list[str]:
+        """
+        Record a file change and schedule the tools it triggers.
+
+        Args:
+            path: Changed file (absolute, or relative to the project root)
+            created: The file was created (also runs on_create tools)
+
+        Returns:
+            Tools scheduled by this event
+        """
+        path = Path(path)
+        rel_path = self._relative(path if path.is_absolute() else self.project_root / path)
+        if rel_path is None:
+            return []
+        if rel_path == CONFIG_FILE_RELATIVE.as_posix() and self._fixed_patterns is None:
+            self.load_patterns()
+            return []
+
+        tools = self.match(rel_path, created)
+        now = time.monotonic()
+        scheduled = []
+        with self._cond:
+            self._stats["events"] += 1
+            if tools:
+                self._stats["matched"] += 1
+            for tool in tools:
+                busy = tool in self._running or now - self._last_end.get(tool, float("-inf")) < SELF_TRIGGER_GRACE
+                if busy and self._is_output(tool, rel_path):
+                    self._stats["self_triggered"] += 1
+                    continue
+                # Other edits during a run queue a follow-up; _finish applies min_interval
+                pending = self._pending.get(tool)
+                if pending is None:
+                    pending = self._pending[tool] = _Pending(now)
+                else:
+                    self._stats["coalesced"] += 1
+                pending.paths.add(rel_path)
+                pending.due_at = max(
+                    min(now + self.debounce, pending.first_at + MAX_DELAY),
+                    self._last_end.get(tool, float("-inf")) + self.min_interval,
+                )
+                scheduled.append(tool)
+            if scheduled:
+                self._ensure_timer()
+                self._cond.notify_all()
+        return scheduled
+
+    def _ensure_timer(self) -> None:
+        if self._timer is None or not self._timer.is_alive():
+            self._stopped = False
+            self._timer = threading.Thread(target=self._run_timer, name="exarp-pattern-triggers", daemon=True)
+            self._timer.start()
+
+    def _run_timer(self) -> None:
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                due = [
+                    tool for tool, pending in self._pending.items()
+                    if pending.due_at <= now and tool not in self._running
+                ]
+                for tool in due:
+                    paths = sorted(self._pending.pop(tool).paths)
+                    self._running[tool] = now
+                    self._cond.release()
+                    try:
+                        self._fire(tool, paths)
+                    finally:
+                        self._cond.acquire()
+                waiting = [p.due_at for t, p in self._pending.items() if t not in self._running]
+                if not due:
+                    self._cond.wait(timeout=max(0.0, min(waiting) - now) if waiting else None)
+
+    def _fire(self, tool: str, paths: list[str]) -> None:
+        """Start a run of a tool on its worker pool."""
+        if self._actions is not None:
+            action = self._actions.get(tool)
+            resolved = (tool, action) if action else None
+        else:
+            resolved = _default_action(tool)
+        if resolved is None:
+            logger.debug(f"No trigger action for {tool}")
+            self._finish(tool, paths, time.monotonic(), "unknown")
+            return
+
+        tool_name, action = resolved
+        started = time.monotonic()
+        logger.info(f"Pattern trigger: running {tool} for {len(paths)} changed file(s)")
+        try:
+            future, _ = get_tool_executor().submit(tool_cost_class(tool_name), action, paths)
+        except Exception as e:
+            logger.warning(f"Pattern trigger {tool} could not start: {e}")
+            self._finish(tool, paths, started, "error", str(e))
+            return
+
+        def done(f) -> None:
+            error = f.exception() if not f.cancelled() else "cancelled"
+            self._finish(tool, paths, started, "error" if error else "success", str(error) if error else None)
+
+        future.add_done_callback(done)
+
+    def _finish(self, tool: str, paths: list[str], started: float, status: str, error: Optional[str] = None) -> None:
+        ended = time.monotonic()
+        with self._cond:
+            self._running.pop(tool, None)
+            self._last_end[tool] = ended
+            if status == "unknown":
+                self._stats["unknown_tools"] += 1
+            else:
+                self._stats["runs"] += 1
+                if status == "error":
+                    self._stats["errors"] += 1
+                    logger.warning(f"Pattern trigger {tool} failed: {error}")
+            self._runs[tool] = {
+                "status": status,
+                "error": error,
+                "paths": paths[:20],
+                "duration_seconds": round(ended - started, 3),
+                "finished_at": time.time(),
+            }
+            # A run queued while this one ran must still respect the interval
+            pending = self._pending.get(tool)
+            if pending is not None:
+                pending.due_at = max(pending.due_at, ended + self.min_interval)
+            self._cond.notify_all()
+
+    def start(self) -> bool:
+        """
+        Start watching the project root.
+
+        Returns:
+            True if filesystem events are being received
+        """
+        if not WATCHDOG_AVAILABLE:
+            logger.debug("watchdog not installed; pattern triggers are not watched")
+            return False
+        with self._cond:
+            if self._observer is not None:
+                return True
+            try:
+                observer = Observer()
+                observer.daemon = True
+                observer.schedule(_PatternEventHandler(self), str(self.project_root), recursive=True)
+                observer.start()
+            except OSError as e:
+                logger.warning(f"Could not watch {self.project_root}: {e}")
+                return False
+            self._observer = observer
+        logger.info(f"Watching {self.project_root} for {len(self._rules)} trigger pattern(s)")
+        return True
+
+    def stop(self) -> None:
+        """Stop watching and drop queued runs (runs in progress finish)."""
+        with self._cond:
+            observer, self._observer = self._observer, None
+            self._stopped = True
+            self._pending.clear()
+            self._cond.notify_all()
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5)
+
+    def wait_idle(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until no run is queued or in progress.
+
+        Returns:
+            True if idle before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._running:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(timeout=remaining)
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get watcher statistics and the last run of each tool."""
+        with self._cond:
+            return {
+                **self._stats,
+                "watching": self._observer is not None,
+                "patterns": len(self._rules),
+                "pending": sorted(self._pending),
+                "running": sorted(self._running),
+                "last_runs": dict(self._runs),
+            }
+
+
+# Watchers keyed by resolved project root
+_watchers: dict[str, PatternTriggerWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def _disabled() -> bool:
+    return os.environ.get("EXARP_DISABLE_PATTERN_WATCHER", "").lower() in ("1", "true", "yes")
+
+
+def get_pattern_watcher(project_root: Union[Path, str]) -> PatternTriggerWatcher:
+    """
+    Get the shared PatternTriggerWatcher for a project root.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        PatternTriggerWatcher instance shared by all callers for that root
+    """
+    key = str(Path(project_root).resolve())
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = PatternTriggerWatcher(key)
+            _watchers[key] = watcher
+        return watcher
+
+
+def start_pattern_watcher(project_root: Union[Path, str]) -> Optional[PatternTriggerWatcher]:
+    """
+    Start the watcher for a project root if it has a pattern file.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        The running watcher, or None if disabled, unconfigured or watchdog
+        is not installed
+    """
+    if _disabled() or not (Path(project_root) / CONFIG_FILE_RELATIVE).exists():
+        return None
+    watcher = get_pattern_watcher(project_root)
+    return watcher if watcher.start() else None
+
+
+def stop_pattern_watchers() -> None:
+    """Stop all watchers."""
+    with _watchers_lock:
+        watchers = list(_watchers.values())
+        _watchers.clear()
+    for watcher in watchers:
+        watcher.stop()
+
+
+def run_pattern_watcher(project_root: Union[Path, str]) -> int:
+    """
+    Run the watcher in the foreground until interrupted (standalone use).
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Process exit code
+    """
+    watcher = get_pattern_watcher(project_root)
+    if not watcher.start():
+        print("Pattern watcher needs watchdog: pip install watchdog", file=sys.stderr)
+        return 1
+    print(f"Watching {watcher.project_root} ({watcher.get_stats()['patterns']} patterns), Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_pattern_watchers()
+    return 0
+
+
+__all__ = [
+    "PatternTriggerWatcher",
+    "TRIGGER_ACTIONS",
+    "TRIGGER_OUTPUTS",
+    "get_pattern_watcher",
+    "normalize_tool_name",
+    "run_pattern_watcher",
+    "start_pattern_watcher",
+    "stop_pattern_watchers",
+]
@@ -16,6 +16,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from ..utils.todo2_store import get_todo2_store
+
 logger = logging.getLogger(__name__)
 
 # Import error handler
@@ -152,11 +154,11 @@ class PRDAlignmentAnalyzer:
 
     def _load_tasks(self) -> list[dict]:
         """Load tasks from Todo2."""
-        if not self.todo2_path.exists():
+        if not get_todo2_store(self.project_root).exists():
             return []
 
         try:
-            state = json.loads(self.todo2_path.read_text())
+            state = get_todo2_store(self.project_root).load_state()
             return state.get("todos", [])
         except Exception as e:
             logger.warning(f"Error loading tasks: {e}")
@@ -20,6 +20,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from ..utils.todo2_store import get_todo2_store
+
 logger = logging.getLogger(__name__)
 
 # Defined personas from project research with trusted advisors from wisdom system
@@ -328,7 +330,7 @@ class PRDGenerator:
             relevance_reasons.append("Project has security focus")
         elif persona_id == "tech_writer" and "documentation" in combined:
             relevance_reasons.append("Documentation is emphasized")
-        elif persona_id == "project_manager" and self.todo2_path.exists():
+        elif persona_id == "project_manager" and get_todo2_store(self.project_root).exists():
             relevance_reasons.append("Todo2 task management present")
         elif persona_id == "qa_engineer" and any(self.project_root.glob("**/test*.py")):
             relevance_reasons.append("Test suite present")
@@ -341,11 +343,11 @@ class PRDGenerator:
         """Extract user stories from Todo2 tasks."""
         user_stories = []
 
-        if not self.todo2_path.exists():
+        if not get_todo2_store(self.project_root).exists():
             return user_stories
 
         try:
-            state = json.loads(self.todo2_path.read_text())
+            state = get_todo2_store(self.project_root).load_state()
             tasks = state.get("todos", [])
 
             for task in tasks:
@@ -558,9 +560,9 @@ class PRDGenerator:
                         )
 
         # Analyze Todo2 for blocked tasks
-        if self.todo2_path.exists():
+        if get_todo2_store(self.project_root).exists():
             try:
-                state = json.loads(self.todo2_path.read_text())
+                state = get_todo2_store(self.project_root).load_state()
                 blocked = [t for t in state.get("todos", []) if t.get("status") == "Blocked"]
                 for task in blocked[:5]:  # Top 5 blockers
                     risks.append(
@@ -595,9 +597,9 @@ class PRDGenerator:
                 timeline["phases"].append({"number": int(match.group(1)), "name": match.group(2).strip()})
 
         # Count tasks by status
-        if self.todo2_path.exists():
+        if get_todo2_store(self.project_root).exists():
             try:
-                state = json.loads(self.todo2_path.read_text())
+                state = get_todo2_store(self.project_root).load_state()
                 for task in state.get("todos", []):
                     status = task.get("status", "Todo")
                     if status in timeline["task_counts"]:
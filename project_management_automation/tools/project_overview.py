@@ -13,6 +13,9 @@ from pathlib import Path
 from typing import Any, Optional
 
 from ..utils import find_project_root
+from ..utils.file_metrics import get_file_metrics_cache
+from ..utils.repo_inventory import get_repo_inventory
+from ..utils.todo2_store import get_todo2_store
 from ..utils.todo2_utils import is_active_status, normalize_status
 
 
@@ -149,19 +152,14 @@ def _get_health_metrics(project_root: Path) -> dict:
 
 def _get_codebase_metrics(project_root: Path) -> dict:
     """Get codebase statistics."""
-    py_files = list(project_root.rglob('*.py'))
-    py_files = [f for f in py_files if 'venv' not in str(f) and '.build-env' not in str(f)
-                and '__pycache__' not in str(f)]
+    inventory = get_repo_inventory(project_root)
+    py_files = inventory.files(ext='.py')
+    md_files = inventory.relpaths(ext='.md')
 
-    total_lines = 0
-    for f in py_files:
-        try:
-            total_lines += len(f.read_text().splitlines())
-        except (OSError, UnicodeDecodeError):
-            pass
-
-    md_files = list(project_root.rglob('*.md'))
-    md_files = [f for f in md_files if 'venv' not in str(f)]
+    # Only files changed since the last scorecard/overview are re-read
+    file_metrics = get_file_metrics_cache(project_root)
+    total_lines = file_metrics.count_lines(py_files)
+    file_metrics.save()
 
     tools_dir = project_root / 'project_management_automation' / 'tools'
     tools_count = len([f for f in tools_dir.glob('*.py') if not f.name.startswith('__')]) if tools_dir.exists() else 0
@@ -185,14 +183,11 @@ def _get_codebase_metrics(project_root: Path) -> dict:
 
 def _get_task_metrics(project_root: Path) -> dict:
     """Get task breakdown from Todo2."""
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    if not todo2_file.exists():
+    store = get_todo2_store(project_root)
+    if not store.exists():
         return {'total': 0, 'by_status': {}, 'by_priority': {}, 'by_category': {}, 'remaining_hours': 0}
 
-    with open(todo2_file) as f:
-        data = json.load(f)
-
-    todos = data.get('todos', [])
+    todos = store.get_tasks()
 
     by_status = {}
     by_priority = {}
@@ -275,14 +270,11 @@ def _get_risks_and_blockers(project_root: Path) -> list[dict]:
 
 def _get_next_actions(project_root: Path) -> list[dict]:
     """Get prioritized next actions from high-priority tasks."""
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    if not todo2_file.exists():
+    store = get_todo2_store(project_root)
+    if not store.exists():
         return []
 
-    with open(todo2_file) as f:
-        data = json.load(f)
-
-    todos = data.get('todos', [])
+    todos = store.get_tasks()
     high_priority = [t for t in todos if t.get('priority') == 'high'
                      and is_active_status(t.get('status', ''))]
 
@@ -297,6 +289,14 @@ def _get_next_actions(project_root: Path) -> list[dict]:
     return actions
 
 
+def _production_label(health: dict, yes: str, no: str, unknown: str) -> str:
+    """Label for the scorecard's production_ready (None when a gating section was unavailable)."""
+    ready = health.get('production_ready')
+    if ready is None:
+        return unknown
+    return yes if ready else no
+
+
 def _format_text(data: dict) -> str:
     """Format as ASCII text for terminal."""
     lines = []
@@ -318,7 +318,7 @@ def _format_text(data: dict) -> str:
     lines.append("│  ─────────────                       │  ────────────                        │")
     lines.append(f"│  Version: {data['project']['version']:<26} │  Overall: {score:.0f}% {status_icon:<25} │")
     lines.append(f"│  Type: {data['project']['type']:<29} │  {'█' * int(score/5)}{'░' * (20-int(score/5)):<25} │")
-    lines.append(f"│  Status: {data['project']['status']:<27} │  Production: {'YES ✅' if health.get('production_ready') else 'NO ❌':<23} │")
+    lines.append(f"│  Status: {data['project']['status']:<27} │  Production: {_production_label(health, 'YES ✅', 'NO ❌', 'UNKNOWN ❔'):<23} │")
     lines.append("│                                                                              │")
 
     # Codebase + Tasks (side by side)
@@ -538,7 +538,7 @@ def _format_html(data: dict) -> str:
                 <div class="score-ring">
                     <div class="score-inner">
                         <span class="score-value">{score:.0f}%</span>
-                        <span style="font-size: 0.75rem; color: #64748b;">{'Ready' if health.get('production_ready') else 'In Dev'}</span>
+                        <span style="font-size: 0.75rem; color: #64748b;">{_production_label(health, 'Ready', 'In Dev', 'Unknown')}</span>
                     </div>
                 </div>
             </div>
@@ -641,7 +641,7 @@ def _format_markdown(data: dict) -> str:
 
 ## 📊 Health Score: **{score:.0f}%** {'🟢' if score >= 70 else '🟡' if score >= 50 else '🔴'}
 
-**Production Ready:** {'✅ Yes' if health.get('production_ready') else '❌ No'}
+**Production Ready:** {_production_label(health, '✅ Yes', '❌ No', '❔ Unknown')}
 
 | Component | Score | Status |
 |-----------|-------|--------|
@@ -751,7 +751,7 @@ style: |
   </span>
 </div>
 
-**Production Ready:** {'✅ Yes' if health.get('production_ready') else '❌ No'}
+**Production Ready:** {_production_label(health, '✅ Yes', '❌ No', '❔ Unknown')}
 
 ---
 
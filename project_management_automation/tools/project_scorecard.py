@@ -8,19 +8,63 @@ Memory Integration:
 - Saves score history for trend tracking
 """
 
+import contextvars
 import json
 import logging
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ..utils import find_project_root
+from ..utils.file_metrics import get_file_metrics_cache
+from ..utils.keyword_matcher import get_keyword_matcher
+from ..utils.repo_inventory import RepoInventory, get_repo_inventory
+from ..utils.todo2_store import get_todo2_store
 from ..utils.todo2_utils import is_completed_status, is_pending_status
+from ..utils.tool_executor import ToolCancelledError, check_cancelled, wait_for
 
 scorecard_logger = logging.getLogger(__name__)
 
 
+# Build output directories whose sources should not count as project code
+_BUILD_OUTPUT_DIRS = frozenset({'target', 'build'})
+
+# Words marking a pending task as aligned with the project's MCP goals.
+# 'ci' and 'cd' are listed but never count: only words of 3+ letters are scored.
+MCP_ALIGNMENT_KEYWORDS = (
+    'mcp', 'fastmcp', 'tool', 'tools', 'prompt', 'prompts', 'resource',
+    'server', 'client', 'automation', 'automate', 'security', 'secure',
+    'validation', 'validate', 'test', 'testing', 'tests', 'coverage',
+    'integration', 'documentation', 'docs', 'workflow', 'ci', 'cd',
+    'health', 'analysis', 'task', 'tasks', 'todo', 'sprint',
+    'boundary', 'rate', 'limiting', 'access', 'control', 'auth',
+    'exarp', 'hook', 'hooks', 'trigger', 'config', 'deploy',
+)
+
+
+def _non_test_sources(inventory: RepoInventory, ext: Any) -> list[Path]:
+    """Source (non-test) files with the given extension(s), excluding build outputs."""
+    return [
+        inventory.project_root / rel
+        for rel in inventory.relpaths(ext=ext, role='source')
+        if not _BUILD_OUTPUT_DIRS.intersection(rel.split('/')[:-1])
+    ]
+
+
+def _production_ready_label(ready: Optional[bool], yes: str, no: str, unknown: str) -> str:
+    """Label for production_ready (None when a gating section was unavailable)."""
+    if ready is None:
+        return unknown
+    return yes if ready else no
+
+
 def _save_scorecard_memory(result: dict[str, Any]) -> dict[str, Any]:
     """Save scorecard results as memory for trend tracking."""
     try:
@@ -41,7 +85,7 @@ def _save_scorecard_memory(result: dict[str, Any]) -> dict[str, Any]:
         content = f"""Project scorecard generated.
 
 ## Overall Score: {result.get('overall_score', 0)}%
-Production Ready: {'✅ Yes' if result.get('production_ready') else '❌ No'}
+Production Ready: {_production_ready_label(result.get('production_ready'), '✅ Yes', '❌ No', '❔ Unknown')}
 
 ## Component Scores
 {chr(10).join(f'- {name}: {score}%' for name, score in sorted(scores.items(), key=lambda x: -x[1]))}
@@ -54,7 +98,7 @@ Production Ready: {'✅ Yes' if result.get('production_ready') else '❌ No'}
 """
 
         return save_session_insight(
-            title=f"Scorecard: {result.get('overall_score', 0)}% {'✅' if result.get('production_ready') else '❌'}",
+            title=f"Scorecard: {result.get('overall_score', 0)}% {_production_ready_label(result.get('production_ready'), '✅', '❌', '❔')}",
             content=content,
             category="insight",
             metadata={"type": "scorecard", "overall_score": result.get('overall_score', 0)}
@@ -90,64 +134,68 @@ except ImportError:
         return []
 
 
-def generate_project_scorecard(
-    output_format: str = "text",
-    include_recommendations: bool = True,
-    output_path: Optional[str] = None
-) -> dict[str, Any]:
-    """
-    Generate comprehensive project health scorecard.
 
-    [HINT: Project scorecard. Returns overall score, component scores (security, testing,
-    docs, alignment, clarity, parallelizable, performance, dogfooding, uniqueness), task metrics, production readiness.]
+# ═══════════════════════════════════════════════════════════════════════════════
+# COLLECTORS
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Each scorecard section is a collector returning {'scores': ..., 'metrics': ...}
+# (and optionally 'data' for values combined after collection). Collectors run
+# concurrently, each bounded by the timeout of its cost class; a collector that
+# times out or fails contributes its last successful result (marked stale) or
+# an 'unavailable' marker instead of blocking the scorecard.
 
-    Args:
-        output_format: Output format - "text", "json", or "markdown"
-        include_recommendations: Include improvement recommendations
-        output_path: Optional path to save report
+# Default timeouts (seconds) per cost class
+COLLECTOR_TIMEOUTS = {
+    'cheap': 10.0,     # A few stat/read calls
+    'scan': 60.0,      # Walks or reads the repository
+    'external': 20.0,  # Subprocesses, network or MCP round-trips
+}
 
-    Returns:
-        Dictionary with scorecard data and formatted output
-    """
-    project_root = find_project_root()
 
-    # Safety check: Ensure we're not scanning the entire home directory
-    # If project_root is the home directory, something went wrong
-    if str(project_root) == str(Path.home()) or str(project_root) == '/Users/davidl':
-        # Try to find the actual project by looking for project_management_automation package
-        potential_root = Path(__file__).parent.parent.parent
-        if (potential_root / 'project_management_automation').exists():
-            project_root = potential_root
-        else:
-            # Last resort: use current working directory if it looks like a project
-            cwd = Path.cwd()
-            if (cwd / 'project_management_automation').exists() or (cwd / '.git').exists():
-                project_root = cwd
+@dataclass(frozen=True)
+class ScorecardCollector:
+    """One pluggable scorecard section."""
 
+    name: str
+    collect: Callable[['ScorecardContext'], dict[str, Any]]
+    cost: str = 'cheap'
+    timeout: Optional[float] = None  # None = COLLECTOR_TIMEOUTS[cost]
+
+
+class ScorecardContext:
+    """Inputs shared by collectors (safe to use from several threads)."""
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        # One shared walk of the tree (honours .gitignore/.cursorignore, skips venvs and caches)
+        self.inventory = get_repo_inventory(project_root)
+        # Line counts come from the persistent per-file cache; only changed files are re-read
+        self.file_metrics = get_file_metrics_cache(project_root)
+        self.todo2_store = get_todo2_store(project_root)
+        self.has_tasks = self.todo2_store.exists()
+        self.todos = self.todo2_store.get_tasks() if self.has_tasks else []
+        # Normalize status matching using utility functions
+        self.pending = [t for t in self.todos if is_pending_status(t.get('status', ''))]
+        self.completed = [t for t in self.todos if is_completed_status(t.get('status', ''))]
+        self._python_sources: Optional[tuple[list[Path], int]] = None
+        self._lock = threading.Lock()
+
+    def python_sources(self) -> tuple[list[Path], int]:
+        """Python files and their total line count (computed once)."""
+        with self._lock:
+            if self._python_sources is None:
+                py_files = self.inventory.files(ext='.py')
+                self._python_sources = (py_files, self.file_metrics.count_lines(py_files))
+            return self._python_sources
+
+
+def _collect_codebase(ctx: ScorecardContext) -> dict[str, Any]:
+    """Codebase size, tools and prompts."""
+    project_root = ctx.project_root
     scores = {}
     metrics = {}
-
-    # ═══════════════════════════════════════════════════════════════
-    # 1. CODEBASE METRICS
-    # ═══════════════════════════════════════════════════════════════
-    # Add exclusions for system directories to prevent scanning home directory
-    py_files = list(project_root.rglob('*.py'))
-    py_files = [f for f in py_files
-                if 'venv' not in str(f)
-                and '.build-env' not in str(f)
-                and '__pycache__' not in str(f)
-                and 'Library' not in str(f)  # Exclude macOS Library directories
-                and 'Containers' not in str(f)  # Exclude app containers
-                and 'Group Containers' not in str(f)  # Exclude group containers
-                and '.Trash' not in str(f)  # Exclude trash
-                and str(f).startswith(str(project_root))]  # Ensure file is within project
-
-    total_py_lines = 0
-    for f in py_files:
-        try:
-            total_py_lines += len(f.read_text().splitlines())
-        except (OSError, UnicodeDecodeError):
-            pass
+    py_files, total_py_lines = ctx.python_sources()
 
     # Count tools and prompts
     tools_dir = project_root / 'project_management_automation' / 'tools'
@@ -168,144 +216,27 @@ def generate_project_scorecard(
         'mcp_prompts': prompts_count,
     }
     scores['codebase'] = 80  # Base score for having a structured codebase
+    return {'scores': scores, 'metrics': metrics}
 
-    # ═══════════════════════════════════════════════════════════════
-    # 2. TESTING
-    # ═══════════════════════════════════════════════════════════════
-    # Detect test files across multiple languages and locations
-    test_files = []
-    test_lines = 0
-
-    # Common test directories
-    test_dirs = [
-        project_root / 'tests',
-        project_root / 'test',
-        project_root / 'native' / 'tests',
-        project_root / 'native' / 'test',
-        project_root / 'agents' / 'backend' / 'tests',
-        project_root / 'web' / 'src' / '__tests__',
-        project_root / 'web' / '__tests__',
-    ]
 
-    # Python tests: test_*.py
-    for test_dir in test_dirs:
-        if test_dir.exists():
-            test_files.extend(test_dir.rglob('test_*.py'))
-
-    # C++ tests: test_*.cpp, *_test.cpp, *test*.cpp
-    for test_dir in test_dirs:
-        if test_dir.exists():
-            test_files.extend(test_dir.rglob('test_*.cpp'))
-            test_files.extend(test_dir.rglob('*_test.cpp'))
-            test_files.extend(test_dir.rglob('*test*.cpp'))
-
-    # Rust tests: *_test.rs, test_*.rs, tests/*.rs (in Rust, tests are in tests/ directory)
-    rust_test_dirs = [project_root / 'agents' / 'backend', project_root / 'native']
-    for base_dir in rust_test_dirs:
-        if base_dir.exists():
-            # Rust convention: tests in tests/ directory
-            tests_dir = base_dir / 'tests'
-            if tests_dir.exists():
-                test_files.extend(tests_dir.rglob('*.rs'))
-            # Also check for inline tests: *_test.rs
-            test_files.extend(base_dir.rglob('*_test.rs'))
-            test_files.extend(base_dir.rglob('test_*.rs'))
-
-    # TypeScript/JavaScript tests: *.test.ts, *.test.tsx, *.spec.ts, *.spec.tsx
-    ts_dirs = [project_root / 'web', project_root / 'agents' / 'web']
-    for ts_dir in ts_dirs:
-        if ts_dir.exists():
-            test_files.extend(ts_dir.rglob('*.test.ts'))
-            test_files.extend(ts_dir.rglob('*.test.tsx'))
-            test_files.extend(ts_dir.rglob('*.spec.ts'))
-            test_files.extend(ts_dir.rglob('*.spec.tsx'))
-
-    # Swift tests: *Tests.swift, *Test.swift
-    swift_dirs = [project_root / 'ios', project_root / 'desktop']
-    for swift_dir in swift_dirs:
-        if swift_dir.exists():
-            test_files.extend(swift_dir.rglob('*Tests.swift'))
-            test_files.extend(swift_dir.rglob('*Test.swift'))
-
-    # Remove duplicates
-    test_files = list(set(test_files))
-
-    # Calculate total test lines
-    for f in test_files:
-        if f.exists():
-            try:
-                test_lines += len(f.read_text().splitlines())
-            except (OSError, UnicodeDecodeError):
-                pass
+def _collect_testing(ctx: ScorecardContext) -> dict[str, Any]:
+    """Test-to-source line ratio across languages."""
+    inventory, file_metrics = ctx.inventory, ctx.file_metrics
+    scores = {}
+    metrics = {}
+    _, total_py_lines = ctx.python_sources()
+
+    # Test files across languages (test_*.py, *_test.rs, *.test.ts, *Tests.swift,
+    # anything with a source extension under tests/, test/ or __tests__/)
+    test_files = inventory.files(role='test')
+    test_lines = file_metrics.count_lines(test_files)
 
     # Calculate test ratio - compare test lines to source code lines
     # For multi-language projects, use all source lines (Python + C++ + Rust + TypeScript + Swift)
-
-    # C++ source files (exclude tests)
-    cpp_files = list(project_root.rglob('*.cpp'))
-    cpp_files = [f for f in cpp_files
-                if 'venv' not in str(f)
-                and '.build-env' not in str(f)
-                and '__pycache__' not in str(f)
-                and 'test' not in str(f).lower()
-                and 'target' not in str(f)
-                and 'Library' not in str(f)
-                and 'Containers' not in str(f)
-                and str(f).startswith(str(project_root))]
-    total_cpp_lines = 0
-    for f in cpp_files:
-        try:
-            total_cpp_lines += len(f.read_text().splitlines())
-        except (OSError, UnicodeDecodeError):
-            pass
-
-    # Rust source files (exclude tests)
-    rust_files = list(project_root.rglob('*.rs'))
-    rust_files = [f for f in rust_files
-                 if 'target' not in str(f)
-                 and 'test' not in str(f).lower()
-                 and 'tests' not in str(f)
-                 and 'Library' not in str(f)
-                 and 'Containers' not in str(f)
-                 and str(f).startswith(str(project_root))]
-    total_rust_lines = 0
-    for f in rust_files:
-        try:
-            total_rust_lines += len(f.read_text().splitlines())
-        except (OSError, UnicodeDecodeError):
-            pass
-
-    # TypeScript source files (exclude tests)
-    ts_files = list(project_root.rglob('*.ts'))
-    ts_files.extend(project_root.rglob('*.tsx'))
-    ts_files = [f for f in ts_files
-                if 'node_modules' not in str(f)
-                and 'test' not in str(f).lower()
-                and 'spec' not in str(f).lower()
-                and '.test.' not in str(f)
-                and 'Library' not in str(f)
-                and 'Containers' not in str(f)
-                and str(f).startswith(str(project_root))]
-    total_ts_lines = 0
-    for f in ts_files:
-        try:
-            total_ts_lines += len(f.read_text().splitlines())
-        except (OSError, UnicodeDecodeError):
-            pass
-
-    # Swift source files (exclude tests)
-    swift_files = list(project_root.rglob('*.swift'))
-    swift_files = [f for f in swift_files
-                  if 'Library' not in str(f)
-                  and 'Containers' not in str(f)
-                  and str(f).startswith(str(project_root))]
-    swift_files = [f for f in swift_files if 'test' not in str(f).lower() and 'build' not in str(f)]
-    total_swift_lines = 0
-    for f in swift_files:
-        try:
-            total_swift_lines += len(f.read_text().splitlines())
-        except (OSError, UnicodeDecodeError):
-            pass
+    total_cpp_lines = file_metrics.count_lines(_non_test_sources(inventory, '.cpp'))
+    total_rust_lines = file_metrics.count_lines(_non_test_sources(inventory, '.rs'))
+    total_ts_lines = file_metrics.count_lines(_non_test_sources(inventory, ('.ts', '.tsx')))
+    total_swift_lines = file_metrics.count_lines(_non_test_sources(inventory, '.swift'))
 
     # Total source lines across all languages
     total_source_lines = total_py_lines + total_cpp_lines + total_rust_lines + total_ts_lines + total_swift_lines
@@ -317,21 +248,19 @@ def generate_project_scorecard(
         'test_lines': test_lines,
         'test_ratio': round(test_ratio, 1),
     }
+    return {'scores': scores, 'metrics': metrics}
 
-    # ═══════════════════════════════════════════════════════════════
-    # 3. DOCUMENTATION
-    # ═══════════════════════════════════════════════════════════════
-    project_root / 'docs'
-    md_files = list(project_root.rglob('*.md'))
-    md_files = [f for f in md_files
-               if 'Library' not in str(f)
-               and 'Containers' not in str(f)
-               and str(f).startswith(str(project_root))]
-    md_files = [f for f in md_files if 'venv' not in str(f)]
-
-    doc_lines = sum(len(f.read_text().splitlines()) for f in md_files if f.exists() and f.is_file())
-    doc_ratio = (doc_lines / total_py_lines * 100) if total_py_lines > 0 else 0
 
+def _collect_documentation(ctx: ScorecardContext) -> dict[str, Any]:
+    """Documentation volume and key documents."""
+    project_root, inventory, file_metrics = ctx.project_root, ctx.inventory, ctx.file_metrics
+    scores = {}
+    metrics = {}
+    _, total_py_lines = ctx.python_sources()
+
+    md_files = inventory.files(ext='.md')
+    doc_lines = file_metrics.count_lines(md_files)
+    doc_ratio = (doc_lines / total_py_lines * 100) if total_py_lines > 0 else 0
     key_docs = ['README.md', 'INSTALL.md', 'docs/SECURITY.md', 'docs/WORKFLOW.md']
     existing_docs = sum(1 for d in key_docs if (project_root / d).exists())
 
@@ -343,201 +272,224 @@ def generate_project_scorecard(
         'doc_ratio': round(doc_ratio, 1),
         'key_docs': f"{existing_docs}/{len(key_docs)}",
     }
+    return {'scores': scores, 'metrics': metrics}
 
-    # ═══════════════════════════════════════════════════════════════
-    # 4. TASK MANAGEMENT
-    # ═══════════════════════════════════════════════════════════════
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    if todo2_file.exists():
-        with open(todo2_file) as f:
-            data = json.load(f)
-        todos = data.get('todos', [])
 
-        # Normalize status matching using utility functions
-        pending = [t for t in todos if is_pending_status(t.get('status', ''))]
-        completed = [t for t in todos if is_completed_status(t.get('status', ''))]
+def _collect_tasks(ctx: ScorecardContext) -> dict[str, Any]:
+    """Task completion, alignment, clarity and parallelizability."""
+    scores = {}
+    metrics = {}
+    if not ctx.has_tasks:
+        scores['completion'] = 0
+        scores['alignment'] = 0
+        scores['clarity'] = 0
+        scores['parallelizable'] = 0
+        metrics['tasks'] = {'total': 0, 'pending': 0, 'completed': 0}
+        return {'scores': scores, 'metrics': metrics}
 
-        completion_rate = len(completed) / len(todos) * 100 if todos else 0
-        scores['completion'] = completion_rate
+    todos, pending, completed = ctx.todos, ctx.pending, ctx.completed
 
-        remaining_hours = sum(t.get('estimatedHours', 0) for t in pending)
+    completion_rate = len(completed) / len(todos) * 100 if todos else 0
+    scores['completion'] = completion_rate
 
-        metrics['tasks'] = {
-            'total': len(todos),
-            'pending': len(pending),
-            'completed': len(completed),
-            'completion_rate': round(completion_rate, 1),
-            'remaining_hours': remaining_hours,
-        }
+    remaining_hours = sum(t.get('estimatedHours', 0) for t in pending)
 
-        # ═══════════════════════════════════════════════════════════
-        # 5. ALIGNMENT ANALYSIS
-        # ═══════════════════════════════════════════════════════════
-        mcp_keywords = {
-            'mcp', 'fastmcp', 'tool', 'tools', 'prompt', 'prompts', 'resource',
-            'server', 'client', 'automation', 'automate', 'security', 'secure',
-            'validation', 'validate', 'test', 'testing', 'tests', 'coverage',
-            'integration', 'documentation', 'docs', 'workflow', 'ci', 'cd',
-            'health', 'analysis', 'task', 'tasks', 'todo', 'sprint',
-            'boundary', 'rate', 'limiting', 'access', 'control', 'auth',
-            'exarp', 'hook', 'hooks', 'trigger', 'config', 'deploy',
-        }
+    metrics['tasks'] = {
+        'total': len(todos),
+        'pending': len(pending),
+        'completed': len(completed),
+        'completion_rate': round(completion_rate, 1),
+        'remaining_hours': remaining_hours,
+    }
 
-        alignment_scores = []
-        well_aligned = 0
-        moderately_aligned = 0
-        for task in pending:
-            content = task.get('content', '').lower()
-            details_text = (task.get('details', '') or task.get('long_description', '') or '').lower()
-            tags = ' '.join(task.get('tags', [])).lower()
-            full_text = f"{content} {details_text} {tags}"
-
-            words = set(re.findall(r'\b[a-z_]{3,}\b', full_text))
-            matches = len(words & mcp_keywords)
-
-            # Score based on matches (generous scoring)
-            if matches >= 5:
-                score = 100
-                well_aligned += 1
-            elif matches >= 3:
-                score = 75
-                moderately_aligned += 1
-            elif matches >= 2:
-                score = 50
-                moderately_aligned += 1
-            elif matches >= 1:
-                score = 30
-            else:
-                score = 10
-            alignment_scores.append(score)
-
-        avg_alignment = sum(alignment_scores) / len(alignment_scores) if alignment_scores else 0
-        # If no pending tasks but we have completed tasks, use a default score based on completion rate
-        if len(pending) == 0 and len(completed) > 0:
-            # High completion suggests good alignment historically
-            avg_alignment = 75.0  # Default score for completed projects
-        scores['alignment'] = avg_alignment
-
-        metrics['alignment'] = {
-            'well_aligned': well_aligned,
-            'moderately_aligned': moderately_aligned,
-            'total_pending': len(pending),
-            'avg_score': round(avg_alignment, 1),
-        }
+    # ═══════════════════════════════════════════════════════════
+    # 5. ALIGNMENT ANALYSIS
+    # ═══════════════════════════════════════════════════════════
+    mcp_matcher = get_keyword_matcher(
+        [kw for kw in MCP_ALIGNMENT_KEYWORDS if len(kw) >= 3], whole_words=True
+    )
 
-        # ═══════════════════════════════════════════════════════════
-        # 6. CLARITY & PARALLELIZABILITY
-        # ═══════════════════════════════════════════════════════════
-        action_verbs = ['add', 'implement', 'create', 'fix', 'update', 'remove',
-                       'refactor', 'migrate', 'integrate', 'test', 'document', 'extend']
-
-        has_estimate = sum(1 for t in pending if t.get('estimatedHours', 0) > 0)
-        has_tags = sum(1 for t in pending if t.get('tags'))
-        small_enough = sum(1 for t in pending if 0 < t.get('estimatedHours', 0) <= 4)
-        clear_name = sum(1 for t in pending if any(
-            t.get('content', '').lower().startswith(v) for v in action_verbs))
-        no_deps = sum(1 for t in pending if not t.get('dependsOn') and not t.get('dependencies'))
-
-        total_pending = len(pending) or 1
-        clarity_score = (has_estimate + has_tags + small_enough + clear_name + no_deps) / (5 * total_pending) * 100
-        # If no pending tasks but we have completed tasks, use a default score
-        if len(pending) == 0 and len(completed) > 0:
-            # High completion suggests tasks were clear enough to complete
-            clarity_score = 70.0  # Default score for completed projects
-        scores['clarity'] = clarity_score
-
-        parallelizable = sum(1 for t in pending if
-            t.get('estimatedHours', 0) <= 4 and
-            not t.get('dependsOn') and
-            not t.get('dependencies'))
-        parallel_score = parallelizable / total_pending * 100 if total_pending else 0
-        # If no pending tasks but we have completed tasks, use a default score
-        if len(pending) == 0 and len(completed) > 0:
-            # If all tasks are completed, they were parallelizable enough to finish
-            parallel_score = 60.0  # Default score for completed projects
-        scores['parallelizable'] = parallel_score
-
-        metrics['clarity'] = {
-            'has_estimate': has_estimate,
-            'has_tags': has_tags,
-            'small_enough': small_enough,
-            'clear_name': clear_name,
-            'no_dependencies': no_deps,
-            'clarity_score': round(clarity_score, 1),
-        }
+    alignment_scores = []
+    well_aligned = 0
+    moderately_aligned = 0
+    task_texts = [
+        f"{task.get('content', '')} "
+        f"{task.get('details', '') or task.get('long_description', '') or ''} "
+        f"{' '.join(task.get('tags', []))}"
+        for task in pending
+    ]
+    for keywords_found in mcp_matcher.find_batch(task_texts):
+        matches = len(keywords_found)
+
+        # Score based on matches (generous scoring)
+        if matches >= 5:
+            score = 100
+            well_aligned += 1
+        elif matches >= 3:
+            score = 75
+            moderately_aligned += 1
+        elif matches >= 2:
+            score = 50
+            moderately_aligned += 1
+        elif matches >= 1:
+            score = 30
+        else:
+            score = 10
+        alignment_scores.append(score)
+
+    avg_alignment = sum(alignment_scores) / len(alignment_scores) if alignment_scores else 0
+    # If no pending tasks but we have completed tasks, use a default score based on completion rate
+    if len(pending) == 0 and len(completed) > 0:
+        # High completion suggests good alignment historically
+        avg_alignment = 75.0  # Default score for completed projects
+    scores['alignment'] = avg_alignment
+
+    metrics['alignment'] = {
+        'well_aligned': well_aligned,
+        'moderately_aligned': moderately_aligned,
+        'total_pending': len(pending),
+        'avg_score': round(avg_alignment, 1),
+    }
 
-        metrics['parallelizable'] = {
-            'ready': parallelizable,
-            'total': total_pending,
-            'score': round(parallel_score, 1),
-        }
+    # ═══════════════════════════════════════════════════════════
+    # 6. CLARITY & PARALLELIZABILITY
+    # ═══════════════════════════════════════════════════════════
+    action_verbs = ['add', 'implement', 'create', 'fix', 'update', 'remove',
+                   'refactor', 'migrate', 'integrate', 'test', 'document', 'extend']
+
+    has_estimate = sum(1 for t in pending if t.get('estimatedHours', 0) > 0)
+    has_tags = sum(1 for t in pending if t.get('tags'))
+    small_enough = sum(1 for t in pending if 0 < t.get('estimatedHours', 0) <= 4)
+    clear_name = sum(1 for t in pending if any(
+        t.get('content', '').lower().startswith(v) for v in action_verbs))
+    no_deps = sum(1 for t in pending if not t.get('dependsOn') and not t.get('dependencies'))
+
+    total_pending = len(pending) or 1
+    clarity_score = (has_estimate + has_tags + small_enough + clear_name + no_deps) / (5 * total_pending) * 100
+    # If no pending tasks but we have completed tasks, use a default score
+    if len(pending) == 0 and len(completed) > 0:
+        # High completion suggests tasks were clear enough to complete
+        clarity_score = 70.0  # Default score for completed projects
+    scores['clarity'] = clarity_score
+
+    parallelizable = sum(1 for t in pending if
+        t.get('estimatedHours', 0) <= 4 and
+        not t.get('dependsOn') and
+        not t.get('dependencies'))
+    parallel_score = parallelizable / total_pending * 100 if total_pending else 0
+    # If no pending tasks but we have completed tasks, use a default score
+    if len(pending) == 0 and len(completed) > 0:
+        # If all tasks are completed, they were parallelizable enough to finish
+        parallel_score = 60.0  # Default score for completed projects
+    scores['parallelizable'] = parallel_score
+
+    metrics['clarity'] = {
+        'has_estimate': has_estimate,
+        'has_tags': has_tags,
+        'small_enough': small_enough,
+        'clear_name': clear_name,
+        'no_dependencies': no_deps,
+        'clarity_score': round(clarity_score, 1),
+    }
 
-        # ═══════════════════════════════════════════════════════════
-        # 6.5. PROGRESS INFERENCE METRICS (T-17)
-        # ═══════════════════════════════════════════════════════════
-        try:
-            from project_management_automation.tools.auto_update_task_status import auto_update_task_status
-
-            # Call with dry_run=True to get metrics without updating
-            inference_json = auto_update_task_status(
-                confidence_threshold=0.7,
-                auto_update=False,  # Only get metrics, don't update
-                output_path=None,
-                codebase_path=str(project_root)
-            )
+    metrics['parallelizable'] = {
+        'ready': parallelizable,
+        'total': total_pending,
+        'score': round(parallel_score, 1),
+    }
+    return {'scores': scores, 'metrics': metrics}
+
+
+def _collect_progress_inference(ctx: ScorecardContext) -> dict[str, Any]:
+    """Inferred vs. marked task completion (T-17)."""
+    project_root = ctx.project_root
+    metrics = {}
+    if not ctx.has_tasks:
+        return {'scores': {}, 'metrics': metrics}
 
-            if inference_json:
-                inference_result = json.loads(inference_json)
-                if inference_result.get('success') and inference_result.get('data'):
-                    inference_data = inference_result['data']
-                    inferred_results = inference_data.get('inferred_results', [])
-
-                    # Calculate inferred vs. marked completion comparison
-                    inferred_done = sum(1 for r in inferred_results if r.get('inferred_status') == 'Done')
-                    marked_done = len(completed)
-                    discrepancy_count = sum(
-                        1 for r in inferred_results
+    todos, completed = ctx.todos, ctx.completed
+    try:
+        from project_management_automation.tools.auto_update_task_status import auto_update_task_status
+
+        # Call with dry_run=True to get metrics without updating
+        inference_json = auto_update_task_status(
+            confidence_threshold=0.7,
+            auto_update=False,  # Only get metrics, don't update
+            output_path=None,
+            codebase_path=str(project_root)
+        )
+
+        if inference_json:
+            inference_result = json.loads(inference_json)
+            if inference_result.get('success') and inference_result.get('data'):
+                inference_data = inference_result['data']
+                inferred_results = inference_data.get('inferred_results', [])
+
+                # Calculate inferred vs. marked completion comparison
+                inferred_done = sum(1 for r in inferred_results if r.get('inferred_status') == 'Done')
+                marked_done = len(completed)
+                discrepancy_count = sum(
+                    1 for r in inferred_results
+                    if r.get('current_status') != r.get('inferred_status')
+                )
+
+                # Calculate inferred completion rate
+                inferred_completion_rate = (inferred_done / len(todos) * 100) if todos else 0
+
+                metrics['progress_inference'] = {
+                    'tasks_analyzed': inference_data.get('total_tasks_analyzed', 0),
+                    'inferences_made': inference_data.get('inferences_made', 0),
+                    'marked_completed': marked_done,
+                    'inferred_completed': inferred_done,
+                    'inferred_completion_rate': round(inferred_completion_rate, 1),
+                    'discrepancy_count': discrepancy_count,
+                    'discrepancies': [
+                        {
+                            'task_id': r.get('task_id'),
+                            'task_name': r.get('task_name'),
+                            'marked': r.get('current_status'),
+                            'inferred': r.get('inferred_status'),
+                            'confidence': round(r.get('confidence', 0.0), 2)
+                        }
+                        for r in inferred_results[:5]
                         if r.get('current_status') != r.get('inferred_status')
-                    )
-
-                    # Calculate inferred completion rate
-                    inferred_completion_rate = (inferred_done / len(todos) * 100) if todos else 0
-
-                    metrics['progress_inference'] = {
-                        'tasks_analyzed': inference_data.get('total_tasks_analyzed', 0),
-                        'inferences_made': inference_data.get('inferences_made', 0),
-                        'marked_completed': marked_done,
-                        'inferred_completed': inferred_done,
-                        'inferred_completion_rate': round(inferred_completion_rate, 1),
-                        'discrepancy_count': discrepancy_count,
-                        'discrepancies': [
-                            {
-                                'task_id': r.get('task_id'),
-                                'task_name': r.get('task_name'),
-                                'marked': r.get('current_status'),
-                                'inferred': r.get('inferred_status'),
-                                'confidence': round(r.get('confidence', 0.0), 2)
-                            }
-                            for r in inferred_results[:5]
-                            if r.get('current_status') != r.get('inferred_status')
-                        ]
-                    }
-        except Exception as e:
-            scorecard_logger.debug(f"Progress inference not available: {e}")
-            metrics['progress_inference'] = {
-                'available': False,
-                'error': str(e)
-            }
-    else:
-        scores['completion'] = 0
-        scores['alignment'] = 0
-        scores['clarity'] = 0
-        scores['parallelizable'] = 0
-        metrics['tasks'] = {'total': 0, 'pending': 0, 'completed': 0}
+                    ]
+                }
+    except Exception as e:
+        scorecard_logger.debug(f"Progress inference not available: {e}")
+        metrics['progress_inference'] = {
+            'available': False,
+            'error': str(e)
+        }
+    return {'scores': {}, 'metrics': metrics}
+
+
+def _collect_codeql(ctx: ScorecardContext) -> dict[str, Any]:
+    """CodeQL configuration and alerts (may call `gh`/GitHub API)."""
+    from .codeql_security import get_codeql_security_metrics
+    return {'scores': {}, 'metrics': {}, 'data': get_codeql_security_metrics()}
+
+
+def _codeql_unavailable() -> dict[str, Any]:
+    """CodeQL metrics used when CodeQL data cannot be collected."""
+    return {
+        'score': 0,
+        'configured': False,
+        'checks': {
+            'codeql_workflow': False,
+            'codeql_config': False,
+            'no_critical_alerts': True,
+            'no_high_alerts': True,
+        },
+        'alerts': {'total': 0, 'critical': 0, 'high': 0, 'medium': 0, 'low': 0, 'source': None},
+        'languages': [],
+        'recommendations': [],
+    }
 
-    # ═══════════════════════════════════════════════════════════════
-    # 7. SECURITY (including CodeQL integration)
-    # ═══════════════════════════════════════════════════════════════
+
+def _collect_security(ctx: ScorecardContext) -> dict[str, Any]:
+    """Security controls (CodeQL is blended in after collection)."""
+    project_root = ctx.project_root
 
     # Check for security.py module existence
     security_module = project_root / 'project_management_automation' / 'utils' / 'security.py'
@@ -546,25 +498,6 @@ def generate_project_scorecard(
     # Check security module contents for specific controls
     security_content = security_module.read_text() if security_module_exists else ""
 
-    # Get CodeQL metrics
-    try:
-        from .codeql_security import get_codeql_security_metrics
-        codeql_metrics = get_codeql_security_metrics()
-    except ImportError:
-        codeql_metrics = {
-            'score': 0,
-            'configured': False,
-            'checks': {
-                'codeql_workflow': False,
-                'codeql_config': False,
-                'no_critical_alerts': True,
-                'no_high_alerts': True,
-            },
-            'alerts': {'total': 0, 'critical': 0, 'high': 0, 'medium': 0, 'low': 0, 'source': None},
-            'languages': [],
-            'recommendations': [],
-        }
-
     security_checks = {
         'security_docs': (project_root / 'docs' / 'SECURITY.md').exists(),
         'ci_cd_workflow': (project_root / '.github' / 'workflows' / 'ci.yml').exists(),
@@ -574,6 +507,22 @@ def generate_project_scorecard(
         'path_boundaries': 'PathValidator' in security_content and 'PathBoundaryError' in security_content,
         'rate_limiting': 'RateLimiter' in security_content and 'rate_limit' in security_content,
         'access_control': 'AccessController' in security_content and 'require_access' in security_content,
+    }
+
+    # Count pending security tasks
+    security_tasks = [t for t in ctx.todo2_store.get_tasks_by_tag('security') if is_pending_status(t.get('status', ''))]
+
+    return {
+        'scores': {},
+        'metrics': {},
+        'data': {'checks': security_checks, 'pending_tasks': len(security_tasks)},
+    }
+
+
+def _security_section(security: dict[str, Any], codeql_metrics: dict[str, Any]) -> tuple[float, dict[str, Any]]:
+    """Combine security checks with CodeQL metrics into the security score and metrics."""
+    security_checks = {
+        **security['checks'],
         # CodeQL checks
         'codeql_workflow': codeql_metrics['checks']['codeql_workflow'],
         'codeql_no_critical': codeql_metrics['checks']['no_critical_alerts'],
@@ -587,17 +536,14 @@ def generate_project_scorecard(
 
     # Blend with CodeQL score if configured (CodeQL gets 30% weight when enabled)
     if codeql_metrics['configured']:
-        scores['security'] = (base_security_score * 0.7) + (codeql_metrics['score'] * 0.3)
+        score = (base_security_score * 0.7) + (codeql_metrics['score'] * 0.3)
     else:
-        scores['security'] = base_security_score
+        score = base_security_score
 
-    # Count pending security tasks
-    security_tasks = [t for t in todos if 'security' in t.get('tags', []) and is_pending_status(t.get('status', ''))] if todo2_file.exists() else []
-
-    metrics['security'] = {
+    return score, {
         'checks_passed': passed,
         'checks_total': len(security_checks),
-        'pending_tasks': len(security_tasks),
+        'pending_tasks': security['pending_tasks'],
         'details': security_checks,
         'codeql': {
             'configured': codeql_metrics['configured'],
@@ -607,9 +553,13 @@ def generate_project_scorecard(
         },
     }
 
-    # ═══════════════════════════════════════════════════════════════
-    # 8. CI/CD
-    # ═══════════════════════════════════════════════════════════════
+
+def _collect_ci_cd(ctx: ScorecardContext) -> dict[str, Any]:
+    """CI/CD and tooling configuration."""
+    project_root = ctx.project_root
+    scores = {}
+    metrics = {}
+
     ci_checks = {
         'github_actions': (project_root / '.github' / 'workflows' / 'ci.yml').exists(),
         'linting': (project_root / 'pyproject.toml').exists(),
@@ -621,10 +571,15 @@ def generate_project_scorecard(
 
     scores['ci_cd'] = sum(1 for v in ci_checks.values() if v) / len(ci_checks) * 100
     metrics['ci_cd'] = ci_checks
+    return {'scores': scores, 'metrics': metrics}
+
+
+def _collect_performance(ctx: ScorecardContext) -> dict[str, Any]:
+    """Performance infrastructure and task dependency analysis."""
+    project_root, todo2_store, todos = ctx.project_root, ctx.todo2_store, ctx.todos
+    scores = {}
+    metrics = {}
 
-    # ═══════════════════════════════════════════════════════════════
-    # 9. PERFORMANCE
-    # ═══════════════════════════════════════════════════════════════
     # Check for performance optimizations and infrastructure
 
     # Check for MCP connection pooling
@@ -654,7 +609,7 @@ def generate_project_scorecard(
         import networkx as nx
 
         # Build task dependency graph if we have tasks
-        if todo2_file.exists() and todos:
+        if todo2_store.exists() and todos:
             G = nx.DiGraph()
 
             # Add tasks as nodes
@@ -770,10 +725,15 @@ def generate_project_scorecard(
         'dependency_analysis': dependency_analysis,
         'description': 'Performance optimizations: connection pooling, async ops, timing, batching, dependency analysis',
     }
+    return {'scores': scores, 'metrics': metrics}
+
+
+def _collect_dogfooding(ctx: ScorecardContext) -> dict[str, Any]:
+    """Does Exarp use its own tools?"""
+    project_root = ctx.project_root
+    scores = {}
+    metrics = {}
 
-    # ═══════════════════════════════════════════════════════════════
-    # 10. DOGFOODING SCORE (Does Exarp use its own tools?)
-    # ═══════════════════════════════════════════════════════════════
     dogfooding_checks = {
         # Git hooks using exarp
         'pre_commit_hook': (project_root / '.git' / 'hooks' / 'pre-commit').exists() and
@@ -810,10 +770,14 @@ def generate_project_scorecard(
         'details': dogfooding_checks,
         'description': 'How much Exarp uses its own tools for self-maintenance',
     }
+    return {'scores': scores, 'metrics': metrics}
 
-    # ═══════════════════════════════════════════════════════════════
-    # 11. UNIQUENESS SCORE (Are we reinventing the wheel?)
-    # ═══════════════════════════════════════════════════════════════
+
+def _collect_uniqueness(ctx: ScorecardContext) -> dict[str, Any]:
+    """Are we reinventing the wheel?"""
+    project_root = ctx.project_root
+    scores = {}
+    metrics = {}
 
     # Check for common patterns that could use existing libraries
 
@@ -967,6 +931,187 @@ def generate_project_scorecard(
         'analysis': uniqueness_analysis,
         'description': 'Are we reinventing wheels? If so, is it justified?',
     }
+    return {'scores': scores, 'metrics': metrics}
+
+
+_COLLECTORS: list[ScorecardCollector] = [
+    ScorecardCollector('codebase', _collect_codebase, cost='scan'),
+    ScorecardCollector('testing', _collect_testing, cost='scan'),
+    ScorecardCollector('documentation', _collect_documentation, cost='scan'),
+    ScorecardCollector('tasks', _collect_tasks),
+    ScorecardCollector('progress_inference', _collect_progress_inference, cost='external'),
+    ScorecardCollector('security', _collect_security),
+    ScorecardCollector('codeql', _collect_codeql, cost='external'),
+    ScorecardCollector('ci_cd', _collect_ci_cd),
+    ScorecardCollector('performance', _collect_performance, cost='scan'),
+    ScorecardCollector('dogfooding', _collect_dogfooding),
+    ScorecardCollector('uniqueness', _collect_uniqueness),
+]
+
+# Last successful result per (project root, collector), reused when a collector times out
+_last_results: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+_last_results_lock = threading.Lock()
+
+
+def register_scorecard_collector(collector: ScorecardCollector) -> None:
+    """
+    Add a scorecard collector (replacing any collector with the same name).
+
+    Args:
+        collector: Collector to run with every scorecard
+    """
+    _COLLECTORS[:] = [c for c in _COLLECTORS if c.name != collector.name]
+    _COLLECTORS.append(collector)
+
+
+def _run_collector(collector: ScorecardCollector, ctx: ScorecardContext) -> tuple[float, dict[str, Any]]:
+    start = time.perf_counter()
+    result = collector.collect(ctx)
+    return time.perf_counter() - start, result
+
+
+def run_scorecard_collectors(
+    ctx: ScorecardContext,
+    collectors: Optional[list[ScorecardCollector]] = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Run collectors concurrently, each bounded by its own timeout.
+
+    Args:
+        ctx: Shared collector inputs
+        collectors: Collectors to run (default: all registered)
+
+    Returns:
+        Collector name -> outcome with 'status' ('ok', 'stale', 'timeout' or
+        'error'), 'seconds', 'cost', and the collector's 'scores', 'metrics'
+        and 'data' (for stale outcomes, from the last successful run)
+    """
+    collectors = list(_COLLECTORS if collectors is None else collectors)
+    root_key = str(ctx.project_root)
+
+    def remember(name: str, future: Future) -> None:
+        # Late results still refresh the cache for the next scorecard
+        if not future.cancelled() and future.exception() is None:
+            with _last_results_lock:
+                _last_results[(root_key, name)] = (time.time(), future.result()[1])
+
+    pool = ThreadPoolExecutor(max_workers=max(1, len(collectors)), thread_name_prefix="scorecard")
+    started = time.perf_counter()
+    futures = []
+    for collector in collectors:
+        # Collectors see the calling request's cancellation token
+        future = pool.submit(contextvars.copy_context().run, _run_collector, collector, ctx)
+        future.add_done_callback(partial(remember, collector.name))
+        futures.append((collector, future))
+
+    try:
+        outcomes = _collect_outcomes(futures, started, root_key)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return outcomes
+
+
+def _collect_outcomes(
+    futures: list[tuple[ScorecardCollector, Future]],
+    started: float,
+    root_key: str,
+) -> dict[str, dict[str, Any]]:
+    """Wait for each collector within its budget (stops early if the request is cancelled)."""
+    outcomes = {}
+    for collector, future in futures:
+        check_cancelled()
+        timeout = collector.timeout if collector.timeout is not None else COLLECTOR_TIMEOUTS.get(collector.cost, 30.0)
+        outcome: dict[str, Any] = {'cost': collector.cost}
+        try:
+            seconds, result = wait_for(future, timeout=max(0.0, started + timeout - time.perf_counter()))
+            outcome.update(status='ok', seconds=round(seconds, 3), **result)
+        except FuturesTimeoutError:
+            scorecard_logger.warning(f"Scorecard collector '{collector.name}' timed out after {timeout}s")
+            outcome.update(status='timeout', seconds=round(time.perf_counter() - started, 3))
+        except ToolCancelledError:
+            raise
+        except Exception as e:
+            scorecard_logger.warning(f"Scorecard collector '{collector.name}' failed: {e}")
+            outcome.update(status='error', error=str(e), seconds=round(time.perf_counter() - started, 3))
+
+        if outcome['status'] != 'ok':
+            with _last_results_lock:
+                previous = _last_results.get((root_key, collector.name))
+            if previous:
+                collected_at, result = previous
+                outcome.update(result)
+                outcome['stale_reason'] = outcome['status']
+                outcome['status'] = 'stale'
+                outcome['age_seconds'] = round(time.time() - collected_at, 1)
+        outcomes[collector.name] = outcome
+    return outcomes
+
+
+def generate_project_scorecard(
+    output_format: str = "text",
+    include_recommendations: bool = True,
+    output_path: Optional[str] = None
+) -> dict[str, Any]:
+    """
+    Generate comprehensive project health scorecard.
+
+    [HINT: Project scorecard. Returns overall score, component scores (security, testing,
+    docs, alignment, clarity, parallelizable, performance, dogfooding, uniqueness), task metrics, production readiness.]
+
+    Sections are collected concurrently; a section that times out or fails is
+    reported from its last successful run (stale) or marked unavailable and
+    left out of the overall score.
+
+    Args:
+        output_format: Output format - "text", "json", or "markdown"
+        include_recommendations: Include improvement recommendations
+        output_path: Optional path to save report
+
+    Returns:
+        Dictionary with scorecard data, per-collector status/timing and formatted output
+    """
+    project_root = find_project_root()
+
+    # Safety check: Ensure we're not scanning the entire home directory
+    # If project_root is the home directory, something went wrong
+    if str(project_root) == str(Path.home()) or str(project_root) == '/Users/davidl':
+        # Try to find the actual project by looking for project_management_automation package
+        potential_root = Path(__file__).parent.parent.parent
+        if (potential_root / 'project_management_automation').exists():
+            project_root = potential_root
+        else:
+            # Last resort: use current working directory if it looks like a project
+            cwd = Path.cwd()
+            if (cwd / 'project_management_automation').exists() or (cwd / '.git').exists():
+                project_root = cwd
+
+    ctx = ScorecardContext(project_root)
+    started = time.perf_counter()
+    outcomes = run_scorecard_collectors(ctx)
+    ctx.file_metrics.save()
+
+    scores = {}
+    metrics = {}
+    for name, outcome in outcomes.items():
+        scores.update(outcome.get('scores', {}))
+        metrics.update(outcome.get('metrics', {}))
+        if outcome['status'] == 'stale':
+            for section in outcome.get('metrics', {}):
+                metrics[section] = {**metrics[section], 'stale': True, 'age_seconds': outcome['age_seconds']}
+        elif outcome['status'] != 'ok' and name not in ('codeql', 'security'):
+            metrics[name] = {'available': False, 'status': outcome['status'], 'error': outcome.get('error')}
+
+    # Security blends in CodeQL; without CodeQL data it falls back to the unconfigured defaults
+    codeql_outcome = outcomes.get('codeql', {})
+    codeql_available = 'data' in codeql_outcome
+    codeql_metrics = codeql_outcome['data'] if codeql_available else _codeql_unavailable()
+    security_outcome = outcomes.get('security', {})
+    if 'data' in security_outcome:
+        scores['security'], metrics['security'] = _security_section(security_outcome['data'], codeql_metrics)
+        if not codeql_available:
+            metrics['security']['codeql']['status'] = codeql_outcome.get('status', 'unavailable')
+    elif security_outcome:
+        metrics['security'] = {'available': False, 'status': security_outcome['status']}
 
     # ═══════════════════════════════════════════════════════════════
     # CALCULATE OVERALL SCORE
@@ -986,15 +1131,28 @@ def generate_project_scorecard(
         'uniqueness': 0.10,  # Not reinventing wheels (or justified if we are)
     }
 
+    # Unavailable sections are left out and the remaining weights rescaled
+    available_weight = sum(w for k, w in weights.items() if k in scores)
     overall_score = sum(scores.get(k, 0) * weights.get(k, 0) for k in weights)
+    if 0 < available_weight < sum(weights.values()):
+        overall_score *= sum(weights.values()) / available_weight
 
-    # Determine production readiness
-    production_ready = scores.get('security', 0) >= 80 and scores.get('testing', 0) >= 50
+    def below(section: str, threshold: float) -> bool:
+        """Whether an available section scores under a threshold (unavailable sections never do)."""
+        return section in scores and scores[section] < threshold
+
+    # Determine production readiness: unknown (None) while a gating section is unavailable
     blockers = []
-    if scores.get('security', 0) < 80:
+    if below('security', 80):
         blockers.append("Security controls incomplete")
-    if scores.get('testing', 0) < 50:
+    if below('testing', 50):
         blockers.append("Test coverage too low")
+    if blockers:
+        production_ready = False
+    elif 'security' in scores and 'testing' in scores:
+        production_ready = True
+    else:
+        production_ready = None
 
     # ═══════════════════════════════════════════════════════════════
     # BUILD RESULT
@@ -1007,13 +1165,27 @@ def generate_project_scorecard(
         'scores': {k: round(v, 1) for k, v in scores.items()},
         'weights': weights,
         'metrics': metrics,
+        'collectors': {
+            name: {
+                'status': outcome['status'],
+                'cost': outcome['cost'],
+                'seconds': outcome['seconds'],
+                **({'error': outcome['error']} if 'error' in outcome else {}),
+                **({'age_seconds': outcome['age_seconds']} if 'age_seconds' in outcome else {}),
+            }
+            for name, outcome in outcomes.items()
+        },
+        'collection_seconds': round(time.perf_counter() - started, 3),
     }
+    unavailable = [name for name, outcome in outcomes.items() if outcome['status'] not in ('ok', 'stale')]
+    if unavailable:
+        result['partial'] = True
 
     # Add recommendations if requested
     if include_recommendations:
         recommendations = []
 
-        if scores.get('security', 0) < 80:
+        if below('security', 80):
             recommendations.append({
                 'priority': 'critical',
                 'area': 'Security',
@@ -1021,30 +1193,31 @@ def generate_project_scorecard(
                 'impact': '+25% to security score',
             })
 
-        # CodeQL-specific recommendations
-        if not codeql_metrics['configured']:
-            recommendations.append({
-                'priority': 'high',
-                'area': 'CodeQL',
-                'action': 'Enable CodeQL workflow for automated security scanning',
-                'impact': '+10% to security score',
-            })
-        elif codeql_metrics['alerts']['critical'] > 0:
-            recommendations.append({
-                'priority': 'critical',
-                'area': 'CodeQL',
-                'action': f"Fix {codeql_metrics['alerts']['critical']} critical CodeQL security alerts",
-                'impact': 'Prevent security vulnerabilities',
-            })
-        elif codeql_metrics['alerts']['high'] > 0:
-            recommendations.append({
-                'priority': 'high',
-                'area': 'CodeQL',
-                'action': f"Address {codeql_metrics['alerts']['high']} high-severity CodeQL alerts",
-                'impact': '+15% to CodeQL score',
-            })
+        # CodeQL-specific recommendations (only when CodeQL data was collected)
+        if codeql_available:
+            if not codeql_metrics['configured']:
+                recommendations.append({
+                    'priority': 'high',
+                    'area': 'CodeQL',
+                    'action': 'Enable CodeQL workflow for automated security scanning',
+                    'impact': '+10% to security score',
+                })
+            elif codeql_metrics['alerts']['critical'] > 0:
+                recommendations.append({
+                    'priority': 'critical',
+                    'area': 'CodeQL',
+                    'action': f"Fix {codeql_metrics['alerts']['critical']} critical CodeQL security alerts",
+                    'impact': 'Prevent security vulnerabilities',
+                })
+            elif codeql_metrics['alerts']['high'] > 0:
+                recommendations.append({
+                    'priority': 'high',
+                    'area': 'CodeQL',
+                    'action': f"Address {codeql_metrics['alerts']['high']} high-severity CodeQL alerts",
+                    'impact': '+15% to CodeQL score',
+                })
 
-        if scores.get('testing', 0) < 50:
+        if below('testing', 50):
             recommendations.append({
                 'priority': 'high',
                 'area': 'Testing',
@@ -1052,7 +1225,7 @@ def generate_project_scorecard(
                 'impact': '+15% to testing score',
             })
 
-        if scores.get('performance', 0) < 70:
+        if below('performance', 70):
             perf_metrics = metrics.get('performance', {})
             perf_details = perf_metrics.get('details', {})
             dep_analysis = perf_metrics.get('dependency_analysis', {})
@@ -1083,7 +1256,7 @@ def generate_project_scorecard(
                 'impact': '+15% to performance score',
             })
 
-        if scores.get('completion', 0) < 25:
+        if below('completion', 25):
             recommendations.append({
                 'priority': 'medium',
                 'area': 'Tasks',
@@ -1091,7 +1264,7 @@ def generate_project_scorecard(
                 'impact': '+5% to overall score',
             })
 
-        if scores.get('dogfooding', 0) < 70:
+        if below('dogfooding', 70):
             missing = [k for k, v in metrics.get('dogfooding', {}).get('details', {}).items() if not v]
             recommendations.append({
                 'priority': 'medium',
@@ -1100,7 +1273,7 @@ def generate_project_scorecard(
                 'impact': '+13% to dogfooding score',
             })
 
-        if scores.get('uniqueness', 0) < 80:
+        if below('uniqueness', 80):
             improvements = metrics.get('uniqueness', {}).get('analysis', {}).get('potential_improvements', [])
             if improvements:
                 recommendations.append({
@@ -1151,7 +1324,7 @@ def _format_text(data: dict) -> str:
     overall = data['overall_score']
     status = "🟢" if overall >= 70 else "🟡" if overall >= 50 else "🔴"
     lines.append(f"\n  OVERALL SCORE: {overall}% {status}")
-    lines.append(f"  Production Ready: {'YES ✅' if data['production_ready'] else 'NO ❌'}")
+    lines.append(f"  Production Ready: {_production_ready_label(data['production_ready'], 'YES ✅', 'NO ❌', 'UNKNOWN ❔')}")
 
     if data.get('blockers'):
         lines.append(f"  Blockers: {', '.join(data['blockers'])}")
@@ -1225,6 +1398,15 @@ def _format_text(data: dict) -> str:
         else:
             lines.append("    🔐 CodeQL: Not configured")
 
+    # Collector timing
+    if data.get('collectors'):
+        lines.append(f"\n  Collectors ({data.get('collection_seconds', 0):.2f}s):")
+        for name, c in sorted(data['collectors'].items(), key=lambda x: -x[1]['seconds']):
+            status = '' if c['status'] == 'ok' else f"  ⚠️ {c['status']}"
+            lines.append(f"    {name:<20} {c['seconds']:>7.2f}s  [{c['cost']}]{status}")
+        if data.get('partial'):
+            lines.append("    ⚠️ Partial results: unavailable sections are excluded from the overall score")
+
     # Recommendations
     if data.get('recommendations'):
         lines.append("\n  Recommendations:")
@@ -1266,7 +1448,7 @@ def _format_markdown(data: dict) -> str:
     overall = data['overall_score']
     status = "🟢" if overall >= 70 else "🟡" if overall >= 50 else "🔴"
     lines.append(f"\n## Overall Score: **{overall}%** {status}")
-    lines.append(f"\n**Production Ready:** {'✅ Yes' if data['production_ready'] else '❌ No'}")
+    lines.append(f"\n**Production Ready:** {_production_ready_label(data['production_ready'], '✅ Yes', '❌ No', '❔ Unknown')}")
 
     if data.get('blockers'):
         lines.append(f"\n**Blockers:** {', '.join(data['blockers'])}")
@@ -1345,6 +1527,16 @@ def _format_markdown(data: dict) -> str:
             lines.append("- **Status:** Not configured")
             lines.append("- **Recommendation:** Add `.github/workflows/codeql.yml` for automated security scanning")
 
+    # Collector timing
+    if data.get('collectors'):
+        lines.append(f"\n## Collectors ({data.get('collection_seconds', 0):.2f}s)\n")
+        if data.get('partial'):
+            lines.append("> ⚠️ Partial results: unavailable sections are excluded from the overall score.\n")
+        lines.append("| Collector | Cost | Time | Status |")
+        lines.append("|-----------|------|------|--------|")
+        for name, c in sorted(data['collectors'].items(), key=lambda x: -x[1]['seconds']):
+            lines.append(f"| {name} | {c['cost']} | {c['seconds']:.2f}s | {c['status']} |")
+
     # Recommendations
     if data.get('recommendations'):
         lines.append("\n## Recommendations\n")
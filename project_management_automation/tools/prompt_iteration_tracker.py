@@ -7,13 +7,18 @@ Based on Cursor IDE Best Practice #7.
 
 import json
 import logging
+import os
 import time
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+from ..utils.file_lock import FileLock
+
 logger = logging.getLogger(__name__)
 
+SUMMARY_VERSION = 1
+
 # Import error handler
 try:
     from ..error_handler import (
@@ -38,13 +43,32 @@ except ImportError:
 
 
 class PromptIterationTracker:
-    """Tracks prompt iterations for workflow analysis."""
+    """
+    Tracks prompt iterations for workflow analysis.
+
+    Each prompt is appended as one line to the day's event log
+    (`events_YYYYMMDD.jsonl`), and that day's summary (`summary_YYYYMMDD.json`:
+    counts by mode, outcome and iteration, plus the highest iteration per
+    task) is updated in the same step. Analysis reads only the summaries for
+    the requested window. A summary that is missing or out of step with its
+    event log (it records the log size it covers) is rebuilt from the log,
+    including days recorded in the older `session_YYYYMMDD.json` format.
+    """
 
     def __init__(self, project_root: Path):
         self.project_root = project_root
         self.log_dir = project_root / ".cursor" / "prompt_history"
         self.log_dir.mkdir(parents=True, exist_ok=True)
-        self.current_log = self.log_dir / f"session_{datetime.now().strftime('%Y%m%d')}.json"
+        self.current_log = self._events_path(datetime.now().date())
+
+    def _events_path(self, day: date) -> Path:
+        return self.log_dir / f"events_{day.strftime('%Y%m%d')}.jsonl"
+
+    def _summary_path(self, day: date) -> Path:
+        return self.log_dir / f"summary_{day.strftime('%Y%m%d')}.json"
+
+    def _legacy_path(self, day: date) -> Path:
+        return self.log_dir / f"session_{day.strftime('%Y%m%d')}.json"
 
     def log_prompt(
         self,
@@ -55,8 +79,9 @@ class PromptIterationTracker:
         iteration: int = 1,
     ) -> dict[str, Any]:
         """Log a prompt iteration."""
+        now = datetime.now()
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "prompt": prompt[:500],  # Truncate long prompts
             "task_id": task_id,
             "mode": mode or "unknown",
@@ -64,65 +89,114 @@ class PromptIterationTracker:
             "iteration": iteration,
             "prompt_length": len(prompt),
         }
+        line = (json.dumps(entry, separators=(",", ":")) + "\n").encode()
+        day = now.date()
+
+        with FileLock(self.log_dir / ".prompt_history.lock"):
+            # Bring the summary up to date before extending the log it covers
+            summary = self._day_summary(day)
+            with open(self._events_path(day), "ab") as f:
+                f.write(line)
+            _add_to_summary(summary, entry)
+            summary["log_bytes"] += len(line)
+            self._save_summary(day, summary)
 
-        # Load existing log
-        log_data = self._load_log()
-        log_data["entries"].append(entry)
-        log_data["last_updated"] = datetime.now().isoformat()
+        return entry
 
-        # Save
-        self._save_log(log_data)
+    def _day_summary(self, day: date) -> dict[str, Any]:
+        """Load a day's summary, rebuilding it if it does not match the event log."""
+        events = self._events_path(day)
+        try:
+            log_bytes = events.stat().st_size
+        except FileNotFoundError:
+            log_bytes = 0
 
-        return entry
+        summary_path = self._summary_path(day)
+        if summary_path.exists():
+            try:
+                summary = json.loads(summary_path.read_text())
+                if summary.get("version") == SUMMARY_VERSION and summary.get("log_bytes") == log_bytes:
+                    return summary
+            except (OSError, ValueError):
+                pass
+        elif log_bytes == 0 and not self._legacy_path(day).exists():
+            return _empty_summary(day)
+
+        summary = _empty_summary(day)
+        for entry in self._read_entries(day):
+            _add_to_summary(summary, entry)
+        summary["log_bytes"] = log_bytes
+        return summary
+
+    def _read_entries(self, day: date) -> list[dict[str, Any]]:
+        """All entries recorded for a day (legacy session file first)."""
+        entries = []
+        legacy = self._legacy_path(day)
+        if legacy.exists():
+            try:
+                entries.extend(json.loads(legacy.read_text()).get("entries", []))
+            except (OSError, ValueError):
+                pass
+        try:
+            with open(self._events_path(day), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue  # Torn write
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _save_summary(self, day: date, summary: dict[str, Any]) -> None:
+        summary_path = self._summary_path(day)
+        tmp_path = summary_path.with_name(f"{summary_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(summary, separators=(",", ":")))
+        os.replace(tmp_path, summary_path)
+
+    def _recorded_days(self) -> set[date]:
+        days = set()
+        for pattern in ("events_*.jsonl", "session_*.json"):
+            for path in self.log_dir.glob(pattern):
+                try:
+                    days.add(datetime.strptime(path.stem.split("_", 1)[1], "%Y%m%d").date())
+                except ValueError:
+                    continue
+        return days
 
     def analyze_iterations(self, days: int = 7) -> dict[str, Any]:
-        """Analyze prompt iterations over time."""
+        """Analyze prompt iterations over the last `days` days (today included)."""
         analysis = {
             "period_days": days,
             "total_prompts": 0,
             "by_mode": {},
             "by_outcome": {},
+            "by_iteration": {},
             "avg_iterations": 0,
             "patterns": [],
             "recommendations": [],
         }
 
-        # Load all logs from period
-        all_entries = []
-        for log_file in self.log_dir.glob("session_*.json"):
-            try:
-                log_data = json.loads(log_file.read_text())
-                all_entries.extend(log_data.get("entries", []))
-            except Exception:
-                pass
-
-        analysis["total_prompts"] = len(all_entries)
-
-        if not all_entries:
+        # Merge the daily summaries in the window
+        today = datetime.now().date()
+        window = {today - timedelta(days=offset) for offset in range(max(1, days))}
+        task_iterations: dict[str, int] = {}
+        for day in sorted(window & self._recorded_days()):
+            summary = self._day_summary(day)
+            analysis["total_prompts"] += summary["total"]
+            for key in ("by_mode", "by_outcome", "by_iteration"):
+                for name, count in summary[key].items():
+                    analysis[key][name] = analysis[key].get(name, 0) + count
+            for task_id, iteration in summary["task_iterations"].items():
+                task_iterations[task_id] = max(task_iterations.get(task_id, 0), iteration)
+
+        if not analysis["total_prompts"]:
             analysis["recommendations"].append(
                 "No prompt history found. Use log_prompt_iteration to track prompts."
             )
             return analysis
 
-        # Analyze by mode
-        for entry in all_entries:
-            mode = entry.get("mode", "unknown")
-            analysis["by_mode"][mode] = analysis["by_mode"].get(mode, 0) + 1
-
-        # Analyze by outcome
-        for entry in all_entries:
-            outcome = entry.get("outcome", "unknown")
-            analysis["by_outcome"][outcome] = analysis["by_outcome"].get(outcome, 0) + 1
-
         # Calculate average iterations per task
-        task_iterations = {}
-        for entry in all_entries:
-            task_id = entry.get("task_id")
-            if task_id:
-                task_iterations[task_id] = max(
-                    task_iterations.get(task_id, 0), entry.get("iteration", 1)
-                )
-
         if task_iterations:
             analysis["avg_iterations"] = round(
                 sum(task_iterations.values()) / len(task_iterations), 2
@@ -153,18 +227,35 @@ class PromptIterationTracker:
 
         return analysis
 
-    def _load_log(self) -> dict:
-        """Load current session log."""
-        if self.current_log.exists():
-            try:
-                return json.loads(self.current_log.read_text())
-            except Exception:
-                pass
-        return {"created": datetime.now().isoformat(), "entries": []}
 
-    def _save_log(self, data: dict) -> None:
-        """Save current session log."""
-        self.current_log.write_text(json.dumps(data, indent=2))
+def _empty_summary(day: date) -> dict[str, Any]:
+    return {
+        "version": SUMMARY_VERSION,
+        "date": day.isoformat(),
+        "total": 0,
+        "by_mode": {},
+        "by_outcome": {},
+        "by_iteration": {},
+        "task_iterations": {},
+        "log_bytes": 0,
+    }
+
+
+def _add_to_summary(summary: dict[str, Any], entry: dict[str, Any]) -> None:
+    """Fold one entry into a daily summary."""
+    mode = entry.get("mode", "unknown")
+    outcome = entry.get("outcome", "unknown")
+    try:
+        iteration = int(entry.get("iteration", 1))
+    except (TypeError, ValueError):
+        iteration = 1
+    summary["total"] += 1
+    summary["by_mode"][mode] = summary["by_mode"].get(mode, 0) + 1
+    summary["by_outcome"][outcome] = summary["by_outcome"].get(outcome, 0) + 1
+    summary["by_iteration"][str(iteration)] = summary["by_iteration"].get(str(iteration), 0) + 1
+    task_id = entry.get("task_id")
+    if task_id:
+        summary["task_iterations"][task_id] = max(summary["task_iterations"].get(task_id, 0), iteration)
 
 
 def log_prompt_iteration(
@@ -179,7 +270,7 @@ def log_prompt_iteration(
 
     📊 Output: Logged entry with timestamp, prompt metadata
     🔧 Side Effects: Writes to .cursor/prompt_history/
-    📁 Creates: Daily session logs
+    📁 Creates: Daily event logs (JSONL) and per-day summaries
     ⏱️ Typical Runtime: <1 second
 
     Example Prompt:
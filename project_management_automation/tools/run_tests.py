@@ -12,7 +12,6 @@ FastMCP Integration:
 """
 
 import asyncio
-import json
 import logging
 import time
 from pathlib import Path
@@ -21,6 +20,9 @@ from typing import Any, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from mcp.server.fastmcp import Context
 
+from ..utils.tool_executor import get_tool_executor
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,6 +115,7 @@ except ImportError:
             AUTOMATION_ERROR = "AUTOMATION_ERROR"
 
 
+@structured_tool
 async def run_tests_async(
     test_path: Optional[str] = None,
     test_framework: str = "auto",
@@ -120,7 +123,9 @@ async def run_tests_async(
     coverage: bool = False,
     output_path: Optional[str] = None,
     ctx: Optional["Context"] = None,
-) -> str:
+    changed_since: Optional[str] = None,
+    workers: int = 1,
+) -> dict[str, Any]:
     """
     Execute test suites with flexible options (async with progress).
 
@@ -131,6 +136,9 @@ async def run_tests_async(
         coverage: Generate coverage report (default: false)
         output_path: Path for test results (default: test-results/)
         ctx: FastMCP Context for progress reporting (optional)
+        changed_since: Only run tests affected by changes since this git ref
+            (pytest; uses per-test coverage from a previous coverage=True run)
+        workers: Number of parallel pytest shards, balanced by past timings (default: 1)
 
     Returns:
         JSON string with test execution results
@@ -152,7 +160,9 @@ async def run_tests_async(
             'test_framework': test_framework,
             'verbose': verbose,
             'coverage': coverage,
-            'output_path': output_path or 'test-results/'
+            'output_path': output_path or 'test-results/',
+            'changed_since': changed_since,
+            'workers': workers,
         }
 
         # ═══ PROGRESS: Step 2/4 - Detect framework ═══
@@ -164,9 +174,8 @@ async def run_tests_async(
         # ═══ PROGRESS: Step 3/4 - Run tests ═══
         await _report_progress(ctx, 3, 4, "Running tests...")
 
-        # Run in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        results = await loop.run_in_executor(None, runner.run)
+        # Run on the subprocess pool; cancelling the request stops the test processes
+        results = await get_tool_executor().run("subprocess", runner.run)
 
         # ═══ PROGRESS: Step 4/4 - Process results ═══
         await _report_progress(ctx, 4, 4, "Processing test results...")
@@ -183,6 +192,9 @@ async def run_tests_async(
             'coverage_file': results.get('results', {}).get('coverage_file'),
             'status': results.get('results', {}).get('status', 'unknown')
         }
+        if results.get('results', {}).get('selection'):
+            response_data['selection'] = results['results']['selection']
+            response_data['shards'] = results['results'].get('shards', [])
 
         # Log summary
         passed = response_data['tests_passed']
@@ -202,7 +214,7 @@ async def run_tests_async(
         if memory_result.get('success'):
             response_data['memory_saved'] = memory_result.get('memory_id')
 
-        return json.dumps(format_success_response(response_data), indent=2)
+        return format_success_response(response_data)
 
     except Exception as e:
         duration = time.time() - start_time
@@ -211,9 +223,10 @@ async def run_tests_async(
             await _log_info(ctx, f"❌ Test run failed: {e}")
 
         error_response = format_error_response(e, ErrorCode.AUTOMATION_ERROR)
-        return json.dumps(error_response, indent=2)
+        return error_response
 
 
+@structured_tool
 def run_tests(
     test_path: Optional[str] = None,
     test_framework: str = "auto",
@@ -221,7 +234,9 @@ def run_tests(
     coverage: bool = False,
     output_path: Optional[str] = None,
     ctx: Optional["Context"] = None,
-) -> str:
+    changed_since: Optional[str] = None,
+    workers: int = 1,
+) -> dict[str, Any]:
     """
     Execute test suites with flexible options (sync wrapper).
 
@@ -234,6 +249,9 @@ def run_tests(
         coverage: Generate coverage report (default: false)
         output_path: Path for test results (default: test-results/)
         ctx: FastMCP Context for progress reporting (optional)
+        changed_since: Only run tests affected by changes since this git ref
+            (pytest; uses per-test coverage from a previous coverage=True run)
+        workers: Number of parallel pytest shards, balanced by past timings (default: 1)
 
     Returns:
         JSON string with test execution results
@@ -248,5 +266,8 @@ def run_tests(
 
     if in_async:
         raise RuntimeError("Use run_tests_async() in async context, or call from sync code")
-    return asyncio.run(run_tests_async(test_path, test_framework, verbose, coverage, output_path, ctx))
+    return asyncio.run(run_tests_async.result(
+        test_path, test_framework, verbose, coverage, output_path, ctx,
+        changed_since=changed_since, workers=workers,
+    ))
 
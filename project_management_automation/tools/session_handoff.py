@@ -24,6 +24,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, List, Optional
 
+from ..utils.todo2_store import get_todo2_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,17 +88,21 @@ def _get_current_hostname() -> str:
     return socket.gethostname()
 
 
-def _load_todo2_state() -> dict[str, Any]:
-    """Load Todo2 state file."""
-    project_root = _find_project_root()
-    todo2_file = project_root / ".todo2" / "state.todo2.json"
+def _load_todo2_state(for_update: bool = False) -> dict[str, Any]:
+    """
+    Load Todo2 state from the shared store.
 
-    if not todo2_file.exists():
+    Args:
+        for_update: Return a private mutable copy (for read-modify-write) instead
+            of the shared read-only snapshot
+    """
+    store = get_todo2_store(_find_project_root())
+
+    if not store.exists():
         return {"todos": []}
 
     try:
-        with open(todo2_file) as f:
-            return json.load(f)
+        return store.load_state_for_update() if for_update else store.load_state()
     except Exception as e:
         logger.error(f"Error loading Todo2 state: {e}")
         return {"todos": [], "error": str(e)}
@@ -104,12 +110,8 @@ def _load_todo2_state() -> dict[str, Any]:
 
 def _save_todo2_state(state: dict[str, Any]) -> bool:
     """Save Todo2 state file."""
-    project_root = _find_project_root()
-    todo2_file = project_root / ".todo2" / "state.todo2.json"
-
     try:
-        with open(todo2_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        get_todo2_store(_find_project_root()).save_state(state)
         return True
     except Exception as e:
         logger.error(f"Error saving Todo2 state: {e}")
@@ -356,29 +358,31 @@ def end_session(
 
             # Unassign my tasks
             if unassign_my_tasks:
-                for task in my_tasks_to_unassign:
-                    task_id = task.get("id")
-                    # Find in todos and remove assignee
-                    for i, t in enumerate(todos):
-                        if t.get("id") == task_id:
-                            # Add handoff note to task
-                            if "comments" not in todos[i]:
-                                todos[i]["comments"] = []
-                            todos[i]["comments"].append({
-                                "id": f"{task_id}-handoff-{int(time.time())}",
-                                "todoId": task_id,
-                                "type": "handoff",
-                                "content": f"**Handoff from {current_host}**: {summary or 'Session ended'}\n\nBlockers: {', '.join(blockers) if blockers else 'None'}\n\nNext steps: {', '.join(next_steps) if next_steps else 'Continue work'}",
-                                "created": timestamp,
-                            })
-                            # Remove assignee
-                            if "assignee" in todos[i]:
-                                del todos[i]["assignee"]
-                            todos[i]["lastModified"] = timestamp
-                            break
-
-                state["todos"] = todos
-                _save_todo2_state(state)
+                with get_todo2_store(_find_project_root()).write_lock():
+                    state = _load_todo2_state(for_update=True)
+                    todos = state.get("todos", [])
+                    for task in my_tasks_to_unassign:
+                        task_id = task.get("id")
+                        # Find in todos and remove assignee
+                        for i, t in enumerate(todos):
+                            if t.get("id") == task_id:
+                                # Add handoff note to task
+                                if "comments" not in todos[i]:
+                                    todos[i]["comments"] = []
+                                todos[i]["comments"].append({
+                                    "id": f"{task_id}-handoff-{int(time.time())}",
+                                    "todoId": task_id,
+                                    "type": "handoff",
+                                    "content": f"**Handoff from {current_host}**: {summary or 'Session ended'}\n\nBlockers: {', '.join(blockers) if blockers else 'None'}\n\nNext steps: {', '.join(next_steps) if next_steps else 'Continue work'}",
+                                    "created": timestamp,
+                                })
+                                # Remove assignee
+                                if "assignee" in todos[i]:
+                                    del todos[i]["assignee"]
+                                todos[i]["lastModified"] = timestamp
+                                break
+
+                    _save_todo2_state(state)
 
             # Save handoff note
             _save_handoff(handoff)
@@ -793,7 +797,8 @@ def sync_todo2_state(
     direction: str = "both",
     prefer_agentic_tools: bool = True,
     auto_commit: bool = True,
-    dry_run: bool = False
+    dry_run: bool = False,
+    peer: Optional[str] = None,
 ) -> str:
     """
     [HINT: Sync Todo2 state. Syncs task state across agents without manual commits. Directions: pull, push, both.]
@@ -803,6 +808,8 @@ def sync_todo2_state(
     This tool provides multiple sync methods:
     1. **Agentic-Tools MCP** (preferred): Uses MCP server which handles its own state sync
     2. **Git Auto-Sync** (fallback): Automatically commits and pushes state changes
+    3. **Delta sync with a peer** (when `peer` is given): Exchanges only the task fields
+       changed since the last sync with another project directory, merged field by field
 
     Directions:
     - pull: Fetch and merge remote state changes
@@ -814,6 +821,7 @@ def sync_todo2_state(
         prefer_agentic_tools: Try agentic-tools MCP first (default: True)
         auto_commit: Auto-commit state changes for git sync (default: True)
         dry_run: Preview sync operations without making changes (default: False)
+        peer: Peer project directory for delta sync (skips agentic-tools and git)
 
     Returns:
         JSON with sync results and details
@@ -822,10 +830,36 @@ def sync_todo2_state(
         sync_todo2_state(direction="pull")  # Pull latest state from remote
         sync_todo2_state(direction="push")  # Push local state changes
         sync_todo2_state(direction="both")  # Pull then push
+        sync_todo2_state(peer="/mnt/laptop/project")  # Exchange changed tasks with a peer
     """
     start_time = time.time()
     current_host = _get_current_hostname()
 
+    if peer:
+        from .todo2_delta_sync import sync_with_peer
+
+        delta_result = sync_with_peer(_find_project_root(), peer, direction=direction, dry_run=dry_run)
+        results = {
+            "success": delta_result.get("success", False),
+            "host": current_host,
+            "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+            "direction": direction,
+            "methods_tried": [delta_result],
+            "final_method": "delta",
+        }
+        if delta_result.get("success"):
+            results["message"] = (
+                f"Synced with {peer}: pulled {delta_result.get('pulled', {}).get('fields_applied', 0)} fields, "
+                f"pushed {delta_result.get('pushed', {}).get('fields_applied', 0)} fields, "
+                f"{len(delta_result['conflicts'])} conflicts"
+            )
+            results["details"] = delta_result
+        else:
+            results["message"] = f"Sync failed: {delta_result.get('error')}"
+            results["errors"] = [delta_result.get("error")]
+        results["duration_ms"] = round((time.time() - start_time) * 1000, 2)
+        return json.dumps(results, indent=2)
+
     if dry_run:
         return json.dumps({
             "success": True,
@@ -1005,6 +1039,7 @@ def session_handoff(
     direction: str = "both",
     prefer_agentic_tools: bool = True,
     auto_commit: bool = True,
+    peer: Optional[str] = None,
 ) -> str:
     """
     [HINT: Session handoff. End/resume sessions for multi-dev coordination. Actions: end, resume, latest, list, sync.]
@@ -1030,6 +1065,7 @@ def session_handoff(
         direction: Sync direction for sync action - "pull", "push", or "both" (default: "both")
         prefer_agentic_tools: Try agentic-tools MCP first for sync (default: True)
         auto_commit: Auto-commit state changes for git sync (default: True)
+        peer: Peer project directory for delta sync (sync action)
 
     Returns:
         JSON with action results
@@ -1067,6 +1103,7 @@ def session_handoff(
             prefer_agentic_tools=prefer_agentic_tools,
             auto_commit=auto_commit,
             dry_run=dry_run,
+            peer=peer,
         )
 
     else:
@@ -1092,6 +1129,7 @@ def register_handoff_tools(mcp) -> None:
             direction: str = "both",
             prefer_agentic_tools: bool = True,
             auto_commit: bool = True,
+            peer: Optional[str] = None,
         ) -> str:
             """
             [HINT: Exarp session handoff. End/resume sessions for multi-dev coordination with git sync. Actions: end, resume, latest, list, sync.]
@@ -1100,7 +1138,7 @@ def register_handoff_tools(mcp) -> None:
             - Git sync integration (prefers agentic-tools MCP, falls back to git)
             - Multi-device coordination
             - Auto-commit functionality
-            - Todo2 state synchronization
+            - Todo2 state synchronization (delta sync with a peer directory via `peer`)
 
             This is an enhanced wrapper around agentic-tools' session_handoff_tool with exarp-specific features.
             """
@@ -1116,6 +1154,7 @@ def register_handoff_tools(mcp) -> None:
                 direction=direction,
                 prefer_agentic_tools=prefer_agentic_tools,
                 auto_commit=auto_commit,
+                peer=peer,
             )
 
         logger.info("✅ Registered exarp_session_handoff tool (enhanced wrapper around agentic-tools)")
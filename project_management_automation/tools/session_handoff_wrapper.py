@@ -127,7 +127,8 @@ class SessionHandoffWrapper:
         direction: str = "both",
         prefer_agentic_tools: bool = True,
         auto_commit: bool = True,
-        dry_run: bool = False
+        dry_run: bool = False,
+        peer: Optional[str] = None,
     ) -> dict[str, Any]:
         """
         Sync Todo2 state across agents/machines.
@@ -137,6 +138,7 @@ class SessionHandoffWrapper:
             prefer_agentic_tools: Try agentic-tools MCP first (default: True)
             auto_commit: Auto-commit state changes (default: True)
             dry_run: Preview without changes (default: False)
+            peer: Peer project directory for delta sync
 
         Returns:
             Dict with sync results
@@ -145,7 +147,8 @@ class SessionHandoffWrapper:
             direction=direction,
             prefer_agentic_tools=prefer_agentic_tools,
             auto_commit=auto_commit,
-            dry_run=dry_run
+            dry_run=dry_run,
+            peer=peer,
         )
         return json.loads(result_str)
 
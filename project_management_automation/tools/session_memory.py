@@ -11,7 +11,6 @@ Trusted Advisor: 🎓 Confucius (Documentation)
 "Choose a job you love, and you will never have to work a day in your life." - Passion sustains.
 """
 
-import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -156,8 +155,7 @@ def recall_task_context(
 
     try:
         # Get memories for this task
-        result_json = funcs['get_memories_by_task_resource'](task_id)
-        result = json.loads(result_json)
+        result = funcs['get_memories_by_task_resource'].result(task_id)
 
         memories = result.get('memories', [])
 
@@ -281,8 +279,7 @@ def generate_session_summary(
 
     try:
         # Get session memories
-        session_json = funcs['get_session_memories_resource'](date)
-        session = json.loads(session_json)
+        session = funcs['get_session_memories_resource'].result(date)
 
         memories = session.get('memories', [])
         session_date = session.get('session_date', date or datetime.now().strftime("%Y-%m-%d"))
@@ -290,8 +287,7 @@ def generate_session_summary(
         # Get wisdom if requested
         wisdom = None
         if include_consultations:
-            wisdom_json = funcs['get_wisdom_resource']()
-            wisdom = json.loads(wisdom_json)
+            wisdom = funcs['get_wisdom_resource'].result()
 
         # Build narrative summary
         narrative = _build_session_narrative(memories, wisdom)
@@ -430,7 +426,7 @@ def get_memories_for_sprint() -> dict[str, Any]:
 
     try:
         # Get recent memories (last 7 days)
-        all_memories = json.loads(funcs['get_memories_resource'](limit=100))
+        all_memories = funcs['get_memories_resource'].result(limit=100)
         memories = all_memories.get('memories', [])
 
         # Filter to last 7 days
@@ -8,12 +8,13 @@ Memory Integration:
 - Saves sprint results as insights for future planning
 """
 
-import json
 import logging
 import time
 from pathlib import Path
 from typing import Any, List, Optional
 
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,6 +83,7 @@ except ImportError:
             AUTOMATION_ERROR = "AUTOMATION_ERROR"
 
 
+@structured_tool
 def sprint_automation(
     max_iterations: int = 10,
     auto_approve: bool = True,
@@ -93,7 +95,7 @@ def sprint_automation(
     dry_run: bool = False,
     output_path: Optional[str] = None,
     notify: bool = False
-) -> str:
+) -> dict[str, Any]:
     """
     Systematically sprint through project processing all background-capable tasks.
 
@@ -203,12 +205,12 @@ def sprint_automation(
             except Exception as e:
                 logger.debug(f"Notification failed: {e}")
 
-        return json.dumps(format_success_response(response_data), indent=2)
+        return format_success_response(response_data)
 
     except Exception as e:
         duration = time.time() - start_time
         log_automation_execution('sprint_automation', duration, False, e)
 
         error_response = format_error_response(e, ErrorCode.AUTOMATION_ERROR)
-        return json.dumps(error_response, indent=2)
+        return error_response
 
@@ -11,6 +11,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..utils.todo2_store import get_todo2_store
 from ..utils.todo2_utils import (
     filter_tasks_by_project,
     get_repo_project_id,
@@ -69,15 +70,12 @@ def find_project_root() -> Path:
 
 
 def load_todo2_tasks(project_root: Path) -> tuple[dict[str, Any], Path]:
-    """Load Todo2 tasks from state file."""
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    if not todo2_file.exists():
-        raise FileNotFoundError(f"Todo2 state file not found: {todo2_file}")
+    """Load Todo2 tasks from the shared state store (read-only snapshot)."""
+    store = get_todo2_store(project_root)
+    if not store.exists():
+        raise FileNotFoundError(f"Todo2 state file not found: {store.state_file}")
 
-    with open(todo2_file) as f:
-        data = json.load(f)
-
-    return data, todo2_file
+    return store.load_state(), store.state_file
 
 
 def analyze_tags(todos: list[dict[str, Any]]) -> dict[str, Any]:
@@ -193,8 +191,10 @@ def apply_consolidations(
     remove_set = {r['tag'] for r in plan['removals']}
 
     changes = []
+    new_todos = []
 
     for task in todos:
+        new_todos.append(task)
         if not task_belongs_to_project(task, project_id):
             continue
         old_tags = task.get('tags', [])
@@ -226,12 +226,12 @@ def apply_consolidations(
             })
 
             if not dry_run:
-                task['tags'] = new_tags
+                # Replace rather than mutate: `data` may be the shared store snapshot
+                new_todos[-1] = {**task, 'tags': new_tags}
 
     if not dry_run:
         # Save changes
-        with open(todo2_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        get_todo2_store(todo2_file.parent.parent).save_state({**data, 'todos': new_todos})
 
     return {
         'dry_run': dry_run,
@@ -28,6 +28,7 @@ from pathlib import Path
 from typing import Any, List, Literal, Optional
 
 from ..utils.task_locking import atomic_assign_task, atomic_batch_assign
+from ..utils.todo2_store import get_todo2_store
 from ..utils.todo2_utils import is_pending_status, normalize_status
 
 logger = logging.getLogger(__name__)
@@ -75,17 +76,21 @@ def _find_project_root() -> Path:
     return Path.cwd().resolve()
 
 
-def _load_todo2_state() -> dict[str, Any]:
-    """Load Todo2 state file."""
-    project_root = _find_project_root()
-    todo2_file = project_root / ".todo2" / "state.todo2.json"
+def _load_todo2_state(for_update: bool = False) -> dict[str, Any]:
+    """
+    Load Todo2 state from the shared store.
+
+    Args:
+        for_update: Return a private mutable copy (for read-modify-write) instead
+            of the shared read-only snapshot
+    """
+    store = get_todo2_store(_find_project_root())
 
-    if not todo2_file.exists():
+    if not store.exists():
         return {"todos": []}
 
     try:
-        with open(todo2_file) as f:
-            return json.load(f)
+        return store.load_state_for_update() if for_update else store.load_state()
     except Exception as e:
         logger.error(f"Error loading Todo2 state: {e}")
         return {"todos": [], "error": str(e)}
@@ -93,17 +98,16 @@ def _load_todo2_state() -> dict[str, Any]:
 
 def _save_todo2_state(state: dict[str, Any]) -> bool:
     """Save Todo2 state file."""
-    project_root = _find_project_root()
-    todo2_file = project_root / ".todo2" / "state.todo2.json"
+    store = get_todo2_store(_find_project_root())
+    todo2_file = store.state_file
 
     try:
         # Create backup
         if todo2_file.exists():
             backup_file = todo2_file.with_suffix('.json.bak')
-            backup_file.write_text(todo2_file.read_text())
+            backup_file.write_bytes(todo2_file.read_bytes())
 
-        with open(todo2_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        store.save_state(state)
         return True
     except Exception as e:
         logger.error(f"Error saving Todo2 state: {e}")
@@ -178,7 +182,7 @@ def assign_task(
     start_time = time.time()
 
     try:
-        state = _load_todo2_state()
+        state = _load_todo2_state(for_update=True)
         todos = state.get("todos", [])
 
         # Find the task
@@ -248,7 +252,7 @@ def assign_task(
             }, indent=2)
 
         # Reload task to add change tracking (assignment already done atomically)
-        state = _load_todo2_state()
+        state = _load_todo2_state(for_update=True)
         todos = state.get("todos", [])
         for i, t in enumerate(todos):
             if t.get("id") == task_id:
@@ -304,7 +308,7 @@ def unassign_task(task_id: str, dry_run: bool = False) -> str:
         JSON with unassignment result
     """
     try:
-        state = _load_todo2_state()
+        state = _load_todo2_state(for_update=True)
         todos = state.get("todos", [])
 
         # Find the task
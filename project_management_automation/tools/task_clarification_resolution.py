@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 from ..utils import find_project_root
+from ..utils.todo2_store import get_todo2_store
 from ..utils.todo2_utils import is_review_status
 
 logger = logging.getLogger(__name__)
@@ -242,20 +243,16 @@ def list_tasks_awaiting_clarification() -> dict[str, Any]:
     Returns:
         Dictionary with list of tasks awaiting clarification
     """
-    project_root = find_project_root()
-    state_file = project_root / ".todo2" / "state.todo2.json"
+    store = get_todo2_store(find_project_root())
 
-    if not state_file.exists():
+    if not store.exists():
         return {
             "status": "error",
-            "error": f"State file not found: {state_file}"
+            "error": f"State file not found: {store.state_file}"
         }
 
     try:
-        with open(state_file) as f:
-            data = json.load(f)
-
-        todos = data.get('todos', [])
+        todos = store.get_tasks()
         review_tasks = [t for t in todos if is_review_status(t.get('status', ''))]
 
         # Extract clarification questions
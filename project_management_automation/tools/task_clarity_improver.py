@@ -20,6 +20,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from ..utils import find_project_root
+from ..utils.todo2_store import get_todo2_store
 from .task_duration_estimator import estimate_task_duration, estimate_task_duration_detailed
 
 logger = logging.getLogger(__name__)
@@ -58,28 +59,24 @@ def analyze_task_clarity(
         todos = list_todos_mcp(project_root=project_root)
         if not todos:
             # Fallback to file access
-            state_file = project_root / ".todo2" / "state.todo2.json"
-            if not state_file.exists():
+            store = get_todo2_store(project_root)
+            if not store.exists():
                 return {
                     "status": "error",
-                    "error": f"State file not found: {state_file}"
+                    "error": f"State file not found: {store.state_file}"
                 }
-            with open(state_file) as f:
-                data = json.load(f)
-            todos = data.get('todos', [])
+            todos = store.get_tasks()
     except Exception as e:
         logger.debug(f"Todo2 MCP not available: {e}, falling back to file access")
         # Fallback to file access
-        state_file = project_root / ".todo2" / "state.todo2.json"
-        if not state_file.exists():
+        store = get_todo2_store(project_root)
+        if not store.exists():
             return {
                 "status": "error",
-                "error": f"State file not found: {state_file}"
+                "error": f"State file not found: {store.state_file}"
             }
         try:
-            with open(state_file) as f:
-                data = json.load(f)
-            todos = data.get('todos', [])
+            todos = store.get_tasks()
         except Exception as e2:
             logger.error(f"Failed to read state file: {e2}")
             return {
@@ -636,37 +633,35 @@ def _apply_improvements_file_based(analysis_result: dict, output_path: Optional[
         logger.debug(f"Todo2 MCP not available: {e}, falling back to file access")
 
     # Fallback to direct file access
-    state_file = project_root / ".todo2" / "state.todo2.json"
+    store = get_todo2_store(project_root)
 
     try:
-        with open(state_file) as f:
-            data = json.load(f)
-        todos = data.get('todos', [])
-
-        applied = 0
-        for task_imp in improvements:
-            task_id = task_imp['task_id']
-            task = next((t for t in todos if t.get('id') == task_id), None)
-
-            if not task:
-                continue
-
-            for improvement in task_imp['improvements']:
-                if improvement['type'] == 'add_estimate':
-                    task['estimatedHours'] = improvement['suggested']
-                    applied += 1
-                elif improvement['type'] == 'rename':
-                    task['name'] = improvement['suggested']
-                    applied += 1
-                elif improvement['type'] == 'remove_dependencies':
-                    task['dependsOn'] = []
-                    task['dependencies'] = []
-                    applied += 1
-
-        # Save updated state
-        data['todos'] = todos
-        with open(state_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        with store.write_lock():
+            data = store.load_state_for_update()
+            todos = data['todos']
+
+            applied = 0
+            for task_imp in improvements:
+                task_id = task_imp['task_id']
+                task = next((t for t in todos if t.get('id') == task_id), None)
+
+                if not task:
+                    continue
+
+                for improvement in task_imp['improvements']:
+                    if improvement['type'] == 'add_estimate':
+                        task['estimatedHours'] = improvement['suggested']
+                        applied += 1
+                    elif improvement['type'] == 'rename':
+                        task['name'] = improvement['suggested']
+                        applied += 1
+                    elif improvement['type'] == 'remove_dependencies':
+                        task['dependsOn'] = []
+                        task['dependencies'] = []
+                        applied += 1
+
+            # Save updated state
+            store.save_state(data)
 
         return {
             'status': 'success',
@@ -7,7 +7,9 @@ by learning from historical task completion data.
 Features:
 - Historical data analysis (learns from completed tasks)
 - Statistical methods (mean, median, percentiles, confidence intervals)
-- Multi-factor matching (tags, keywords, priority, complexity)
+- Multi-factor matching (tags, keywords, priority, complexity) over an
+  inverted index of the historical corpus, built once per state snapshot
+- Batch estimation and top-k historical matches for many tasks at once
 - Confidence scores and uncertainty ranges
 - Multiple estimation strategies with weighted combination
 """
@@ -20,9 +22,128 @@ from pathlib import Path
 from typing import Any, List, Optional
 
 from ..utils import find_project_root
+from ..utils.keyword_matcher import get_keyword_matcher
+from ..utils.todo2_store import get_todo2_store
 
 logger = logging.getLogger(__name__)
 
+# Minimum match score for a historical record to count
+MIN_MATCH_SCORE = 0.1
+
+# Number of top matches averaged into a historical estimate
+TOP_MATCHES = 10
+
+# Score weights for the matching factors
+WORD_WEIGHT = 0.5
+TAG_WEIGHT = 0.3
+PRIORITY_WEIGHT = 0.2
+
+# Keyword heuristic tiers, checked in order; the first tier hit sets the estimate
+KEYWORD_TIERS = {
+    'quick': ('quick', 'simple', 'minor', 'small', 'fix typo', 'update version', 'bump'),
+    'small': ('add', 'create', 'implement', 'setup', 'install', 'configure'),
+    'medium': ('refactor', 'migrate', 'integrate', 'update', 'improve', 'enhance'),
+    'large': ('complex', 'major', 'rewrite', 'redesign', 'architecture', 'system'),
+}
+KEYWORD_TIER_HOURS = {'quick': 0.5, 'small': 2.0, 'medium': 3.0, 'large': 4.0}
+
+
+class HistoryIndex:
+    """
+    Sparse term index over historical task records.
+
+    Word and tag postings map each term to the records containing it, so a
+    query only touches records sharing at least one term; records matching
+    on priority alone all score exactly PRIORITY_WEIGHT and are taken in
+    record order. Scores match a full scan (Jaccard word overlap, fraction
+    of the record's tags matched, priority equality).
+    """
+
+    def __init__(self, records: list[dict]):
+        """
+        Build the index.
+
+        Args:
+            records: Historical records from load_historical_data()
+        """
+        self.records = records
+        self._word_postings: dict[str, list[int]] = {}
+        self._tag_postings: dict[str, list[int]] = {}
+        self._by_priority: dict[str, list[int]] = {}
+        self._word_counts: list[int] = []
+        self._tag_counts: list[int] = []
+
+        for i, record in enumerate(records):
+            words = set((record['name'] + " " + record['details']).lower().split())
+            self._word_counts.append(len(words))
+            for word in words:
+                self._word_postings.setdefault(word, []).append(i)
+
+            record_tags = [str(t).lower() for t in record.get('tags') or []]
+            self._tag_counts.append(len(record_tags))
+            for tag in set(record_tags):
+                self._tag_postings.setdefault(tag, []).append(i)
+
+            priority = str(record.get('priority') or 'medium').lower()
+            self._by_priority.setdefault(priority, []).append(i)
+
+    def match(self, text: str, tags: list[str], priority: str, top_k: int = TOP_MATCHES) -> list[tuple[float, int]]:
+        """
+        Score records against one task.
+
+        Args:
+            text: Lowercased task name + details
+            tags: Task tags
+            priority: Task priority
+            top_k: Maximum matches to return
+
+        Returns:
+            (score, record index) pairs above MIN_MATCH_SCORE, best first
+            (ties in record order)
+        """
+        scores: dict[int, float] = {}
+
+        text_words = set(text.split())
+        if text_words:
+            shared: dict[int, int] = {}
+            for word in text_words:
+                for i in self._word_postings.get(word, ()):
+                    shared[i] = shared.get(i, 0) + 1
+            for i, overlap in shared.items():
+                union = len(text_words) + self._word_counts[i] - overlap
+                scores[i] = overlap / union * WORD_WEIGHT
+
+        if tags:
+            tag_hits: dict[int, int] = {}
+            for tag in {str(t).lower() for t in tags}:
+                for i in self._tag_postings.get(tag, ()):
+                    tag_hits[i] = tag_hits.get(i, 0) + 1
+            for i, overlap in tag_hits.items():
+                scores[i] = scores.get(i, 0.0) + overlap / self._tag_counts[i] * TAG_WEIGHT
+
+        same_priority = self._by_priority.get(priority.lower(), [])
+        for i in same_priority:
+            if i in scores:
+                scores[i] += PRIORITY_WEIGHT
+
+        ranked = sorted(
+            ((score, i) for i, score in scores.items() if score > MIN_MATCH_SCORE),
+            key=lambda pair: (-pair[0], pair[1]),
+        )[:top_k]
+
+        # Priority-only matches tie at PRIORITY_WEIGHT; fill remaining slots in record order
+        if PRIORITY_WEIGHT > MIN_MATCH_SCORE and (len(ranked) < top_k or ranked[-1][0] <= PRIORITY_WEIGHT):
+            filler = []
+            for i in same_priority:
+                if len(filler) >= top_k:
+                    break
+                if i not in scores:
+                    filler.append((PRIORITY_WEIGHT, i))
+            if filler:
+                ranked = sorted(ranked + filler, key=lambda pair: (-pair[0], pair[1]))[:top_k]
+
+        return ranked
+
 
 class TaskDurationEstimator:
     """Statistical task duration estimator."""
@@ -32,26 +153,26 @@ class TaskDurationEstimator:
         if project_root is None:
             project_root = find_project_root()
         self.project_root = project_root
-        self.state_file = project_root / ".todo2" / "state.todo2.json"
+        self.store = get_todo2_store(project_root)
+        self.state_file = self.store.state_file
         self._historical_data: list[dict] | None = None
+        self._historical_version: tuple | None = None
+        self._history_index: HistoryIndex | None = None
 
     def load_historical_data(self) -> list[dict]:
-        """Load and process historical task data."""
-        if self._historical_data is not None:
-            return self._historical_data
-
-        if not self.state_file.exists():
+        """Load and process historical task data (rebuilt only when the state file changes)."""
+        if not self.store.exists():
             logger.warning(f"State file not found: {self.state_file}")
             return []
 
         try:
-            with open(self.state_file) as f:
-                data = json.load(f)
+            snapshot = self.store.snapshot()
+            if self._historical_data is not None and self._historical_version == snapshot.fingerprint:
+                return self._historical_data
 
-            todos = data.get('todos', [])
             historical = []
 
-            for task in todos:
+            for task in snapshot.by_status.get('completed', []):
                 # Only use completed tasks with time data
                 status = task.get('status', '').lower()
                 if status not in ['done', 'completed']:
@@ -99,6 +220,8 @@ class TaskDurationEstimator:
                         continue
 
             self._historical_data = historical
+            self._historical_version = snapshot.fingerprint
+            self._history_index = HistoryIndex(historical)
             logger.info(f"Loaded {len(historical)} historical task records")
             return historical
 
@@ -144,20 +267,84 @@ class TaskDurationEstimator:
         Returns:
             Dictionary with estimate, confidence, method, and metadata
         """
-        if tags is None:
-            tags = []
+        historical_data = self.load_historical_data() if use_historical else []
+        return self._estimate_one(name, details, tags or [], priority, historical_data)
+
+    def estimate_batch(self, tasks: list[dict], use_historical: bool = True) -> list[dict[str, Any]]:
+        """
+        Statistically estimate many tasks against one historical snapshot.
 
+        Args:
+            tasks: Task dicts with 'name' and optional 'details', 'tags', 'priority'
+
+        Returns:
+            Estimate dicts (as from estimate()) in task order
+        """
+        historical_data = self.load_historical_data() if use_historical else []
+        return [
+            self._estimate_one(
+                task.get('name', ''),
+                task.get('details', '') or '',
+                task.get('tags') or [],
+                task.get('priority') or 'medium',
+                historical_data,
+            )
+            for task in tasks
+        ]
+
+    def match_history_batch(self, tasks: list[dict], top_k: int = 5) -> list[list[dict[str, Any]]]:
+        """
+        Find the top-k most similar completed tasks for each task.
+
+        Args:
+            tasks: Task dicts with 'name' and optional 'details', 'tags', 'priority'
+            top_k: Matches per task
+
+        Returns:
+            Per task, a list of {'name', 'actual_hours', 'score'} dicts, best first
+        """
+        historical = self.load_historical_data()
+        if not historical:
+            return [[] for _ in tasks]
+        index = self._get_history_index(historical)
+        results = []
+        for task in tasks:
+            text = (task.get('name', '') + " " + (task.get('details', '') or '')).lower()
+            matches = index.match(text, task.get('tags') or [], task.get('priority') or 'medium', top_k)
+            results.append([
+                {
+                    'name': historical[i]['name'],
+                    'actual_hours': historical[i]['actual_hours'],
+                    'score': round(score, 3),
+                }
+                for score, i in matches
+            ])
+        return results
+
+    def _get_history_index(self, historical: list[dict]) -> HistoryIndex:
+        """Get the index for a record list (cached for the loaded snapshot)."""
+        if self._history_index is not None and self._history_index.records is historical:
+            return self._history_index
+        return HistoryIndex(historical)
+
+    def _estimate_one(
+        self,
+        name: str,
+        details: str,
+        tags: list[str],
+        priority: str,
+        historical_data: list[dict],
+    ) -> dict[str, Any]:
+        """Estimate one task against already-loaded historical data."""
         text = (name + " " + details).lower()
 
         # Strategy 1: Historical data matching (if available)
         historical_estimate = None
         historical_confidence = 0.0
-        if use_historical:
-            historical_data = self.load_historical_data()
-            if historical_data:
-                historical_estimate, historical_confidence = self._estimate_from_history(
-                    text, tags, priority, historical_data
-                )
+        if historical_data:
+            historical_estimate, historical_confidence = self._estimate_from_history(
+                text, tags, priority, historical_data
+            )
 
         # Strategy 2: Keyword-based heuristic (fallback)
         heuristic_estimate = self._estimate_from_keywords(text)
@@ -211,43 +398,15 @@ class TaskDurationEstimator:
         historical: list[dict]
     ) -> tuple[float, float]:
         """Estimate using historical data matching."""
-        matches = []
-        text_words = set(text.split())
+        index = self._get_history_index(historical)
+        top_matches = [
+            {'actual_hours': historical[i]['actual_hours'], 'score': score}
+            for score, i in index.match(text, tags, priority, TOP_MATCHES)
+        ]
 
-        for record in historical:
-            score = 0.0
-            record_text = (record['name'] + " " + record['details']).lower()
-            record_words = set(record_text.split())
-
-            # Text similarity (word overlap)
-            if text_words and record_words:
-                word_overlap = len(text_words & record_words) / len(text_words | record_words)
-                score += word_overlap * 0.5
-
-            # Tag matching
-            record_tags = [t.lower() for t in record.get('tags', [])]
-            if tags and record_tags:
-                tag_overlap = len({t.lower() for t in tags} & set(record_tags))
-                if record_tags:
-                    score += (tag_overlap / len(record_tags)) * 0.3
-
-            # Priority matching
-            if priority.lower() == record.get('priority', 'medium').lower():
-                score += 0.2
-
-            if score > 0.1:  # Minimum threshold
-                matches.append({
-                    'actual_hours': record['actual_hours'],
-                    'score': score,
-                })
-
-        if not matches:
+        if not top_matches:
             return None, 0.0
 
-        # Sort by score and take top matches
-        matches.sort(key=lambda x: x['score'], reverse=True)
-        top_matches = matches[:min(10, len(matches))]
-
         # Weighted average of top matches
         total_weight = sum(m['score'] for m in top_matches)
         if total_weight == 0:
@@ -264,28 +423,9 @@ class TaskDurationEstimator:
 
     def _estimate_from_keywords(self, text: str) -> float:
         """Estimate using keyword heuristics (improved version)."""
-        # Quick/simple tasks
-        quick_keywords = ['quick', 'simple', 'minor', 'small', 'fix typo', 'update version', 'bump']
-        if any(kw in text for kw in quick_keywords):
-            return 0.5
-
-        # Small tasks
-        small_keywords = ['add', 'create', 'implement', 'setup', 'install', 'configure']
-        if any(kw in text for kw in small_keywords):
-            return 2.0
-
-        # Medium tasks
-        medium_keywords = ['refactor', 'migrate', 'integrate', 'update', 'improve', 'enhance']
-        if any(kw in text for kw in medium_keywords):
-            return 3.0
-
-        # Large tasks
-        large_keywords = ['complex', 'major', 'rewrite', 'redesign', 'architecture', 'system']
-        if any(kw in text for kw in large_keywords):
-            return 4.0
-
-        # Default
-        return 2.0
+        # First tier (quickest first) with a keyword in the text wins
+        tiers = get_keyword_matcher(KEYWORD_TIERS).groups(text)
+        return KEYWORD_TIER_HOURS[tiers[0]] if tiers else 2.0
 
     def _get_priority_multiplier(self, priority: str) -> float:
         """Get time multiplier based on priority."""
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any, Optional
 
 from ..utils import find_project_root
+from ..utils.todo2_store import get_todo2_store
 from ..utils.todo2_utils import filter_tasks_by_project, get_repo_project_id, is_completed_status, is_pending_status
 
 logger = logging.getLogger(__name__)
@@ -103,17 +104,14 @@ def analyze_task_hierarchy(
     project_root = find_project_root()
 
     # Load tasks
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    if not todo2_file.exists():
+    store = get_todo2_store(project_root)
+    if not store.exists():
         return {
             "success": False,
             "error": "No .todo2/state.todo2.json found",
         }
 
-    with open(todo2_file) as f:
-        data = json.load(f)
-
-    todos = data.get('todos', [])
+    todos = store.get_tasks()
     project_id = get_repo_project_id(project_root)
     todos = filter_tasks_by_project(todos, project_id, logger=logger)
 
@@ -4,12 +4,13 @@ MCP Tool Wrapper for Test Coverage Analysis
 Wraps TestCoverageAnalyzer to expose as MCP tool.
 """
 
-from typing import Optional
-import json
+from typing import Any, Optional
 import logging
 import time
 from pathlib import Path
 
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 # Import error handler
@@ -32,12 +33,13 @@ except ImportError:
             AUTOMATION_ERROR = "AUTOMATION_ERROR"
 
 
+@structured_tool
 def analyze_test_coverage(
     coverage_file: Optional[str] = None,
     min_coverage: int = 80,
     output_path: Optional[str] = None,
     format: str = "html"
-) -> str:
+) -> dict[str, Any]:
     """
     Generate coverage reports and identify gaps.
 
@@ -84,12 +86,12 @@ def analyze_test_coverage(
         duration = time.time() - start_time
         log_automation_execution('analyze_test_coverage', duration, True)
 
-        return json.dumps(format_success_response(response_data), indent=2)
+        return format_success_response(response_data)
 
     except Exception as e:
         duration = time.time() - start_time
         log_automation_execution('analyze_test_coverage', duration, False, e)
 
         error_response = format_error_response(e, ErrorCode.AUTOMATION_ERROR)
-        return json.dumps(error_response, indent=2)
+        return error_response
 
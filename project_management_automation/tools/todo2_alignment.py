@@ -4,12 +4,13 @@ MCP Tool Wrapper for Todo2 Alignment Analysis
 Wraps Todo2AlignmentAnalyzerV2 to expose as MCP tool.
 """
 
-from typing import Optional
-import json
+from typing import Any, Optional
 import logging
 import time
 from pathlib import Path
 
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 # Import error handler at module level to avoid scoping issues
@@ -34,16 +35,19 @@ except ImportError:
             AUTOMATION_ERROR = "AUTOMATION_ERROR"
 
 
+@structured_tool
 def analyze_todo2_alignment(
     create_followup_tasks: bool = True,
-    output_path: Optional[str] = None
-) -> str:
+    output_path: Optional[str] = None,
+    write_report: bool = True
+) -> dict[str, Any]:
     """
     Analyze task alignment with project goals, find misaligned tasks.
 
     Args:
         create_followup_tasks: Whether to create Todo2 tasks for misaligned tasks
         output_path: Path for report output (default: docs/TODO2_ALIGNMENT_REPORT.md)
+        write_report: Whether to write the markdown report to output_path
 
     Returns:
         JSON string with analysis results
@@ -68,6 +72,12 @@ def analyze_todo2_alignment(
         analyzer = Todo2AlignmentAnalyzerV2(config, project_root)
         results = analyzer.run()
 
+        # Write report
+        report_path = project_root / config['output_path']
+        if write_report and results.get('report'):
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text(results['report'])
+
         # Extract key metrics from analysis results
         analysis_results = results.get('results', {})
         misaligned_tasks = analysis_results.get('misaligned_tasks', [])
@@ -84,7 +94,7 @@ def analyze_todo2_alignment(
             'average_alignment_score': alignment_score,
             'by_priority': analysis_results.get('by_priority', {}),
             'by_status': analysis_results.get('by_status', {}),
-            'report_path': str(Path(config['output_path']).absolute()),
+            'report_path': str(report_path.absolute()),
             'tasks_created': len(results.get('followup_tasks', [])) if create_followup_tasks else 0,
             'status': results.get('status', 'unknown')
         }
@@ -92,10 +102,10 @@ def analyze_todo2_alignment(
         duration = time.time() - start_time
         log_automation_execution('analyze_todo2_alignment', duration, True)
 
-        return json.dumps(format_success_response(response_data), indent=2)
+        return format_success_response(response_data)
 
     except Exception as e:
         duration = time.time() - start_time
         log_automation_execution('analyze_todo2_alignment', duration, False, e)
         error_response = format_error_response(e, ErrorCode.AUTOMATION_ERROR)
-        return json.dumps(error_response, indent=2)
+        return error_response
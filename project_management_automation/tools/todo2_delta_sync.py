@@ -0,0 +1,437 @@
+"""
+Delta synchronization of Todo2 task state between replicas.
+
+The git fallback of `sync_todo2_state` shares state by committing the whole
+`state.todo2.json` and merging it, so every sync ships the full file and
+concurrent edits conflict at file granularity. This module syncs task
+records field by field instead:
+- each replica (a project directory) keeps sync metadata in
+  `.exarp/todo2_sync.json`: a replica id, a Lamport clock, a local change
+  sequence, and per task field the (clock, replica) stamp of its last change
+- local edits are found by diffing the state file against stored field
+  hashes and are stamped with a new Lamport time
+- a peer is sent only the fields that changed since the sequence number it
+  last received from this replica
+- an incoming field replaces the local one when its stamp is newer (last
+  writer wins per field); fields edited on both sides since the previous
+  exchange are reported as conflicts, compared with
+  branch_merge.detect_merge_conflicts
+- deleted tasks travel as tombstones
+
+Only the `todos` list is synchronized; other top-level keys stay local.
+A peer is another project directory (a second checkout, a shared mount),
+so a sync runs no git commands.
+
+Usage:
+    from project_management_automation.tools.todo2_delta_sync import sync_with_peer
+
+    result = sync_with_peer(project_root, "/mnt/laptop/project", direction="both")
+"""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import uuid
+from contextlib import ExitStack
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..utils.todo2_store import get_todo2_store
+from .branch_merge import detect_merge_conflicts
+
+logger = logging.getLogger(__name__)
+
+SYNC_FILE_RELATIVE = Path(".exarp") / "todo2_sync.json"
+SYNC_VERSION = 1
+
+SYNC_DIRECTIONS = ("pull", "push", "both")
+
+
+def _value_hash(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def _stamp(meta: list) -> tuple[int, str]:
+    """(Lamport clock, replica id) of a field or tombstone record; totally ordered."""
+    return (meta[0], meta[1])
+
+
+class Todo2Replica:
+    """
+    One project directory taking part in a delta sync.
+
+    Field records in the metadata are [clock, replica, seq, hash]; a hash of
+    None marks a field removed from the task. Tombstones are [clock, replica, seq].
+    Not thread-safe: hold `lock()` for the whole load/observe/apply/save cycle.
+    """
+
+    def __init__(self, project_root: Union[Path, str]):
+        """
+        Initialize replica.
+
+        Args:
+            project_root: Project root containing the `.todo2` directory
+        """
+        self.project_root = Path(project_root)
+        self.sync_file = self.project_root / SYNC_FILE_RELATIVE
+        self.store = get_todo2_store(self.project_root)
+        self.meta: dict[str, Any] = {}
+        self.state: dict[str, Any] = {"todos": []}
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._state_changed = False
+
+    @property
+    def replica_id(self) -> str:
+        return self.meta["replica"]
+
+    @property
+    def seq(self) -> int:
+        return self.meta["seq"]
+
+    def lock(self):
+        """Cross-process lock on this replica's state file."""
+        return self.store.write_lock()
+
+    def load(self) -> None:
+        """Read the sync metadata and a private copy of the Todo2 state."""
+        meta = None
+        try:
+            with open(self.sync_file, encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable sync metadata {self.sync_file}: {e}")
+        if not isinstance(meta, dict) or meta.get("version") != SYNC_VERSION:
+            meta = {
+                "version": SYNC_VERSION,
+                "replica": f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}",
+                "clock": 0,
+                "seq": 0,
+                "tasks": {},
+                "peers": {},
+            }
+        self.meta = meta
+
+        self.state = self.store.load_state_for_update() if self.store.exists() else {"todos": []}
+        self._by_id = {
+            str(task["id"]): task
+            for task in self.state["todos"]
+            if isinstance(task, dict) and task.get("id")
+        }
+        self._state_changed = False
+
+    def _next(self, clock: Optional[int] = None) -> tuple[int, int]:
+        """Advance the local sequence (and the Lamport clock unless one is given)."""
+        if clock is None:
+            self.meta["clock"] += 1
+            clock = self.meta["clock"]
+        self.meta["seq"] += 1
+        return clock, self.meta["seq"]
+
+    def observe(self) -> int:
+        """
+        Stamp fields edited, added or removed locally since the last sync.
+
+        Returns:
+            Number of field and task changes recorded
+        """
+        tasks_meta = self.meta["tasks"]
+        changes = 0
+        for task_id, task in self._by_id.items():
+            entry = tasks_meta.setdefault(task_id, {"fields": {}, "deleted": None})
+            if entry["deleted"]:
+                # Re-created locally: every field is new again
+                entry["deleted"] = None
+                entry["fields"] = {}
+            fields = entry["fields"]
+            for name, value in task.items():
+                if name == "id":
+                    continue
+                value_hash = _value_hash(value)
+                record = fields.get(name)
+                if record is None or record[3] != value_hash:
+                    clock, seq = self._next()
+                    fields[name] = [clock, self.replica_id, seq, value_hash]
+                    changes += 1
+            for name, record in fields.items():
+                if name not in task and record[3] is not None:
+                    clock, seq = self._next()
+                    fields[name] = [clock, self.replica_id, seq, None]
+                    changes += 1
+
+        for task_id, entry in tasks_meta.items():
+            if task_id not in self._by_id and not entry["deleted"]:
+                clock, seq = self._next()
+                entry["deleted"] = [clock, self.replica_id, seq]
+                changes += 1
+        return changes
+
+    def cursor(self, peer_id: str) -> int:
+        """Highest sequence number of a peer already applied here."""
+        return self.meta["peers"].get(peer_id, {}).get("received", 0)
+
+    def changes_since(self, seq: int) -> dict[str, Any]:
+        """
+        Collect task changes made or received after a local sequence number.
+
+        Args:
+            seq: Sequence number the receiving peer has already seen
+
+        Returns:
+            Delta with 'replica', 'clock', 'seq' and 'tasks'
+            (task id -> {'fields': {name: {'stamp', 'value' | 'removed'}}} or {'deleted': stamp})
+        """
+        tasks: dict[str, Any] = {}
+        for task_id, entry in self.meta["tasks"].items():
+            deleted = entry["deleted"]
+            if deleted:
+                if deleted[2] > seq:
+                    tasks[task_id] = {"deleted": list(_stamp(deleted))}
+                continue
+            task = self._by_id.get(task_id, {})
+            fields = {}
+            for name, record in entry["fields"].items():
+                if record[2] <= seq:
+                    continue
+                change: dict[str, Any] = {"stamp": list(_stamp(record))}
+                if record[3] is None:
+                    change["removed"] = True
+                else:
+                    change["value"] = task.get(name)
+                fields[name] = change
+            if fields:
+                tasks[task_id] = {"fields": fields}
+        return {
+            "replica": self.replica_id,
+            "clock": self.meta["clock"],
+            "seq": self.meta["seq"],
+            "tasks": tasks,
+        }
+
+    def apply(self, delta: dict[str, Any]) -> dict[str, Any]:
+        """
+        Merge a peer's delta field by field.
+
+        Args:
+            delta: Result of the peer's changes_since()
+
+        Returns:
+            Dict with 'created', 'updated', 'deleted', 'fields_applied' counts
+            and 'conflicts' (fields edited on both sides since the last exchange)
+        """
+        peer_id = delta["replica"]
+        # Local changes after this point were not yet seen by the peer
+        seen_by_peer = self.meta["peers"].get(peer_id, {}).get("seq_at_receive", 0)
+        self.meta["clock"] = max(self.meta["clock"], delta["clock"])
+
+        result: dict[str, Any] = {"created": 0, "updated": 0, "deleted": 0, "fields_applied": 0, "conflicts": []}
+        remote_views: list[dict[str, Any]] = []
+        local_views: list[dict[str, Any]] = []
+        concurrent: dict[str, dict[str, str]] = {}
+
+        for task_id, change in delta["tasks"].items():
+            entry = self.meta["tasks"].get(task_id)
+            task = self._by_id.get(task_id)
+
+            if "deleted" in change:
+                stamp = tuple(change["deleted"])
+                if entry is None:
+                    _, seq = self._next(stamp[0])
+                    self.meta["tasks"][task_id] = {"fields": {}, "deleted": [*stamp, seq]}
+                    continue
+                if entry["deleted"] and _stamp(entry["deleted"]) >= stamp:
+                    continue
+                if any(_stamp(record) > stamp for record in entry["fields"].values()):
+                    continue  # Edited here after the peer deleted it: the edit wins
+                if task is not None:
+                    if any(record[2] > seen_by_peer for record in entry["fields"].values()):
+                        result["conflicts"].append(
+                            {"task_id": task_id, "conflict_fields": ["deleted"], "resolution": {"deleted": "remote"}}
+                        )
+                    self.state["todos"].remove(task)
+                    del self._by_id[task_id]
+                    result["deleted"] += 1
+                    self._state_changed = True
+                _, seq = self._next(stamp[0])
+                entry["deleted"] = [*stamp, seq]
+                continue
+
+            fields = change.get("fields", {})
+            newest = max((tuple(f["stamp"]) for f in fields.values()), default=None)
+            if entry is None:
+                entry = self.meta["tasks"][task_id] = {"fields": {}, "deleted": None}
+            elif entry["deleted"]:
+                if newest is None or newest <= _stamp(entry["deleted"]):
+                    continue  # Edits older than the local deletion
+                entry["deleted"] = None
+                entry["fields"] = {}
+
+            created = task is None
+            if created:
+                task = {"id": task_id}
+                self.state["todos"].append(task)
+                self._by_id[task_id] = task
+            local_view = dict(task)
+            remote_view = dict(task)
+            applied = 0
+
+            for name, field in fields.items():
+                stamp = tuple(field["stamp"])
+                removed = field.get("removed", False)
+                value_hash = None if removed else _value_hash(field.get("value"))
+                if removed:
+                    remote_view.pop(name, None)
+                else:
+                    remote_view[name] = field.get("value")
+
+                record = entry["fields"].get(name)
+                remote_wins = record is None or stamp > _stamp(record)
+                if not created and record is not None and record[2] > seen_by_peer and record[3] != value_hash:
+                    concurrent.setdefault(task_id, {})[name] = "remote" if remote_wins else "local"
+                if not remote_wins:
+                    continue
+
+                if removed:
+                    task.pop(name, None)
+                else:
+                    task[name] = field.get("value")
+                _, seq = self._next(stamp[0])
+                entry["fields"][name] = [*stamp, seq, value_hash]
+                applied += 1
+
+            if applied:
+                self._state_changed = True
+                result["fields_applied"] += applied
+                result["created" if created else "updated"] += 1
+            if task_id in concurrent:
+                remote_views.append(remote_view)
+                local_views.append(local_view)
+
+        for conflict in detect_merge_conflicts(remote_views, local_views):
+            resolution = {
+                name: winner
+                for name, winner in concurrent[conflict.task_id].items()
+                if name in conflict.conflict_fields
+            }
+            if resolution:
+                result["conflicts"].append(
+                    {"task_id": conflict.task_id, "conflict_fields": list(resolution), "resolution": resolution}
+                )
+
+        self.meta["peers"][peer_id] = {
+            "received": delta["seq"],
+            "seq_at_receive": self.meta["seq"],
+            "synced_at": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+        }
+        return result
+
+    def save(self) -> None:
+        """Persist the Todo2 state (only if a delta changed it) and the sync metadata."""
+        if self._state_changed:
+            self.store.save_state(self.state)
+            self._state_changed = False
+        self.sync_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.sync_file.with_name(f"{self.sync_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, separators=(",", ":"))
+        os.replace(tmp_file, self.sync_file)
+
+
+def _delta_size(delta: dict[str, Any]) -> dict[str, int]:
+    return {
+        "tasks": len(delta["tasks"]),
+        "fields": sum(len(change.get("fields", {})) for change in delta["tasks"].values()),
+        "tombstones": sum(1 for change in delta["tasks"].values() if "deleted" in change),
+    }
+
+
+def sync_with_peer(
+    project_root: Union[Path, str],
+    peer_root: Union[Path, str],
+    direction: str = "both",
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """
+    Exchange task changes with a peer project directory.
+
+    Args:
+        project_root: Local project root
+        peer_root: Peer project root (another checkout or a shared mount)
+        direction: "pull" (apply peer changes here), "push" (apply local
+            changes at the peer) or "both"
+        dry_run: Compute and report the exchange without writing anything
+
+    Returns:
+        Result dict with 'success', delta sizes and per-side merge results
+    """
+    if direction not in SYNC_DIRECTIONS:
+        return {"success": False, "method": "delta", "error": f"Unknown direction: {direction}"}
+
+    local = Todo2Replica(project_root)
+    peer = Todo2Replica(peer_root)
+    if not peer.project_root.is_dir():
+        return {"success": False, "method": "delta", "error": f"Peer directory not found: {peer_root}"}
+    if local.project_root.resolve() == peer.project_root.resolve():
+        return {"success": False, "method": "delta", "error": "Peer is the local project"}
+
+    try:
+        with ExitStack() as stack:
+            # Fixed lock order so two processes syncing the same pair cannot deadlock
+            for replica in sorted((local, peer), key=lambda r: str(r.project_root.resolve())):
+                stack.enter_context(replica.lock())
+
+            local.load()
+            peer.load()
+            observed = {"local": local.observe(), "peer": peer.observe()}
+
+            # Both deltas are taken before either side applies anything, so
+            # nothing just received is echoed straight back
+            pull = peer.changes_since(local.cursor(peer.replica_id)) if direction in ("pull", "both") else None
+            push = local.changes_since(peer.cursor(local.replica_id)) if direction in ("push", "both") else None
+
+            result: dict[str, Any] = {
+                "success": True,
+                "method": "delta",
+                "direction": direction,
+                "dry_run": dry_run,
+                "replica": local.replica_id,
+                "peer": {"path": str(peer.project_root), "replica": peer.replica_id},
+                "observed": observed,
+            }
+            if pull is not None:
+                result["pulled"] = {**_delta_size(pull), **local.apply(pull)}
+            if push is not None:
+                result["pushed"] = {**_delta_size(push), **peer.apply(push)}
+            if direction == "both":
+                # Each side now holds everything the other had
+                local.meta["peers"][peer.replica_id]["received"] = peer.seq
+                peer.meta["peers"][local.replica_id]["received"] = local.seq
+
+            # Both sides see the same concurrent edits; report them once, from the local side
+            if pull is not None:
+                result["conflicts"] = result["pulled"]["conflicts"]
+            else:
+                flip = {"local": "remote", "remote": "local"}
+                result["conflicts"] = [
+                    {**c, "resolution": {name: flip[winner] for name, winner in c["resolution"].items()}}
+                    for c in result["pushed"]["conflicts"]
+                ]
+            if not dry_run:
+                local.save()
+                peer.save()
+            return result
+
+    except Exception as e:
+        logger.error(f"Delta sync with {peer_root} failed: {e}")
+        return {"success": False, "method": "delta", "error": str(e)}
+
+
+__all__ = [
+    "Todo2Replica",
+    "sync_with_peer",
+]
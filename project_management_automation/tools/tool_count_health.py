@@ -7,12 +7,13 @@ Can be run as part of daily automation or triggered by context primer.
 Design Goal: Keep tool count ≤30 to prevent context pollution in AI workflows.
 """
 
-import json
 import logging
 import time
 from datetime import datetime
 from typing import Any
 
+from ..utils.tool_result import structured_tool
+
 logger = logging.getLogger(__name__)
 
 # Design constraint
@@ -107,10 +108,11 @@ def _count_registered_tools() -> dict[str, Any]:
     }
 
 
+@structured_tool
 def check_tool_count_health(
     include_suggestions: bool = True,
     create_task: bool = False
-) -> str:
+) -> dict[str, Any]:
     """
     [HINT: Tool count health. Checks if tool count exceeds 30. Returns count, status, consolidation suggestions.]
 
@@ -171,36 +173,35 @@ def check_tool_count_health(
         # Create task if requested and over limit
         if create_task and status in ["warning", "over_limit"]:
             try:
-                import json as json_mod
-
                 from project_management_automation.utils import find_project_root
+                from project_management_automation.utils.todo2_store import get_todo2_store
 
                 project_root = find_project_root()
-                todo2_file = project_root / ".todo2" / "state.todo2.json"
-
-                if todo2_file.exists():
-                    state = json_mod.loads(todo2_file.read_text())
-                    todos = state.get("todos", [])
-
-                    # Check if task already exists
-                    existing = [t for t in todos if "tool count" in t.get("name", "").lower()]
-                    if not existing:
-                        from project_management_automation.utils import annotate_task_project, get_current_project_id
-                        project_id = get_current_project_id(project_root)
-                        new_task = annotate_task_project({
-                            "id": f"TOOL-COUNT-{int(time.time())}",
-                            "name": f"Consolidate tools: {count} exceeds limit of {MAX_TOOL_COUNT}",
-                            "long_description": f"Tool count health check detected {count} tools, exceeding the design limit of {MAX_TOOL_COUNT}.\n\nConsolidation suggestions:\n" + "\n".join(f"- {s['suggestion']}" for s in result.get("consolidation_suggestions", [])),
-                            "status": "Todo",
-                            "priority": "high",
-                            "tags": ["automation", "consolidation", "tool-count"],
-                            "created": datetime.utcnow().isoformat() + "Z",
-                            "lastModified": datetime.utcnow().isoformat() + "Z",
-                        }, project_id)
-                        todos.append(new_task)
-                        state["todos"] = todos
-                        todo2_file.write_text(json_mod.dumps(state, indent=2))
-                        result["task_created"] = new_task["id"]
+                store = get_todo2_store(project_root)
+
+                if store.exists():
+                    with store.write_lock():
+                        state = store.load_state_for_update()
+                        todos = state["todos"]
+
+                        # Check if task already exists
+                        existing = [t for t in todos if "tool count" in t.get("name", "").lower()]
+                        if not existing:
+                            from project_management_automation.utils import annotate_task_project, get_current_project_id
+                            project_id = get_current_project_id(project_root)
+                            new_task = annotate_task_project({
+                                "id": f"TOOL-COUNT-{int(time.time())}",
+                                "name": f"Consolidate tools: {count} exceeds limit of {MAX_TOOL_COUNT}",
+                                "long_description": f"Tool count health check detected {count} tools, exceeding the design limit of {MAX_TOOL_COUNT}.\n\nConsolidation suggestions:\n" + "\n".join(f"- {s['suggestion']}" for s in result.get("consolidation_suggestions", [])),
+                                "status": "Todo",
+                                "priority": "high",
+                                "tags": ["automation", "consolidation", "tool-count"],
+                                "created": datetime.utcnow().isoformat() + "Z",
+                                "lastModified": datetime.utcnow().isoformat() + "Z",
+                            }, project_id)
+                            todos.append(new_task)
+                            store.save_state(state)
+                            result["task_created"] = new_task["id"]
             except Exception as e:
                 logger.warning(f"Could not create task: {e}")
                 result["task_error"] = str(e)
@@ -208,15 +209,15 @@ def check_tool_count_health(
         duration = time.time() - start_time
         result["duration_ms"] = round(duration * 1000, 2)
 
-        return json.dumps(result, indent=2)
+        return result
 
     except Exception as e:
         logger.error(f"Error checking tool count health: {e}", exc_info=True)
-        return json.dumps({
+        return {
             "success": False,
             "error": str(e),
             "limit": MAX_TOOL_COUNT,
-        }, indent=2)
+        }
 
 
 def get_tool_count_for_context_primer() -> dict[str, Any]:
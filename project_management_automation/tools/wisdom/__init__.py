@@ -75,12 +75,16 @@ try:
     from .sefaria import (
         fetch_sefaria_text,
         get_sefaria_wisdom,
+        prefetch_sefaria_references,
     )
+    from .sefaria_cache import get_sefaria_cache
     SEFARIA_AVAILABLE = True
 except ImportError:
     SEFARIA_AVAILABLE = False
     get_sefaria_wisdom = None
     fetch_sefaria_text = None
+    prefetch_sefaria_references = None
+    get_sefaria_cache = None
 
 # Pistis Sophia (original source)
 try:
@@ -12,17 +12,26 @@ Available text sources:
 - Talmud selections
 
 No API key required - Sefaria's API is open!
+
+Texts are served offline-first from a disk cache (see sefaria_cache.py):
+wisdom requests never wait on the network; missing texts and the next
+PREFETCH_DAYS days of seeded references are fetched in the background.
 """
 
 import json
+import os
 import random
 import urllib.error
 import urllib.request
-from datetime import datetime
+import zlib
+from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-# Sefaria API base URL
-SEFARIA_API = "https://www.sefaria.org/api"
+# Sefaria API base URL (EXARP_SEFARIA_API overrides, e.g. for a local mirror)
+SEFARIA_API = os.environ.get("EXARP_SEFARIA_API", "https://www.sefaria.org/api")
+
+# Days of upcoming daily quotes whose texts are fetched ahead of time
+PREFETCH_DAYS = 7
 
 # Curated selections mapped to project health levels
 # Format: {"ref": "Sefaria reference", "context": "when to use"}
@@ -153,6 +162,8 @@ def fetch_sefaria_text(ref: str, language: str = "en", include_hebrew: bool = Fa
     """
     Fetch text from Sefaria API.
 
+    Blocks on the network; request paths should use lookup_sefaria_text().
+
     Args:
         ref: Sefaria text reference (e.g., "Pirkei_Avot.1.14")
         language: Language preference ("en" or "he")
@@ -222,6 +233,81 @@ def get_aeon_level(health_score: float) -> str:
         return "treasury"
 
 
+def select_reference(health_score: float, source: str, day: Optional[date] = None) -> Dict[str, str]:
+    """
+    Pick the selection (ref and context) for a health score.
+
+    Args:
+        health_score: Project health score (0-100)
+        source: Text source key in SEFARIA_SELECTIONS
+        day: Seed the choice with this date (same quote all day); None for random
+
+    Returns:
+        Selection dict with "ref" and "context"
+    """
+    selections = SEFARIA_SELECTIONS[source][get_aeon_level(health_score)]
+
+    # Stable seed (not hash(), which varies per process) so prefetched
+    # references match what later processes select
+    if day is not None:
+        random.seed(int(day.strftime("%Y%m%d")) + int(health_score) + zlib.crc32(source.encode()))
+
+    selection = random.choice(selections)
+    random.seed()  # Reset
+    return selection
+
+
+def lookup_sefaria_text(
+    ref: str,
+    language: str = "en",
+    include_hebrew: bool = False,
+    fetch_live: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    Get text from the offline cache without waiting on the network.
+
+    Args:
+        ref: Sefaria text reference
+        language: Language preference ("en" or "he")
+        include_hebrew: If True, include Hebrew text
+        fetch_live: If True, fetch missing or expired texts in the background
+
+    Returns:
+        Dictionary with text data (as from fetch_sefaria_text), or None if
+        the text is not cached yet.
+    """
+    try:
+        from .sefaria_cache import get_sefaria_cache
+        text_data = get_sefaria_cache().lookup(ref, fetch_missing=fetch_live)
+    except Exception:
+        return None
+
+    if text_data and not (include_hebrew or language == "he"):
+        text_data.pop("hebrew", None)
+    return text_data
+
+
+def prefetch_sefaria_references(health_score: float, source: str, days: int = PREFETCH_DAYS) -> int:
+    """
+    Fetch the texts of the next days' seeded quotes in the background.
+
+    Args:
+        health_score: Project health score (0-100)
+        source: Text source key in SEFARIA_SELECTIONS
+        days: Number of upcoming days
+
+    Returns:
+        Number of references queued for fetching
+    """
+    today = datetime.now().date()
+    refs = [select_reference(health_score, source, today + timedelta(days=i))["ref"] for i in range(1, days + 1)]
+    try:
+        from .sefaria_cache import get_sefaria_cache
+        return get_sefaria_cache().prefetch(refs)
+    except Exception:
+        return 0
+
+
 def get_sefaria_wisdom(
     health_score: float,
     source: str = "pirkei_avot",
@@ -233,11 +319,16 @@ def get_sefaria_wisdom(
     """
     Get wisdom from Sefaria based on project health.
 
+    Never blocks on the network: texts come from the offline cache, and a
+    reference that is not cached yet shows a "[Read: ...]" fallback while it
+    is fetched in the background.
+
     Args:
         health_score: Project health score (0-100)
         source: Which text source (pirkei_avot, proverbs, ecclesiastes, psalms)
         seed_date: If True, same quote shown all day
-        fetch_live: If True, fetch from API; if False, use cached/fallback
+        fetch_live: If True, fetch uncached texts (and upcoming days' texts)
+            in the background; if False, use cached/fallback
         include_hebrew: If True, include Hebrew text alongside English
         hebrew_only: If True, return only Hebrew text (no English)
 
@@ -249,24 +340,18 @@ def get_sefaria_wisdom(
 
     source_data = SEFARIA_SELECTIONS[source]
     aeon_level = get_aeon_level(health_score)
-    selections = source_data[aeon_level]
 
     # Use date as seed for consistent daily quote
-    if seed_date:
-        today = datetime.now().strftime("%Y%m%d")
-        random.seed(int(today) + int(health_score) + hash(source))
+    selection = select_reference(health_score, source, datetime.now().date() if seed_date else None)
 
-    selection = random.choice(selections)
-    random.seed()  # Reset
-
-    # Try to fetch from Sefaria
-    text_data = None
-    if fetch_live:
-        text_data = fetch_sefaria_text(
-            selection["ref"],
-            language="he" if hebrew_only else "en",
-            include_hebrew=include_hebrew or hebrew_only
-        )
+    text_data = lookup_sefaria_text(
+        selection["ref"],
+        language="he" if hebrew_only else "en",
+        include_hebrew=include_hebrew or hebrew_only,
+        fetch_live=fetch_live,
+    )
+    if fetch_live and seed_date:
+        prefetch_sefaria_references(health_score, source)
 
     # Process English text
     quote = ""
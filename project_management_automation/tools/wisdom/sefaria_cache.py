@@ -0,0 +1,264 @@
+"""
+Offline-first cache for Sefaria texts (`.exarp/sefaria_texts.json`).
+
+Wisdom quotes are drawn from a small, fixed set of Sefaria references, and the
+quote for a day is deterministic, yet every wisdom request used to block on
+an HTTP call (up to 8s) to fetch the text. This cache makes the request path
+network-free:
+- texts are stored per reference and served from disk; entries older than
+  the TTL are still served while a refresh runs in the background
+- a miss returns None immediately (callers show their fallback) and queues
+  a background fetch
+- failed fetches are negative-cached so an offline machine does not retry
+  on every request
+- upcoming days' seeded references can be prefetched in the background
+
+Set EXARP_DISABLE_SEFARIA_FETCH=1 to serve only what is already cached.
+
+Usage:
+    from project_management_automation.tools.wisdom.sefaria_cache import get_sefaria_cache
+
+    cache = get_sefaria_cache()
+    text = cache.lookup("Pirkei_Avot.1.14")   # never touches the network
+    cache.prefetch(["Proverbs.4.7"])
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_RELATIVE = Path(".exarp") / "sefaria_texts.json"
+CACHE_VERSION = 1
+
+# Texts change rarely; failures are retried after a short back-off
+DEFAULT_TTL = 30 * 24 * 3600
+DEFAULT_NEGATIVE_TTL = 15 * 60
+
+
+def _fetch_text(ref: str) -> Optional[dict[str, Any]]:
+    # Resolved at call time so the fetcher can be patched
+    from . import sefaria
+    return sefaria.fetch_sefaria_text(ref, include_hebrew=True)
+
+
+class SefariaTextCache:
+    """
+    Persistent reference -> text cache with a background fetch worker.
+
+    All methods are thread-safe; only the worker thread performs network I/O.
+    """
+
+    def __init__(
+        self,
+        cache_file: Union[Path, str],
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        fetch: Callable[[str], Optional[dict[str, Any]]] = _fetch_text,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            cache_file: JSON file holding cached texts
+            ttl: Seconds before a fetched text is refreshed (it is still served)
+            negative_ttl: Seconds before a failed reference is retried
+            fetch: Callable(ref) returning text data or None on failure
+        """
+        self.cache_file = Path(cache_file)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._fetch = fetch
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending: set[str] = set()
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "negative_hits": 0, "fetched": 0, "failed": 0}
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.cache_file, encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                    self._entries = data.get("texts", {})
+            except FileNotFoundError:
+                pass
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable Sefaria cache {self.cache_file}: {e}")
+        return self._entries
+
+    def _needs_fetch(self, entry: Optional[dict[str, Any]], now: float) -> bool:
+        if entry is None:
+            return True
+        if now - entry.get("failed_at", 0) < self.negative_ttl:
+            return False
+        if not entry.get("data"):
+            return True
+        return now - entry.get("fetched_at", 0) >= self.ttl
+
+    def lookup(self, ref: str, fetch_missing: bool = True) -> Optional[dict[str, Any]]:
+        """
+        Get a cached text without blocking on the network.
+
+        Args:
+            ref: Sefaria reference
+            fetch_missing: Queue a background fetch for missing, expired or
+                retryable references
+
+        Returns:
+            Copy of the text data (including 'hebrew' when available), or
+            None if not cached
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._load().get(ref)
+            if entry and entry.get("data"):
+                if self._needs_fetch(entry, now):
+                    self._stats["stale_hits"] += 1
+                else:
+                    self._stats["hits"] += 1
+            elif entry:
+                self._stats["negative_hits"] += 1
+            else:
+                self._stats["misses"] += 1
+            data = dict(entry["data"]) if entry and entry.get("data") else None
+        if fetch_missing:
+            self.prefetch([ref])
+        return data
+
+    def prefetch(self, refs: Iterable[str]) -> int:
+        """
+        Queue background fetches for references that are missing or expired.
+
+        Args:
+            refs: Sefaria references
+
+        Returns:
+            Number of references queued (0 when EXARP_DISABLE_SEFARIA_FETCH is set)
+        """
+        if os.environ.get("EXARP_DISABLE_SEFARIA_FETCH", "").lower() in ("1", "true", "yes"):
+            return 0
+        now = time.time()
+        queued = 0
+        with self._lock:
+            entries = self._load()
+            for ref in refs:
+                if ref in self._pending or not self._needs_fetch(entries.get(ref), now):
+                    continue
+                self._pending.add(ref)
+                self._queue.put(ref)
+                queued += 1
+            if queued and (self._worker is None or not self._worker.is_alive()):
+                self._worker = threading.Thread(target=self._run, name="sefaria-prefetch", daemon=True)
+                self._worker.start()
+        return queued
+
+    def _run(self) -> None:
+        while True:
+            try:
+                ref = self._queue.get(timeout=5)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._worker = None
+                        return
+                continue
+
+            try:
+                data = self._fetch(ref)
+            except Exception as e:
+                logger.debug(f"Sefaria fetch failed for {ref}: {e}")
+                data = None
+
+            with self._lock:
+                entries = self._load()
+                if data:
+                    entries[ref] = {"data": data, "fetched_at": time.time()}
+                else:
+                    # Keep serving an expired text; just hold off retrying
+                    entries[ref] = {**entries.get(ref, {"data": None}), "failed_at": time.time()}
+                self._stats["fetched" if data else "failed"] += 1
+                self._save_locked()
+                self._pending.discard(ref)
+                if not self._pending:
+                    self._idle.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no fetches are pending.
+
+        Returns:
+            True if idle, False on timeout
+        """
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+
+    def _save_locked(self) -> None:
+        payload = {"version": CACHE_VERSION, "texts": self._entries or {}}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save Sefaria cache {self.cache_file}: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            entries = self._load()
+            return {
+                **self._stats,
+                "texts": sum(1 for e in entries.values() if e.get("data")),
+                "negative": sum(1 for e in entries.values() if not e.get("data")),
+                "pending": len(self._pending),
+            }
+
+
+# Caches keyed by resolved project root
+_caches: dict[str, SefariaTextCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_sefaria_cache(project_root: Optional[Union[Path, str]] = None) -> SefariaTextCache:
+    """
+    Get the shared SefariaTextCache for a project root.
+
+    Args:
+        project_root: Project root (defaults to find_project_root())
+
+    Returns:
+        SefariaTextCache instance shared by all callers for that root
+    """
+    if project_root is None:
+        from ...utils import find_project_root
+        project_root = find_project_root()
+    root = Path(project_root)
+    try:
+        key = str(root.resolve())
+    except OSError:
+        key = str(root.absolute())
+
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = SefariaTextCache(root / CACHE_FILE_RELATIVE)
+            _caches[key] = cache
+        return cache
+
+
+__all__ = [
+    "SefariaTextCache",
+    "get_sefaria_cache",
+]
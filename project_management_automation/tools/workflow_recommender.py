@@ -14,6 +14,8 @@ import re
 import time
 from typing import Any, Optional
 
+from ..utils.keyword_matcher import get_keyword_matcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,6 +121,13 @@ ASK_INDICATORS = {
 }
 
 
+def _indicator_matcher():
+    """Matcher for the AGENT and ASK indicator keywords (one pass finds both)."""
+    return get_keyword_matcher(
+        {"agent": AGENT_INDICATORS["keywords"], "ask": ASK_INDICATORS["keywords"]}
+    )
+
+
 def recommend_workflow_mode(
     task_description: Optional[str] = None,
     task_id: Optional[str] = None,
@@ -156,28 +165,22 @@ def recommend_workflow_mode(
         # If task_id provided, load from Todo2
         if task_id and not task_description:
             from project_management_automation.utils import find_project_root
+            from project_management_automation.utils.todo2_store import get_todo2_store
 
-            project_root = find_project_root()
-            todo2_path = project_root / ".todo2" / "state.todo2.json"
-
-            if todo2_path.exists():
-                state = json.loads(todo2_path.read_text())
-                task = next(
-                    (t for t in state.get("todos", []) if t.get("id") == task_id),
-                    None,
-                )
-                if task:
-                    content = f"{task.get('name', '')} {task.get('long_description', '')}"
-                    tags = task.get("tags", [])
+            task = get_todo2_store(find_project_root()).get_task(task_id)
+            if task:
+                content = f"{task.get('name', '')} {task.get('long_description', '')}"
+                tags = task.get("tags", [])
 
         content_lower = content.lower()
+        keywords_found = _indicator_matcher().find(content_lower)
 
         # Score AGENT indicators
         agent_score = 0
         agent_reasons = []
 
         for kw in AGENT_INDICATORS["keywords"]:
-            if kw in content_lower:
+            if kw in keywords_found:
                 agent_score += 2
                 agent_reasons.append(f"Keyword: '{kw}'")
 
@@ -196,7 +199,7 @@ def recommend_workflow_mode(
         ask_reasons = []
 
         for kw in ASK_INDICATORS["keywords"]:
-            if kw in content_lower:
+            if kw in keywords_found:
                 ask_score += 2
                 ask_reasons.append(f"Keyword: '{kw}'")
 
@@ -337,12 +340,13 @@ def get_mode_suggestion_for_task(
         Dict with recommendation and whether switch is needed
     """
     content_lower = task_description.lower()
+    keywords_found = _indicator_matcher().find(content_lower)
 
     # Quick scoring
-    agent_score = sum(2 for kw in AGENT_INDICATORS["keywords"] if kw in content_lower)
+    agent_score = sum(2 for kw in AGENT_INDICATORS["keywords"] if kw in keywords_found)
     agent_score += sum(3 for p in AGENT_INDICATORS["patterns"] if re.search(p, content_lower))
 
-    ask_score = sum(2 for kw in ASK_INDICATORS["keywords"] if kw in content_lower)
+    ask_score = sum(2 for kw in ASK_INDICATORS["keywords"] if kw in keywords_found)
     ask_score += sum(3 for p in ASK_INDICATORS["patterns"] if re.search(p, content_lower))
 
     recommended = "AGENT" if agent_score > ask_score else "ASK"
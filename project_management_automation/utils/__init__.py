@@ -10,6 +10,7 @@ Exports:
     - configure_logging: MCP-aware logging configuration
     - get_logger: Get MCP-aware logger
     - is_mcp_mode: Check if running as MCP server
+    - get_todo2_store: Shared, indexed Todo2 state snapshot
 """
 
 from .logging_config import configure_logging, get_logger, is_mcp_mode, suppress_noisy_loggers
@@ -79,6 +80,11 @@ from .todo2_utils import (
     task_belongs_to_project,
     validate_project_ownership,
 )
+from .todo2_store import (
+    Todo2Store,
+    get_todo2_store,
+    load_todo2_state,
+)
 from .todo2_mcp_client import (
     add_comments_mcp,
     create_todos_mcp,
@@ -135,6 +141,10 @@ __all__ = [
     'normalize_status_to_title_case',
     'task_belongs_to_project',
     'validate_project_ownership',
+    # Todo2 state store
+    'Todo2Store',
+    'get_todo2_store',
+    'load_todo2_state',
     # Todo2 MCP client
     'list_todos_mcp',
     'create_todos_mcp',
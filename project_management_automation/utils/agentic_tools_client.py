@@ -24,11 +24,12 @@ except ImportError:
 
 # Import session pool from mcp_client if available
 try:
-    from project_management_automation.scripts.base.mcp_client import _session_pool
+    from project_management_automation.scripts.base.mcp_client import _session_pool, run_mcp_sync
     POOL_AVAILABLE = True
 except ImportError:
     POOL_AVAILABLE = False
     _session_pool = None
+    run_mcp_sync = None
 
 
 def _load_mcp_config(project_root: Path) -> dict:
@@ -117,7 +118,11 @@ async def _call_agentic_tools_tool(tool_name: str, arguments: dict, project_root
 def _call_agentic_tools_tool_sync(tool_name: str, arguments: dict, project_root: Path) -> Optional[dict]:
     """Synchronous wrapper for async agentic-tools tool calls."""
     try:
-        return asyncio.run(_call_agentic_tools_tool(tool_name, arguments, project_root))
+        coro = _call_agentic_tools_tool(tool_name, arguments, project_root)
+        if POOL_AVAILABLE and MCP_CLIENT_AVAILABLE:
+            # Shared long-lived loop keeps pooled sessions warm between calls
+            return run_mcp_sync(coro)
+        return asyncio.run(coro)
     except Exception as e:
         logger.error(f"Failed to call agentic-tools tool {tool_name} (sync): {e}")
         return None
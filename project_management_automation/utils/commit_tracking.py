@@ -12,21 +12,23 @@ Licensed under GPL-3.0. This implementation is original Python code.
 See ATTRIBUTIONS.md for details.
 """
 
+import bisect
 import json
 import logging
+import os
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
+from .branch_utils import MAIN_BRANCH, get_task_branch
+from .file_lock import FileLock
 from .project_root import find_project_root
-from .json_cache import JsonCacheManager
+from .todo2_store import get_todo2_store
 
 logger = logging.getLogger(__name__)
 
-# Cache manager for commits
-_cache_manager = JsonCacheManager.get_instance()
-
 
 class TaskCommit:
     """Represents a single commit (change) to a task."""
@@ -80,49 +82,291 @@ class TaskCommit:
 
 
 class CommitTracker:
-    """Manages commit history for tasks."""
+    """
+    Manages commit history for tasks.
+
+    Storage is an append-only JSON Lines log (`.todo2/commits.jsonl`) plus a
+    sidecar index (`.todo2/commits.idx.json`) mapping task IDs, branches and
+    commit IDs to byte offsets in the log:
+    - Recording a commit appends one line (no full-file rewrite)
+    - Per-task / per-branch queries seek straight to the indexed lines
+    - The index is caught up incrementally when the log grows (e.g. appends
+      from another process) and rebuilt if the log is replaced
+    - compact() rewrites the log in timestamp order, drops duplicate and
+      unreadable records and persists a fresh index
+    - Appends, log rewrites and index writes hold `.todo2/commits.lock`, so
+      concurrent processes never interleave records or offsets
+
+    A legacy `.todo2/commits.json` is migrated to the log on first use.
+    """
+
+    LOG_VERSION = "2.0"
+    # Persist the sidecar index after this many appends (amortized O(1) writes)
+    INDEX_FLUSH_INTERVAL = 64
+    # Auto-compact once this many appends arrived out of timestamp order
+    COMPACT_THRESHOLD = 1000
 
     def __init__(self, project_root: Optional[Path] = None):
         self.project_root = project_root or find_project_root()
-        self.commits_file = self.project_root / ".todo2" / "commits.json"
-        # Use unified JSON cache instead of module-level cache
-        self._cache = _cache_manager.get_cache(self.commits_file, enable_stats=True)
+        todo2_dir = self.project_root / ".todo2"
+        self.commits_file = todo2_dir / "commits.jsonl"
+        self.index_file = todo2_dir / "commits.idx.json"
+        self.legacy_commits_file = todo2_dir / "commits.json"
+        self.lock_file = todo2_dir / "commits.lock"
+
+        self._lock = threading.RLock()
+        self._reset_index()
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _reset_index(self) -> None:
+        # by_task / by_branch: key -> list of [offset, iso_timestamp]
+        self._by_task: dict[str, list[list[Any]]] = {}
+        self._by_branch: dict[str, list[list[Any]]] = {}
+        self._by_id: dict[str, int] = {}
+        self._indexed_size = 0
+        self._indexed_ino: Optional[int] = None
+        self._last_timestamp = ""
+        self._out_of_order = 0
+        self._bad_records = 0
+        self._unflushed = 0
+
+    def _index_record(self, offset: int, data: dict[str, Any]) -> None:
+        commit_id = data.get("id")
+        timestamp = data.get("timestamp") or ""
+        entry = [offset, timestamp]
+        self._by_task.setdefault(data.get("task_id", ""), []).append(entry)
+        self._by_branch.setdefault(data.get("branch") or "main", []).append(entry)
+        if commit_id:
+            self._by_id[commit_id] = offset
+        if timestamp < self._last_timestamp:
+            self._out_of_order += 1
+        else:
+            self._last_timestamp = timestamp
+
+    def _scan_log_from(self, offset: int) -> None:
+        """Index every complete record in the log from `offset` onwards."""
+        with open(self.commits_file, "rb") as f:
+            f.seek(offset)
+            while True:
+                line = f.readline()
+                if not line or not line.endswith(b"\n"):
+                    # EOF or a partially written trailing record
+                    break
+                if line.strip():
+                    try:
+                        self._index_record(offset, json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        self._bad_records += 1
+                offset += len(line)
+        self._indexed_size = offset
+
+    def _load_persisted_index(self, ino: int) -> bool:
+        """Load the sidecar index if it matches the current log file."""
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+
+        if data.get("version") != self.LOG_VERSION or data.get("log_ino") != ino:
+            return False
+
+        self._by_task = data.get("by_task", {})
+        self._by_branch = data.get("by_branch", {})
+        self._by_id = data.get("by_id", {})
+        self._indexed_size = data.get("log_size", 0)
+        self._last_timestamp = data.get("last_timestamp", "")
+        self._out_of_order = data.get("out_of_order", 0)
+        self._bad_records = data.get("bad_records", 0)
+        self._indexed_ino = ino
+        return True
+
+    def _persist_index(self) -> None:
+        """Atomically write the sidecar index."""
+        data = {
+            "version": self.LOG_VERSION,
+            "log_ino": self._indexed_ino,
+            "log_size": self._indexed_size,
+            "last_timestamp": self._last_timestamp,
+            "out_of_order": self._out_of_order,
+            "bad_records": self._bad_records,
+            "by_task": self._by_task,
+            "by_branch": self._by_branch,
+            "by_id": self._by_id,
+        }
+        tmp_file = self.index_file.with_suffix(".json.tmp")
+        try:
+            tmp_file.write_text(json.dumps(data, separators=(",", ":")))
+            os.replace(tmp_file, self.index_file)
+            self._unflushed = 0
+        except OSError as e:
+            logger.warning(f"Error writing commit index: {e}")
 
     def _ensure_commits_file(self) -> None:
-        """Ensure commits file exists with initial structure."""
+        """Ensure the commit log exists, migrating a legacy commits.json once."""
+        if self.commits_file.exists():
+            return
+        with self._lock, FileLock(self.lock_file):
+            # Another process may have created (or migrated) it meanwhile
+            if not self.commits_file.exists():
+                self._create_commits_file()
+
+    def _create_commits_file(self) -> None:
+        """Create the commit log from a legacy commits.json, if any (caller holds the file lock)."""
         self.commits_file.parent.mkdir(parents=True, exist_ok=True)
-        if not self.commits_file.exists():
-            self.commits_file.write_text(json.dumps({"commits": [], "version": "1.0"}, indent=2))
 
-    def _load_commits(self) -> list[TaskCommit]:
-        """Load all commits from storage with caching."""
+        legacy: list[dict[str, Any]] = []
+        if self.legacy_commits_file.exists():
+            try:
+                with open(self.legacy_commits_file, encoding="utf-8") as f:
+                    legacy = json.load(f).get("commits", [])
+            except (OSError, json.JSONDecodeError, AttributeError) as e:
+                logger.error(f"Error reading legacy commits file: {e}")
+
+        self._write_log(legacy)
+        if legacy:
+            self.legacy_commits_file.rename(self.legacy_commits_file.with_suffix(".json.migrated"))
+            logger.info(f"Migrated {len(legacy)} commits to {self.commits_file.name}")
+
+    def _write_log(self, records: list[dict[str, Any]]) -> None:
+        """Atomically replace the log with `records` and rebuild the index."""
+        tmp_file = self.commits_file.with_suffix(".jsonl.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        os.replace(tmp_file, self.commits_file)
+
+        self._reset_index()
+        self._indexed_ino = self.commits_file.stat().st_ino
+        self._scan_log_from(0)
+        self._persist_index()
+
+    def _refresh_index(self) -> None:
+        """Bring the in-memory index up to date with the log on disk."""
         self._ensure_commits_file()
+        st = self.commits_file.stat()
+
+        if self._indexed_ino != st.st_ino or self._indexed_size > st.st_size:
+            # Log replaced (compaction elsewhere) or first use: start over
+            self._reset_index()
+            if not self._load_persisted_index(st.st_ino) or self._indexed_size > st.st_size:
+                self._reset_index()
+            self._indexed_ino = st.st_ino
+
+        if self._indexed_size < st.st_size:
+            self._scan_log_from(self._indexed_size)
+
+    def _read_records(self, offsets: list[int]) -> list[TaskCommit]:
+        """Read the commits stored at the given log offsets."""
+        commits = []
+        with open(self.commits_file, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                try:
+                    commits.append(TaskCommit.from_dict(json.loads(f.readline())))
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError, ValueError) as e:
+                    logger.warning(f"Skipping unreadable commit at offset {offset}: {e}")
+        return commits
+
+    def _read_entries(self, entries: list[list[Any]]) -> list[TaskCommit]:
+        """Read index entries in timestamp order (oldest first)."""
+        ordered = sorted(entries, key=lambda e: e[1])
+        return self._read_records([e[0] for e in ordered])
+
+    # ------------------------------------------------------------------
+    # Storage API
+    # ------------------------------------------------------------------
 
+    def _load_commits(self) -> list[TaskCommit]:
+        """Load all commits from storage (full log scan, oldest first)."""
         try:
-            # Use unified JSON cache (automatically handles mtime invalidation)
-            data = self._cache.get_or_load()
-            commits_data = data.get("commits", [])
-            commits = [TaskCommit.from_dict(c) for c in commits_data]
-            return commits
+            with self._lock:
+                self._refresh_index()
+                return self._read_entries(
+                    [entry for entries in self._by_task.values() for entry in entries]
+                )
         except Exception as e:
             logger.error(f"Error loading commits: {e}")
             return []
 
     def _save_commits(self, commits: list[TaskCommit]) -> None:
-        """Save commits to storage and invalidate cache."""
-        self._ensure_commits_file()
-
+        """Replace the entire log with `commits` (bulk rewrite; prefer create_commit)."""
         try:
-            commits_data = [c.to_dict() for c in commits]
-            data = {"commits": commits_data, "version": "1.0", "last_updated": datetime.now().isoformat()}
-            with open(self.commits_file, "w") as f:
-                json.dump(data, f, indent=2)
-            # Invalidate cache after save (next load will pick up new mtime)
-            self._cache.invalidate()
+            with self._lock, FileLock(self.lock_file):
+                self.commits_file.parent.mkdir(parents=True, exist_ok=True)
+                self._write_log([c.to_dict() for c in commits])
         except Exception as e:
             logger.error(f"Error saving commits: {e}")
             raise
 
+    def _append_commit(self, commit: TaskCommit) -> None:
+        """Append one commit to the log and index it."""
+        line = (json.dumps(commit.to_dict(), separators=(",", ":")) + "\n").encode("utf-8")
+        self._ensure_commits_file()
+        # The file lock makes the end-of-log offset and the append one step
+        # across processes (the RLock only covers threads in this process)
+        with self._lock, FileLock(self.lock_file):
+            self._refresh_index()
+            with open(self.commits_file, "a+b") as f:
+                offset = f.seek(0, os.SEEK_END)
+                if offset != self._indexed_size and offset > 0:
+                    # Terminate a torn record left by an interrupted writer
+                    f.seek(offset - 1)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                        offset += 1
+                f.write(line)
+
+            if offset == self._indexed_size:
+                self._index_record(offset, commit.to_dict())
+                self._indexed_size = offset + len(line)
+            else:
+                # Another writer appended in between; index everything new
+                self._scan_log_from(self._indexed_size)
+
+            self._unflushed += 1
+            if self._out_of_order >= self.COMPACT_THRESHOLD:
+                self._compact()
+            elif self._unflushed >= self.INDEX_FLUSH_INTERVAL:
+                self._persist_index()
+
+    def compact(self) -> int:
+        """
+        Rewrite the log in timestamp order, dropping duplicate commit IDs
+        (last write wins) and unreadable records, and persist a fresh index.
+
+        Returns:
+            Number of commits retained
+        """
+        self._ensure_commits_file()
+        with self._lock, FileLock(self.lock_file):
+            return self._compact()
+
+    def _compact(self) -> int:
+        """Rewrite the log (caller holds both locks)."""
+        self._refresh_index()
+        latest: dict[str, TaskCommit] = {}
+        anonymous: list[TaskCommit] = []
+        for commit in self._read_records(sorted({e[0] for v in self._by_task.values() for e in v})):
+            if commit.id:
+                latest[commit.id] = commit
+            else:
+                anonymous.append(commit)
+
+        commits = sorted([*latest.values(), *anonymous], key=lambda c: c.timestamp)
+        self._write_log([c.to_dict() for c in commits])
+        logger.debug(f"Compacted commit log to {len(commits)} commits")
+        return len(commits)
+
+    def flush(self) -> None:
+        """Persist the sidecar index now."""
+        with self._lock, FileLock(self.lock_file):
+            if self._indexed_ino is not None:
+                self._persist_index()
+
     def create_commit(
         self,
         task_id: str,
@@ -132,7 +376,7 @@ class CommitTracker:
         author: str = "system",
         branch: Optional[str] = None,
     ) -> TaskCommit:
-        """Create and store a new commit."""
+        """Create and store a new commit (O(1) append)."""
         commit = TaskCommit(
             task_id=task_id,
             message=message,
@@ -142,29 +386,43 @@ class CommitTracker:
             branch=branch or self._get_task_branch(task_id),
         )
 
-        commits = self._load_commits()
-        commits.append(commit)
-        self._save_commits(commits)
+        self._append_commit(commit)
 
         logger.debug(f"Created commit {commit.id[:8]} for task {task_id[:8]}: {message}")
         return commit
 
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_all_commits(self) -> list[TaskCommit]:
+        """Get every commit, oldest first."""
+        return self._load_commits()
+
+    def get_commit(self, commit_id: str) -> Optional[TaskCommit]:
+        """Get a single commit by ID."""
+        with self._lock:
+            self._refresh_index()
+            offset = self._by_id.get(commit_id)
+            if offset is None:
+                return None
+            records = self._read_records([offset])
+        return records[0] if records else None
+
     def get_commits_for_task(self, task_id: str, branch: Optional[str] = None) -> list[TaskCommit]:
-        """Get all commits for a specific task."""
-        commits = self._load_commits()
-        filtered = [c for c in commits if c.task_id == task_id]
+        """Get all commits for a specific task (oldest first)."""
+        with self._lock:
+            self._refresh_index()
+            commits = self._read_entries(self._by_task.get(task_id, []))
         if branch:
-            filtered = [c for c in filtered if c.branch == branch]
-        # Sort by timestamp (oldest first)
-        filtered.sort(key=lambda c: c.timestamp)
-        return filtered
+            commits = [c for c in commits if c.branch == branch]
+        return commits
 
     def get_commits_for_branch(self, branch: str) -> list[TaskCommit]:
-        """Get all commits for a specific branch."""
-        commits = self._load_commits()
-        filtered = [c for c in commits if c.branch == branch]
-        filtered.sort(key=lambda c: c.timestamp)
-        return filtered
+        """Get all commits for a specific branch (oldest first)."""
+        with self._lock:
+            self._refresh_index()
+            return self._read_entries(self._by_branch.get(branch, []))
 
     def get_latest_commit_for_task(self, task_id: str, branch: Optional[str] = None) -> Optional[TaskCommit]:
         """Get the most recent commit for a task."""
@@ -173,49 +431,36 @@ class CommitTracker:
 
     def get_task_state_at_commit(self, task_id: str, commit_id: str) -> Optional[dict[str, Any]]:
         """Get task state at a specific commit."""
-        commits = self.get_commits_for_task(task_id)
-        for commit in commits:
-            if commit.id == commit_id:
-                return commit.new_state
-            if commit.new_state:  # Use new_state from the commit
-                # Continue to find the target commit
-                pass
-        return None
+        commit = self.get_commit(commit_id)
+        if commit is None or commit.task_id != task_id:
+            return None
+        return commit.new_state
 
     def get_task_state_at_time(self, task_id: str, timestamp: datetime) -> Optional[dict[str, Any]]:
         """Get task state at a specific point in time."""
-        commits = self.get_commits_for_task(task_id)
-        state = None
-        for commit in commits:
-            if commit.timestamp <= timestamp:
-                state = commit.new_state
-            else:
-                break
-        return state
+        with self._lock:
+            self._refresh_index()
+            entries = sorted(self._by_task.get(task_id, []), key=lambda e: e[1])
+            # Index timestamps are ISO strings; bisect on them, then read one record
+            position = bisect.bisect_right([e[1] for e in entries], timestamp.isoformat())
+            if position == 0:
+                return None
+            records = self._read_records([entries[position - 1][0]])
+        return records[0].new_state if records else None
 
     def _get_task_branch(self, task_id: str) -> str:
         """Extract branch from task metadata or return 'main'."""
-        # Try to load task from Todo2 to get branch tag
+        # Look up the task's branch tag in the shared Todo2 snapshot
         try:
-            todo2_file = self.project_root / ".todo2" / "state.todo2.json"
-            if todo2_file.exists():
-                with open(todo2_file) as f:
-                    data = json.load(f)
-                    tasks = data.get("todos", [])
-                    for task in tasks:
-                        if task.get("id") == task_id:
-                            tags = task.get("tags", [])
-                            # Look for branch: prefix
-                            for tag in tags:
-                                if tag.startswith("branch:"):
-                                    return tag.split(":", 1)[1]
-            return "main"
+            task = get_todo2_store(self.project_root).get_task(task_id)
+            return get_task_branch(task) if task else MAIN_BRANCH
         except Exception:
-            return "main"
+            return MAIN_BRANCH
 
     def clear_cache(self) -> None:
-        """Clear the commits cache (force reload)."""
-        self._commits_cache = None
+        """Clear the in-memory index (force re-read from the sidecar/log)."""
+        with self._lock:
+            self._reset_index()
 
 
 # Global commit tracker instance
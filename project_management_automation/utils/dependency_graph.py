@@ -0,0 +1,473 @@
+"""
+Linear-time dependency graph analytics.
+
+Shared engine for task dependency analysis (analyze_todo2_dependencies,
+optimize_todo2_parallelization, IntelligentAutomationBase):
+- Tarjan strongly connected components for cycle detection
+- Topological order of the acyclic part (edges inside cycles are ignored)
+- DP longest path: critical path length, number of critical chains and the
+  nodes on them, with lazy enumeration of the chains themselves
+- Memoized depth (longest downstream chain from each node)
+- Dependency levels (waves of tasks that can run in parallel)
+
+Every analysis is O(V + E); nothing enumerates all simple paths.
+
+Edges point from dependency to dependent: an edge a -> b means b depends on a.
+
+Usage:
+    from project_management_automation.utils.dependency_graph import DependencyGraph
+
+    graph = DependencyGraph.from_tasks(tasks)
+    critical = graph.critical_paths()
+    print(critical.length, critical.count, critical.paths(limit=5))
+    print(graph.cycles())
+"""
+
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any, Callable, Optional
+
+Node = Hashable
+
+
+def get_task_dependencies(task: dict[str, Any]) -> list[str]:
+    """
+    Get dependency IDs of a Todo2 task.
+
+    Handles both 'dependencies' and 'dependsOn', and both string and
+    {'id': ...} dependency entries.
+    """
+    deps = task.get('dependencies', []) or task.get('dependsOn', []) or []
+    ids = []
+    for dep in deps:
+        dep_id = dep if isinstance(dep, str) else (dep.get('id') if isinstance(dep, dict) else None)
+        if dep_id:
+            ids.append(dep_id)
+    return ids
+
+
+class CriticalPaths:
+    """
+    Compact description of all longest chains in a dependency graph.
+
+    The number of critical chains can grow exponentially with graph width, so
+    chains are counted and enumerated lazily rather than materialized.
+    """
+
+    def __init__(
+        self,
+        length: float,
+        count: int,
+        ends: list[Node],
+        critical_preds: dict[Node, list[Node]],
+        nodes: list[Node],
+    ):
+        self.length = length
+        self.count = count
+        self.ends = ends
+        self.nodes = nodes
+        self._critical_preds = critical_preds
+
+    def iter_paths(self) -> Iterator[list[Node]]:
+        """Yield each critical chain (first node to last), in a deterministic order."""
+        for end in self.ends:
+            # Iterative DFS backwards along critical predecessors
+            stack: list[tuple[Node, int]] = [(end, 0)]
+            path: list[Node] = []
+            while stack:
+                node, depth = stack.pop()
+                del path[depth:]
+                path.append(node)
+                preds = self._critical_preds.get(node)
+                if not preds:
+                    yield path[::-1]
+                    continue
+                for pred in reversed(preds):
+                    stack.append((pred, depth + 1))
+
+    def paths(self, limit: Optional[int] = None) -> list[list[Node]]:
+        """
+        Get critical chains.
+
+        Args:
+            limit: Maximum number of chains to return (None for all)
+        """
+        result = []
+        for path in self.iter_paths():
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(path)
+        return result
+
+    def to_dict(self, limit: int = 5) -> dict[str, Any]:
+        """Serializable summary with at most `limit` example chains."""
+        return {
+            'length': self.length,
+            'count': self.count,
+            'nodes': list(self.nodes),
+            'paths': self.paths(limit),
+        }
+
+
+class DependencyGraph:
+    """Directed dependency graph with linear-time analytics (edge a -> b: b depends on a)."""
+
+    def __init__(self, nodes: Iterable[Node] = (), edges: Iterable[tuple[Node, Node]] = ()):
+        """
+        Initialize graph.
+
+        Args:
+            nodes: Node IDs (order is preserved and used to break ties)
+            edges: (dependency, dependent) pairs; unknown endpoints are added as nodes
+        """
+        self._succ: dict[Node, list[Node]] = {}
+        self._pred: dict[Node, list[Node]] = {}
+        for node in nodes:
+            self.add_node(node)
+        for source, target in edges:
+            self.add_edge(source, target)
+
+        self._scc_index: Optional[dict[Node, int]] = None
+        self._sccs: Optional[list[list[Node]]] = None
+        self._topo: Optional[list[Node]] = None
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[dict[str, Any]]) -> "DependencyGraph":
+        """Build from Todo2 tasks; dependencies on unknown task IDs are ignored."""
+        tasks = list(tasks)
+        graph = cls(task.get('id') for task in tasks if task.get('id'))
+        for task in tasks:
+            task_id = task.get('id')
+            if not task_id:
+                continue
+            for dep_id in get_task_dependencies(task):
+                if dep_id in graph._succ:
+                    graph.add_edge(dep_id, task_id)
+        return graph
+
+    @classmethod
+    def from_adjacency(cls, adjacency: dict[Node, Iterable[Node]], nodes: Iterable[Node] = ()) -> "DependencyGraph":
+        """Build from a {node: [successors]} mapping (plus optional isolated nodes)."""
+        graph = cls(nodes)
+        for source, targets in adjacency.items():
+            graph.add_node(source)
+            for target in targets:
+                graph.add_edge(source, target)
+        return graph
+
+    @classmethod
+    def from_networkx(cls, nx_graph: Any) -> "DependencyGraph":
+        """Build from a networkx DiGraph (anything exposing nodes() and edges())."""
+        return cls(nx_graph.nodes(), nx_graph.edges())
+
+    # ── Structure ────────────────────────────────────────────────────────────
+
+    def add_node(self, node: Node) -> None:
+        if node not in self._succ:
+            self._succ[node] = []
+            self._pred[node] = []
+            self._invalidate()
+
+    def add_edge(self, source: Node, target: Node) -> None:
+        self.add_node(source)
+        self.add_node(target)
+        self._succ[source].append(target)
+        self._pred[target].append(source)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._scc_index = None
+        self._sccs = None
+        self._topo = None
+
+    @property
+    def nodes(self) -> list[Node]:
+        return list(self._succ)
+
+    def __len__(self) -> int:
+        return len(self._succ)
+
+    def __contains__(self, node: Node) -> bool:
+        return node in self._succ
+
+    def successors(self, node: Node) -> list[Node]:
+        return self._succ.get(node, [])
+
+    def predecessors(self, node: Node) -> list[Node]:
+        return self._pred.get(node, [])
+
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self._succ.values())
+
+    def adjacency(self) -> dict[Node, list[Node]]:
+        """{node: [successors]} for nodes that have successors."""
+        return {node: list(targets) for node, targets in self._succ.items() if targets}
+
+    def roots(self) -> list[Node]:
+        """Nodes without dependencies (in-degree 0)."""
+        return [node for node, preds in self._pred.items() if not preds]
+
+    # ── Cycles ───────────────────────────────────────────────────────────────
+
+    def strongly_connected_components(self) -> list[list[Node]]:
+        """
+        Strongly connected components (iterative Tarjan), in reverse topological order.
+
+        Returns:
+            List of components, each a list of nodes
+        """
+        if self._sccs is not None:
+            return self._sccs
+
+        index: dict[Node, int] = {}
+        lowlink: dict[Node, int] = {}
+        on_stack: set[Node] = set()
+        stack: list[Node] = []
+        sccs: list[list[Node]] = []
+        counter = 0
+
+        for start in self._succ:
+            if start in index:
+                continue
+            index[start] = lowlink[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack.add(start)
+            work: list[tuple[Node, Iterator[Node]]] = [(start, iter(self._succ[start]))]
+
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = lowlink[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self._succ[child])))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        lowlink[node] = min(lowlink[node], index[child])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    sccs.append(component[::-1])
+
+        self._sccs = sccs
+        self._scc_index = {node: i for i, component in enumerate(sccs) for node in component}
+        return sccs
+
+    def _cyclic_components(self) -> list[list[Node]]:
+        return [
+            component for component in reversed(self.strongly_connected_components())
+            if len(component) > 1 or component[0] in self._succ[component[0]]
+        ]
+
+    def is_dag(self) -> bool:
+        return not self._cyclic_components()
+
+    def cycles(self) -> list[list[Node]]:
+        """
+        One representative cycle per strongly connected component with a cycle.
+
+        Returns:
+            Cycles as [a, b, ..., a]; every node in a dependency cycle belongs to
+            exactly one reported component
+        """
+        scc_index = self._scc_index_map()
+        cycles = []
+        for component in self._cyclic_components():
+            start = component[0]
+            comp_id = scc_index[start]
+            # BFS inside the component for the shortest path back to start
+            parent: dict[Node, Node] = {}
+            frontier = [start]
+            found = None
+            while frontier and found is None:
+                next_frontier = []
+                for node in frontier:
+                    for child in self._succ[node]:
+                        if scc_index[child] != comp_id:
+                            continue
+                        if child == start:
+                            found = node
+                            break
+                        if child not in parent:
+                            parent[child] = node
+                            next_frontier.append(child)
+                    if found is not None:
+                        break
+                frontier = next_frontier
+
+            cycle = [start]
+            node = found
+            while node != start:
+                cycle.append(node)
+                node = parent[node]
+            cycles.append([start] + cycle[1:][::-1] + [start])
+        return cycles
+
+    def cycle_members(self) -> list[list[Node]]:
+        """Strongly connected components that contain a cycle (each in node order)."""
+        return [list(component) for component in self._cyclic_components()]
+
+    def _scc_index_map(self) -> dict[Node, int]:
+        if self._scc_index is None:
+            self.strongly_connected_components()
+        return self._scc_index
+
+    # ── Ordering and paths ───────────────────────────────────────────────────
+
+    def _acyclic_preds(self, node: Node) -> list[Node]:
+        scc_index = self._scc_index_map()
+        comp = scc_index[node]
+        return [pred for pred in self._pred[node] if scc_index[pred] != comp]
+
+    def topological_order(self) -> list[Node]:
+        """
+        Topological order (Kahn), ignoring edges inside dependency cycles.
+
+        Ties are broken by insertion order, so the result is deterministic.
+        """
+        if self._topo is not None:
+            return self._topo
+
+        scc_index = self._scc_index_map()
+        in_degree = {node: len(self._acyclic_preds(node)) for node in self._succ}
+        ready = [node for node in self._succ if in_degree[node] == 0]
+        order: list[Node] = []
+        position = 0
+        while position < len(ready):
+            node = ready[position]
+            position += 1
+            order.append(node)
+            for child in self._succ[node]:
+                if scc_index[child] == scc_index[node]:
+                    continue
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    ready.append(child)
+
+        self._topo = order
+        return order
+
+    def critical_paths(self, weight: Optional[Callable[[Node], float]] = None) -> CriticalPaths:
+        """
+        Longest dependency chains via dynamic programming over the topological order.
+
+        Args:
+            weight: Node weight (e.g. estimated hours); defaults to 1 per node,
+                so length is the number of tasks on the chain
+
+        Returns:
+            CriticalPaths with the length, number of chains and critical nodes
+        """
+        order = self.topological_order()
+        if not order:
+            return CriticalPaths(0, 0, [], {}, [])
+
+        dist: dict[Node, float] = {}
+        count: dict[Node, int] = {}
+        critical_preds: dict[Node, list[Node]] = {}
+
+        for node in order:
+            node_weight = weight(node) if weight else 1
+            preds = self._acyclic_preds(node)
+            if preds:
+                best = max(dist[pred] for pred in preds)
+                best_preds = list(dict.fromkeys(pred for pred in preds if dist[pred] == best))
+                dist[node] = best + node_weight
+                count[node] = sum(count[pred] for pred in best_preds)
+                critical_preds[node] = best_preds
+            else:
+                dist[node] = node_weight
+                count[node] = 1
+
+        length = max(dist.values())
+        ends = [node for node in order if dist[node] == length]
+
+        # Nodes lying on at least one critical chain
+        on_chain = set(ends)
+        frontier = list(ends)
+        while frontier:
+            node = frontier.pop()
+            for pred in critical_preds.get(node, []):
+                if pred not in on_chain:
+                    on_chain.add(pred)
+                    frontier.append(pred)
+
+        return CriticalPaths(
+            length=length,
+            count=sum(count[node] for node in ends),
+            ends=ends,
+            critical_preds={node: preds for node, preds in critical_preds.items() if node in on_chain},
+            nodes=[node for node in order if node in on_chain],
+        )
+
+    def longest_path(self, weight: Optional[Callable[[Node], float]] = None) -> list[Node]:
+        """One longest dependency chain (empty for an empty graph)."""
+        paths = self.critical_paths(weight).paths(limit=1)
+        return paths[0] if paths else []
+
+    def depths(self) -> dict[Node, int]:
+        """
+        Memoized depth of every node: number of tasks on the longest chain
+        starting at the node and following its dependents.
+        """
+        scc_index = self._scc_index_map()
+        depth: dict[Node, int] = {}
+        for node in reversed(self.topological_order()):
+            comp = scc_index[node]
+            depth[node] = 1 + max(
+                (depth[child] for child in self._succ[node] if scc_index[child] != comp),
+                default=0,
+            )
+        return depth
+
+    def max_depth(self) -> int:
+        return max(self.depths().values(), default=0)
+
+    def levels(self, nodes: Optional[Iterable[Node]] = None) -> list[list[Node]]:
+        """
+        Group nodes into dependency levels (waves).
+
+        Level 0 holds nodes with no dependencies; level k holds nodes whose
+        dependencies are all in earlier levels, so each level can run in parallel.
+
+        Args:
+            nodes: Restrict to these nodes (dependencies outside the set are
+                treated as already satisfied)
+        """
+        subset = set(self._succ) if nodes is None else {n for n in nodes if n in self._succ}
+        level: dict[Node, int] = {}
+        for node in self.topological_order():
+            if node not in subset:
+                continue
+            level[node] = 1 + max(
+                (level[pred] for pred in self._acyclic_preds(node) if pred in level),
+                default=-1,
+            )
+
+        waves: list[list[Node]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+        for node, lvl in level.items():
+            waves[lvl].append(node)
+        return waves
+
+
+__all__ = [
+    "CriticalPaths",
+    "DependencyGraph",
+    "get_task_dependencies",
+]
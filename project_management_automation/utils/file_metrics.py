@@ -0,0 +1,226 @@
+"""
+Persistent per-file metrics cache (`.exarp/file_metrics.json`).
+
+Line counts for scorecards and overviews are derived from file contents;
+re-reading every file on every request makes latency proportional to the
+size of the tree. This cache stores, per project-relative path:
+- size and mtime_ns (stat signature; a match means the cached metrics are reused)
+- a content hash (touch-only changes, e.g. checkouts, are recognised)
+- derived metrics: line count
+
+Only files whose stat signature changed are read, in binary chunks (newline
+bytes are counted without decoding).
+
+Usage:
+    from project_management_automation.utils.file_metrics import get_file_metrics_cache
+
+    metrics = get_file_metrics_cache(project_root)
+    total = metrics.count_lines(paths)
+    metrics.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_RELATIVE = Path(".exarp") / "file_metrics.json"
+CACHE_VERSION = 1
+
+# Read size for hashing and newline counting
+CHUNK_SIZE = 1024 * 1024
+
+
+def scan_file(path: Union[Path, str]) -> tuple[str, int]:
+    """
+    Hash a file and count its lines in one buffered binary pass.
+
+    A final line without a trailing newline counts as a line.
+
+    Returns:
+        (content hash, line count)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    lines = 0
+    last = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last and last != b"\n":
+        lines += 1
+    return digest.hexdigest(), lines
+
+
+class FileMetricsCache:
+    """
+    Per-file metrics keyed by path, stat signature and content hash.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(self, project_root: Union[Path, str], cache_file: Optional[Union[Path, str]] = None):
+        """
+        Initialize cache.
+
+        Args:
+            project_root: Project root (paths are stored relative to it)
+            cache_file: Cache location (default: <root>/.exarp/file_metrics.json)
+        """
+        self.project_root = Path(project_root)
+        self.cache_file = Path(cache_file) if cache_file else self.project_root / CACHE_FILE_RELATIVE
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "scanned": 0, "content_unchanged": 0, "errors": 0}
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.cache_file, encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                    self._entries = data.get("files", {})
+            except FileNotFoundError:
+                pass
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable metrics cache {self.cache_file}: {e}")
+        return self._entries
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def metrics(self, path: Union[Path, str]) -> Optional[dict[str, Any]]:
+        """
+        Get metrics for one file, re-scanning it only if it changed.
+
+        Args:
+            path: File path (absolute or relative to the project root)
+
+        Returns:
+            Dict with 'lines', 'size', 'mtime_ns' and 'hash', or None if unreadable
+        """
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.project_root / path
+        key = self._key(path)
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+                self._stats["hits"] += 1
+                return entry
+
+        try:
+            content_hash, lines = scan_file(path)
+        except OSError as e:
+            logger.debug(f"Cannot read {path}: {e}")
+            with self._lock:
+                self._stats["errors"] += 1
+            return None
+
+        with self._lock:
+            self._stats["scanned"] += 1
+            if entry and entry.get("hash") == content_hash:
+                self._stats["content_unchanged"] += 1
+            entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": content_hash, "lines": lines}
+            self._load()[key] = entry
+            self._dirty = True
+            return entry
+
+    def count_lines(self, paths: Iterable[Union[Path, str]]) -> int:
+        """Total line count across files, skipping unreadable ones."""
+        total = 0
+        for path in paths:
+            entry = self.metrics(path)
+            if entry:
+                total += entry["lines"]
+        return total
+
+    def save(self) -> bool:
+        """
+        Persist the cache if anything changed, dropping entries for deleted files.
+
+        Returns:
+            True if the cache file was written
+        """
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return False
+            entries = {
+                key: entry for key, entry in self._entries.items()
+                if (self.project_root / key).exists()
+            }
+            self._entries = entries
+            payload = {"version": CACHE_VERSION, "files": entries}
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(tmp_file, self.cache_file)
+            except OSError as e:
+                logger.warning(f"Failed to save metrics cache {self.cache_file}: {e}")
+                return False
+            self._dirty = False
+            return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries or {})}
+
+
+# Caches keyed by resolved project root
+_caches: dict[str, FileMetricsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_file_metrics_cache(project_root: Union[Path, str]) -> FileMetricsCache:
+    """
+    Get the shared FileMetricsCache for a project root.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        FileMetricsCache instance shared by all callers for that root
+    """
+    path = Path(project_root)
+    try:
+        key = str(path.resolve())
+    except OSError:
+        key = str(path.absolute())
+
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = FileMetricsCache(path)
+            _caches[key] = cache
+        return cache
+
+
+__all__ = [
+    "FileMetricsCache",
+    "get_file_metrics_cache",
+    "scan_file",
+]
@@ -2,12 +2,14 @@
 Unified JSON Caching Utility
 
 Provides centralized, reusable JSON file caching with:
-- File modification time (mtime) invalidation
+- File signature invalidation (mtime, size, inode) with a single stat per check
 - TTL (time-to-live) expiration
-- LRU eviction for cache size limits
+- Optional stale-while-revalidate (serve the old value, reload in background)
+- Manager-wide LRU eviction by entry count and approximate bytes
+- Optional watchdog (inotify) driven invalidation
 - Decorator and context manager patterns
 - Cache statistics and monitoring
-- Thread-safe operations
+- Thread-safe operations (locks are never held during file I/O)
 
 Usage:
     # Decorator pattern
@@ -19,10 +21,15 @@ Usage:
     # Context manager pattern
     cache = JsonFileCache(Path(".todo2/commits.json"), ttl=300)
     data = cache.get_or_load()
+
+    # Shared, bounded caches
+    cache = JsonCacheManager.get_instance().get_cache(path)
+    data = cache.get_or_load()
 """
 
 import json
 import logging
+import os
 import threading
 import time
 from collections import OrderedDict
@@ -30,17 +37,47 @@ from functools import wraps
 from pathlib import Path
 from typing import Any, Callable, Optional, TypeVar, Union
 
+# Optional watchdog import for event-driven invalidation
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    Observer = None  # type: ignore
+    FileSystemEventHandler = object  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Manager-wide limits
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# While a watcher covers a file, still stat it at most this often (missed events)
+WATCH_REVALIDATE_INTERVAL = 30.0
+
+
+def _new_stats() -> dict[str, int]:
+    return {
+        "hits": 0,
+        "misses": 0,
+        "stale_hits": 0,
+        "invalidations": 0,
+        "invalidations_mtime": 0,
+        "invalidations_ttl": 0,
+        "errors": 0,
+    }
+
 
 class JsonFileCache:
     """
-    File-based JSON cache with mtime invalidation and TTL support.
-    
+    File-based JSON cache with signature invalidation and TTL support.
+
     Thread-safe caching for JSON files with automatic invalidation
-    based on file modification time and optional TTL expiration.
+    based on file modification (mtime/size/inode) and optional TTL expiration.
+    Concurrent misses are coalesced into a single load.
     """
 
     def __init__(
@@ -51,165 +88,246 @@ class JsonFileCache:
         enable_stats: bool = True,
         default_value: Any = None,
         raise_on_error: bool = False,
+        stale_while_revalidate: bool = False,
     ):
         """
         Initialize JSON file cache.
 
         Args:
             file_path: Path to JSON file to cache
-            ttl: Time-to-live in seconds (None = mtime only, no TTL)
-            max_size: Maximum cache entries (None = unlimited, not used for single file)
+            ttl: Time-to-live in seconds (None = file changes only, no TTL)
+            max_size: Unused for a single file (see JsonCacheManager limits)
             enable_stats: Enable statistics collection
             default_value: Value to return on error (if raise_on_error=False)
             raise_on_error: Whether to raise exceptions or return default_value
+            stale_while_revalidate: On expiry/change, return the previous value
+                and reload in a background thread
         """
         self.file_path = Path(file_path) if isinstance(file_path, str) else file_path
         self.ttl = ttl
-        self.max_size = max_size  # Reserved for future multi-file caching
+        self.max_size = max_size
         self.enable_stats = enable_stats
         self.default_value = default_value if default_value is not None else {}
         self.raise_on_error = raise_on_error
+        self.stale_while_revalidate = stale_while_revalidate
 
         # Cache state
-        self._cache: Optional[dict[str, Any]] = None
-        self._cache_mtime: Optional[float] = None
+        self._cache: Optional[Any] = None
+        self._cache_sig: Optional[tuple[int, int, int]] = None
         self._cache_timestamp: Optional[float] = None  # For TTL
+        self._checked_at = 0.0  # Last signature check (monotonic)
+        self.size_bytes = 0  # Approximate memory cost (file size)
 
-        # Thread safety
+        # Thread safety: _lock guards state, _load_lock serializes file loads
         self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._refreshing = False
 
-        # Statistics
-        self._stats = {
-            "hits": 0,
-            "misses": 0,
-            "invalidations": 0,
-            "invalidations_mtime": 0,
-            "invalidations_ttl": 0,
-            "errors": 0,
-        } if enable_stats else None
-
-    def _is_valid(self) -> bool:
-        """Check if cache is valid (not expired, file not modified)."""
-        if self._cache is None:
-            return False
+        # Set by JsonCacheManager
+        self._manager: Optional['JsonCacheManager'] = None
+        self._key: Optional[str] = None
+        self._watched = False
 
-        # Check TTL expiration
-        if self.ttl is not None and self._cache_timestamp is not None:
-            if time.time() - self._cache_timestamp > self.ttl:
-                if self.enable_stats:
-                    self._stats["invalidations_ttl"] += 1
-                return False
+        # Statistics
+        self._stats = _new_stats() if enable_stats else None
 
-        # Check file modification time
+    def _stat(self) -> Optional[tuple[int, int, int]]:
+        """File signature from one stat call (None if missing/unreadable)."""
         try:
-            if not self.file_path.exists():
-                return False
-
-            current_mtime = self.file_path.stat().st_mtime
-            if self._cache_mtime is None or self._cache_mtime != current_mtime:
-                if self.enable_stats and self._cache_mtime is not None:
-                    self._stats["invalidations_mtime"] += 1
-                return False
-
-            return True
-        except (OSError, IOError) as e:
-            logger.warning(f"Error checking file mtime for {self.file_path}: {e}")
-            return False
+            st = os.stat(self.file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _ttl_expired(self) -> bool:
+        return (
+            self.ttl is not None
+            and self._cache_timestamp is not None
+            and time.time() - self._cache_timestamp > self.ttl
+        )
+
+    def _check(self) -> Optional[str]:
+        """
+        Validate the cached value.
 
-    def get(self) -> Optional[dict[str, Any]]:
+        Returns:
+            None if valid, otherwise 'empty', 'ttl', 'changed' or 'missing'
+        """
+        with self._lock:
+            if self._cache is None:
+                return 'empty'
+            if self._ttl_expired():
+                return 'ttl'
+            if self._watched and time.monotonic() - self._checked_at < WATCH_REVALIDATE_INTERVAL:
+                return None
+            cached_sig = self._cache_sig
+
+        sig = self._stat()
+        if sig is None:
+            return 'missing'
+        if sig != cached_sig:
+            return 'changed'
+        self._checked_at = time.monotonic()
+        return None
+
+    def _count(self, key: str) -> None:
+        if self._stats is not None:
+            self._stats[key] += 1
+
+    def _count_invalid(self, reason: str) -> None:
+        if reason == 'ttl':
+            self._count("invalidations_ttl")
+        elif reason == 'changed':
+            self._count("invalidations_mtime")
+
+    def _notify(self, outcome: Optional[str]) -> None:
+        manager = self._manager
+        if manager is not None:
+            manager._touch(self, outcome)
+
+    def get(self) -> Optional[Any]:
         """
         Get cached data if valid, None if expired/missing.
 
         Returns:
-            Cached data dict if valid, None otherwise
+            Cached data if valid, None otherwise
         """
+        reason = self._check()
         with self._lock:
-            if self._is_valid():
-                if self.enable_stats:
-                    self._stats["hits"] += 1
-                return self._cache
+            if reason is None and self._cache is not None:
+                self._count("hits")
+                data = self._cache
             else:
-                if self.enable_stats:
-                    self._stats["misses"] += 1
-                return None
+                self._count("misses")
+                self._count_invalid(reason)
+                data = None
+        self._notify('hit' if data is not None else 'miss')
+        return data
 
-    def get_or_load(self) -> dict[str, Any]:
+    def get_or_load(self) -> Any:
         """
         Get cached data or load from file.
 
+        With stale_while_revalidate, an expired or changed value is returned
+        immediately while one background thread reloads it.
+
         Returns:
-            Data dict from cache or file
+            Data from cache or file (default_value on error)
         """
+        reason = self._check()
+        refresh = False
         with self._lock:
-            # Try cache first
-            cached = self.get()
-            if cached is not None:
-                return cached
+            data = self._cache
+            if reason is None and data is not None:
+                self._count("hits")
+                outcome = 'hit'
+            elif data is not None and self.stale_while_revalidate and reason in ('ttl', 'changed'):
+                self._count("stale_hits")
+                self._count_invalid(reason)
+                refresh = not self._refreshing
+                self._refreshing = True
+                outcome = 'stale'
+            else:
+                self._count("misses")
+                self._count_invalid(reason)
+                data = None
+                outcome = 'miss'
+
+        if refresh:
+            threading.Thread(
+                target=self._revalidate,
+                name=f"json-cache-refresh-{self.file_path.name}",
+                daemon=True,
+            ).start()
+        if data is not None:
+            self._notify(outcome)
+            return data
+
+        data = self._load()
+        self._notify(outcome)
+        return data
+
+    def _revalidate(self) -> None:
+        try:
+            self._load(force=True)
+        except Exception as e:
+            logger.warning(f"Background reload of {self.file_path} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+            self._notify(None)
+
+    def _load(self, force: bool = False) -> Any:
+        """Load the file into the cache (one loader at a time)."""
+        with self._load_lock:
+            sig = self._stat()
+
+            # Another thread may have loaded the current version while we waited
+            if not force:
+                with self._lock:
+                    if self._cache is not None and sig is not None and sig == self._cache_sig \
+                            and not self._ttl_expired():
+                        return self._cache
+
+            if sig is None:
+                if self.raise_on_error:
+                    raise FileNotFoundError(f"File not found: {self.file_path}")
+                logger.warning(f"File not found: {self.file_path}, returning default")
+                return self.default_value
 
-            # Load from file
             try:
-                if not self.file_path.exists():
-                    if self.raise_on_error:
-                        raise FileNotFoundError(f"File not found: {self.file_path}")
-                    logger.warning(f"File not found: {self.file_path}, returning default")
-                    return self.default_value
-
-                # Load JSON
                 with open(self.file_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-
-                # Update cache
-                self._cache = data
-                self._cache_timestamp = time.time()
-                try:
-                    self._cache_mtime = self.file_path.stat().st_mtime
-                except (OSError, IOError) as e:
-                    logger.warning(f"Error getting mtime for {self.file_path}: {e}")
-                    self._cache_mtime = None
-
-                if self.enable_stats:
-                    self._stats["misses"] += 1
-
-                return data
-
             except json.JSONDecodeError as e:
-                if self.enable_stats:
-                    self._stats["errors"] += 1
+                with self._lock:
+                    self._count("errors")
                 logger.error(f"Invalid JSON in {self.file_path}: {e}")
                 if self.raise_on_error:
                     raise
                 return self.default_value
-
-            except (OSError, IOError) as e:
-                if self.enable_stats:
-                    self._stats["errors"] += 1
+            except OSError as e:
+                with self._lock:
+                    self._count("errors")
                 logger.error(f"Error reading {self.file_path}: {e}")
                 if self.raise_on_error:
                     raise
                 return self.default_value
 
+            self._store(data, sig)
+            return data
+
+    def _store(self, data: Any, sig: Optional[tuple[int, int, int]] = None) -> None:
+        """Cache a value for the file's current (or given) signature."""
+        if sig is None:
+            sig = self._stat()
+        with self._lock:
+            self._cache = data
+            self._cache_sig = sig
+            self._cache_timestamp = time.time()
+            self._checked_at = time.monotonic()
+            self.size_bytes = sig[1] if sig else 0
+
     def invalidate(self) -> None:
         """Manually invalidate cache."""
         with self._lock:
-            self._cache = None
-            self._cache_mtime = None
-            self._cache_timestamp = None
-            if self.enable_stats:
-                self._stats["invalidations"] += 1
+            self._release()
+            self._count("invalidations")
+        self._notify(None)
+
+    def _release(self) -> None:
+        """Drop the cached value (caller holds _lock)."""
+        self._cache = None
+        self._cache_sig = None
+        self._cache_timestamp = None
+        self.size_bytes = 0
 
     def clear(self) -> None:
         """Clear all cache data and reset statistics."""
         with self._lock:
-            self.invalidate()
+            self._release()
             if self.enable_stats:
-                self._stats = {
-                    "hits": 0,
-                    "misses": 0,
-                    "invalidations": 0,
-                    "invalidations_mtime": 0,
-                    "invalidations_ttl": 0,
-                    "errors": 0,
-                }
+                self._stats = _new_stats()
+        self._notify(None)
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -222,16 +340,14 @@ class JsonFileCache:
             return {"enabled": False}
 
         with self._lock:
-            total_requests = self._stats["hits"] + self._stats["misses"]
-            hit_rate = (
-                self._stats["hits"] / total_requests
-                if total_requests > 0
-                else 0.0
-            )
+            served = self._stats["hits"] + self._stats["stale_hits"]
+            total_requests = served + self._stats["misses"]
+            hit_rate = served / total_requests if total_requests > 0 else 0.0
 
             return {
                 "hits": self._stats["hits"],
                 "misses": self._stats["misses"],
+                "stale_hits": self._stats["stale_hits"],
                 "hit_rate": round(hit_rate, 3),
                 "invalidations": self._stats["invalidations"],
                 "invalidations_mtime": self._stats["invalidations_mtime"],
@@ -240,23 +356,55 @@ class JsonFileCache:
                 "ttl": self.ttl,
                 "file_path": str(self.file_path),
                 "cached": self._cache is not None,
+                "size_bytes": self.size_bytes,
             }
 
 
+class _InvalidationHandler(FileSystemEventHandler):  # type: ignore[misc]
+    """Watchdog handler invalidating caches for changed files."""
+
+    def __init__(self, manager: 'JsonCacheManager'):
+        super().__init__()
+        self.manager = manager
+
+    def on_any_event(self, event) -> None:
+        if getattr(event, "is_directory", False):
+            return
+        for path in (getattr(event, "src_path", None), getattr(event, "dest_path", None)):
+            if path:
+                self.manager.invalidate_file(path)
+
+
 class JsonCacheManager:
     """
     Global cache manager for multiple JSON file caches.
 
     Singleton pattern for managing multiple file caches across the application.
+    Caches are kept in LRU order; when more than `max_entries` files are
+    cached or their combined size exceeds `max_bytes`, the least recently
+    used caches are dropped.
     """
 
     _instance: Optional['JsonCacheManager'] = None
     _lock = threading.Lock()
 
-    def __init__(self):
-        """Initialize cache manager."""
-        self._caches: dict[str, JsonFileCache] = OrderedDict()
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize cache manager.
+
+        Args:
+            max_entries: Maximum number of cached files
+            max_bytes: Maximum combined size of cached files (approximate)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._caches: OrderedDict[str, JsonFileCache] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._total_bytes = 0
         self._manager_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stale_hits": 0, "evictions": 0}
+        self._observer = None
+        self._watched_dirs: set[str] = set()
 
     @classmethod
     def get_instance(cls) -> 'JsonCacheManager':
@@ -267,12 +415,17 @@ class JsonCacheManager:
                     cls._instance = cls()
         return cls._instance
 
+    @staticmethod
+    def _key_for(file_path: Union[Path, str]) -> str:
+        return str(Path(file_path).absolute())
+
     def get_cache(
         self,
         file_path: Union[Path, str],
         ttl: Optional[int] = None,
         max_size: Optional[int] = None,
         enable_stats: bool = True,
+        stale_while_revalidate: bool = False,
     ) -> JsonFileCache:
         """
         Get or create cache for file.
@@ -280,36 +433,157 @@ class JsonCacheManager:
         Args:
             file_path: Path to JSON file
             ttl: Time-to-live in seconds
-            max_size: Maximum cache size (reserved for future)
-            enable_stats: Enable statistics
+            max_size: Unused (see max_entries/max_bytes)
+            enable_stats: Enable per-file statistics
+            stale_while_revalidate: Serve stale values while reloading in background
 
         Returns:
             JsonFileCache instance for the file
         """
-        path_str = str(Path(file_path).absolute())
+        path_str = self._key_for(file_path)
 
         with self._manager_lock:
-            if path_str not in self._caches:
-                self._caches[path_str] = JsonFileCache(
+            cache = self._caches.get(path_str)
+            if cache is None:
+                cache = JsonFileCache(
                     file_path=file_path,
                     ttl=ttl,
                     max_size=max_size,
                     enable_stats=enable_stats,
+                    stale_while_revalidate=stale_while_revalidate,
                 )
-            return self._caches[path_str]
+                cache._manager = self
+                cache._key = path_str
+                self._caches[path_str] = cache
+                self._sizes[path_str] = 0
+                self._watch_locked(cache)
+                self._evict_locked(keep=path_str)
+            else:
+                self._caches.move_to_end(path_str)
+            return cache
+
+    def _touch(self, cache: JsonFileCache, outcome: Optional[str]) -> None:
+        """Record an access: update LRU order, byte accounting and stats."""
+        key = cache._key
+        with self._manager_lock:
+            if key is None or self._caches.get(key) is not cache:
+                return
+            if outcome == 'hit':
+                self._stats["hits"] += 1
+            elif outcome == 'stale':
+                self._stats["stale_hits"] += 1
+            elif outcome == 'miss':
+                self._stats["misses"] += 1
+            size = cache.size_bytes
+            self._total_bytes += size - self._sizes[key]
+            self._sizes[key] = size
+            if outcome is not None:
+                self._caches.move_to_end(key)
+            self._evict_locked(keep=key)
+
+    def _evict_locked(self, keep: Optional[str] = None) -> None:
+        """Drop least recently used caches until within limits (caller holds lock)."""
+        while len(self._caches) > self.max_entries or (
+            self._total_bytes > self.max_bytes and len(self._caches) > 1
+        ):
+            key = next(iter(self._caches))
+            if key == keep:
+                if len(self._caches) == 1:
+                    break
+                self._caches.move_to_end(key)
+                key = next(iter(self._caches))
+            cache = self._caches.pop(key)
+            self._total_bytes -= self._sizes.pop(key, 0)
+            self._stats["evictions"] += 1
+            cache._manager = None
+            with cache._lock:
+                cache._release()
 
     def invalidate_file(self, file_path: Union[Path, str]) -> None:
         """Invalidate cache for specific file."""
-        path_str = str(Path(file_path).absolute())
+        path_str = self._key_for(file_path)
         with self._manager_lock:
-            if path_str in self._caches:
-                self._caches[path_str].invalidate()
+            cache = self._caches.get(path_str)
+        if cache is not None:
+            cache.invalidate()
 
     def invalidate_all(self) -> None:
         """Invalidate all caches."""
         with self._manager_lock:
+            caches = list(self._caches.values())
+        for cache in caches:
+            cache.invalidate()
+
+    # ── Watching ─────────────────────────────────────────────────────────────
+
+    def _watch_locked(self, cache: JsonFileCache) -> None:
+        if self._observer is None:
+            return
+        directory = str(Path(cache._key).parent)
+        if directory not in self._watched_dirs:
+            try:
+                self._observer.schedule(_InvalidationHandler(self), directory, recursive=False)
+                self._watched_dirs.add(directory)
+            except OSError as e:
+                logger.debug(f"Cannot watch {directory}: {e}")
+                return
+        cache._watched = True
+
+    def start_watching(self) -> bool:
+        """
+        Invalidate caches from filesystem events (inotify/FSEvents via watchdog).
+
+        While watched, files are only re-stat'ed every WATCH_REVALIDATE_INTERVAL
+        seconds as a safety net.
+
+        Returns:
+            True if watching is active
+        """
+        if not WATCHDOG_AVAILABLE:
+            logger.debug("watchdog not installed; JSON caches use stat validation only")
+            return False
+        with self._manager_lock:
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.daemon = True
+                self._observer.start()
+                for cache in self._caches.values():
+                    self._watch_locked(cache)
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop event-driven invalidation."""
+        with self._manager_lock:
+            observer, self._observer = self._observer, None
+            self._watched_dirs.clear()
             for cache in self._caches.values():
-                cache.invalidate()
+                cache._watched = False
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5)
+
+    # ── Stats ────────────────────────────────────────────────────────────────
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get manager-wide statistics.
+
+        Returns:
+            Dictionary with entry/byte usage, limits, hit/miss/eviction counts
+        """
+        with self._manager_lock:
+            served = self._stats["hits"] + self._stats["stale_hits"]
+            total = served + self._stats["misses"]
+            return {
+                "entries": len(self._caches),
+                "max_entries": self.max_entries,
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                **self._stats,
+                "hit_rate": round(served / total, 3) if total else 0.0,
+                "watching": self._observer is not None,
+                "watched_dirs": len(self._watched_dirs),
+            }
 
     def get_all_stats(self) -> dict[str, dict[str, Any]]:
         """
@@ -319,10 +593,8 @@ class JsonCacheManager:
             Dictionary mapping file paths to their statistics
         """
         with self._manager_lock:
-            return {
-                path: cache.get_stats()
-                for path, cache in self._caches.items()
-            }
+            caches = list(self._caches.items())
+        return {path: cache.get_stats() for path, cache in caches}
 
 
 def json_file_cache(
@@ -338,8 +610,8 @@ def json_file_cache(
 
     Args:
         file_path: Path to JSON file
-        ttl: Time-to-live in seconds (None = mtime only)
-        max_size: Maximum cache size (reserved for future)
+        ttl: Time-to-live in seconds (None = file changes only)
+        max_size: Unused for a single file
         enable_stats: Enable statistics
         default_value: Value to return on error
         raise_on_error: Whether to raise exceptions
@@ -372,13 +644,7 @@ def json_file_cache(
 
             # Call function and cache result
             result = func()
-            with cache._lock:
-                cache._cache = result  # type: ignore
-                cache._cache_timestamp = time.time()
-                try:
-                    cache._cache_mtime = cache.file_path.stat().st_mtime
-                except (OSError, IOError):
-                    cache._cache_mtime = None
+            cache._store(result)
             return result
 
         # Attach cache to function for manual invalidation
@@ -0,0 +1,240 @@
+"""
+Compiled multi-keyword matcher for task text classification.
+
+Alignment, scoring, estimation and workflow recommendation all classify task
+text against keyword lists with `any(kw in text for kw in keywords)` per
+group, i.e. one scan of the text per keyword. A KeywordMatcher compiles all
+keywords of all groups into one trie-shaped regex and finds every keyword
+hit in a single pass:
+- substring semantics by default (same results as `kw in text`), or whole
+  words with `whole_words=True` (same as tokenizing on word boundaries)
+- overlapping hits are all reported ("test" and "testing" in "testing")
+- batch methods scan a whole backlog as one joined text
+
+Matching is case-insensitive (keywords and text are lowercased).
+
+Usage:
+    from project_management_automation.utils.keyword_matcher import get_keyword_matcher
+
+    matcher = get_keyword_matcher({"testing": ["test", "coverage"], "docs": ["readme", "guide"]})
+    matcher.groups("Add README coverage")            # ["testing", "docs"]
+    matcher.groups_batch(task_texts)                 # one list per text
+"""
+
+import bisect
+import re
+import threading
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Union
+
+# Joins batch texts; never part of a keyword and never a word character
+_SEPARATOR = "\x00"
+
+# Compiled matchers kept by get_keyword_matcher()
+MAX_CACHED_MATCHERS = 64
+
+KeywordGroups = Union[Iterable[str], Mapping[str, Iterable[str]]]
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex alternation shaped as a trie; at each position it matches the longest word."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        ends_here = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends_here:
+            # Greedy optional: prefer continuing to a longer word
+            return (body if len(branches) == 1 and len(body) == 1 else f"(?:{body})") + "?"
+        return body
+
+    return build(trie)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class KeywordMatcher:
+    """
+    Finds all keywords (and the groups they belong to) in one pass over a text.
+
+    Instances are immutable and thread-safe.
+    """
+
+    def __init__(self, keywords: KeywordGroups, whole_words: bool = False):
+        """
+        Compile a matcher.
+
+        Args:
+            keywords: Keyword list (one group named "") or mapping of
+                group name -> keywords (group order is kept in results)
+            whole_words: Only match keywords delimited by word boundaries
+        """
+        groups = keywords if isinstance(keywords, Mapping) else {"": keywords}
+        self.whole_words = whole_words
+        self.group_names: tuple[str, ...] = tuple(groups)
+        self._keyword_groups: dict[str, list[str]] = {}
+        # Groups containing an empty keyword match every text (as `"" in text` does)
+        self._always: list[str] = []
+        for name, words in groups.items():
+            for word in words:
+                word = str(word).lower()
+                if not word:
+                    if name not in self._always:
+                        self._always.append(name)
+                    continue
+                names = self._keyword_groups.setdefault(word, [])
+                if name not in names:
+                    names.append(name)
+        self._group_rank = {name: i for i, name in enumerate(self.group_names)}
+
+        # Every keyword that is a prefix of another starts wherever the longer one does
+        self._prefixes: dict[str, tuple[str, ...]] = {}
+        for word in self._keyword_groups:
+            self._prefixes[word] = tuple(
+                word[:i] for i in range(1, len(word) + 1) if word[:i] in self._keyword_groups
+            )
+
+        if self._keyword_groups:
+            body = _trie_pattern(self._keyword_groups)
+            if whole_words:
+                self._regex = re.compile(rf"(?=\b({body})\b)")
+            else:
+                self._regex = re.compile(f"(?=({body}))")
+        else:
+            self._regex = None
+
+    def _scan(self, text: str) -> Iterable[tuple[int, str]]:
+        """Yield (start offset, keyword) for every keyword occurrence."""
+        if self._regex is None:
+            return
+        for match in self._regex.finditer(text):
+            start = match.start()
+            longest = match.group(1)
+            for word in self._prefixes[longest]:
+                if self.whole_words and len(word) < len(longest):
+                    end = start + len(word)
+                    if _is_word_char(text[end - 1]) == _is_word_char(text[end]):
+                        continue
+                yield start, word
+
+    def find(self, text: str) -> set[str]:
+        """
+        All keywords occurring in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of matched (lowercase) keywords
+        """
+        return {word for _, word in self._scan(text.lower())} if text else set()
+
+    def _groups_for(self, words: Iterable[str]) -> list[str]:
+        hit = set(self._always)
+        for word in words:
+            hit.update(self._keyword_groups[word])
+        return sorted(hit, key=self._group_rank.__getitem__)
+
+    def groups(self, text: str) -> list[str]:
+        """
+        Groups with at least one keyword in a text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Group names, in the order the groups were declared
+        """
+        return self._groups_for(self.find(text))
+
+    def any(self, text: str) -> bool:
+        """Check whether any keyword occurs in a text."""
+        if self._always:
+            return True
+        if not text or self._regex is None:
+            return False
+        return next(iter(self._scan(text.lower())), None) is not None
+
+    def find_batch(self, texts: Sequence[str]) -> list[set[str]]:
+        """
+        Keywords occurring in each text, scanning all texts in one pass.
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            One set of matched keywords per text
+        """
+        results: list[set[str]] = [set() for _ in texts]
+        if not texts:
+            return results
+        # Lowercase before measuring: lower() can change a text's length
+        lowered = [str(t or "").lower().replace(_SEPARATOR, " ") for t in texts]
+        starts = []
+        offset = 0
+        for text in lowered:
+            starts.append(offset)
+            offset += len(text) + 1
+        for start, word in self._scan(_SEPARATOR.join(lowered)):
+            results[bisect.bisect_right(starts, start) - 1].add(word)
+        return results
+
+    def groups_batch(self, texts: Sequence[str]) -> list[list[str]]:
+        """
+        Groups hit by each text, scanning all texts in one pass.
+
+        Args:
+            texts: Texts to scan
+
+        Returns:
+            One list of group names (declaration order) per text
+        """
+        return [self._groups_for(words) for words in self.find_batch(texts)]
+
+
+# Compiled matchers keyed by (normalized keyword groups, whole_words)
+_matchers: dict[tuple, KeywordMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_keyword_matcher(keywords: KeywordGroups, whole_words: bool = False) -> KeywordMatcher:
+    """
+    Get a compiled matcher for a keyword set, compiling it only once.
+
+    Args:
+        keywords: Keyword list or mapping of group name -> keywords
+        whole_words: Only match keywords delimited by word boundaries
+
+    Returns:
+        KeywordMatcher shared by all callers using the same keywords
+    """
+    if isinstance(keywords, Mapping):
+        key = (tuple((name, tuple(words)) for name, words in keywords.items()), whole_words)
+    else:
+        keywords = tuple(keywords)
+        key = (keywords, whole_words)
+
+    with _matchers_lock:
+        matcher = _matchers.get(key)
+        if matcher is None:
+            matcher = KeywordMatcher(keywords, whole_words)
+            if len(_matchers) >= MAX_CACHED_MATCHERS:
+                _matchers.pop(next(iter(_matchers)))
+            _matchers[key] = matcher
+        return matcher
+
+
+__all__ = [
+    "KeywordMatcher",
+    "get_keyword_matcher",
+]
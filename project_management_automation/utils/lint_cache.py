@@ -0,0 +1,401 @@
+"""
+Persistent lint results store (`.exarp/lint_cache.json`).
+
+Running ruff/flake8 over the whole tree on every `lint(action="run")` makes
+latency proportional to the size of the project even when one file changed.
+This store keeps each file's problems keyed by:
+- the linter configuration (linter, select/ignore, config file contents and
+  the linter executable), hashed into a config key
+- the file's content hash
+
+so only files whose content changed since the last run under the same
+configuration are re-linted. Per-file severity/category counts are kept as
+well, and project-wide totals are updated incrementally as files change
+rather than recomputed from every problem.
+
+The last configuration used is remembered so `lint(action="analyze")` can
+analyze the stored problems without running the linter at all.
+
+Usage:
+    from project_management_automation.utils.lint_cache import get_lint_result_store, lint_config_key
+
+    store = get_lint_result_store(project_root)
+    config = lint_config_key(project_root, "ruff", select, ignore)
+    stale = store.stale(config, {"pkg/mod.py": content_hash})
+    store.update(config, "pkg/mod.py", content_hash, problems)
+    store.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_RELATIVE = Path(".exarp") / "lint_cache.json"
+CACHE_VERSION = 1
+
+# Configurations kept (least recently used beyond this are dropped on save)
+MAX_CONFIGS = 4
+
+# Files whose contents change what a linter reports
+LINT_CONFIG_FILES = ("pyproject.toml", "ruff.toml", ".ruff.toml", "setup.cfg", "tox.ini", ".flake8")
+
+
+def code_category(code: str) -> str:
+    """Categorize a rule code by its prefix."""
+    if code.startswith('E'):
+        return 'error'
+    if code.startswith('F'):
+        return 'fatal'
+    if code.startswith('W'):
+        return 'warning'
+    if code.startswith('I'):
+        return 'import'
+    if code.startswith('UP'):
+        return 'upgrade'
+    return 'other'
+
+
+def summarize_problems(problems: Iterable[Mapping[str, Any]]) -> dict[str, dict[str, int]]:
+    """Count problems by severity and by category."""
+    by_severity: Counter = Counter()
+    by_category: Counter = Counter()
+    for p in problems:
+        by_severity[p.get('severity', 'unknown')] += 1
+        by_category[code_category(p.get('code', ''))] += 1
+    return {"by_severity": dict(by_severity), "by_category": dict(by_category)}
+
+
+def lint_config_key(
+    project_root: Union[Path, str],
+    linter: str,
+    select: Optional[str] = None,
+    ignore: Optional[str] = None,
+) -> str:
+    """
+    Hash everything besides file contents that affects lint results.
+
+    Args:
+        project_root: Project root holding the linter config files
+        linter: Linter name
+        select: Rule codes enabled on the command line
+        ignore: Rule codes ignored on the command line
+
+    Returns:
+        Config key (hex digest)
+    """
+    root = Path(project_root)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([linter, select or "", ignore or ""]).encode())
+
+    # A reinstalled/upgraded linter binary changes the rules it applies
+    executable = shutil.which(linter)
+    if executable:
+        try:
+            st = os.stat(executable)
+            digest.update(f"{executable}:{st.st_size}:{st.st_mtime_ns}".encode())
+        except OSError:
+            pass
+
+    for name in LINT_CONFIG_FILES:
+        try:
+            digest.update(name.encode())
+            digest.update((root / name).read_bytes())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+class LintResultStore:
+    """
+    Per-file lint problems keyed by config key and content hash.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(self, project_root: Union[Path, str], cache_file: Optional[Union[Path, str]] = None):
+        """
+        Initialize store.
+
+        Args:
+            project_root: Project root (paths are stored relative to it)
+            cache_file: Store location (default: <root>/.exarp/lint_cache.json)
+        """
+        self.project_root = Path(project_root)
+        self.cache_file = Path(cache_file) if cache_file else self.project_root / CACHE_FILE_RELATIVE
+        self._data: Optional[dict[str, Any]] = None
+        # config key -> running totals over all of that config's files
+        self._totals: dict[str, dict[str, Counter]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._stats = {"reused": 0, "relinted": 0, "removed": 0}
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = {"configs": {}, "last": None}
+            try:
+                with open(self.cache_file, encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                    self._data = {"configs": data.get("configs", {}), "last": data.get("last")}
+            except FileNotFoundError:
+                pass
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable lint cache {self.cache_file}: {e}")
+        return self._data
+
+    def _config(self, config: str, linter: Optional[str] = None) -> dict[str, Any]:
+        configs = self._load()["configs"]
+        entry = configs.get(config)
+        if entry is None:
+            entry = configs[config] = {"linter": linter, "files": {}}
+        elif linter:
+            entry["linter"] = linter
+        entry["used_at"] = time.time()
+        return entry
+
+    def _config_totals(self, config: str) -> dict[str, Counter]:
+        totals = self._totals.get(config)
+        if totals is None:
+            totals = {"by_severity": Counter(), "by_category": Counter()}
+            for entry in self._config(config)["files"].values():
+                totals["by_severity"].update(entry["counts"]["by_severity"])
+                totals["by_category"].update(entry["counts"]["by_category"])
+            self._totals[config] = totals
+        return totals
+
+    def _key(self, path: Union[Path, str]) -> str:
+        path = Path(path)
+        if not path.is_absolute():
+            return path.as_posix()
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def stale(self, config: str, hashes: Mapping[str, str]) -> list[str]:
+        """
+        Find files whose stored results do not match their current content.
+
+        Args:
+            config: Config key from lint_config_key()
+            hashes: Relative path -> current content hash
+
+        Returns:
+            Relative paths that need linting
+        """
+        with self._lock:
+            files = self._config(config)["files"]
+            stale = [key for key, content_hash in hashes.items()
+                     if files.get(key, {}).get("hash") != content_hash]
+            self._stats["reused"] += len(hashes) - len(stale)
+            self._stats["relinted"] += len(stale)
+            return stale
+
+    def stale_paths(self, current_hash: Callable[[str], Optional[str]], config: Optional[str] = None) -> list[str]:
+        """
+        Find stored files whose content no longer matches what was linted.
+
+        Args:
+            current_hash: Relative path -> current content hash (None if gone)
+            config: Config key (default: the configuration last linted)
+
+        Returns:
+            Relative paths whose stored results are outdated
+        """
+        with self._lock:
+            data = self._load()
+            entry = data["configs"].get(config or data.get("last") or "")
+            items = list(entry["files"].items()) if entry else []
+        return [key for key, file_entry in items if current_hash(key) != file_entry["hash"]]
+
+    def update(
+        self,
+        config: str,
+        path: Union[Path, str],
+        content_hash: str,
+        problems: list[dict[str, Any]],
+        linter: Optional[str] = None,
+    ) -> None:
+        """
+        Record a file's lint results, adjusting the running totals.
+
+        Args:
+            config: Config key from lint_config_key()
+            path: File path (absolute or relative to the project root)
+            content_hash: Hash of the content that was linted
+            problems: Problems reported for the file (may be empty)
+            linter: Linter name, recorded with a new config
+        """
+        key = self._key(path)
+        counts = summarize_problems(problems)
+        with self._lock:
+            entry = self._config(config, linter)
+            totals = self._config_totals(config)
+            old = entry["files"].get(key)
+            if old:
+                totals["by_severity"].subtract(old["counts"]["by_severity"])
+                totals["by_category"].subtract(old["counts"]["by_category"])
+            totals["by_severity"].update(counts["by_severity"])
+            totals["by_category"].update(counts["by_category"])
+            entry["files"][key] = {"hash": content_hash, "problems": problems, "counts": counts}
+            self._load()["last"] = config
+            self._dirty = True
+
+    def prune(self, config: str, under: str, keep: Iterable[str]) -> int:
+        """
+        Drop results for files under a directory that no longer exist.
+
+        Args:
+            config: Config key from lint_config_key()
+            under: Root-relative directory ('' for the whole project)
+            keep: Relative paths that still exist under it
+
+        Returns:
+            Number of entries removed
+        """
+        keep = set(keep)
+        prefix = f"{under}/" if under else ""
+        with self._lock:
+            files = self._config(config)["files"]
+            totals = self._config_totals(config)
+            gone = [key for key in files if key.startswith(prefix) and key not in keep]
+            for key in gone:
+                old = files.pop(key)
+                totals["by_severity"].subtract(old["counts"]["by_severity"])
+                totals["by_category"].subtract(old["counts"]["by_category"])
+            if gone:
+                self._dirty = True
+                self._stats["removed"] += len(gone)
+            return len(gone)
+
+    def results(self, config: Optional[str] = None, paths: Optional[Iterable[str]] = None) -> Optional[dict[str, Any]]:
+        """
+        Assemble stored problems and aggregates.
+
+        Args:
+            config: Config key (default: the configuration last linted)
+            paths: Relative paths to include (default: every stored file)
+
+        Returns:
+            Dict with 'linter', 'problems', 'by_severity', 'by_category',
+            'by_file' and 'files', or None if nothing was stored for the config
+        """
+        with self._lock:
+            data = self._load()
+            config = config or data.get("last")
+            entry = data["configs"].get(config) if config else None
+            if entry is None:
+                return None
+            files = entry["files"]
+            selected = files.keys() if paths is None else [p for p in paths if p in files]
+
+            problems: list[dict[str, Any]] = []
+            by_file: dict[str, int] = {}
+            for key in selected:
+                file_problems = files[key]["problems"]
+                if file_problems:
+                    problems.extend(file_problems)
+                    by_file[key] = len(file_problems)
+
+            if paths is None:
+                totals = self._config_totals(config)
+                by_severity = {k: v for k, v in totals["by_severity"].items() if v > 0}
+                by_category = {k: v for k, v in totals["by_category"].items() if v > 0}
+            else:
+                by_severity, by_category = Counter(), Counter()
+                for key in selected:
+                    by_severity.update(files[key]["counts"]["by_severity"])
+                    by_category.update(files[key]["counts"]["by_category"])
+
+            return {
+                "linter": entry.get("linter"),
+                "problems": problems,
+                "by_severity": dict(by_severity),
+                "by_category": dict(by_category),
+                "by_file": by_file,
+                "files": len(selected),
+            }
+
+    def save(self) -> bool:
+        """
+        Persist the store if anything changed, keeping the most recent configs.
+
+        Returns:
+            True if the store file was written
+        """
+        with self._lock:
+            if not self._dirty or self._data is None:
+                return False
+            configs = self._data["configs"]
+            for config in sorted(configs, key=lambda c: configs[c].get("used_at", 0))[:-MAX_CONFIGS]:
+                del configs[config]
+                self._totals.pop(config, None)
+            payload = {"version": CACHE_VERSION, **self._data}
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(tmp_file, self.cache_file)
+            except OSError as e:
+                logger.warning(f"Failed to save lint cache {self.cache_file}: {e}")
+                return False
+            self._dirty = False
+            return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            configs = self._load()["configs"]
+            return {
+                **self._stats,
+                "configs": len(configs),
+                "files": sum(len(entry["files"]) for entry in configs.values()),
+            }
+
+
+# Stores keyed by resolved project root
+_stores: dict[str, LintResultStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_lint_result_store(project_root: Union[Path, str]) -> LintResultStore:
+    """
+    Get the shared LintResultStore for a project root.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        LintResultStore instance shared by all callers for that root
+    """
+    path = Path(project_root)
+    try:
+        key = str(path.resolve())
+    except OSError:
+        key = str(path.absolute())
+
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = LintResultStore(path)
+            _stores[key] = store
+        return store
+
+
+__all__ = [
+    "LintResultStore",
+    "code_category",
+    "get_lint_result_store",
+    "lint_config_key",
+    "summarize_problems",
+]
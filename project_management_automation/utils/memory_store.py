@@ -0,0 +1,496 @@
+"""
+Indexed store for AI session memories (`.exarp/memories/*.json`).
+
+Memories stay one JSON file each; this store keeps an in-process index over
+them so recall does not touch every file:
+- Inverted index with BM25 ranking (title terms weighted above content),
+  with prefix expansion for partial words
+- Catalog of memory ID -> file, and secondary indexes by category, linked
+  task, session date and created_at
+- Incremental updates on save/delete; other writers are picked up via the
+  directory mtime (one stat per access) plus a periodic full revalidation
+  that re-parses only files whose mtime or size changed
+
+Usage:
+    from project_management_automation.utils.memory_store import get_memory_store
+
+    store = get_memory_store(memories_dir)
+    store.save(memory)
+    hits = store.search("import error", limit=10)
+    recent = store.filter(since="2025-01-01T00:00:00")
+
+Returned memory dicts are shared between callers; treat them as read-only
+(get() returns a private copy for read-modify-write).
+"""
+
+import bisect
+import copy
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Field weights for term frequencies
+TITLE_WEIGHT = 3
+CONTENT_WEIGHT = 1
+CATEGORY_WEIGHT = 1
+
+# Maximum vocabulary terms a prefix query term expands to
+MAX_PREFIX_EXPANSIONS = 50
+
+# Seconds between full revalidations (catches in-place edits by other processes)
+REVALIDATE_INTERVAL = 30.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens (letters, digits, underscores)."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class _Entry:
+    """Index bookkeeping for one memory (kept apart from the memory dict)."""
+
+    __slots__ = ("memory", "sig", "id", "terms", "length", "category", "tasks", "session_date", "created_at")
+
+    def __init__(self, memory: dict[str, Any], sig: Optional[tuple[int, int]], key: str):
+        self.memory = memory
+        self.sig = sig
+        # The memory's own "id" (normally the file stem, but not necessarily)
+        self.id = str(memory.get("id") or key)
+        terms: Counter = Counter()
+        for token in tokenize(str(memory.get("title", ""))):
+            terms[token] += TITLE_WEIGHT
+        for token in tokenize(str(memory.get("content", ""))):
+            terms[token] += CONTENT_WEIGHT
+        for token in tokenize(str(memory.get("category", ""))):
+            terms[token] += CATEGORY_WEIGHT
+        self.terms = dict(terms)
+        self.length = sum(terms.values())
+        self.category = memory.get("category")
+        tasks = memory.get("linked_tasks") or []
+        self.tasks = tuple(t for t in tasks if isinstance(t, str))
+        self.session_date = memory.get("session_date")
+        self.created_at = str(memory.get("created_at", ""))
+
+
+class MemoryStore:
+    """
+    In-process index over a memories directory.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(self, memories_dir: Union[Path, str]):
+        """
+        Initialize store.
+
+        Args:
+            memories_dir: Directory holding one <id>.json file per memory
+        """
+        self.memories_dir = Path(memories_dir)
+        self._lock = threading.RLock()
+        self._entries: dict[str, _Entry] = {}  # File stem -> entry
+        self._by_id: dict[str, str] = {}  # Memory "id" -> file stem
+        self._postings: dict[str, dict[str, int]] = {}
+        self._vocabulary: list[str] = []  # Sorted, for prefix expansion
+        self._vocabulary_dirty = False
+        self._total_length = 0
+        self._by_category: dict[str, set[str]] = {}
+        self._by_task: dict[str, set[str]] = {}
+        self._by_session_date: dict[str, set[str]] = {}
+        self._by_created: list[tuple[str, str]] = []  # Sorted (created_at, id)
+        self._newest_first: Optional[list[dict[str, Any]]] = None
+        self._dir_mtime_ns: Optional[int] = None
+        self._validated_at = 0.0
+        self._loaded = False
+        self._stats = {"full_scans": 0, "files_parsed": 0, "searches": 0}
+
+    # ── Index maintenance ────────────────────────────────────────────────────
+
+    def _index(self, memory_id: str, entry: _Entry) -> None:
+        self._unindex(memory_id)
+        self._entries[memory_id] = entry
+        self._by_id[entry.id] = memory_id
+        for term, tf in entry.terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary_dirty = True
+            postings[memory_id] = tf
+        self._total_length += entry.length
+        if entry.category:
+            self._by_category.setdefault(entry.category, set()).add(memory_id)
+        for task_id in entry.tasks:
+            self._by_task.setdefault(task_id, set()).add(memory_id)
+        if entry.session_date:
+            self._by_session_date.setdefault(entry.session_date, set()).add(memory_id)
+        bisect.insort(self._by_created, (entry.created_at, memory_id))
+        self._newest_first = None
+
+    def _unindex(self, memory_id: str) -> None:
+        entry = self._entries.pop(memory_id, None)
+        if entry is None:
+            return
+        if self._by_id.get(entry.id) == memory_id:
+            del self._by_id[entry.id]
+        for term in entry.terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(memory_id, None)
+                if not postings:
+                    del self._postings[term]
+                    self._vocabulary_dirty = True
+        self._total_length -= entry.length
+        for index, key in (
+            (self._by_category, entry.category),
+            (self._by_session_date, entry.session_date),
+            *((self._by_task, task_id) for task_id in entry.tasks),
+        ):
+            ids = index.get(key) if key else None
+            if ids is not None:
+                ids.discard(memory_id)
+                if not ids:
+                    del index[key]
+        pos = bisect.bisect_left(self._by_created, (entry.created_at, memory_id))
+        if pos < len(self._by_created) and self._by_created[pos] == (entry.created_at, memory_id):
+            del self._by_created[pos]
+        self._newest_first = None
+
+    def _read_file(self, path: Path) -> Optional[dict[str, Any]]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                memory = json.load(f)
+            self._stats["files_parsed"] += 1
+            return memory if isinstance(memory, dict) else None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Error loading memory {path}: {e}")
+            return None
+
+    def _dir_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.memories_dir).st_mtime_ns
+        except OSError:
+            return None
+
+    def _scan(self) -> None:
+        """Reconcile the index with the directory, re-parsing changed files only."""
+        self._stats["full_scans"] += 1
+        dir_mtime = self._dir_mtime()
+        seen: set[str] = set()
+        try:
+            entries = list(os.scandir(self.memories_dir))
+        except OSError:
+            entries = []
+
+        for dir_entry in entries:
+            if not dir_entry.name.endswith(".json"):
+                continue
+            memory_id = dir_entry.name[:-5]
+            try:
+                st = dir_entry.stat()
+            except OSError:
+                continue
+            sig = (st.st_mtime_ns, st.st_size)
+            seen.add(memory_id)
+            current = self._entries.get(memory_id)
+            if current is not None and current.sig == sig:
+                continue
+            memory = self._read_file(Path(dir_entry.path))
+            if memory is None:
+                self._unindex(memory_id)
+                seen.discard(memory_id)
+                continue
+            self._index(memory_id, _Entry(memory, sig, memory_id))
+
+        for memory_id in [m for m in self._entries if m not in seen]:
+            self._unindex(memory_id)
+
+        self._dir_mtime_ns = dir_mtime
+        self._validated_at = time.monotonic()
+        self._loaded = True
+
+    def _ensure_fresh(self) -> None:
+        if not self._loaded:
+            self._scan()
+        elif self._dir_mtime() != self._dir_mtime_ns:
+            self._scan()
+        elif time.monotonic() - self._validated_at >= REVALIDATE_INTERVAL:
+            self._scan()
+
+    def refresh(self) -> None:
+        """Revalidate against the directory now."""
+        with self._lock:
+            self._scan()
+
+    # ── Writes ───────────────────────────────────────────────────────────────
+
+    def _path(self, memory_id: str) -> Path:
+        return self.memories_dir / f"{memory_id}.json"
+
+    def save(self, memory: dict[str, Any], indent: Optional[int] = 2) -> Path:
+        """
+        Write a memory file and update the index incrementally.
+
+        The store keeps its own copy of `memory`; later changes by the caller
+        are not indexed until saved again.
+
+        Args:
+            memory: Memory dict (must have an 'id')
+            indent: JSON indentation
+
+        Returns:
+            Path of the written file
+        """
+        memory_id = str(memory["id"])
+        path = self._path(memory_id)
+        with self._lock:
+            self.memories_dir.mkdir(parents=True, exist_ok=True)
+            # Only adopt the new directory mtime if nobody else changed the directory
+            unchanged = self._loaded and self._dir_mtime() == self._dir_mtime_ns
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(memory, f, indent=indent)
+            try:
+                st = path.stat()
+                sig: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                sig = None
+            if self._loaded:
+                self._index(memory_id, _Entry(copy.deepcopy(memory), sig, memory_id))
+                if unchanged:
+                    self._dir_mtime_ns = self._dir_mtime()
+        return path
+
+    def delete(self, memory_id: str) -> bool:
+        """
+        Delete a memory file and remove it from the index.
+
+        Returns:
+            True if a file was deleted
+        """
+        path = self._path(memory_id)
+        with self._lock:
+            unchanged = self._loaded and self._dir_mtime() == self._dir_mtime_ns
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                self._unindex(memory_id)
+                return False
+            self._unindex(memory_id)
+            if unchanged:
+                self._dir_mtime_ns = self._dir_mtime()
+        return True
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+
+    def _lookup(self, memory_id: str) -> Optional[str]:
+        if memory_id in self._entries:
+            return memory_id
+        return self._by_id.get(memory_id)
+
+    def get(self, memory_id: str) -> Optional[dict[str, Any]]:
+        """Get a private copy of one memory by ID or file stem (None if missing)."""
+        with self._lock:
+            self._ensure_fresh()
+            key = self._lookup(memory_id)
+            return copy.deepcopy(self._entries[key].memory) if key is not None else None
+
+    def path(self, memory_id: str) -> Optional[Path]:
+        """File holding a memory, by ID or file stem (None if missing)."""
+        with self._lock:
+            self._ensure_fresh()
+            key = self._lookup(memory_id)
+            return self._path(key) if key is not None else None
+
+    def all(self) -> list[dict[str, Any]]:
+        """All memories, newest first (shared list; do not mutate)."""
+        with self._lock:
+            self._ensure_fresh()
+            if self._newest_first is None:
+                self._newest_first = [self._entries[mid].memory for _, mid in reversed(self._by_created)]
+            return self._newest_first
+
+    def count(self) -> int:
+        """Number of memories."""
+        with self._lock:
+            self._ensure_fresh()
+            return len(self._entries)
+
+    def category_counts(self) -> dict[str, int]:
+        """Number of memories per category."""
+        with self._lock:
+            self._ensure_fresh()
+            counts = {category: len(ids) for category, ids in self._by_category.items()}
+            uncategorized = len(self._entries) - sum(counts.values())
+            if uncategorized:
+                counts["unknown"] = counts.get("unknown", 0) + uncategorized
+            return counts
+
+    def filter(
+        self,
+        category: Optional[str] = None,
+        task_id: Optional[str] = None,
+        since: Optional[str] = None,
+        session_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        ignore_case: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Filter memories using the secondary indexes.
+
+        Args:
+            category: Exact category (see ignore_case)
+            task_id: Linked task ID
+            since: ISO timestamp; only memories created at or after it
+            session_date: Session date (YYYY-MM-DD)
+            limit: Maximum results
+            ignore_case: Match category case-insensitively
+
+        Returns:
+            Matching memories, newest first
+        """
+        with self._lock:
+            self._ensure_fresh()
+            candidates: Optional[set[str]] = None
+            if category and ignore_case:
+                folded = category.casefold()
+                candidates = set()
+                for name, ids in self._by_category.items():
+                    if name.casefold() == folded:
+                        candidates |= ids
+                category = None
+            for index, key in (
+                (self._by_category, category),
+                (self._by_task, task_id),
+                (self._by_session_date, session_date),
+            ):
+                if key:
+                    ids = index.get(key, set())
+                    candidates = set(ids) if candidates is None else candidates & ids
+
+            start = bisect.bisect_left(self._by_created, (since, "")) if since else 0
+            results = []
+            for created_at, memory_id in reversed(self._by_created[start:]):
+                if candidates is not None and memory_id not in candidates:
+                    continue
+                results.append(self._entries[memory_id].memory)
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
+
+    def _expand(self, term: str) -> list[str]:
+        if term in self._postings:
+            return [term]
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect.bisect_left(self._vocabulary, term)
+        expanded = []
+        for candidate in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not candidate.startswith(term):
+                break
+            expanded.append(candidate)
+        return expanded
+
+    def search(self, query: str, limit: int = 10, category: Optional[str] = None) -> list[dict[str, Any]]:
+        """
+        Rank memories against a free-text query with BM25.
+
+        Query words missing from the vocabulary match as prefixes
+        ("migrat" finds "migration").
+
+        Args:
+            query: Search text
+            limit: Maximum results
+            category: Optional category filter
+
+        Returns:
+            Matching memories, best first (ties: newest first)
+        """
+        with self._lock:
+            self._ensure_fresh()
+            self._stats["searches"] += 1
+            n_docs = len(self._entries)
+            if not n_docs:
+                return []
+            avg_length = self._total_length / n_docs or 1.0
+            allowed = self._by_category.get(category, set()) if category else None
+
+            scores: dict[str, float] = {}
+            for query_term in dict.fromkeys(tokenize(query)):
+                for term in self._expand(query_term):
+                    postings = self._postings[term]
+                    idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for memory_id, tf in postings.items():
+                        if allowed is not None and memory_id not in allowed:
+                            continue
+                        length = self._entries[memory_id].length
+                        norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                        scores[memory_id] = scores.get(memory_id, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+
+            ranked = sorted(
+                scores,
+                key=lambda mid: (scores[mid], self._entries[mid].created_at),
+                reverse=True,
+            )
+            return [self._entries[mid].memory for mid in ranked[:limit]]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            return {
+                **self._stats,
+                "memories": len(self._entries),
+                "terms": len(self._postings),
+                "categories": len(self._by_category),
+                "linked_tasks": len(self._by_task),
+            }
+
+
+# Stores keyed by resolved memories directory
+_stores: dict[str, MemoryStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_memory_store(memories_dir: Union[Path, str]) -> MemoryStore:
+    """
+    Get the shared MemoryStore for a memories directory.
+
+    Args:
+        memories_dir: Directory holding memory JSON files
+
+    Returns:
+        MemoryStore instance shared by all callers for that directory
+    """
+    path = Path(memories_dir)
+    try:
+        key = str(path.resolve())
+    except OSError:
+        key = str(path.absolute())
+
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = MemoryStore(path)
+            _stores[key] = store
+        return store
+
+
+__all__ = [
+    "MemoryStore",
+    "get_memory_store",
+    "tokenize",
+]
@@ -0,0 +1,356 @@
+"""
+Near-duplicate text detection without all-pairs comparison.
+
+Finds pairs of similar strings (task names, descriptions, memory titles)
+using a candidate-generation stage in front of the exact similarity check:
+- Token sets: character q-grams (for SequenceMatcher ratio) or words (for Jaccard)
+- Candidates from an inverted index over rare-first token prefixes (prefix
+  filtering), or from MinHash LSH buckets for large collections
+- Size / length / token-overlap bounds that rule out pairs which cannot match
+- Verification with the exact measure (real_quick_ratio → quick_ratio → ratio)
+
+Prefix filtering compares each record only with records sharing a token in
+their prefixes. It is exact for measure="jaccard"; for measure="ratio" the
+q-gram bound is derived conservatively from the ratio threshold and matches
+all-pairs results on edit-style near-duplicates. Above EXHAUSTIVE_LIMIT texts
+common q-grams make prefix posting lists long, so candidates come from MinHash
+LSH banding instead (near-linear, with high but not guaranteed recall).
+Reported pairs and scores are always exact.
+
+Usage:
+    from project_management_automation.utils.near_duplicates import find_similar_pairs
+
+    pairs = find_similar_pairs(names, threshold=0.85)
+    for i, j, score in pairs:
+        print(names[i], "~", names[j], score)
+"""
+
+import hashlib
+import math
+import random
+import re
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterator, Sequence
+from difflib import SequenceMatcher
+from itertools import chain
+from typing import Literal
+
+Measure = Literal["ratio", "jaccard"]
+
+# q-gram length used to generate candidates for SequenceMatcher ratio
+QGRAM_SIZE = 3
+
+# Collections larger than this use MinHash LSH candidates instead of prefix filtering
+EXHAUSTIVE_LIMIT = 2000
+
+# LSH banding: pairs with q-gram Jaccard J collide with probability 1 - (1 - J**ROWS)**BANDS
+LSH_BANDS = 40
+LSH_ROWS = 4
+
+_MERSENNE_61 = (1 << 61) - 1
+
+_WORD_RE = re.compile(r"\S+")
+
+
+def _qgrams(text: str, q: int = QGRAM_SIZE) -> set[str]:
+    if len(text) <= q:
+        return {text}
+    return {text[k:k + q] for k in range(len(text) - q + 1)}
+
+
+def _words(text: str) -> set[str]:
+    return set(_WORD_RE.findall(text.lower()))
+
+
+def _candidate_threshold(measure: Measure, threshold: float) -> float:
+    """Set-similarity threshold used for candidate generation."""
+    if measure == "jaccard":
+        return threshold
+    # Each unmatched character can break up to q q-grams on either side,
+    # plus one extra for block boundaries: keep the Dice bound generous.
+    return max(0.0, 1.0 - (QGRAM_SIZE + 1) * (1.0 - threshold))
+
+
+def _min_overlap(size: int, sim: float, measure: Measure) -> int:
+    """Smallest token overlap any partner needs to reach `sim` with a set of `size`."""
+    if sim <= 0:
+        return 1
+    if measure == "jaccard":
+        return max(1, math.ceil(sim * size - 1e-9))
+    # Dice: 2|x∩y| / (|x|+|y|) >= sim, minimised when |y| is smallest
+    return max(1, math.ceil(sim * size / (2.0 - sim) - 1e-9))
+
+
+class _TokenizedRecords:
+    """Tokenized records with rarest-first prefixes for prefix filtering."""
+
+    def __init__(self, texts: Sequence[str], measure: Measure, candidate_sim: float, frequencies: Counter):
+        self.measure = measure
+        self.candidate_sim = candidate_sim
+        self.frequencies = frequencies
+
+        tokenize = _words if measure == "jaccard" else _qgrams
+        self.sets: list[set[str]] = [tokenize(text) if text else set() for text in texts]
+        for tokens in self.sets:
+            frequencies.update(tokens)
+        self.prefixes: list[list[str]] = []
+
+    def build_prefixes(self) -> None:
+        freq = self.frequencies
+        for tokens in self.sets:
+            if not tokens:
+                self.prefixes.append([])
+                continue
+            ordered = sorted(tokens, key=lambda t: (freq[t], t))
+            overlap = _min_overlap(len(ordered), self.candidate_sim, self.measure)
+            self.prefixes.append(ordered[:max(1, len(ordered) - overlap + 1)])
+
+
+def _prefix_candidates(records: _TokenizedRecords) -> Iterator[tuple[int, set[int]]]:
+    """
+    Yield (record, earlier candidates) using prefix filtering.
+
+    Records are processed smallest token set first; each probes the records
+    already indexed.
+    """
+    records.build_prefixes()
+    order = sorted(range(len(records.sets)), key=lambda r: len(records.sets[r]))
+    index: dict[str, list[int]] = defaultdict(list)
+
+    for r in order:
+        prefix = records.prefixes[r]
+        if not prefix:
+            continue
+        # Merging posting lists in C is far cheaper than a Python loop
+        yield r, set(chain.from_iterable(index[t] for t in prefix if t in index))
+        for token in prefix:
+            index[token].append(r)
+
+
+def _stable_hash(token: str) -> int:
+    # hash() is salted per process; LSH buckets must be reproducible
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _lsh_candidates(
+    records: _TokenizedRecords,
+    bands: int = LSH_BANDS,
+    rows: int = LSH_ROWS,
+) -> Iterator[tuple[int, set[int]]]:
+    """Yield (record, earlier candidates) sharing at least one MinHash LSH bucket."""
+    rng = random.Random(0)
+    coefficients = [(rng.randrange(1, _MERSENNE_61), rng.randrange(_MERSENNE_61)) for _ in range(bands * rows)]
+    token_hashes: dict[str, array] = {}
+    buckets: list[dict[tuple[int, ...], list[int]]] = [defaultdict(list) for _ in range(bands)]
+
+    for r, tokens in enumerate(records.sets):
+        if not tokens:
+            continue
+        for token in tokens:
+            if token not in token_hashes:
+                h = _stable_hash(token)
+                token_hashes[token] = array("Q", [(a * h + b) % _MERSENNE_61 for a, b in coefficients])
+        signature = list(map(min, zip(*(token_hashes[t] for t in tokens))))
+
+        candidates: set[int] = set()
+        for band, band_buckets in enumerate(buckets):
+            bucket = band_buckets[tuple(signature[band * rows:(band + 1) * rows])]
+            candidates.update(bucket)
+            bucket.append(r)
+        yield r, candidates
+
+
+def _size_compatible(size_a: int, size_b: int, sim: float, measure: Measure) -> bool:
+    small, large = (size_a, size_b) if size_a <= size_b else (size_b, size_a)
+    if measure == "jaccard":
+        return small >= sim * large - 1e-9
+    return 2.0 * small >= sim * (small + large) - 1e-9
+
+
+def _length_compatible(len_a: int, len_b: int, threshold: float) -> bool:
+    # SequenceMatcher.ratio <= 2*min(len)/(len_a+len_b)
+    return 2.0 * min(len_a, len_b) >= threshold * (len_a + len_b) - 1e-9
+
+
+def _ratio(matcher: SequenceMatcher, first: str, threshold: float) -> float:
+    """
+    SequenceMatcher ratio of (first, matcher.b), or 0.0 if the cheap bounds rule it out.
+
+    `matcher` keeps its second sequence so its analysis is reused across candidates.
+    """
+    matcher.set_seq1(first)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return 0.0
+    return matcher.ratio()
+
+
+def _set_similar(a: set[str], b: set[str], sim: float, measure: Measure) -> bool:
+    """Exact token-set check against the candidate threshold (set ops run in C)."""
+    inter = len(a & b)
+    if measure == "jaccard":
+        return inter >= sim * (len(a) + len(b) - inter) - 1e-9
+    return 2.0 * inter >= sim * (len(a) + len(b)) - 1e-9
+
+
+def _jaccard(a: set[str], b: set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def find_similar_pairs(
+    texts: Sequence[str],
+    threshold: float = 0.85,
+    measure: Measure = "ratio",
+    min_length: int = 1,
+    exhaustive_limit: int = EXHAUSTIVE_LIMIT,
+) -> list[tuple[int, int, float]]:
+    """
+    Find all pairs of texts whose similarity is at least `threshold`.
+
+    Args:
+        texts: Texts to compare (empty or shorter than min_length are ignored)
+        threshold: Minimum similarity (0.0 - 1.0)
+        measure: "ratio" (difflib.SequenceMatcher(None, texts[i], texts[j]).ratio(),
+            case-sensitive) or "jaccard" (word-set Jaccard, case-insensitive)
+        min_length: Minimum text length for a record to take part
+        exhaustive_limit: Use prefix filtering up to this many texts, LSH above
+
+    Returns:
+        List of (i, j, similarity) with i < j, sorted by (i, j)
+    """
+    candidate_sim = _candidate_threshold(measure, threshold)
+    active = [k for k, t in enumerate(texts) if t and len(t) >= min_length]
+
+    records = _TokenizedRecords([texts[k] for k in active], measure, candidate_sim, Counter())
+    if len(active) <= exhaustive_limit:
+        candidate_stream = _prefix_candidates(records)
+    else:
+        candidate_stream = _lsh_candidates(records)
+
+    pairs: list[tuple[int, int, float]] = []
+    for r, candidates in candidate_stream:
+        tokens = records.sets[r]
+        text_r = texts[active[r]]
+        matcher = None
+
+        for other in candidates:
+            other_tokens = records.sets[other]
+            if not _size_compatible(len(other_tokens), len(tokens), candidate_sim, measure):
+                continue
+            i, j = sorted((active[other], active[r]))
+            text_o = texts[active[other]]
+            if measure == "jaccard":
+                score = _jaccard(other_tokens, tokens)
+            elif not _length_compatible(len(text_o), len(text_r), threshold):
+                continue
+            elif not _set_similar(other_tokens, tokens, candidate_sim, measure):
+                continue
+            elif j == active[r]:
+                if matcher is None:
+                    matcher = SequenceMatcher(None, "", text_r)
+                score = _ratio(matcher, text_o, threshold)
+            else:
+                # ratio() is not symmetric: always score (earlier, later)
+                score = _ratio(SequenceMatcher(None, "", text_o), text_r, threshold)
+            if score >= threshold:
+                pairs.append((i, j, score))
+
+    pairs.sort(key=lambda p: (p[0], p[1]))
+    return pairs
+
+
+def find_similar_groups(
+    texts: Sequence[str],
+    threshold: float = 0.85,
+    measure: Measure = "ratio",
+    min_length: int = 1,
+) -> list[list[int]]:
+    """
+    Greedily group similar texts.
+
+    Walks texts in order; each ungrouped text starts a group that absorbs every
+    later ungrouped text similar to it (the same result as the classic nested
+    loop, without comparing every pair).
+
+    Returns:
+        Groups (lists of indices, 2+ members each) in order of first member
+    """
+    neighbours: dict[int, list[int]] = defaultdict(list)
+    for i, j, _score in find_similar_pairs(texts, threshold, measure, min_length):
+        neighbours[i].append(j)
+
+    grouped: set[int] = set()
+    groups = []
+    for i in range(len(texts)):
+        if i in grouped or i not in neighbours:
+            continue
+        group = [i] + [j for j in neighbours[i] if j not in grouped]
+        if len(group) > 1:
+            grouped.update(group)
+            groups.append(group)
+    return groups
+
+
+def match_similar(
+    queries: Sequence[str],
+    candidates: Sequence[str],
+    threshold: float = 0.7,
+    measure: Measure = "jaccard",
+) -> list[tuple[int, int, float]]:
+    """
+    Find similar (query, candidate) pairs between two collections.
+
+    Args:
+        queries: Texts to look up
+        candidates: Texts to search
+        threshold: Minimum similarity (0.0 - 1.0)
+        measure: "jaccard" (word sets) or "ratio" (SequenceMatcher(None, candidate, query))
+
+    Returns:
+        List of (query_index, candidate_index, similarity), sorted by indices
+    """
+    candidate_sim = _candidate_threshold(measure, threshold)
+    frequencies: Counter = Counter()
+    query_records = _TokenizedRecords(queries, measure, candidate_sim, frequencies)
+    cand_records = _TokenizedRecords(candidates, measure, candidate_sim, frequencies)
+    query_records.build_prefixes()
+    cand_records.build_prefixes()
+
+    index: dict[str, list[int]] = defaultdict(list)
+    for c, prefix in enumerate(cand_records.prefixes):
+        for token in prefix:
+            index[token].append(c)
+
+    matches: list[tuple[int, int, float]] = []
+    for q, prefix in enumerate(query_records.prefixes):
+        tokens = query_records.sets[q]
+        if not tokens:
+            continue
+        seen = set(chain.from_iterable(index[t] for t in prefix if t in index))
+        matcher = SequenceMatcher(None, "", queries[q]) if measure == "ratio" and seen else None
+        for c in sorted(seen):
+            cand_tokens = cand_records.sets[c]
+            if not _size_compatible(len(cand_tokens), len(tokens), candidate_sim, measure):
+                continue
+            if measure == "jaccard":
+                score = _jaccard(tokens, cand_tokens)
+            elif not _length_compatible(len(candidates[c]), len(queries[q]), threshold):
+                continue
+            elif not _set_similar(cand_tokens, tokens, candidate_sim, measure):
+                continue
+            else:
+                score = _ratio(matcher, candidates[c], threshold)
+            if score >= threshold:
+                matches.append((q, c, score))
+    return matches
+
+
+__all__ = [
+    "EXHAUSTIVE_LIMIT",
+    "find_similar_pairs",
+    "find_similar_groups",
+    "match_similar",
+]
@@ -0,0 +1,543 @@
+"""
+Single-pass repository file inventory.
+
+Walks the project tree once with os.scandir and serves every file listing the
+scanning tools need (scorecard, docs health, automation opportunities):
+- Honours .gitignore (root and nested) and .cursorignore, plus a built-in
+  list of VCS, virtualenv, dependency and cache directories
+- Buckets files by extension and by role (source / test / doc / other)
+- Revalidates with one stat per directory: only directories whose mtime
+  changed are re-listed; a changed ignore file triggers a full rescan
+
+Usage:
+    from project_management_automation.utils.repo_inventory import get_repo_inventory
+
+    inventory = get_repo_inventory(project_root)
+    py_files = inventory.files(ext='.py')
+    tests = inventory.files(role='test')
+    docs = inventory.files(ext='.md', under=project_root / 'docs')
+
+Only paths are cached; read file contents (or stat them) as needed.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .project_root import find_project_root
+
+logger = logging.getLogger(__name__)
+
+# Directories never worth scanning, whatever the ignore files say
+DEFAULT_EXCLUDED_DIRS = frozenset({
+    '.git', '.hg', '.svn',
+    'node_modules', '.venv', 'venv', '.build-env',
+    '__pycache__', '.tox', '.nox', '.mypy_cache', '.pytest_cache', '.ruff_cache',
+    # Exarp's own caches and state (memories, metrics, tool results)
+    '.exarp',
+    # Guard against scanning a home directory by mistake (macOS)
+    'Library', 'Containers', 'Group Containers', '.Trash',
+})
+
+IGNORE_FILES = ('.gitignore', '.cursorignore')
+
+SOURCE_EXTENSIONS = frozenset({
+    '.py', '.c', '.cc', '.cpp', '.cxx', '.h', '.hpp', '.rs', '.go', '.java', '.kt',
+    '.ts', '.tsx', '.js', '.jsx', '.swift', '.sh',
+})
+DOC_EXTENSIONS = frozenset({'.md', '.rst', '.adoc'})
+TEST_DIR_NAMES = frozenset({'tests', 'test', '__tests__'})
+
+_TEST_NAME_RE = re.compile(
+    r'^(test_.*|.*_test|.*Tests?)\.[^.]+$'          # test_x.py, x_test.rs, FooTests.swift
+    r'|^.*\.(test|spec)\.[jt]sx?$'                   # x.test.ts, x.spec.tsx
+    r'|^.*test.*\.(cpp|cc|cxx)$',                    # C++ test sources
+    re.IGNORECASE,
+)
+
+# Seconds during which a validated snapshot is served without re-statting directories
+VALIDATE_INTERVAL = 2.0
+
+
+def classify_file(rel_path: str) -> str:
+    """
+    Classify a file by role.
+
+    Args:
+        rel_path: Path relative to the project root (POSIX separators)
+
+    Returns:
+        'test', 'doc', 'source' or 'other'
+    """
+    name = rel_path.rsplit('/', 1)[-1]
+    ext = os.path.splitext(name)[1].lower()
+    if ext in DOC_EXTENSIONS:
+        return 'doc'
+    if ext in SOURCE_EXTENSIONS:
+        parts = rel_path.split('/')[:-1]
+        if _TEST_NAME_RE.match(name) or any(part in TEST_DIR_NAMES for part in parts):
+            return 'test'
+        return 'source'
+    return 'other'
+
+
+def _translate_pattern(pattern: str) -> str:
+    """Translate a gitignore glob into a regex (without anchors)."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == len(pattern):
+            out.append('/.*')
+            i += 3
+        elif pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+        elif c == '*':
+            out.append('[^/]*')
+            i += 1
+        elif c == '?':
+            out.append('[^/]')
+            i += 1
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                out.append(f'[{body}]')
+                i = end + 1
+        elif c == '\\' and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return ''.join(out)
+
+
+class IgnoreRule:
+    """One compiled gitignore pattern, scoped to the directory of its ignore file."""
+
+    __slots__ = ('base', 'regex', 'negate', 'dir_only', 'anchored')
+
+    def __init__(self, base: str, pattern: str):
+        self.base = base
+        self.negate = pattern.startswith('!')
+        if self.negate:
+            pattern = pattern[1:]
+        elif pattern.startswith('\\!') or pattern.startswith('\\#'):
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        self.anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+        self.regex = re.compile(f'^{_translate_pattern(pattern)}$')
+
+    def matches(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + '/'):
+                return False
+            rel_path = rel_path[len(self.base) + 1:]
+        target = rel_path if self.anchored else name
+        return self.regex.match(target) is not None
+
+
+def parse_ignore_file(path: Union[Path, str], base: str = '') -> list[IgnoreRule]:
+    """
+    Parse a .gitignore-style file.
+
+    Args:
+        path: Ignore file path
+        base: Directory of the ignore file relative to the project root ('' for root)
+
+    Returns:
+        List of IgnoreRule (empty if the file cannot be read)
+    """
+    rules = []
+    try:
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.rstrip('\n').rstrip('\r')
+                if not line.strip() or line.startswith('#'):
+                    continue
+                line = line.rstrip(' ') if not line.endswith('\\ ') else line
+                try:
+                    rules.append(IgnoreRule(base, line))
+                except re.error:
+                    logger.debug(f"Skipping invalid ignore pattern {line!r} in {path}")
+    except OSError:
+        pass
+    return rules
+
+
+def is_ignored(rules: list[IgnoreRule], rel_path: str, name: str, is_dir: bool) -> bool:
+    """Apply rules in order; the last matching rule decides."""
+    ignored = False
+    for rule in rules:
+        if rule.negate == ignored and rule.matches(rel_path, name, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+class _DirListing:
+    """Cached listing of one directory (already filtered by ignore rules)."""
+
+    __slots__ = ('mtime_ns', 'files', 'subdirs', 'ignore_sigs', 'rules')
+
+    def __init__(
+        self,
+        mtime_ns: int,
+        files: list[str],
+        subdirs: list[str],
+        ignore_sigs: dict[str, tuple],
+        rules: list[IgnoreRule],
+    ):
+        self.mtime_ns = mtime_ns
+        self.files = files
+        self.subdirs = subdirs
+        self.ignore_sigs = ignore_sigs
+        self.rules = rules  # Rules from this directory's own ignore files
+
+
+def _file_sig(path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+class RepoInventory:
+    """
+    Cached inventory of the files in a project tree.
+
+    The first query walks the tree once; later queries revalidate with one
+    stat per directory (at most every VALIDATE_INTERVAL seconds) and re-list
+    only directories that changed.
+    """
+
+    def __init__(self, project_root: Union[Path, str], excluded_dirs: Optional[Iterable[str]] = None):
+        """
+        Initialize inventory.
+
+        Args:
+            project_root: Root directory to inventory
+            excluded_dirs: Directory names to skip (defaults to DEFAULT_EXCLUDED_DIRS)
+        """
+        self.project_root = Path(project_root)
+        self._root = str(self.project_root)
+        self.excluded_dirs = frozenset(excluded_dirs) if excluded_dirs is not None else DEFAULT_EXCLUDED_DIRS
+
+        self._listings: dict[str, _DirListing] = {}
+        self._files: list[str] = []
+        self._by_ext: dict[str, list[str]] = {}
+        self._by_role: dict[str, list[str]] = {}
+        self._validated_at = 0.0
+        self._lock = threading.RLock()
+        self._stats = {'full_scans': 0, 'dirs_listed': 0, 'dirs_reused': 0, 'validations': 0, 'hits': 0}
+
+    # ── Walking ──────────────────────────────────────────────────────────────
+
+    def _abs(self, rel_dir: str) -> str:
+        return os.path.join(self._root, rel_dir) if rel_dir else self._root
+
+    def _list_dir(self, rel_dir: str, mtime_ns: int, rules: list[IgnoreRule]) -> tuple[_DirListing, list[IgnoreRule]]:
+        abs_dir = self._abs(rel_dir)
+        try:
+            entries = list(os.scandir(abs_dir))
+        except OSError as e:
+            logger.debug(f"Cannot list {abs_dir}: {e}")
+            return _DirListing(mtime_ns, [], [], {}, []), rules
+
+        ignore_sigs: dict[str, tuple] = {}
+        own_rules: list[IgnoreRule] = []
+        names = {entry.name for entry in entries}
+        for ignore_name in IGNORE_FILES:
+            # .cursorignore is only honoured at the project root
+            if ignore_name in names and (ignore_name == '.gitignore' or not rel_dir):
+                ignore_path = os.path.join(abs_dir, ignore_name)
+                ignore_sigs[ignore_name] = _file_sig(ignore_path)
+                own_rules.extend(parse_ignore_file(ignore_path, rel_dir))
+        local_rules = rules + own_rules if own_rules else rules
+
+        files, subdirs = [], []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+            if is_dir:
+                if entry.name in self.excluded_dirs or is_ignored(local_rules, rel_path, entry.name, True):
+                    continue
+                subdirs.append(entry.name)
+            elif is_file and not is_ignored(local_rules, rel_path, entry.name, False):
+                files.append(entry.name)
+
+        files.sort()
+        subdirs.sort()
+        self._stats['dirs_listed'] += 1
+        return _DirListing(mtime_ns, files, subdirs, ignore_sigs, own_rules), local_rules
+
+    def _walk(self, full: bool) -> None:
+        """Walk the tree, reusing listings of unchanged directories unless `full`."""
+        old = {} if full else self._listings
+        listings: dict[str, _DirListing] = {}
+        # Stack of (relative dir, inherited ignore rules)
+        stack: list[tuple[str, list[IgnoreRule]]] = [('', [])]
+
+        while stack:
+            rel_dir, rules = stack.pop()
+            abs_dir = self._abs(rel_dir)
+            try:
+                mtime_ns = os.stat(abs_dir).st_mtime_ns
+            except OSError:
+                continue
+
+            cached = old.get(rel_dir)
+            if cached is not None and cached.mtime_ns == mtime_ns and all(
+                _file_sig(os.path.join(abs_dir, name)) == sig for name, sig in cached.ignore_sigs.items()
+            ):
+                listing = cached
+                local_rules = rules + cached.rules if cached.rules else rules
+                self._stats['dirs_reused'] += 1
+            else:
+                if cached is not None and cached.ignore_sigs != {
+                    name: _file_sig(os.path.join(abs_dir, name)) for name in cached.ignore_sigs
+                }:
+                    # Ignore rules changed: everything below may change
+                    old = {}
+                listing, local_rules = self._list_dir(rel_dir, mtime_ns, rules)
+
+            listings[rel_dir] = listing
+            for name in reversed(listing.subdirs):
+                stack.append((f"{rel_dir}/{name}" if rel_dir else name, local_rules))
+
+        self._listings = listings
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        files: list[str] = []
+        for rel_dir, listing in sorted(self._listings.items()):
+            prefix = f"{rel_dir}/" if rel_dir else ''
+            files.extend(prefix + name for name in listing.files)
+
+        by_ext: dict[str, list[str]] = {}
+        by_role: dict[str, list[str]] = {}
+        for rel_path in files:
+            ext = os.path.splitext(rel_path)[1].lower()
+            by_ext.setdefault(ext, []).append(rel_path)
+            by_role.setdefault(classify_file(rel_path), []).append(rel_path)
+
+        self._files = files
+        self._by_ext = by_ext
+        self._by_role = by_role
+
+    def _ensure_fresh(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not self._listings:
+                self._stats['full_scans'] += 1
+                self._walk(full=True)
+            elif now - self._validated_at >= VALIDATE_INTERVAL:
+                self._stats['validations'] += 1
+                self._walk(full=False)
+            else:
+                self._stats['hits'] += 1
+                return
+            self._validated_at = time.monotonic()
+
+    def refresh(self, full: bool = False) -> None:
+        """
+        Revalidate now.
+
+        Args:
+            full: Discard all cached listings and walk the whole tree again
+        """
+        with self._lock:
+            if full:
+                self._listings = {}
+            self._validated_at = 0.0
+        self._ensure_fresh()
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+
+    def relpaths(
+        self,
+        ext: Optional[Union[str, Iterable[str]]] = None,
+        role: Optional[Union[str, Iterable[str]]] = None,
+        under: Optional[Union[Path, str]] = None,
+        recursive: bool = True,
+    ) -> list[str]:
+        """
+        List file paths relative to the project root (POSIX separators).
+
+        Args:
+            ext: Extension(s) to include, e.g. '.py' or ('.ts', '.tsx')
+            role: Role(s) to include: 'source', 'test', 'doc', 'other'
+            under: Only files inside this directory (absolute or root-relative)
+            recursive: With `under`, include files in subdirectories
+
+        Returns:
+            Sorted list of relative paths
+        """
+        self._ensure_fresh()
+        with self._lock:
+            exts = {ext.lower()} if isinstance(ext, str) else ({e.lower() for e in ext} if ext else None)
+            roles = {role} if isinstance(role, str) else (set(role) if role else None)
+
+            if exts is not None:
+                candidates = [p for e in sorted(exts) for p in self._by_ext.get(e, [])]
+                if len(exts) > 1:
+                    candidates.sort()
+            elif roles is not None and len(roles) == 1:
+                candidates = list(self._by_role.get(next(iter(roles)), []))
+            else:
+                candidates = list(self._files)
+
+        if roles is not None and not (exts is None and len(roles) == 1):
+            candidates = [p for p in candidates if classify_file(p) in roles]
+
+        if under is not None:
+            prefix = self._relative_dir(under)
+            if prefix is None:
+                return []
+            if prefix:
+                candidates = [p for p in candidates if p.startswith(prefix + '/')]
+            if not recursive:
+                depth = prefix.count('/') + 1 if prefix else 0
+                candidates = [p for p in candidates if p.count('/') == depth]
+        return candidates
+
+    def files(
+        self,
+        ext: Optional[Union[str, Iterable[str]]] = None,
+        role: Optional[Union[str, Iterable[str]]] = None,
+        under: Optional[Union[Path, str]] = None,
+        recursive: bool = True,
+    ) -> list[Path]:
+        """Like relpaths(), but returns absolute Paths."""
+        return [self.project_root / p for p in self.relpaths(ext, role, under, recursive)]
+
+    def _relative_dir(self, directory: Union[Path, str]) -> Optional[str]:
+        path = Path(directory)
+        if not path.is_absolute():
+            rel_str = path.as_posix()
+            return '' if rel_str == '.' else rel_str
+        try:
+            rel = path.relative_to(self.project_root)
+        except ValueError:
+            try:
+                rel = path.resolve().relative_to(self.project_root.resolve())
+            except (ValueError, OSError):
+                return None
+        rel_str = rel.as_posix()
+        return '' if rel_str == '.' else rel_str
+
+    def contains(self, directory: Union[Path, str]) -> bool:
+        """Check whether a directory lies inside this inventory's root."""
+        return self._relative_dir(directory) is not None
+
+    def extension_counts(self) -> dict[str, int]:
+        """Number of files per extension."""
+        self._ensure_fresh()
+        with self._lock:
+            return {ext: len(paths) for ext, paths in self._by_ext.items()}
+
+    def role_counts(self) -> dict[str, int]:
+        """Number of files per role."""
+        self._ensure_fresh()
+        with self._lock:
+            return {role: len(paths) for role, paths in self._by_role.items()}
+
+    def fingerprint(
+        self,
+        ext: Optional[Union[str, Iterable[str]]] = None,
+        role: Optional[Union[str, Iterable[str]]] = None,
+        under: Optional[Union[Path, str]] = None,
+    ) -> str:
+        """
+        Digest of the selected files' paths, sizes and mtimes.
+
+        Changes whenever a selected file is added, removed or modified, so it
+        can key caches of results derived from file contents. Costs one stat
+        per selected file.
+
+        Args:
+            ext: Extension(s) to include (as in relpaths())
+            role: Role(s) to include (as in relpaths())
+            under: Only files inside this directory
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for rel_path in self.relpaths(ext, role, under):
+            sig = _file_sig(os.path.join(self._root, rel_path))
+            digest.update(f"{rel_path}\0{sig}\n".encode())
+        return digest.hexdigest()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get inventory statistics."""
+        with self._lock:
+            return {
+                **self._stats,
+                'root': self._root,
+                'directories': len(self._listings),
+                'files': len(self._files),
+            }
+
+
+# Inventories keyed by resolved project root
+_inventories: dict[str, RepoInventory] = {}
+_inventories_lock = threading.Lock()
+
+
+def get_repo_inventory(project_root: Optional[Union[Path, str]] = None) -> RepoInventory:
+    """
+    Get the shared RepoInventory for a project root.
+
+    Args:
+        project_root: Project root (defaults to find_project_root())
+
+    Returns:
+        RepoInventory instance shared by all callers for that root
+    """
+    root = Path(project_root) if project_root is not None else find_project_root()
+    try:
+        key = str(root.resolve())
+    except OSError:
+        key = str(root.absolute())
+
+    with _inventories_lock:
+        inventory = _inventories.get(key)
+        if inventory is None:
+            inventory = RepoInventory(root)
+            _inventories[key] = inventory
+        return inventory
+
+
+__all__ = [
+    "DEFAULT_EXCLUDED_DIRS",
+    "RepoInventory",
+    "classify_file",
+    "get_repo_inventory",
+    "is_ignored",
+    "parse_ignore_file",
+]
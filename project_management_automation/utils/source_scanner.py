@@ -0,0 +1,414 @@
+"""
+Line-pattern scanner for source and documentation files.
+
+Task discovery (TODO/FIXME comments, Markdown checklists) and the sprint
+wishlist used to walk the whole tree with glob/rglob, filter ignored
+directories only afterwards, and re-read every file on every run. This
+engine:
+- takes its file list from the repository inventory, which prunes ignored
+  directories (.git, node_modules, virtualenvs, .gitignore entries) during
+  the walk
+- caches per-file matches in `.exarp/source_scan.json`, keyed by stat
+  signature and content hash, so repeat runs only read changed files
+- fans the changed files out across a process pool when there are enough of
+  them to amortize the worker start-up (regex matching holds the GIL, so
+  threads would not help)
+
+Patterns are matched against each line; a match records the line number and
+the pattern's groups.
+
+Environment:
+    EXARP_SCAN_WORKERS=4    # Worker processes (0 or 1 scans in-process)
+
+Usage:
+    from project_management_automation.utils.source_scanner import ScanRule, get_source_scanner
+
+    rule = ScanRule("todo", r'#\\s*(TODO|FIXME)[\\s:]+(.+)', re.IGNORECASE)
+    matches = get_source_scanner(project_root).scan(paths, [rule])
+    for rel_path, hits in matches.items():
+        for hit in hits:
+            hit["rule"], hit["line"], hit["groups"]
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_RELATIVE = Path(".exarp") / "source_scan.json"
+CACHE_VERSION = 1
+
+# Rule sets whose results are kept per file (oldest dropped first)
+MAX_RULE_SETS = 4
+
+# Fewer changed files than this are scanned in-process
+MIN_PARALLEL_FILES = 64
+# Files per task sent to a worker process
+BATCH_SIZE = 32
+MAX_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class ScanRule:
+    """A named line pattern."""
+
+    name: str
+    pattern: str
+    flags: int = 0
+
+
+def rules_key(rules: Sequence[ScanRule]) -> str:
+    """Digest identifying a rule set in the cache."""
+    payload = json.dumps([[r.name, r.pattern, int(r.flags)] for r in rules])
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def _glob_regex(pattern: str) -> re.Pattern:
+    """Translate a glob ('**/' spans directories, '*' does not) to a regex."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+def match_glob(rel_paths: Iterable[str], patterns: Sequence[str]) -> list[str]:
+    """
+    Select project-relative paths matching any of the glob patterns.
+
+    Args:
+        rel_paths: Paths relative to the project root (POSIX separators)
+        patterns: Glob patterns as accepted by Path.glob, e.g. '**/*.py'
+
+    Returns:
+        Matching paths, grouped by the first pattern they match (in pattern
+        order), each path once
+    """
+    regexes = [_glob_regex(p) for p in patterns]
+    buckets: list[list[str]] = [[] for _ in regexes]
+    for rel_path in rel_paths:
+        for bucket, regex in zip(buckets, regexes):
+            if regex.match(rel_path):
+                bucket.append(rel_path)
+                break
+    return [rel_path for bucket in buckets for rel_path in bucket]
+
+
+@lru_cache(maxsize=32)
+def _compiled(rules: tuple[ScanRule, ...]) -> list[tuple[str, re.Pattern]]:
+    return [(rule.name, re.compile(rule.pattern, rule.flags)) for rule in rules]
+
+
+def scan_file(path: str, rules: tuple[ScanRule, ...]) -> Optional[tuple[str, list[dict[str, Any]]]]:
+    """
+    Hash a file and match rules against its lines.
+
+    Args:
+        path: File path
+        rules: Rules to apply
+
+    Returns:
+        (content hash, matches) or None if the file cannot be read
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+    matches = []
+    compiled = _compiled(rules)
+    for line_num, line in enumerate(data.decode("utf-8", errors="ignore").split("\n"), 1):
+        for name, regex in compiled:
+            match = regex.search(line)
+            if match:
+                matches.append({
+                    "rule": name,
+                    "line": line_num,
+                    "groups": list(match.groups()) or [match.group(0)],
+                })
+    return content_hash, matches
+
+
+def _scan_batch(paths: list[str], rules: tuple[ScanRule, ...]) -> list[Optional[tuple[str, list[dict[str, Any]]]]]:
+    """Worker-process entry point."""
+    return [scan_file(path, rules) for path in paths]
+
+
+def _default_workers() -> int:
+    try:
+        return max(0, int(os.environ.get("EXARP_SCAN_WORKERS", "")))
+    except ValueError:
+        return min(MAX_WORKERS, os.cpu_count() or 1)
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    """Shared worker pool (recreated if a different size is requested)."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and _pool_workers != workers:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        if _pool is None:
+            # Never fork the server: it runs tools on threads that may hold locks
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            context = multiprocessing.get_context(method)
+            if method == "forkserver":
+                context.set_forkserver_preload([__name__])
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_scan_pool() -> None:
+    """Stop the worker processes (a new pool is started on next use)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_scan_pool)
+
+
+class SourceScanner:
+    """
+    Per-file rule matches keyed by path, stat signature and content hash.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(self, project_root: Union[Path, str], cache_file: Optional[Union[Path, str]] = None):
+        """
+        Initialize scanner.
+
+        Args:
+            project_root: Project root (paths are stored relative to it)
+            cache_file: Cache location (default: <root>/.exarp/source_scan.json)
+        """
+        self.project_root = Path(project_root)
+        self.cache_file = Path(cache_file) if cache_file else self.project_root / CACHE_FILE_RELATIVE
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "scanned": 0, "content_unchanged": 0, "errors": 0, "parallel_batches": 0}
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.cache_file, encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                    self._entries = data.get("files", {})
+            except FileNotFoundError:
+                pass
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Ignoring unreadable scan cache {self.cache_file}: {e}")
+        return self._entries
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def _scan_paths(
+        self, paths: list[str], rules: tuple[ScanRule, ...], workers: int
+    ) -> list[Optional[tuple[str, list[dict[str, Any]]]]]:
+        if workers > 1 and len(paths) >= MIN_PARALLEL_FILES:
+            batches = [paths[i:i + BATCH_SIZE] for i in range(0, len(paths), BATCH_SIZE)]
+            try:
+                pool = _process_pool(workers)
+                results = []
+                for batch in pool.map(_scan_batch, batches, [rules] * len(batches)):
+                    results.extend(batch)
+                with self._lock:
+                    self._stats["parallel_batches"] += len(batches)
+                return results
+            except (OSError, RuntimeError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel scan unavailable, scanning in-process: {e}")
+                shutdown_scan_pool()
+        return [scan_file(path, rules) for path in paths]
+
+    def scan(
+        self,
+        paths: Iterable[Union[Path, str]],
+        rules: Sequence[ScanRule],
+        workers: Optional[int] = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Match rules against files, re-reading only files that changed.
+
+        Args:
+            paths: Files (absolute or relative to the project root)
+            rules: Rules to apply to every line
+            workers: Worker processes for changed files (default:
+                $EXARP_SCAN_WORKERS or the CPU count, capped at MAX_WORKERS)
+
+        Returns:
+            Project-relative path -> list of matches ({'rule', 'line',
+            'groups'}), in input order; unreadable files are omitted
+        """
+        rules = tuple(rules)
+        key_for_rules = rules_key(rules)
+        workers = _default_workers() if workers is None else workers
+
+        found: dict[str, Optional[list[dict[str, Any]]]] = {}
+        stale: list[tuple[str, str, os.stat_result]] = []
+        with self._lock:
+            entries = self._load()
+            for path in paths:
+                path = Path(path)
+                if not path.is_absolute():
+                    path = self.project_root / path
+                key = self._key(path)
+                if key in found:
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entry = entries.get(key)
+                if (
+                    entry
+                    and entry.get("size") == st.st_size
+                    and entry.get("mtime_ns") == st.st_mtime_ns
+                    and key_for_rules in entry.get("results", {})
+                ):
+                    self._stats["hits"] += 1
+                    found[key] = entry["results"][key_for_rules]
+                else:
+                    found[key] = None
+                    stale.append((key, str(path), st))
+
+        scanned = self._scan_paths([path for _, path, _ in stale], rules, workers)
+
+        with self._lock:
+            entries = self._load()
+            for (key, _, st), result in zip(stale, scanned):
+                if result is None:
+                    self._stats["errors"] += 1
+                    found.pop(key, None)
+                    continue
+                content_hash, matches = result
+                self._stats["scanned"] += 1
+                entry = entries.get(key)
+                if entry and entry.get("hash") == content_hash:
+                    self._stats["content_unchanged"] += 1
+                    results = dict(entry.get("results", {}))
+                    results.pop(key_for_rules, None)
+                else:
+                    results = {}
+                results[key_for_rules] = matches
+                while len(results) > MAX_RULE_SETS:
+                    results.pop(next(iter(results)))
+                entries[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": content_hash, "results": results}
+                found[key] = matches
+                self._dirty = True
+        return found
+
+    def save(self) -> bool:
+        """
+        Persist the cache if anything changed, dropping entries for deleted files.
+
+        Returns:
+            True if the cache file was written
+        """
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return False
+            entries = {
+                key: entry for key, entry in self._entries.items()
+                if (self.project_root / key).exists()
+            }
+            self._entries = entries
+            payload = {"version": CACHE_VERSION, "files": entries}
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, separators=(",", ":"))
+                os.replace(tmp_file, self.cache_file)
+            except OSError as e:
+                logger.warning(f"Failed to save scan cache {self.cache_file}: {e}")
+                return False
+            self._dirty = False
+            return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scanner statistics."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries or {})}
+
+
+# Scanners keyed by resolved project root
+_scanners: dict[str, SourceScanner] = {}
+_scanners_lock = threading.Lock()
+
+
+def get_source_scanner(project_root: Union[Path, str]) -> SourceScanner:
+    """
+    Get the shared SourceScanner for a project root.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        SourceScanner instance shared by all callers for that root
+    """
+    path = Path(project_root)
+    try:
+        key = str(path.resolve())
+    except OSError:
+        key = str(path.absolute())
+
+    with _scanners_lock:
+        scanner = _scanners.get(key)
+        if scanner is None:
+            scanner = SourceScanner(path)
+            _scanners[key] = scanner
+        return scanner
+
+
+__all__ = [
+    "ScanRule",
+    "SourceScanner",
+    "get_source_scanner",
+    "match_glob",
+    "rules_key",
+    "scan_file",
+    "shutdown_scan_pool",
+]
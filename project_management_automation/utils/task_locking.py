@@ -5,7 +5,6 @@ Provides atomic task assignment operations that prevent two agents from
 working on the same task simultaneously.
 """
 
-import json
 import logging
 import time
 from datetime import datetime
@@ -14,10 +13,19 @@ from typing import Any, Optional
 
 from .file_lock import state_file_lock, task_lock
 from .project_root import find_project_root
+from .todo2_store import Todo2Store, get_todo2_store
 
 logger = logging.getLogger(__name__)
 
 
+def _backup_and_save(store: Todo2Store, state: dict[str, Any]) -> None:
+    """Back up the current state file and write the new state through the store."""
+    if store.state_file.exists():
+        backup_file = store.state_file.with_suffix('.json.bak')
+        backup_file.write_bytes(store.state_file.read_bytes())
+    store.save_state(state)
+
+
 def atomic_assign_task(
     task_id: str,
     assignee_name: str,
@@ -55,21 +63,18 @@ def atomic_assign_task(
     """
     try:
         with task_lock(task_id=task_id, timeout=timeout):
-            # Load state
-            project_root = find_project_root()
-            state_file = project_root / ".todo2" / "state.todo2.json"
+            # Load state (the store re-validates against the file under the lock)
+            store = get_todo2_store(find_project_root())
 
-            if not state_file.exists():
+            if not store.exists():
                 return (False, "State file not found")
 
-            # Load state (bypass cache during locked operation)
-            with open(state_file) as f:
-                state = json.load(f)
+            state = store.load_state_for_update()
 
             # Find task
             task = None
             task_index = -1
-            for i, t in enumerate(state.get("todos", [])):
+            for i, t in enumerate(state["todos"]):
                 if t.get("id") == task_id:
                     task = t
                     task_index = i
@@ -101,15 +106,8 @@ def atomic_assign_task(
             # Update in state
             state["todos"][task_index] = task
 
-            # Save state (atomic write)
-            # Create backup first
-            if state_file.exists():
-                backup_file = state_file.with_suffix('.json.bak')
-                backup_file.write_text(state_file.read_text())
-
-            # Write new state
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            # Save state (atomic write, backup first)
+            _backup_and_save(store, state)
 
             logger.info(f"Atomically assigned task {task_id} to {assignee_type}:{assignee_name}")
             return (True, None)
@@ -149,23 +147,21 @@ def atomic_check_and_assign(
     """
     try:
         with task_lock(task_id=task_id, timeout=timeout):
-            project_root = find_project_root()
-            state_file = project_root / ".todo2" / "state.todo2.json"
+            store = get_todo2_store(find_project_root())
 
-            if not state_file.exists():
+            if not store.exists():
                 return {
                     "success": False,
                     "assigned": False,
                     "reason": "State file not found",
                 }
 
-            with open(state_file) as f:
-                state = json.load(f)
+            state = store.load_state_for_update()
 
             # Find task
             task = None
             task_index = -1
-            for i, t in enumerate(state.get("todos", [])):
+            for i, t in enumerate(state["todos"]):
                 if t.get("id") == task_id:
                     task = t
                     task_index = i
@@ -201,12 +197,7 @@ def atomic_check_and_assign(
             state["todos"][task_index] = task
 
             # Save
-            if state_file.exists():
-                backup_file = state_file.with_suffix('.json.bak')
-                backup_file.write_text(state_file.read_text())
-
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            _backup_and_save(store, state)
 
             return {
                 "success": True,
@@ -258,10 +249,9 @@ def atomic_batch_assign(
     """
     try:
         with state_file_lock(timeout=timeout):
-            project_root = find_project_root()
-            state_file = project_root / ".todo2" / "state.todo2.json"
+            store = get_todo2_store(find_project_root())
 
-            if not state_file.exists():
+            if not store.exists():
                 return {
                     "success": False,
                     "assigned": [],
@@ -269,21 +259,16 @@ def atomic_batch_assign(
                     "total": len(task_ids),
                 }
 
-            with open(state_file) as f:
-                state = json.load(f)
+            state = store.load_state_for_update()
+            index_by_id = {t.get("id"): i for i, t in enumerate(state["todos"])}
 
             assigned = []
             failed = []
 
             for task_id in task_ids:
                 # Find task
-                task = None
-                task_index = -1
-                for i, t in enumerate(state.get("todos", [])):
-                    if t.get("id") == task_id:
-                        task = t
-                        task_index = i
-                        break
+                task_index = index_by_id.get(task_id, -1)
+                task = state["todos"][task_index] if task_index >= 0 else None
 
                 if task is None:
                     failed.append({"task_id": task_id, "reason": "Task not found"})
@@ -312,12 +297,7 @@ def atomic_batch_assign(
 
             # Save if any assignments made
             if assigned:
-                if state_file.exists():
-                    backup_file = state_file.with_suffix('.json.bak')
-                    backup_file.write_text(state_file.read_text())
-
-                with open(state_file, 'w') as f:
-                    json.dump(state, f, indent=2)
+                _backup_and_save(store, state)
 
             return {
                 "success": len(failed) == 0,
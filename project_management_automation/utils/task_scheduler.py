@@ -0,0 +1,198 @@
+"""
+DAG scheduler for automation jobs.
+
+Runs independent jobs (daily checks, nightly maintenance) concurrently on a
+bounded thread pool while keeping the results of a sequential run:
+- Explicit ordering via `depends_on`
+- Declared read/write sets on shared resources (e.g. 'todo2'): when a job
+  writes a resource that another job reads or writes, the one submitted
+  later waits for the earlier one, so conflicting writers never overlap
+- Per-job wall time plus the critical path (longest chain of measured
+  durations through the DAG), which bounds the achievable speedup
+
+Usage:
+    from project_management_automation.utils.task_scheduler import ScheduledJob, run_job_dag
+
+    jobs = [
+        ScheduledJob('cleanup', cleanup, writes=frozenset({'todo2'})),
+        ScheduledJob('duplicates', find_duplicates, reads=frozenset({'todo2'})),
+        ScheduledJob('docs', check_docs, reads=frozenset({'docs'})),
+    ]
+    report = run_job_dag(jobs, max_workers=4)
+    report['results']['docs'], report['critical_path_seconds']
+
+Jobs return a result dict; exceptions are caught and reported as
+{'status': 'error', 'error': ...} without stopping other jobs. Jobs run in a
+copy of the caller's context, so when the calling tool call is cancelled
+(see tool_executor), jobs not yet started are reported as
+{'status': 'cancelled'} instead of running.
+"""
+
+import contextvars
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .dependency_graph import DependencyGraph
+from .tool_executor import cancellation_requested
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class ScheduledJob:
+    """One schedulable unit of work."""
+
+    job_id: str
+    run: Callable[[], dict[str, Any]]
+    reads: frozenset[str] = frozenset()
+    writes: frozenset[str] = frozenset()
+    depends_on: tuple[str, ...] = ()
+
+
+def _conflicts(earlier: ScheduledJob, later: ScheduledJob) -> bool:
+    """Check whether two jobs touch a shared resource and at least one writes it."""
+    return bool(
+        earlier.writes & (later.reads | later.writes)
+        or later.writes & earlier.reads
+    )
+
+
+def build_job_graph(jobs: list[ScheduledJob]) -> DependencyGraph:
+    """
+    Build the execution DAG for a list of jobs.
+
+    Edges come from explicit `depends_on` entries (unknown IDs are ignored)
+    and from resource conflicts, which are ordered by position in `jobs`.
+    If explicit dependencies contradict that order and form a cycle, the
+    jobs are chained in list order instead.
+
+    Args:
+        jobs: Jobs in submission (priority) order
+
+    Returns:
+        DependencyGraph with an edge a -> b when b must wait for a
+    """
+    job_ids = [job.job_id for job in jobs]
+    known = set(job_ids)
+    edges: dict[tuple[str, str], None] = {}
+
+    for job in jobs:
+        for dep in job.depends_on:
+            if dep in known and dep != job.job_id:
+                edges[(dep, job.job_id)] = None
+
+    for i, earlier in enumerate(jobs):
+        for later in jobs[i + 1:]:
+            if _conflicts(earlier, later):
+                edges[(earlier.job_id, later.job_id)] = None
+
+    graph = DependencyGraph(nodes=job_ids, edges=edges)
+    if not graph.is_dag():
+        logger.warning(f"Job dependencies form a cycle {graph.cycles()[0]}; running jobs sequentially")
+        graph = DependencyGraph(nodes=job_ids, edges=zip(job_ids, job_ids[1:]))
+    return graph
+
+
+def run_job_dag(jobs: list[ScheduledJob], max_workers: int = DEFAULT_MAX_WORKERS) -> dict[str, Any]:
+    """
+    Run jobs as a DAG on a bounded worker pool.
+
+    Ready jobs are started in list order as workers free up. A failed job
+    does not block its dependents (they only wait for it to finish).
+
+    Args:
+        jobs: Jobs in submission (priority) order; job IDs must be unique
+        max_workers: Maximum number of jobs running at once
+
+    Returns:
+        Dictionary with:
+        - results: job_id -> result dict
+        - timings: job_id -> {'start', 'end', 'duration'} (seconds from scheduler start)
+        - wall_seconds: Total elapsed time
+        - serial_seconds: Sum of job durations (time a sequential run would take)
+        - critical_path / critical_path_seconds: Longest chain of measured durations
+        - waves: Jobs grouped by dependency level
+        - max_workers: Worker pool size used
+    """
+    by_id = {job.job_id: job for job in jobs}
+    if len(by_id) != len(jobs):
+        raise ValueError("Job IDs must be unique")
+
+    graph = build_job_graph(jobs)
+    order = {job_id: i for i, job_id in enumerate(by_id)}
+    waiting_on = {job_id: len(graph.predecessors(job_id)) for job_id in by_id}
+    results: dict[str, dict[str, Any]] = {}
+    timings: dict[str, dict[str, float]] = {}
+    started_at = time.perf_counter()
+
+    def run_timed(job: ScheduledJob) -> dict[str, Any]:
+        start = time.perf_counter()
+        if cancellation_requested():
+            offset = round(start - started_at, 3)
+            timings[job.job_id] = {'start': offset, 'end': offset, 'duration': 0.0}
+            return {'status': 'cancelled', 'error': 'Cancelled before start'}
+        try:
+            result = job.run()
+            if not isinstance(result, dict):
+                result = {'status': 'success', 'summary': {'output': str(result)[:500]}}
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {e}", exc_info=True)
+            result = {'status': 'error', 'error': str(e)}
+        end = time.perf_counter()
+        timings[job.job_id] = {
+            'start': round(start - started_at, 3),
+            'end': round(end - started_at, 3),
+            'duration': end - start,
+        }
+        return result
+
+    workers = max(1, min(max_workers, len(jobs))) if jobs else 1
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job-dag") as pool:
+        running: dict[Future, str] = {}
+
+        def submit(job_ids: list[str]) -> None:
+            for job_id in sorted(job_ids, key=order.__getitem__):
+                logger.debug(f"Starting job {job_id}")
+                running[pool.submit(contextvars.copy_context().run, run_timed, by_id[job_id])] = job_id
+
+        submit([job_id for job_id, count in waiting_on.items() if count == 0])
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            ready = []
+            for future in done:
+                job_id = running.pop(future)
+                results[job_id] = future.result()
+                for successor in graph.successors(job_id):
+                    waiting_on[successor] -= 1
+                    if waiting_on[successor] == 0:
+                        ready.append(successor)
+            submit(ready)
+
+    def duration(job_id: str) -> float:
+        return timings.get(job_id, {}).get('duration', 0.0)
+
+    critical = graph.critical_paths(weight=duration)
+    critical_path = graph.longest_path(weight=duration)
+    return {
+        'results': results,
+        'timings': timings,
+        'wall_seconds': time.perf_counter() - started_at,
+        'serial_seconds': sum(duration(job_id) for job_id in by_id),
+        'critical_path': critical_path,
+        'critical_path_seconds': critical.length,
+        'waves': graph.levels(),
+        'max_workers': workers,
+    }
+
+
+__all__ = [
+    "DEFAULT_MAX_WORKERS",
+    "ScheduledJob",
+    "build_job_graph",
+    "run_job_dag",
+]
@@ -0,0 +1,363 @@
+"""
+Test impact analysis and timing-balanced sharding for pytest.
+
+Selects the tests affected by files changed since a git ref, using the
+per-test coverage contexts recorded by a previous `pytest --cov
+--cov-context=test` run (the `.coverage` SQLite database), and splits the
+selection into shards of roughly equal expected duration using the timings
+of previous runs.
+
+Selection is conservative: when a change cannot be mapped to tests (a new
+or uncovered Python file, conftest.py, packaging/config files, any other
+non-Python file except documentation and images, or no coverage data at
+all) the whole test path is selected.
+
+Usage:
+    from project_management_automation.utils.test_impact import (
+        get_changed_files, load_coverage_map, select_tests, TestTimings, shard_items,
+    )
+
+    changed = get_changed_files(project_root, "origin/main")
+    selection = select_tests(project_root, changed, load_coverage_map(project_root / ".coverage"))
+    shards = shard_items(selection.items, 4, TestTimings(project_root).durations())
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+TIMINGS_FILE_RELATIVE = Path(".exarp") / "test_timings.json"
+
+# Changes to these files can affect any test
+GLOBAL_FILES = frozenset({
+    'conftest.py', 'pytest.ini', 'pyproject.toml', 'setup.cfg', 'setup.py', 'tox.ini',
+    'requirements.txt', 'requirements-dev.txt',
+})
+
+# Non-Python files that cannot change test outcomes (documentation, images);
+# any other non-Python change (data, fixtures, templates, config) runs all tests
+NON_CODE_SUFFIXES = frozenset({
+    '.md', '.rst', '.adoc', '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico',
+})
+
+# Expected duration (seconds) of a test with no recorded timing
+DEFAULT_TEST_SECONDS = 1.0
+
+
+def get_changed_files(project_root: Path, since: str, timeout: int = 30) -> set[str]:
+    """
+    Files changed since a git ref, including uncommitted and untracked files.
+
+    Args:
+        project_root: Repository root
+        since: Git ref to compare against (e.g. "HEAD~1", "origin/main")
+        timeout: Timeout per git command in seconds
+
+    Returns:
+        Set of paths relative to the repository root (POSIX separators)
+
+    Raises:
+        RuntimeError: If git fails (unknown ref, not a repository)
+    """
+    changed: set[str] = set()
+    for cmd in (
+        ['git', 'diff', '--name-only', since],
+        ['git', 'ls-files', '--others', '--exclude-standard'],
+    ):
+        result = subprocess.run(cmd, cwd=str(project_root), capture_output=True, text=True, timeout=timeout)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(cmd)} failed: {result.stderr.strip()}")
+        changed.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return changed
+
+
+def _context_to_nodeid(context: str) -> Optional[str]:
+    """Map a pytest-cov context ("nodeid|run") to a test node id."""
+    nodeid = context.split('|', 1)[0]
+    return nodeid if '::' in nodeid else None
+
+
+def load_coverage_map(coverage_file: Union[Path, str], project_root: Optional[Path] = None) -> dict[str, set[str]]:
+    """
+    Read per-test contexts from a coverage.py data file.
+
+    Args:
+        coverage_file: Path to the `.coverage` SQLite database
+        project_root: Root used to relativize measured file paths
+
+    Returns:
+        Measured file (relative path) -> node ids of tests that executed it.
+        Empty if the file is missing, unreadable or has no test contexts.
+    """
+    coverage_file = Path(coverage_file)
+    if not coverage_file.exists():
+        return {}
+    root = str(project_root or coverage_file.parent)
+
+    try:
+        conn = sqlite3.connect(f"file:{coverage_file}?mode=ro", uri=True)
+    except sqlite3.Error as e:
+        logger.warning(f"Cannot open coverage data {coverage_file}: {e}")
+        return {}
+
+    coverage_map: dict[str, set[str]] = {}
+    try:
+        files = dict(conn.execute("SELECT id, path FROM file"))
+        contexts = {
+            cid: nodeid for cid, ctx in conn.execute("SELECT id, context FROM context")
+            if (nodeid := _context_to_nodeid(ctx))
+        }
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        pairs = []
+        for table in ('line_bits', 'arc'):
+            if table in tables:
+                pairs.extend(conn.execute(f"SELECT DISTINCT file_id, context_id FROM {table}"))
+    except sqlite3.Error as e:
+        logger.warning(f"Unreadable coverage data {coverage_file}: {e}")
+        return {}
+    finally:
+        conn.close()
+
+    for file_id, context_id in pairs:
+        nodeid = contexts.get(context_id)
+        path = files.get(file_id)
+        if nodeid is None or path is None:
+            continue
+        rel = os.path.relpath(path, root) if os.path.isabs(path) else path
+        coverage_map.setdefault(Path(rel).as_posix(), set()).add(nodeid)
+    return coverage_map
+
+
+@dataclass
+class TestSelection:
+    """Tests chosen for a change set."""
+
+    __test__ = False  # Not a pytest test class
+
+    items: list[str]  # Node ids or test file paths to pass to pytest
+    full: bool  # True if the whole test path was selected
+    reason: str
+    changed_files: list[str] = field(default_factory=list)
+
+
+def select_tests(
+    project_root: Path,
+    changed: Iterable[str],
+    coverage_map: dict[str, set[str]],
+    test_path: str = 'tests',
+) -> TestSelection:
+    """
+    Select the tests affected by a set of changed files.
+
+    Args:
+        project_root: Repository root
+        changed: Changed files relative to the root
+        coverage_map: Output of load_coverage_map()
+        test_path: Test directory (relative to the root) used for a full run
+
+    Returns:
+        TestSelection (items is empty if nothing relevant changed)
+    """
+    changed = sorted(set(changed))
+    full = TestSelection([test_path], True, '', changed)
+    if not coverage_map:
+        full.reason = 'no per-test coverage data (run with coverage=True first)'
+        return full
+
+    test_prefix = test_path.rstrip('/') + '/'
+    items: set[str] = set()
+    for rel in changed:
+        name = rel.rsplit('/', 1)[-1]
+        if name in GLOBAL_FILES:
+            full.reason = f'{rel} affects all tests'
+            return full
+        if not rel.endswith('.py'):
+            if Path(rel).suffix.lower() in NON_CODE_SUFFIXES or name.startswith('LICENSE'):
+                continue
+            full.reason = f'{rel} is not Python and may be read by tests'
+            return full
+        if rel.startswith(test_prefix) and name.startswith('test_'):
+            # Changed or new test module: run it entirely (if it still exists)
+            if (project_root / rel).exists():
+                items.add(rel)
+            continue
+        if rel in coverage_map:
+            items.update(coverage_map[rel])
+        elif (project_root / rel).exists():
+            full.reason = f'{rel} has no coverage data'
+            return full
+
+    # A whole test module supersedes individual node ids inside it
+    modules = {item for item in items if '::' not in item}
+    selected = sorted(item for item in items if item.split('::', 1)[0] not in modules or '::' not in item)
+    reason = f'{len(selected)} test(s)/module(s) affected by {len(changed)} changed file(s)'
+    return TestSelection(selected, False, reason, changed)
+
+
+def junit_testcases(junit_file: Union[Path, str]) -> list[ET.Element]:
+    """All <testcase> elements of a JUnit XML file ([] if unreadable)."""
+    try:
+        return list(ET.parse(junit_file).getroot().iter('testcase'))
+    except (OSError, ET.ParseError) as e:
+        logger.debug(f"Cannot parse JUnit XML {junit_file}: {e}")
+        return []
+
+
+def testcase_nodeid(testcase: ET.Element, project_root: Path) -> Optional[str]:
+    """
+    Reconstruct a pytest node id from a JUnit <testcase>.
+
+    pytest writes classname as the module path with dots plus any classes
+    ("tests.test_x.TestY"); the longest prefix naming an existing file is
+    taken as the module.
+    """
+    classname = testcase.get('classname', '')
+    name = testcase.get('name', '')
+    if not classname or not name:
+        return None
+    parts = classname.split('.')
+    for i in range(len(parts), 0, -1):
+        module = '/'.join(parts[:i]) + '.py'
+        if (project_root / module).exists():
+            return '::'.join([module, *parts[i:], name])
+    return None
+
+
+def merge_junit(shard_files: Iterable[Union[Path, str]], output_file: Union[Path, str]) -> dict[str, Any]:
+    """
+    Merge per-shard JUnit XML files into one <testsuites> document.
+
+    Args:
+        shard_files: JUnit XML files (missing/unreadable files are skipped)
+        output_file: Merged file to write
+
+    Returns:
+        Totals: tests, failures, errors, skipped, time
+    """
+    merged = ET.Element('testsuites')
+    totals = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0, 'time': 0.0}
+    for shard_file in shard_files:
+        try:
+            root = ET.parse(shard_file).getroot()
+        except (OSError, ET.ParseError) as e:
+            logger.warning(f"Skipping unreadable shard result {shard_file}: {e}")
+            continue
+        suites = [root] if root.tag == 'testsuite' else list(root.iter('testsuite'))
+        for suite in suites:
+            merged.append(suite)
+            for key in ('tests', 'failures', 'errors', 'skipped'):
+                totals[key] += int(suite.get(key, 0))
+            # Shards run in parallel: wall time is the slowest shard
+            totals['time'] = max(totals['time'], float(suite.get('time', 0)))
+
+    for key, value in totals.items():
+        merged.set(key, str(round(value, 3) if key == 'time' else value))
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(merged).write(output_file, encoding='utf-8', xml_declaration=True)
+    return totals
+
+
+class TestTimings:
+    """Per-test durations from previous runs (`.exarp/test_timings.json`)."""
+
+    __test__ = False  # Not a pytest test class
+
+    def __init__(self, project_root: Path, timings_file: Optional[Union[Path, str]] = None):
+        self.project_root = Path(project_root)
+        self.timings_file = Path(timings_file) if timings_file else self.project_root / TIMINGS_FILE_RELATIVE
+        self._timings: Optional[dict[str, float]] = None
+
+    def durations(self) -> dict[str, float]:
+        """Node id -> last recorded duration in seconds."""
+        if self._timings is None:
+            try:
+                with open(self.timings_file, encoding='utf-8') as f:
+                    data = json.load(f)
+                self._timings = {k: float(v) for k, v in data.get('tests', {}).items()}
+            except FileNotFoundError:
+                self._timings = {}
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Ignoring unreadable test timings {self.timings_file}: {e}")
+                self._timings = {}
+        return self._timings
+
+    def update_from_junit(self, junit_file: Union[Path, str]) -> int:
+        """
+        Record durations from a JUnit XML file and save.
+
+        Returns:
+            Number of test durations recorded
+        """
+        timings = self.durations()
+        recorded = 0
+        for testcase in junit_testcases(junit_file):
+            nodeid = testcase_nodeid(testcase, self.project_root)
+            if nodeid:
+                timings[nodeid] = float(testcase.get('time', 0) or 0)
+                recorded += 1
+        if recorded:
+            try:
+                self.timings_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.timings_file.with_name(f"{self.timings_file.name}.{os.getpid()}.tmp")
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump({'tests': timings}, f, separators=(',', ':'), sort_keys=True)
+                os.replace(tmp_file, self.timings_file)
+            except OSError as e:
+                logger.warning(f"Failed to save test timings {self.timings_file}: {e}")
+        return recorded
+
+
+def estimate_duration(item: str, timings: dict[str, float]) -> float:
+    """Expected duration of a node id, module or directory from recorded timings."""
+    if item in timings:
+        return timings[item]
+    prefix = item.rstrip('/') + ('/' if not item.endswith('.py') else '::')
+    known = [seconds for nodeid, seconds in timings.items() if nodeid.startswith(prefix)]
+    return sum(known) if known else DEFAULT_TEST_SECONDS
+
+
+def shard_items(items: list[str], shards: int, timings: dict[str, float]) -> list[list[str]]:
+    """
+    Split test items into shards of similar expected duration.
+
+    Longest-processing-time-first: items are placed, slowest first, on the
+    currently lightest shard.
+
+    Args:
+        items: Node ids, test modules or directories
+        shards: Number of shards
+        timings: Recorded durations (TestTimings.durations())
+
+    Returns:
+        Non-empty shards (at most `shards`)
+    """
+    shards = max(1, min(shards, len(items)))
+    bins: list[tuple[float, list[str]]] = [(0.0, []) for _ in range(shards)]
+    for item in sorted(items, key=lambda i: (-estimate_duration(i, timings), i)):
+        index = min(range(shards), key=lambda b: bins[b][0])
+        load, members = bins[index]
+        members.append(item)
+        bins[index] = (load + estimate_duration(item, timings), members)
+    return [members for _, members in bins if members]
+
+
+__all__ = [
+    "TestSelection",
+    "TestTimings",
+    "estimate_duration",
+    "get_changed_files",
+    "junit_testcases",
+    "load_coverage_map",
+    "merge_junit",
+    "select_tests",
+    "shard_items",
+    "testcase_nodeid",
+]
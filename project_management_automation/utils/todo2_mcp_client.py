@@ -12,6 +12,8 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .todo2_store import get_todo2_store
+
 logger = logging.getLogger(__name__)
 
 # Try to import MCP client library
@@ -25,11 +27,12 @@ except ImportError:
 
 # Import session pool from mcp_client if available
 try:
-    from project_management_automation.scripts.base.mcp_client import _session_pool
+    from project_management_automation.scripts.base.mcp_client import _session_pool, run_mcp_sync
     POOL_AVAILABLE = True
 except ImportError:
     POOL_AVAILABLE = False
     _session_pool = None
+    run_mcp_sync = None
 
 
 def _load_mcp_config(project_root: Path) -> dict:
@@ -53,20 +56,29 @@ def _load_mcp_config(project_root: Path) -> dict:
         return {}
 
 
-def _load_todo2_file(project_root: Path) -> Optional[dict]:
-    """Fallback: Load Todo2 state directly from file."""
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    if not todo2_file.exists():
+def _load_todo2_file(project_root: Path, for_update: bool = False) -> Optional[dict]:
+    """
+    Fallback: Load Todo2 state from the shared store.
+
+    Readers get the shared read-only snapshot; writers pass for_update=True
+    to get a private copy and persist it with _save_todo2_file().
+    """
+    store = get_todo2_store(project_root)
+    if not store.exists():
         return None
     
     try:
-        with open(todo2_file) as f:
-            return json.load(f)
+        return store.load_state_for_update() if for_update else store.load_state()
     except Exception as e:
         logger.error(f"Failed to load Todo2 file: {e}")
         return None
 
 
+def _save_todo2_file(project_root: Path, state: dict) -> None:
+    """Fallback: Persist Todo2 state through the shared store."""
+    get_todo2_store(project_root).save_state(state)
+
+
 async def _call_todo2_tool(tool_name: str, arguments: dict, project_root: Path) -> Optional[dict]:
     """Call a Todo2 tool via MCP with connection pooling."""
     if not MCP_CLIENT_AVAILABLE:
@@ -141,7 +153,11 @@ async def _call_todo2_tool(tool_name: str, arguments: dict, project_root: Path)
 def _call_todo2_tool_sync(tool_name: str, arguments: dict, project_root: Path) -> Optional[dict]:
     """Synchronous wrapper for async Todo2 tool calls."""
     try:
-        return asyncio.run(_call_todo2_tool(tool_name, arguments, project_root))
+        coro = _call_todo2_tool(tool_name, arguments, project_root)
+        if POOL_AVAILABLE and MCP_CLIENT_AVAILABLE:
+            # Shared long-lived loop keeps pooled sessions warm between calls
+            return run_mcp_sync(coro)
+        return asyncio.run(coro)
     except Exception as e:
         logger.error(f"Failed to call Todo2 tool {tool_name} (sync): {e}")
         return None
@@ -276,40 +292,39 @@ def create_todos_mcp(
     
     # Fallback to file access
     logger.debug("Falling back to direct file access for create_todos")
-    state = _load_todo2_file(project_root)
-    if state is None:
-        logger.error("Cannot create todos: Todo2 state file not found")
-        return None
-    
-    tasks = state.get('tasks', [])
-    created_ids = []
-    
-    # Generate IDs and add tasks
-    for todo in todos:
-        # Generate simple ID (in real Todo2, IDs are more complex)
-        task_id = f"T-{len(tasks) + len(created_ids) + 1}"
-        task = {
-            'id': task_id,
-            'name': todo.get('name', ''),
-            'long_description': todo.get('long_description', ''),
-            'status': todo.get('status', 'Todo'),
-            'priority': todo.get('priority', 'medium'),
-            'tags': todo.get('tags', []),
-            'dependencies': todo.get('dependencies', []),
-        }
-        tasks.append(task)
-        created_ids.append(task_id)
-    
-    # Write back to file
-    state['tasks'] = tasks
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    try:
-        with open(todo2_file, 'w') as f:
-            json.dump(state, f, indent=2)
-        return created_ids
-    except Exception as e:
-        logger.error(f"Failed to write Todo2 file: {e}")
-        return None
+    with get_todo2_store(project_root).write_lock():
+        state = _load_todo2_file(project_root, for_update=True)
+        if state is None:
+            logger.error("Cannot create todos: Todo2 state file not found")
+            return None
+    
+        tasks = state.get('tasks', [])
+        created_ids = []
+    
+        # Generate IDs and add tasks
+        for todo in todos:
+            # Generate simple ID (in real Todo2, IDs are more complex)
+            task_id = f"T-{len(tasks) + len(created_ids) + 1}"
+            task = {
+                'id': task_id,
+                'name': todo.get('name', ''),
+                'long_description': todo.get('long_description', ''),
+                'status': todo.get('status', 'Todo'),
+                'priority': todo.get('priority', 'medium'),
+                'tags': todo.get('tags', []),
+                'dependencies': todo.get('dependencies', []),
+            }
+            tasks.append(task)
+            created_ids.append(task_id)
+    
+        # Write back to file
+        state['tasks'] = tasks
+        try:
+            _save_todo2_file(project_root, state)
+            return created_ids
+        except Exception as e:
+            logger.error(f"Failed to write Todo2 file: {e}")
+            return None
 
 
 def update_todos_mcp(
@@ -355,40 +370,39 @@ def update_todos_mcp(
     
     # Fallback to file access
     logger.debug("Falling back to direct file access for update_todos")
-    state = _load_todo2_file(project_root)
-    if state is None:
-        logger.error("Cannot update todos: Todo2 state file not found")
-        return False
-    
-    tasks = state.get('tasks', [])
-    task_dict = {t.get('id'): t for t in tasks}
-    
-    # Apply updates
-    for update in updates:
-        task_id = update.get('id')
-        if task_id not in task_dict:
-            logger.warning(f"Task {task_id} not found for update")
-            continue
+    with get_todo2_store(project_root).write_lock():
+        state = _load_todo2_file(project_root, for_update=True)
+        if state is None:
+            logger.error("Cannot update todos: Todo2 state file not found")
+            return False
+    
+        tasks = state.get('tasks', [])
+        task_dict = {t.get('id'): t for t in tasks}
+    
+        # Apply updates
+        for update in updates:
+            task_id = update.get('id')
+            if task_id not in task_dict:
+                logger.warning(f"Task {task_id} not found for update")
+                continue
         
-        task = task_dict[task_id]
-        # Update fields (normalize status if present)
-        for key, value in update.items():
-            if key != 'id':
-                if key == 'status':
-                    from .todo2_utils import normalize_status_to_title_case
-                    value = normalize_status_to_title_case(value)
-                task[key] = value
-    
-    # Write back to file
-    state['tasks'] = list(task_dict.values())
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    try:
-        with open(todo2_file, 'w') as f:
-            json.dump(state, f, indent=2)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to write Todo2 file: {e}")
-        return False
+            task = task_dict[task_id]
+            # Update fields (normalize status if present)
+            for key, value in update.items():
+                if key != 'id':
+                    if key == 'status':
+                        from .todo2_utils import normalize_status_to_title_case
+                        value = normalize_status_to_title_case(value)
+                    task[key] = value
+    
+        # Write back to file
+        state['tasks'] = list(task_dict.values())
+        try:
+            _save_todo2_file(project_root, state)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write Todo2 file: {e}")
+            return False
 
 
 def get_todo_details_mcp(
@@ -480,29 +494,28 @@ def add_comments_mcp(
     
     # Fallback to file access
     logger.debug("Falling back to direct file access for add_comments")
-    state = _load_todo2_file(project_root)
-    if state is None:
-        logger.error("Cannot add comments: Todo2 state file not found")
-        return False
-    
-    # Ensure comments structure exists
-    if 'comments' not in state:
-        state['comments'] = []
-    
-    # Add comments
-    for comment in comments:
-        comment['todoId'] = todo_id
-        state['comments'].append(comment)
-    
-    # Write back to file
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    try:
-        with open(todo2_file, 'w') as f:
-            json.dump(state, f, indent=2)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to write Todo2 file: {e}")
-        return False
+    with get_todo2_store(project_root).write_lock():
+        state = _load_todo2_file(project_root, for_update=True)
+        if state is None:
+            logger.error("Cannot add comments: Todo2 state file not found")
+            return False
+    
+        # Ensure comments structure exists
+        if 'comments' not in state:
+            state['comments'] = []
+    
+        # Add comments
+        for comment in comments:
+            comment['todoId'] = todo_id
+            state['comments'].append(comment)
+    
+        # Write back to file
+        try:
+            _save_todo2_file(project_root, state)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write Todo2 file: {e}")
+            return False
 
 
 def delete_todos_mcp(
@@ -536,28 +549,27 @@ def delete_todos_mcp(
     
     # Fallback to file access
     logger.debug("Falling back to direct file access for delete_todos")
-    state = _load_todo2_file(project_root)
-    if state is None:
-        logger.error("Cannot delete todos: Todo2 state file not found")
-        return False
-    
-    tasks = state.get('tasks', [])
-    # Filter out deleted tasks
-    state['tasks'] = [t for t in tasks if t.get('id') not in ids]
-    
-    # Also remove associated comments
-    if 'comments' in state:
-        state['comments'] = [c for c in state.get('comments', []) if c.get('todoId') not in ids]
-    
-    # Write back to file
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
-    try:
-        with open(todo2_file, 'w') as f:
-            json.dump(state, f, indent=2)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to write Todo2 file: {e}")
-        return False
+    with get_todo2_store(project_root).write_lock():
+        state = _load_todo2_file(project_root, for_update=True)
+        if state is None:
+            logger.error("Cannot delete todos: Todo2 state file not found")
+            return False
+    
+        tasks = state.get('tasks', [])
+        # Filter out deleted tasks
+        state['tasks'] = [t for t in tasks if t.get('id') not in ids]
+    
+        # Also remove associated comments
+        if 'comments' in state:
+            state['comments'] = [c for c in state.get('comments', []) if c.get('todoId') not in ids]
+    
+        # Write back to file
+        try:
+            _save_todo2_file(project_root, state)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write Todo2 file: {e}")
+            return False
 
 
 __all__ = [
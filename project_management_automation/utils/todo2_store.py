@@ -0,0 +1,301 @@
+"""
+Shared in-process Todo2 state store.
+
+Parses `.todo2/state.todo2.json` once per on-disk version and serves every
+reader from the same snapshot:
+- Invalidation on inode, mtime (ns) or size change (one stat per access)
+- Indexes by task ID, canonical status, tag and branch
+- Write-through saves that prime the snapshot without re-parsing
+- Thread-safe reloads
+
+Usage:
+    from project_management_automation.utils.todo2_store import get_todo2_store
+
+    store = get_todo2_store()
+    tasks = store.get_tasks()
+    task = store.get_task("T-123")
+    pending = store.get_tasks_by_status("todo")
+
+Snapshots are shared between callers; treat returned dicts as read-only.
+Writers should copy what they modify and persist via `save_state()`; hold
+`write_lock()` around the cycle when other processes may write concurrently.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .branch_utils import get_task_branch
+from .project_root import find_project_root
+from .todo2_utils import normalize_status
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE_RELATIVE = Path(".todo2") / "state.todo2.json"
+
+
+class Todo2Snapshot:
+    """Immutable view of one parsed version of the Todo2 state file."""
+
+    def __init__(self, data: dict[str, Any], fingerprint: Optional[tuple[int, int, int]]):
+        self.data = data
+        self.fingerprint = fingerprint
+        self.tasks: list[dict[str, Any]] = [t for t in data.get("todos", []) if isinstance(t, dict)]
+
+        self.by_id: dict[str, dict[str, Any]] = {}
+        self.by_status: dict[str, list[dict[str, Any]]] = {}
+        self.by_tag: dict[str, list[dict[str, Any]]] = {}
+        self.by_branch: dict[str, list[dict[str, Any]]] = {}
+
+        for task in self.tasks:
+            task_id = task.get("id")
+            if task_id:
+                self.by_id[task_id] = task
+            self.by_status.setdefault(normalize_status(task.get("status", "")), []).append(task)
+            for tag in task.get("tags") or []:
+                self.by_tag.setdefault(tag, []).append(task)
+            self.by_branch.setdefault(get_task_branch(task), []).append(task)
+
+
+class Todo2Store:
+    """
+    Process-wide cache of the Todo2 state file for one project root.
+
+    Each accessor validates the snapshot with a single `stat()` call and
+    re-parses only when the file was replaced or modified.
+    """
+
+    def __init__(self, project_root: Union[Path, str]):
+        """
+        Initialize store.
+
+        Args:
+            project_root: Project root containing the `.todo2` directory
+        """
+        self.project_root = Path(project_root)
+        self.state_file = self.project_root / STATE_FILE_RELATIVE
+
+        self._snapshot: Optional[Todo2Snapshot] = None
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "loads": 0, "saves": 0, "errors": 0}
+
+    @staticmethod
+    def _fingerprint(st: os.stat_result) -> tuple[int, int, int]:
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _stat(self) -> Optional[os.stat_result]:
+        try:
+            return self.state_file.stat()
+        except OSError:
+            return None
+
+    def snapshot(self) -> Todo2Snapshot:
+        """
+        Get the current snapshot, re-parsing only if the file changed.
+
+        Returns:
+            Todo2Snapshot (empty if the state file is missing or invalid)
+        """
+        st = self._stat()
+        fingerprint = self._fingerprint(st) if st else None
+
+        with self._lock:
+            if self._snapshot is not None and self._snapshot.fingerprint == fingerprint:
+                self._stats["hits"] += 1
+                return self._snapshot
+
+            data: dict[str, Any] = {"todos": []}
+            if st is not None:
+                try:
+                    with open(self.state_file, encoding="utf-8") as f:
+                        loaded = json.load(f)
+                    if isinstance(loaded, dict):
+                        data = loaded
+                        data.setdefault("todos", [])
+                    self._stats["loads"] += 1
+                except (OSError, json.JSONDecodeError) as e:
+                    self._stats["errors"] += 1
+                    logger.error(f"Error loading Todo2 state {self.state_file}: {e}")
+                    fingerprint = None
+
+            self._snapshot = Todo2Snapshot(data, fingerprint)
+            return self._snapshot
+
+    @property
+    def version(self) -> Optional[tuple[int, int, int]]:
+        """Fingerprint (inode, mtime_ns, size) of the current state file version."""
+        return self.snapshot().fingerprint
+
+    def exists(self) -> bool:
+        """Check whether the state file exists on disk."""
+        return self.state_file.exists()
+
+    def load_state(self) -> dict[str, Any]:
+        """Get the full parsed state dict (shared, read-only)."""
+        return self.snapshot().data
+
+    def get_tasks(self) -> list[dict[str, Any]]:
+        """Get all tasks (shared, read-only)."""
+        return self.snapshot().tasks
+
+    def get_task(self, task_id: str) -> Optional[dict[str, Any]]:
+        """Get a task by ID, or None if not found."""
+        return self.snapshot().by_id.get(task_id)
+
+    def get_tasks_by_status(self, status: str) -> list[dict[str, Any]]:
+        """
+        Get tasks with the given status.
+
+        Args:
+            status: Any status spelling; matched on its canonical form (see normalize_status)
+        """
+        return self.snapshot().by_status.get(normalize_status(status), [])
+
+    def get_tasks_by_tag(self, tag: str) -> list[dict[str, Any]]:
+        """Get tasks carrying the given tag."""
+        return self.snapshot().by_tag.get(tag, [])
+
+    def get_tasks_by_branch(self, branch: str) -> list[dict[str, Any]]:
+        """Get tasks on the given branch (tasks without a branch tag are on 'main')."""
+        return self.snapshot().by_branch.get(branch, [])
+
+    def load_state_for_update(self) -> dict[str, Any]:
+        """
+        Read a private, mutable copy of the state for a read-modify-write cycle.
+
+        Always reads from disk so writers see changes made by other processes;
+        pair with `save_state()`, which makes the written dict the new snapshot.
+
+        Returns:
+            Freshly parsed state dict (with a 'todos' key)
+        """
+        with open(self.state_file, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            data = {"todos": []}
+        data.setdefault("todos", [])
+        return data
+
+    @contextmanager
+    def write_lock(self, timeout: float = 10.0) -> Iterator[None]:
+        """
+        Hold the cross-process state file lock for a read-modify-write cycle.
+
+        Uses the same lock file as file_lock.state_file_lock(). The lock is not
+        reentrant: do not nest write_lock() blocks within one thread.
+
+        Args:
+            timeout: Maximum time to wait for the lock (seconds)
+        """
+        from .file_lock import FileLock
+
+        if not self.state_file.parent.is_dir():
+            # No Todo2 directory yet: nothing to protect, don't create one
+            yield
+            return
+
+        lock = FileLock(self.state_file.with_name(self.state_file.name + ".lock"), timeout=timeout)
+        if not lock.acquire(blocking=True):
+            raise RuntimeError(f"Failed to acquire lock for {self.state_file}")
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def save_state(self, state: dict[str, Any], indent: Optional[int] = 2) -> None:
+        """
+        Atomically write the state file and make `state` the current snapshot.
+
+        The store takes ownership of `state`; callers must not mutate it afterwards.
+
+        Args:
+            state: Full Todo2 state dict to persist
+            indent: JSON indentation (matches Todo2's own formatting by default)
+        """
+        with self._lock:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.state_file.parent), prefix=".state.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(state, f, indent=indent)
+                os.replace(tmp_path, self.state_file)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+            st = self._stat()
+            state.setdefault("todos", [])
+            self._snapshot = Todo2Snapshot(state, self._fingerprint(st) if st else None)
+            self._stats["saves"] += 1
+
+    def invalidate(self) -> None:
+        """Drop the current snapshot so the next access re-parses the file."""
+        with self._lock:
+            self._snapshot = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            return {
+                **self._stats,
+                "file_path": str(self.state_file),
+                "cached": self._snapshot is not None,
+                "task_count": len(self._snapshot.tasks) if self._snapshot else 0,
+            }
+
+
+# Stores keyed by resolved project root
+_stores: dict[str, Todo2Store] = {}
+_stores_lock = threading.Lock()
+
+
+def get_todo2_store(project_root: Optional[Union[Path, str]] = None) -> Todo2Store:
+    """
+    Get the shared Todo2Store for a project root.
+
+    Args:
+        project_root: Project root (defaults to find_project_root())
+
+    Returns:
+        Todo2Store instance shared by all callers for that root
+    """
+    root = Path(project_root) if project_root is not None else find_project_root()
+    try:
+        key = str(root.resolve())
+    except OSError:
+        key = str(root.absolute())
+
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = Todo2Store(root)
+            _stores[key] = store
+        return store
+
+
+def load_todo2_state(project_root: Optional[Union[Path, str]] = None) -> dict[str, Any]:
+    """Load Todo2 state via the shared store (read-only)."""
+    return get_todo2_store(project_root).load_state()
+
+
+def load_todo2_tasks(project_root: Optional[Union[Path, str]] = None) -> list[dict[str, Any]]:
+    """Load Todo2 tasks via the shared store (read-only)."""
+    return get_todo2_store(project_root).get_tasks()
+
+
+__all__ = [
+    "Todo2Snapshot",
+    "Todo2Store",
+    "get_todo2_store",
+    "load_todo2_state",
+    "load_todo2_tasks",
+]
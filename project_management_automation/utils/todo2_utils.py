@@ -8,7 +8,6 @@ Encapsulates helpers that:
 - validate project ownership on startup
 """
 
-import json
 import logging
 import subprocess
 from collections.abc import Iterable
@@ -121,16 +120,14 @@ def load_todo2_project_info(project_root: Optional[Path] = None) -> Optional[dic
         Project dict with id, name, path, repository, added_at, or None if not found
     """
     from .project_root import find_project_root
-    root = find_project_root(project_root)
-    todo2_file = root / ".todo2" / "state.todo2.json"
+    from .todo2_store import get_todo2_store
+    store = get_todo2_store(find_project_root(project_root))
     
-    if not todo2_file.exists():
+    if not store.exists():
         return None
     
     try:
-        with open(todo2_file) as f:
-            state = json.load(f)
-        return state.get("project")
+        return store.load_state().get("project")
     except Exception as e:
         logger.debug(f"Error loading Todo2 project info: {e}")
         return None
@@ -0,0 +1,535 @@
+"""
+Worker pools for blocking MCP tools.
+
+Most FastMCP tools are plain sync functions that run subprocesses, parse large
+JSON files or call the network. Called directly they block the server's event
+loop, so one slow `automation(action="sprint")` stalls `tools/list` and every
+other request on the connection. The executor runs them on bounded thread
+pools, one per declared cost class:
+- "cpu": in-process analysis (scoring, estimation, duplicate detection)
+- "io": file and Todo2 state reads/writes
+- "subprocess": git, pytest, linters, pip-audit, automation scripts
+- "llm": local model inference (Ollama, MLX)
+
+Each pool's size is that class's concurrency limit, so a burst of test runs
+cannot starve quick state reads. Per-class metrics (queue depth, wait time,
+outcomes) are available from `get_stats()`.
+
+Cancellation is cooperative: when the awaiting request is cancelled, a job
+still queued is dropped, and a running one has its token set so the tool can
+stop at its next `check_cancelled()`/`cancellation_requested()` point.
+`run_subprocess()` and `wait_for()` also watch the token while blocked, and
+terminate the child process (group) or stop waiting when it is set.
+
+Threads are used rather than processes: tools share process-local caches
+(Todo2 store, repo inventory, result caches) and are registered as closures.
+
+Environment:
+    EXARP_DISABLE_TOOL_OFFLOAD=1                          # Run tools inline on the event loop
+    EXARP_TOOL_POOL_SIZES="cpu=2,io=8,subprocess=4,llm=2"  # Per-class concurrency limits
+
+Usage:
+    from project_management_automation.utils.tool_executor import check_cancelled, offload, run_subprocess
+
+    @mcp.tool()
+    @offload("subprocess")
+    def testing(action: str = "run") -> str:
+        ...
+        for test_file in test_files:
+            check_cancelled()
+            run_subprocess([sys.executable, "-m", "pytest", test_file], capture_output=True)
+"""
+
+import asyncio
+import contextvars
+import inspect
+import logging
+import os
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import wraps
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+COST_CLASSES = ("cpu", "io", "subprocess", "llm")
+
+DEFAULT_POOL_SIZES = {"cpu": 2, "io": 8, "subprocess": 4, "llm": 2}
+
+# Seconds between cancellation checks while blocked on a child process or future
+CANCEL_POLL_INTERVAL = 0.1
+# Seconds a cancelled child process gets to exit after SIGTERM before SIGKILL
+TERMINATE_GRACE = 3.0
+
+# Cost class of each blocking tool (tools not listed run in the "io" pool)
+TOOL_COST_CLASSES = {
+    "add_external_tool_hints": "io",
+    "automation": "subprocess",
+    "tool_catalog": "io",
+    "context": "cpu",
+    "recommend": "cpu",
+    "analyze_alignment": "io",
+    "security": "subprocess",
+    "generate_config": "io",
+    "setup_hooks": "io",
+    "prompt_tracking": "io",
+    "health": "subprocess",
+    "check_attribution": "subprocess",
+    "report": "io",
+    "task_analysis": "cpu",
+    "testing": "subprocess",
+    "lint": "subprocess",
+    "memory": "io",
+    "task_discovery": "io",
+    "task_workflow": "io",
+    "estimation": "cpu",
+    "ollama": "llm",
+    "mlx": "llm",
+    "git_tools": "subprocess",
+    "session": "io",
+    "memory_maint": "cpu",
+    # Legacy names still routed by the stdio server
+    "detect_duplicate_tasks": "cpu",
+    "improve_task_clarity": "cpu",
+    "scan_dependency_security": "subprocess",
+}
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+def offload_enabled() -> bool:
+    """
+    Check whether tools should be offloaded to worker pools.
+
+    Offloading turns sync tools into coroutines, which the
+    EXARP_PATCH_ISAWAITABLE workaround would stop FastMCP from awaiting.
+    """
+    return not (_env_flag("EXARP_DISABLE_TOOL_OFFLOAD") or _env_flag("EXARP_PATCH_ISAWAITABLE"))
+
+
+def _pool_sizes() -> dict[str, int]:
+    sizes = dict(DEFAULT_POOL_SIZES)
+    for item in os.environ.get("EXARP_TOOL_POOL_SIZES", "").split(","):
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if name not in sizes:
+            continue
+        try:
+            sizes[name] = max(1, int(value))
+        except ValueError:
+            logger.warning(f"Ignoring invalid pool size for {name}: {value!r}")
+    return sizes
+
+
+def tool_cost_class(tool_name: str) -> str:
+    """Get the cost class of a tool ("io" if undeclared)."""
+    return TOOL_COST_CLASSES.get(tool_name, "io")
+
+
+class ToolCancelledError(CancelledError):
+    """Raised by check_cancelled() when the calling request was cancelled."""
+
+
+class CancellationToken:
+    """Cancellation flag shared between a request and the job running it."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "exarp_tool_cancellation", default=None
+)
+
+
+def current_cancellation_token() -> Optional[CancellationToken]:
+    """Get the token of the job running in this context (None outside the executor)."""
+    return _current_token.get()
+
+
+def cancellation_requested() -> bool:
+    """Check whether the request running in this context was cancelled."""
+    token = _current_token.get()
+    return token is not None and token.cancelled
+
+
+def check_cancelled() -> None:
+    """
+    Stop the current job if its request was cancelled.
+
+    Raises:
+        ToolCancelledError: If cancellation was requested
+    """
+    if cancellation_requested():
+        raise ToolCancelledError("Tool call cancelled")
+
+
+def wait_for(future: Future, timeout: Optional[float] = None) -> Any:
+    """
+    Like future.result(timeout), but stop waiting as soon as the request is cancelled.
+
+    Raises:
+        ToolCancelledError: If cancellation was requested while waiting
+        concurrent.futures.TimeoutError: If the future did not finish in time
+    """
+    if current_cancellation_token() is None:
+        return future.result(timeout=timeout)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        check_cancelled()
+        remaining = CANCEL_POLL_INTERVAL if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            return future.result(timeout=min(remaining, CANCEL_POLL_INTERVAL))
+        except FuturesTimeoutError:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise
+
+
+def _terminate(proc: subprocess.Popen, new_session: bool) -> None:
+    """Stop a child process (and its process group when it leads one)."""
+    def send(sig: int) -> None:
+        try:
+            if new_session:
+                os.killpg(proc.pid, sig)
+            elif sig == signal.SIGTERM:
+                proc.terminate()
+            else:
+                proc.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    send(signal.SIGTERM)
+    try:
+        proc.wait(timeout=TERMINATE_GRACE)
+    except subprocess.TimeoutExpired:
+        send(getattr(signal, "SIGKILL", signal.SIGTERM))
+        proc.wait()
+
+
+def run_subprocess(
+    args: Any,
+    *,
+    input: Any = None,
+    capture_output: bool = False,
+    timeout: Optional[float] = None,
+    check: bool = False,
+    **popen_kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """
+    subprocess.run() that terminates the child when the calling request is cancelled.
+
+    Outside a cancellable job this is plain subprocess.run(). Inside one the
+    child is started in its own process group (POSIX) so that cancelling also
+    stops the processes it spawned (pytest workers, linters).
+
+    Raises:
+        ToolCancelledError: If cancellation was requested (the child is terminated first)
+        subprocess.TimeoutExpired, subprocess.CalledProcessError: As subprocess.run()
+    """
+    if current_cancellation_token() is None:
+        return subprocess.run(
+            args, input=input, capture_output=capture_output, timeout=timeout, check=check, **popen_kwargs
+        )
+
+    if capture_output:
+        popen_kwargs["stdout"] = popen_kwargs["stderr"] = subprocess.PIPE
+    if input is not None:
+        popen_kwargs["stdin"] = subprocess.PIPE
+    new_session = os.name == "posix" and "start_new_session" not in popen_kwargs
+    if new_session:
+        popen_kwargs["start_new_session"] = True
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with subprocess.Popen(args, **popen_kwargs) as proc:
+        while True:
+            if cancellation_requested():
+                _terminate(proc, new_session)
+                raise ToolCancelledError("Tool call cancelled")
+            remaining = CANCEL_POLL_INTERVAL if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                stdout, stderr = proc.communicate(input, timeout=min(remaining, CANCEL_POLL_INTERVAL))
+                break
+            except subprocess.TimeoutExpired:
+                input = None  # Already sent; communicate() keeps what was read so far
+                if deadline is not None and time.monotonic() >= deadline:
+                    _terminate(proc, new_session)
+                    stdout, stderr = proc.communicate()
+                    raise subprocess.TimeoutExpired(proc.args, timeout, output=stdout, stderr=stderr)
+
+    if check and proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
+
+class _ClassStats:
+    """Counters for one cost class (guarded by the executor lock)."""
+
+    def __init__(self):
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.max_queue_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.started = 0
+
+    def as_dict(self, workers: int) -> dict[str, Any]:
+        return {
+            "workers": workers,
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_wait_ms": round(self.total_wait / self.started * 1000, 2) if self.started else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+        }
+
+
+class ToolExecutor:
+    """
+    Bounded thread pools for blocking tools, one per cost class.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(self, pool_sizes: Optional[dict[str, int]] = None):
+        """
+        Initialize executor.
+
+        Args:
+            pool_sizes: Workers per cost class (default: DEFAULT_POOL_SIZES,
+                overridden by $EXARP_TOOL_POOL_SIZES)
+        """
+        self.pool_sizes = {**_pool_sizes(), **(pool_sizes or {})}
+        self._pools: dict[str, ThreadPoolExecutor] = {}
+        self._stats = {cost_class: _ClassStats() for cost_class in COST_CLASSES}
+        self._lock = threading.Lock()
+
+    def _pool(self, cost_class: str) -> ThreadPoolExecutor:
+        with self._lock:
+            pool = self._pools.get(cost_class)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=self.pool_sizes[cost_class],
+                    thread_name_prefix=f"exarp-{cost_class}",
+                )
+                self._pools[cost_class] = pool
+            return pool
+
+    def _execute(
+        self,
+        cost_class: str,
+        token: CancellationToken,
+        queued_at: float,
+        fn: Callable[..., Any],
+        args: tuple,
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Worker side of a job: account for the wait, then run fn with its token set."""
+        stats = self._stats[cost_class]
+        wait = time.perf_counter() - queued_at
+        with self._lock:
+            stats.queued -= 1
+            if token.cancelled:
+                stats.cancelled += 1
+                raise ToolCancelledError("Tool call cancelled before it started")
+            stats.running += 1
+            stats.started += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+
+        _current_token.set(token)
+        outcome = "failed"
+        try:
+            result = fn(*args, **kwargs)
+            outcome = "completed"
+            return result
+        except CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            with self._lock:
+                stats.running -= 1
+                setattr(stats, outcome, getattr(stats, outcome) + 1)
+
+    def submit(
+        self,
+        cost_class: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[Future, CancellationToken]:
+        """
+        Queue a call on a cost class's pool.
+
+        The caller's context variables are visible to fn.
+
+        Args:
+            cost_class: One of COST_CLASSES
+            fn: Blocking callable
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Tuple of (future, cancellation token for the job)
+
+        Raises:
+            ValueError: If cost_class is unknown
+        """
+        if cost_class not in self._stats:
+            raise ValueError(f"Unknown cost class: {cost_class!r} (expected one of {', '.join(COST_CLASSES)})")
+        token = CancellationToken()
+        stats = self._stats[cost_class]
+        context = contextvars.copy_context()
+        pool = self._pool(cost_class)
+        with self._lock:
+            stats.queued += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, stats.queued)
+        try:
+            future = pool.submit(
+                context.run, self._execute, cost_class, token, time.perf_counter(), fn, args, kwargs
+            )
+        except RuntimeError:
+            with self._lock:
+                stats.queued -= 1
+            raise
+        return future, token
+
+    async def run(self, cost_class: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking call on a cost class's pool without blocking the event loop.
+
+        If the awaiting task is cancelled, the job is dropped when still
+        queued, otherwise its token is set for cooperative cancellation.
+
+        Args:
+            cost_class: One of COST_CLASSES
+            fn: Blocking callable
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            fn's return value (its exceptions propagate)
+        """
+        future, token = self.submit(cost_class, fn, *args, **kwargs)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            token.cancel()
+            if future.cancel():
+                # Never started, so _execute will not account for it
+                with self._lock:
+                    self._stats[cost_class].queued -= 1
+                    self._stats[cost_class].cancelled += 1
+            raise
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-class pool metrics."""
+        with self._lock:
+            return {
+                cost_class: stats.as_dict(self.pool_sizes[cost_class])
+                for cost_class, stats in self._stats.items()
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop all pools, dropping queued jobs (running jobs finish)."""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_executor: Optional[ToolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ToolExecutor:
+    """
+    Get the process-wide ToolExecutor.
+
+    Returns:
+        ToolExecutor shared by all tools
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ToolExecutor()
+        return _executor
+
+
+def shutdown_tool_executor() -> None:
+    """Shut down the process-wide ToolExecutor (a new one is created on next use)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+def offload(cost_class: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorate a sync tool so it runs on its cost class's worker pool.
+
+    The wrapper is a coroutine function with the tool's signature and
+    docstring, so FastMCP registers and awaits it like a native async tool.
+    Coroutine functions are returned unchanged, as are all tools when
+    offloading is disabled.
+
+    Args:
+        cost_class: One of COST_CLASSES (default: the tool's entry in
+            TOOL_COST_CLASSES)
+
+    Returns:
+        Decorator
+    """
+    if cost_class is not None and cost_class not in COST_CLASSES:
+        raise ValueError(f"Unknown cost class: {cost_class!r} (expected one of {', '.join(COST_CLASSES)})")
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(fn) or not offload_enabled():
+            return fn
+        resolved = cost_class or tool_cost_class(fn.__name__)
+
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await get_tool_executor().run(resolved, fn, *args, **kwargs)
+
+        wrapper.cost_class = resolved
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "COST_CLASSES",
+    "TOOL_COST_CLASSES",
+    "CancellationToken",
+    "ToolCancelledError",
+    "ToolExecutor",
+    "cancellation_requested",
+    "check_cancelled",
+    "current_cancellation_token",
+    "get_tool_executor",
+    "offload",
+    "offload_enabled",
+    "run_subprocess",
+    "shutdown_tool_executor",
+    "tool_cost_class",
+    "wait_for",
+]
@@ -0,0 +1,156 @@
+"""
+Structured tool results with serialization deferred to the MCP boundary.
+
+Tools return JSON strings to MCP clients, but composite tools (sprint,
+daily, overview, session memory) call other tools in-process and used to
+json.loads() those strings straight back. A tool decorated with
+@structured_tool is written to return a dict; calling it still returns
+a JSON string (compact, produced once), while `tool.result(...)` returns
+the dict itself as a ToolResult, without serializing anything.
+
+Usage:
+    from ..utils.tool_result import call_result, structured_tool
+
+    @structured_tool
+    def check_documentation_health(create_tasks: bool = True) -> dict[str, Any]:
+        ...
+        return format_success_response(response_data)
+
+    check_documentation_health()                     # '{"success":true,...}'
+    check_documentation_health.result()              # ToolResult({...})
+    call_result(some_tool, **kwargs)                 # ToolResult for any tool
+"""
+
+import functools
+import inspect
+import json
+from typing import Any, Callable, Optional
+
+
+class ToolResult(dict):
+    """
+    A tool's result as a dict, serialized only when it leaves the process.
+
+    Follows the repo's response shapes: {"success": bool, "data": {...}}
+    from format_success_response/format_error_response, or plain dicts
+    with an optional "status"/"error".
+    """
+
+    @property
+    def ok(self) -> bool:
+        """False if the tool reported an error."""
+        if "success" in self:
+            return self["success"] is not False
+        return self.get("status") != "error" and not self.get("error")
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """The payload: "data" for success responses, else the result itself."""
+        data = self.get("data", self)
+        return data if isinstance(data, dict) else {"result": data}
+
+    @property
+    def error_message(self) -> Optional[str]:
+        """Error message of a failed result."""
+        if self.ok:
+            return None
+        error = self.get("error")
+        if isinstance(error, dict):
+            error = error.get("message", error)
+        return str(error) if error else "Tool reported failure"
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Serialize (compact unless indent is given)."""
+        return to_json(self, indent)
+
+
+def to_json(value: Any, indent: Optional[int] = None) -> str:
+    """
+    Serialize a tool result for the MCP boundary.
+
+    Args:
+        value: Result dict (strings pass through unchanged)
+        indent: Pretty-print indent (default: compact)
+
+    Returns:
+        JSON string
+    """
+    if isinstance(value, str):
+        return value
+    if indent is None:
+        return json.dumps(value, separators=(",", ":"), default=str)
+    return json.dumps(value, indent=indent, default=str)
+
+
+def as_result(value: Any) -> ToolResult:
+    """
+    Normalize a tool's return value to a ToolResult.
+
+    JSON strings from tools not yet returning dicts are parsed; non-JSON
+    text and other values are wrapped under "result".
+    """
+    if isinstance(value, ToolResult):
+        return value
+    if isinstance(value, dict):
+        return ToolResult(value)
+    if isinstance(value, (str, bytes)):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return ToolResult({"result": value})
+        return as_result(value) if isinstance(value, dict) else ToolResult({"result": value})
+    if value is None:
+        return ToolResult()
+    return ToolResult({"result": value})
+
+
+def structured_tool(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Decorate a tool written to return a dict.
+
+    The decorated tool returns a compact JSON string (its MCP contract) and
+    gains `.result(...)`, returning a ToolResult without serializing.
+    Coroutine functions stay coroutine functions.
+
+    Args:
+        func: Tool implementation returning a dict
+
+    Returns:
+        Tool returning JSON, with a `.result` attribute
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def tool(*args, **kwargs) -> str:
+            return to_json(await func(*args, **kwargs))
+
+        async def result(*args, **kwargs) -> ToolResult:
+            return as_result(await func(*args, **kwargs))
+    else:
+        @functools.wraps(func)
+        def tool(*args, **kwargs) -> str:
+            return to_json(func(*args, **kwargs))
+
+        def result(*args, **kwargs) -> ToolResult:
+            return as_result(func(*args, **kwargs))
+
+    functools.update_wrapper(result, func)
+    tool.__annotations__ = {**getattr(func, "__annotations__", {}), "return": str}
+    tool.__signature__ = inspect.signature(func).replace(return_annotation=str)
+    tool.result = result
+    tool._structured = True
+    return tool
+
+
+def call_result(func: Callable[..., Any], *args, **kwargs) -> ToolResult:
+    """
+    Call a tool in-process and get its structured result.
+
+    Uses the tool's `.result` entry point when it has one (no JSON round
+    trip) and otherwise parses whatever it returns.
+    """
+    if getattr(func, "_structured", False) is True:
+        return func.result(*args, **kwargs)
+    return as_result(func(*args, **kwargs))
+
+
+__all__ = ["ToolResult", "as_result", "call_result", "structured_tool", "to_json"]
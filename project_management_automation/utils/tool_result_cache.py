@@ -0,0 +1,391 @@
+"""
+Persistent result cache for read-only MCP tools.
+
+Many consolidated tools (report, task_analysis, health docs, alignment) are
+pure functions of repository state, yet agents call them repeatedly and every
+call recomputes from scratch. This cache stores their results keyed by:
+- tool name and normalized arguments (defaults applied, so `report()` and
+  `report(action="overview")` share an entry)
+- fingerprints of the inputs the tool declares ("todo2", "inventory", "docs")
+- the package version
+
+Entries live in `.exarp/tool_cache/` (one JSON file each) so they survive
+server restarts, and are evicted least-recently-used beyond an entry/byte
+budget. Responses carry a `cache_status` field ("hit", "miss" or "bypass").
+Set EXARP_DISABLE_TOOL_CACHE=1 to turn the cache off.
+
+Usage:
+    from project_management_automation.utils.tool_result_cache import cached_tool
+
+    @cached_tool("report", inputs={"overview": ("todo2", "inventory"), "scorecard": ("todo2", "inventory")})
+    def report(action: str = "overview", output_path: Optional[str] = None) -> str:
+        ...
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from ..version import __version__
+from .project_root import find_project_root
+from .repo_inventory import DOC_EXTENSIONS, get_repo_inventory
+from .todo2_store import get_todo2_store
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_RELATIVE = Path(".exarp") / "tool_cache"
+
+# Size budget (entries beyond either limit are evicted, least recently used first)
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Input name -> fingerprint of that input for a project root
+INPUT_FINGERPRINTS: dict[str, Callable[[Path], Any]] = {
+    "todo2": lambda root: get_todo2_store(root).version,
+    "inventory": lambda root: get_repo_inventory(root).fingerprint(),
+    "docs": lambda root: get_repo_inventory(root).fingerprint(ext=DOC_EXTENSIONS),
+}
+
+
+def register_input_fingerprint(name: str, fingerprint: Callable[[Path], Any]) -> None:
+    """
+    Register an input that cached tools can declare.
+
+    Args:
+        name: Input name used in `cached_tool(inputs=...)`
+        fingerprint: Callable(project_root) returning a JSON-serializable
+            value that changes whenever the input changes
+    """
+    INPUT_FINGERPRINTS[name] = fingerprint
+
+
+def fingerprint_inputs(project_root: Path, inputs: Sequence[str]) -> dict[str, Any]:
+    """Fingerprint each declared input for a project root."""
+    return {name: INPUT_FINGERPRINTS[name](project_root) for name in sorted(inputs)}
+
+
+class ToolResultCache:
+    """
+    On-disk, size-bounded store of tool results.
+
+    All methods are thread-safe.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[Path, str],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per entry
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum total size of entry files
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> file size, least recently used first
+        self._entries: Optional[OrderedDict[str, int]] = None
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+
+    @staticmethod
+    def make_key(tool: str, args: Mapping[str, Any], inputs: Mapping[str, Any]) -> str:
+        """Derive the cache key for a call."""
+        payload = json.dumps(
+            {"tool": tool, "args": args, "inputs": inputs, "version": __version__},
+            sort_keys=True, default=str, separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _index(self) -> OrderedDict[str, int]:
+        """Entries on disk, ordered by last use (file mtime)."""
+        if self._entries is None:
+            found = []
+            try:
+                with os.scandir(self.cache_dir) as it:
+                    for entry in it:
+                        if entry.name.endswith(".json"):
+                            st = entry.stat()
+                            found.append((st.st_mtime_ns, entry.name[:-5], st.st_size))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Cannot list tool cache {self.cache_dir}: {e}")
+            found.sort()
+            self._entries = OrderedDict((key, size) for _, key, size in found)
+            self._bytes = sum(self._entries.values())
+        return self._entries
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached result.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        path = self._path(key)
+        with self._lock:
+            if key not in self._index():
+                self._stats["misses"] += 1
+                return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                result = json.load(f)["result"]
+            os.utime(path)  # Persist recency for LRU order across restarts
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Dropping unreadable tool cache entry {path}: {e}")
+            with self._lock:
+                self._forget(key)
+                self._stats["misses"] += 1
+            return None
+
+        with self._lock:
+            if key in self._index():
+                self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+        return result
+
+    def put(self, key: str, result: str, meta: Optional[dict[str, Any]] = None) -> bool:
+        """
+        Store a result, evicting least recently used entries over budget.
+
+        Args:
+            key: Cache key from make_key()
+            result: Tool result to cache
+            meta: Extra fields stored alongside (tool, args) for inspection
+
+        Returns:
+            True if stored
+        """
+        payload = json.dumps({**(meta or {}), "created_at": time.time(), "result": result}, default=str)
+        size = len(payload.encode())
+        if size > self.max_bytes:
+            return False
+
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write tool cache entry {path}: {e}")
+            with self._lock:
+                self._stats["errors"] += 1
+            return False
+
+        with self._lock:
+            entries = self._index()
+            self._bytes += size - entries.pop(key, 0)
+            entries[key] = size
+            self._stats["stores"] += 1
+            self._evict_locked()
+        return True
+
+    def _forget(self, key: str) -> None:
+        entries = self._index()
+        if key in entries:
+            self._bytes -= entries.pop(key)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def _evict_locked(self) -> None:
+        entries = self._index()
+        while entries and (len(entries) > self.max_entries or self._bytes > self.max_bytes):
+            key = next(iter(entries))
+            self._forget(key)
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            for key in list(self._index()):
+                self._forget(key)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            entries = self._index()
+            total = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(entries),
+                "size_bytes": self._bytes,
+                "hit_rate": round(self._stats["hits"] / total * 100, 1) if total else 0.0,
+                "cache_dir": str(self.cache_dir),
+            }
+
+
+# Caches keyed by resolved project root
+_caches: dict[str, ToolResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_tool_result_cache(project_root: Optional[Union[Path, str]] = None) -> ToolResultCache:
+    """
+    Get the shared ToolResultCache for a project root.
+
+    Args:
+        project_root: Project root (defaults to find_project_root())
+
+    Returns:
+        ToolResultCache instance shared by all callers for that root
+    """
+    root = Path(project_root) if project_root is not None else find_project_root()
+    try:
+        key = str(root.resolve())
+    except OSError:
+        key = str(root.absolute())
+
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ToolResultCache(root / CACHE_DIR_RELATIVE)
+            _caches[key] = cache
+        return cache
+
+
+def _with_cache_status(result: str, status: str) -> str:
+    """Add `cache_status` to a JSON object result (other results are returned unchanged)."""
+    try:
+        data = json.loads(result)
+    except (TypeError, ValueError):
+        return result
+    if not isinstance(data, dict):
+        return result
+    data["cache_status"] = status
+    if "\n" in result:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _is_cacheable(result: str) -> bool:
+    """False for errors and partial results (e.g. a scorecard with failed or stale collectors)."""
+    try:
+        data = json.loads(result)
+    except (TypeError, ValueError):
+        return True
+    if not isinstance(data, dict):
+        return True
+    if "error" in data or data.get("success") is False or data.get("status") == "error":
+        return False
+    for payload in (data, data.get("data")):
+        if not isinstance(payload, dict):
+            continue
+        if payload.get("partial"):
+            return False
+        collectors = payload.get("collectors")
+        if isinstance(collectors, dict) and any(
+            not isinstance(c, dict) or c.get("status") != "ok" for c in collectors.values()
+        ):
+            return False
+    return True
+
+
+def _default_bypass(args: Mapping[str, Any]) -> bool:
+    # Writing a report file is a side effect the caller asked for
+    return bool(args.get("output_path"))
+
+
+def cached_tool(
+    tool: str,
+    inputs: Union[Sequence[str], Mapping[str, Sequence[str]]],
+    bypass: Callable[[Mapping[str, Any]], bool] = _default_bypass,
+) -> Callable:
+    """
+    Cache a read-only tool's string results across calls and restarts.
+
+    Args:
+        tool: Tool name (part of the cache key)
+        inputs: Inputs the result depends on, or a mapping from `action`
+            value to inputs (actions not listed are never cached)
+        bypass: Predicate on the normalized arguments; True skips the cache
+            (e.g. when the call has side effects)
+
+    Returns:
+        Decorator. Results that are JSON objects gain a `cache_status` field.
+        A result is not stored if it reports an error, is partial (a
+        `partial` flag or a collector that did not finish) or if the tool
+        changed its own inputs while running.
+    """
+    def decorator(func: Callable[..., str]) -> Callable[..., str]:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> str:
+            if os.environ.get("EXARP_DISABLE_TOOL_CACHE", "").lower() in ("1", "true", "yes"):
+                return func(*args, **kwargs)
+            try:
+                bound = signature.bind(*args, **kwargs)
+            except TypeError:
+                return func(*args, **kwargs)
+            bound.apply_defaults()
+            call_args = dict(bound.arguments)
+
+            if isinstance(inputs, Mapping):
+                declared = inputs.get(call_args.get("action"))
+            else:
+                declared = inputs
+            if declared is None or bypass(call_args):
+                return _with_cache_status(func(*args, **kwargs), "bypass")
+
+            try:
+                project_root = find_project_root()
+                cache = get_tool_result_cache(project_root)
+                before = fingerprint_inputs(project_root, declared)
+                key = cache.make_key(tool, call_args, before)
+            except Exception as e:
+                logger.debug(f"Tool cache unavailable for {tool}: {e}")
+                return _with_cache_status(func(*args, **kwargs), "bypass")
+
+            cached = cache.get(key)
+            if cached is not None:
+                return _with_cache_status(cached, "hit")
+
+            result = func(*args, **kwargs)
+            if isinstance(result, str) and _is_cacheable(result):
+                try:
+                    unchanged = fingerprint_inputs(project_root, declared) == before
+                except Exception:
+                    unchanged = False
+                if unchanged:
+                    cache.put(key, result, {"tool": tool, "args": call_args})
+            return _with_cache_status(result, "miss")
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "INPUT_FINGERPRINTS",
+    "ToolResultCache",
+    "cached_tool",
+    "fingerprint_inputs",
+    "get_tool_result_cache",
+    "register_input_fingerprint",
+]
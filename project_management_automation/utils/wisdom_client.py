@@ -24,11 +24,12 @@ except ImportError:
 
 # Import session pool from mcp_client
 try:
-    from project_management_automation.scripts.base.mcp_client import _session_pool
+    from project_management_automation.scripts.base.mcp_client import _session_pool, run_mcp_sync
     POOL_AVAILABLE = True
 except ImportError:
     POOL_AVAILABLE = False
     _session_pool = None
+    run_mcp_sync = None
 
 
 def _load_mcp_config(project_root: Path) -> dict:
@@ -161,7 +162,11 @@ def call_wisdom_tool_sync(tool_name: str, arguments: dict, project_root: Optiona
         project_root = find_project_root()
     
     try:
-        return asyncio.run(_call_wisdom_tool(tool_name, arguments, project_root))
+        coro = _call_wisdom_tool(tool_name, arguments, project_root)
+        if POOL_AVAILABLE and MCP_CLIENT_AVAILABLE:
+            # Shared long-lived loop keeps pooled sessions warm between calls
+            return run_mcp_sync(coro)
+        return asyncio.run(coro)
     except Exception as e:
         logger.error(f"Failed to call wisdom tool synchronously: {e}")
         return None
@@ -174,7 +179,11 @@ def read_wisdom_resource_sync(uri: str, project_root: Optional[Path] = None) ->
         project_root = find_project_root()
     
     try:
-        return asyncio.run(_read_wisdom_resource(uri, project_root))
+        coro = _read_wisdom_resource(uri, project_root)
+        if POOL_AVAILABLE and MCP_CLIENT_AVAILABLE:
+            # Shared long-lived loop keeps pooled sessions warm between calls
+            return run_mcp_sync(coro)
+        return asyncio.run(coro)
     except Exception as e:
         logger.error(f"Failed to read wisdom resource synchronously: {e}")
         return None
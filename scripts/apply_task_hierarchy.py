@@ -8,9 +8,9 @@ Renames task IDs to include component prefixes:
 - Testing tasks → T-TESTING-*
 """
 
-import json
 import sys
 from collections import defaultdict
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
@@ -24,6 +24,7 @@ from project_management_automation.utils.todo2_utils import (
     get_repo_project_id,
     is_pending_status,
 )
+from project_management_automation.utils.todo2_store import get_todo2_store
 from project_management_automation.tools.task_hierarchy_analyzer import COMPONENT_PATTERNS
 
 # Component to prefix mapping
@@ -82,69 +83,69 @@ def generate_new_id(old_id: str, prefix: str) -> str:
 def apply_hierarchy(dry_run: bool = True) -> dict:
     """Apply hierarchy prefixes to tasks."""
     project_root = find_project_root()
-    todo2_file = project_root / '.todo2' / 'state.todo2.json'
+    store = get_todo2_store(project_root)
     
-    if not todo2_file.exists():
+    if not store.exists():
         return {"error": "Todo2 state file not found"}
     
-    with open(todo2_file) as f:
-        data = json.load(f)
+    # Hold the Todo2 write lock across the read-modify-write when applying
+    with (store.write_lock() if not dry_run else nullcontext()):
+        data = store.load_state_for_update()
     
-    todos = data.get('todos', [])
-    project_id = get_repo_project_id(project_root)
-    todos = filter_tasks_by_project(todos, project_id)
+        todos = data.get('todos', [])
+        project_id = get_repo_project_id(project_root)
+        todos = filter_tasks_by_project(todos, project_id)
     
-    # Build ID mapping: old_id -> new_id
-    # Track which tasks have been assigned to avoid duplicates
-    assigned_tasks = set()
-    id_mapping = {}
-    changes = []
+        # Build ID mapping: old_id -> new_id
+        # Track which tasks have been assigned to avoid duplicates
+        assigned_tasks = set()
+        id_mapping = {}
+        changes = []
     
-    for component, prefix in COMPONENT_PREFIXES.items():
-        matching_tasks = identify_component_tasks(todos, component)
+        for component, prefix in COMPONENT_PREFIXES.items():
+            matching_tasks = identify_component_tasks(todos, component)
         
-        for task in matching_tasks:
-            old_id = task.get('id')
-            if not old_id or old_id in assigned_tasks:
-                continue  # Skip if already assigned to another component
+            for task in matching_tasks:
+                old_id = task.get('id')
+                if not old_id or old_id in assigned_tasks:
+                    continue  # Skip if already assigned to another component
             
-            new_id = generate_new_id(old_id, prefix)
-            id_mapping[old_id] = new_id
-            assigned_tasks.add(old_id)
+                new_id = generate_new_id(old_id, prefix)
+                id_mapping[old_id] = new_id
+                assigned_tasks.add(old_id)
             
-            changes.append({
-                'component': component,
-                'old_id': old_id,
-                'new_id': new_id,
-                'task_name': task.get('name', '')[:50],
-                'status': task.get('status', ''),
-            })
-    
-    # Update task IDs and dependencies
-    if not dry_run:
-        for task in todos:
-            # Update task ID if it's in the mapping
-            old_id = task.get('id')
-            if old_id in id_mapping:
-                task['id'] = id_mapping[old_id]
-                task['lastModified'] = datetime.now().isoformat()
+                changes.append({
+                    'component': component,
+                    'old_id': old_id,
+                    'new_id': new_id,
+                    'task_name': task.get('name', '')[:50],
+                    'status': task.get('status', ''),
+                })
+    
+        # Update task IDs and dependencies
+        if not dry_run:
+            for task in todos:
+                # Update task ID if it's in the mapping
+                old_id = task.get('id')
+                if old_id in id_mapping:
+                    task['id'] = id_mapping[old_id]
+                    task['lastModified'] = datetime.now().isoformat()
             
-            # Update dependencies
-            deps = task.get('dependencies', [])
-            updated_deps = []
-            for dep_id in deps:
-                if dep_id in id_mapping:
-                    updated_deps.append(id_mapping[dep_id])
-                else:
-                    updated_deps.append(dep_id)
+                # Update dependencies
+                deps = task.get('dependencies', [])
+                updated_deps = []
+                for dep_id in deps:
+                    if dep_id in id_mapping:
+                        updated_deps.append(id_mapping[dep_id])
+                    else:
+                        updated_deps.append(dep_id)
             
-            if updated_deps != deps:
-                task['dependencies'] = updated_deps
-                task['lastModified'] = datetime.now().isoformat()
+                if updated_deps != deps:
+                    task['dependencies'] = updated_deps
+                    task['lastModified'] = datetime.now().isoformat()
         
-        # Save changes
-        with open(todo2_file, 'w') as f:
-            json.dump(data, f, indent=2)
+            # Save changes
+            store.save_state(data)
     
     # Group changes by component
     by_component = defaultdict(list)
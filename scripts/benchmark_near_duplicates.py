@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark for near-duplicate task detection.
+
+Times the indexed near-duplicate search (utils/near_duplicates.py) on
+synthetic task names from 1k up to 50k tasks, and compares it against the
+all-pairs SequenceMatcher loop on the sizes where that is still feasible.
+Sizes above near_duplicates.EXHAUSTIVE_LIMIT use LSH candidates; the
+"recall" column compares them with prefix filtering where that is feasible.
+
+Usage:
+    python3 scripts/benchmark_near_duplicates.py
+    python3 scripts/benchmark_near_duplicates.py --sizes 1000 5000 50000 --brute-force-limit 1000
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from project_management_automation.utils.near_duplicates import EXHAUSTIVE_LIMIT, find_similar_pairs
+
+VERBS = ["implement", "fix", "add", "update", "refactor", "document", "test", "remove", "migrate", "optimize"]
+COMMON = ["the", "for", "in", "to", "of", "and", "with", "on"]
+SYLLABLES = [
+    "auth", "cache", "data", "base", "score", "card", "mem", "ory", "sync", "pars", "er", "re", "port",
+    "lint", "sched", "ule", "est", "im", "ator", "dash", "board", "ex", "sess", "ion", "work", "flow",
+    "con", "fig", "in", "dex", "tok", "en", "graph", "node", "task", "queue", "log", "met", "ric",
+]
+
+
+def _vocabulary(rng: random.Random, size: int = 3000) -> list[str]:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.sample(SYLLABLES, rng.randint(2, 3))))
+    return sorted(words)
+
+
+def generate_task_names(count: int, duplicate_rate: float = 0.1, seed: int = 42) -> list[str]:
+    """Generate task names where roughly duplicate_rate of them are near-duplicates."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    names: list[str] = []
+    for _ in range(count):
+        if names and rng.random() < duplicate_rate:
+            chars = list(rng.choice(names))
+            for _ in range(rng.randint(1, 2)):
+                chars.insert(rng.randrange(len(chars)), rng.choice(string.ascii_lowercase))
+            names.append("".join(chars))
+        else:
+            words = [rng.choice(VERBS)] + rng.sample(vocabulary, rng.randint(2, 4))
+            words.insert(rng.randint(1, len(words)), rng.choice(COMMON))
+            names.append(" ".join(words))
+    return names
+
+
+def brute_force_pairs(texts: list[str], threshold: float) -> int:
+    """Count similar pairs with the original all-pairs loop."""
+    found = 0
+    for i, a in enumerate(texts):
+        for b in texts[i + 1:]:
+            if SequenceMatcher(None, a, b).ratio() >= threshold:
+                found += 1
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate task detection")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 25000, 50000])
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--brute-force-limit", type=int, default=2000,
+                        help="Largest size to also time with the all-pairs loop")
+    parser.add_argument("--recall-limit", type=int, default=5000,
+                        help="Largest LSH size to check against prefix filtering")
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8} {'pairs':>8} {'indexed (s)':>12} {'recall':>8} {'all-pairs (s)':>14}")
+    for size in args.sizes:
+        names = generate_task_names(size)
+
+        start = time.perf_counter()
+        pairs = find_similar_pairs(names, args.threshold)
+        indexed = time.perf_counter() - start
+
+        recall = "-"
+        if EXHAUSTIVE_LIMIT < size <= args.recall_limit:
+            exact = find_similar_pairs(names, args.threshold, exhaustive_limit=size)
+            recall = f"{len(pairs) / len(exact):.3f}" if exact else "1.000"
+
+        brute = "-"
+        if size <= args.brute_force_limit:
+            start = time.perf_counter()
+            expected = brute_force_pairs(names, args.threshold)
+            brute = f"{time.perf_counter() - start:.2f}"
+            if expected != len(pairs):
+                print(f"  warning: all-pairs found {expected} pairs, indexed found {len(pairs)}")
+
+        print(f"{size:>8} {len(pairs):>8} {indexed:>12.2f} {recall:>8} {brute:>14}")
+
+if __name__ == "__main__":
+    main()
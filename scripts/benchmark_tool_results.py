@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark for in-process tool composition.
+
+Composite tools (sprint, daily, overview) used to call other tools, get a
+json.dumps(..., indent=2) string back and json.loads it again. Tools
+decorated with @structured_tool (utils/tool_result.py) expose `.result()`,
+which hands over the dict directly; serialization happens once, compactly,
+at the MCP boundary.
+
+Times one composed call per payload size three ways:
+- "round trip": the old path (pretty JSON string, parsed back)
+- "result": the structured entry point (no serialization)
+- "boundary": the compact JSON a client receives, with its size next to
+  the old pretty-printed size
+
+Usage:
+    python3 scripts/benchmark_tool_results.py
+    python3 scripts/benchmark_tool_results.py --items 10 100 1000 10000 --repeat 200
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from project_management_automation.utils.tool_result import structured_tool, to_json
+
+
+def make_payload(items: int) -> dict:
+    """Result shaped like detect_duplicate_tasks / analyze_todo2_alignment output."""
+    return {
+        "success": True,
+        "data": {
+            "total_tasks": items,
+            "report_path": "/project/docs/REPORT.md",
+            "findings": [
+                {
+                    "task_id": f"T-{i}",
+                    "name": f"Implement feature {i} for the scheduler",
+                    "similarity": round(0.85 + (i % 15) / 100, 2),
+                    "tags": ["automation", "backend", f"area-{i % 7}"],
+                    "matches": [{"task_id": f"T-{i + 1}", "score": 0.9}],
+                }
+                for i in range(items)
+            ],
+        },
+        "timestamp": 1760000000.0,
+    }
+
+
+def _time(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON round trips between tools")
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'items':>7} {'round trip (ms)':>16} {'result (ms)':>12} {'boundary (ms)':>14} "
+          f"{'pretty (KB)':>12} {'compact (KB)':>13}")
+    for items in args.items:
+        payload = make_payload(items)
+        repeat = max(1, args.repeat * 100 // max(items, 100))
+
+        @structured_tool
+        def tool() -> dict:
+            return payload
+
+        def legacy_tool() -> str:
+            return json.dumps(payload, indent=2)
+
+        round_trip = _time(lambda: json.loads(legacy_tool())["data"], repeat)
+        direct = _time(lambda: tool.result().data, repeat)
+        boundary = _time(lambda: to_json(tool.result()), repeat)
+
+        pretty_kb = len(legacy_tool()) / 1024
+        compact_kb = len(tool()) / 1024
+        print(f"{items:>7} {round_trip:>16.3f} {direct:>12.4f} {boundary:>14.3f} {pretty_kb:>12.1f} {compact_kb:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
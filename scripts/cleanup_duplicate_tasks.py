@@ -9,21 +9,32 @@ or the oldest task if none are done.
 import json
 import sys
 from collections import defaultdict
+from contextlib import nullcontext
 from pathlib import Path
 
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from project_management_automation.utils.todo2_store import get_todo2_store
+
 
 def cleanup_duplicates(dry_run: bool = True) -> dict:
     """Clean up duplicate tasks."""
+    store = get_todo2_store(project_root)
 
-    # Find project root
-    current = Path(__file__).parent.parent
-    todo2_path = current / '.todo2' / 'state.todo2.json'
-
-    if not todo2_path.exists():
+    if not store.exists():
         return {"error": "Todo2 state file not found"}
 
-    with open(todo2_path) as f:
-        state = json.load(f)
+    # Hold the Todo2 write lock across the read-modify-write when applying
+    with (store.write_lock() if not dry_run else nullcontext()):
+        return _cleanup_state(store, dry_run)
+
+
+def _cleanup_state(store, dry_run: bool) -> dict:
+    """Remove duplicates from the current Todo2 state."""
+    state = store.load_state_for_update()
+    todo2_path = store.state_file
 
     todos = state.get('todos', [])
     original_count = len(todos)
@@ -123,8 +134,7 @@ def cleanup_duplicates(dry_run: bool = True) -> dict:
         print(f"\n💾 Backup saved to: {backup_path}")
 
         # Save cleaned state
-        with open(todo2_path, 'w') as f:
-            json.dump(state, f, indent=2)
+        store.save_state(state)
         print(f"✅ Cleaned state saved to: {todo2_path}")
     else:
         print("\n🔍 DRY RUN - No changes made. Run with --apply to execute.")
@@ -85,3 +85,26 @@ def mock_mcp_client():
     mock_client.list_tools = Mock(return_value=[])
     mock_client.list_resources = Mock(return_value=[])
     return mock_client
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """
+    Give each test empty caches, so results stored by one test (mocks return
+    different data) are never served to another.
+
+    Persistent caches are written under tmp_path instead of the project.
+    """
+    from project_management_automation.tools import ollama_gateway, pattern_watcher
+    from project_management_automation.tools.wisdom import sefaria_cache
+    from project_management_automation.utils import tool_result_cache
+
+    # An absolute path replaces the project root when joined to it
+    monkeypatch.setattr(tool_result_cache, "_caches", {})
+    monkeypatch.setattr(tool_result_cache, "CACHE_DIR_RELATIVE", tmp_path / "tool_cache")
+    monkeypatch.setattr(sefaria_cache, "_caches", {})
+    monkeypatch.setattr(sefaria_cache, "CACHE_FILE_RELATIVE", tmp_path / "sefaria_texts.json")
+    monkeypatch.setattr(ollama_gateway, "_gateway", None)
+    monkeypatch.setattr(pattern_watcher, "_watchers", {})
+    yield
+    pattern_watcher.stop_pattern_watchers()
@@ -239,38 +239,37 @@ class TestEstimation:
         mock_estimator.get_statistics.assert_called_once()
         assert isinstance(result, str)
 
-    @patch('pathlib.Path.exists')
     @patch('project_management_automation.utils.find_project_root')
     @patch('project_management_automation.tools.mlx_task_estimator.MLXEnhancedTaskEstimator')
-    def test_estimation_batch_action(self, mock_estimator_class, mock_root, mock_exists):
+    def test_estimation_batch_action(self, mock_estimator_class, mock_root, tmp_path):
         """Test batch action processes multiple tasks."""
         # Setup mocks
-        from pathlib import Path
-        mock_root.return_value = Path("/test/project")
-        mock_exists.return_value = True
-        
+        mock_root.return_value = tmp_path
+
         mock_estimator = Mock()
         mock_estimator.estimate.return_value = {
             "estimate_hours": 2.0,
             "confidence": 0.8,
             "method": "mlx_enhanced"
         }
+        mock_estimator.match_history_batch.return_value = [[], []]
         mock_estimator_class.return_value = mock_estimator
 
-        # Mock Todo2 file reading
-        with patch('builtins.open', create=True) as mock_open:
-            mock_open.return_value.__enter__.return_value.read.return_value = json.dumps({
-                "todos": [
-                    {"id": "T-1", "name": "Task 1", "status": "Todo", "tags": ["test"]},
-                    {"id": "T-2", "name": "Task 2", "status": "Todo", "tags": ["test"]}
-                ]
-            })
-
-            result = estimation(action="batch", use_mlx=True)
-            result_dict = parse_json_response(result)
+        # Todo2 state read through the store
+        state_file = tmp_path / ".todo2" / "state.todo2.json"
+        state_file.parent.mkdir()
+        state_file.write_text(json.dumps({
+            "todos": [
+                {"id": "T-1", "name": "Task 1", "status": "Todo", "tags": ["test"]},
+                {"id": "T-2", "name": "Task 2", "status": "Todo", "tags": ["test"]}
+            ]
+        }))
+
+        result = estimation(action="batch", use_mlx=True)
+        result_dict = parse_json_response(result)
 
-            assert result_dict.get("status") == "success"
-            assert result_dict.get("total_tasks") == 2
+        assert result_dict.get("status") == "success"
+        assert result_dict.get("total_tasks") == 2
 
     def test_estimation_invalid_action(self):
         """Test invalid action returns error."""
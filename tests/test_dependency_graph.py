@@ -0,0 +1,148 @@
+"""
+Tests for the dependency graph engine.
+
+Tests cycle detection, critical paths, depth and dependency levels.
+"""
+
+import time
+
+from project_management_automation.utils.dependency_graph import (
+    DependencyGraph,
+    get_task_dependencies,
+)
+
+
+def _chain_graph() -> DependencyGraph:
+    # a -> b -> d, a -> c -> d, d -> e
+    return DependencyGraph(
+        nodes=["a", "b", "c", "d", "e"],
+        edges=[("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "e")],
+    )
+
+
+class TestFromTasks:
+    """Test building graphs from Todo2 tasks."""
+
+    def test_dependency_formats(self):
+        """Test string, dict and dependsOn dependencies; unknown IDs are ignored."""
+        tasks = [
+            {"id": "T-1"},
+            {"id": "T-2", "dependencies": ["T-1", "T-missing"]},
+            {"id": "T-3", "dependsOn": [{"id": "T-2"}]},
+        ]
+
+        graph = DependencyGraph.from_tasks(tasks)
+
+        assert graph.adjacency() == {"T-1": ["T-2"], "T-2": ["T-3"]}
+        assert get_task_dependencies(tasks[2]) == ["T-2"]
+        assert graph.roots() == ["T-1"]
+
+
+class TestCycles:
+    """Test Tarjan SCC cycle detection."""
+
+    def test_dag_has_no_cycles(self):
+        """Test a DAG reports no cycles."""
+        graph = _chain_graph()
+        assert graph.is_dag()
+        assert graph.cycles() == []
+
+    def test_reports_one_cycle_per_component(self):
+        """Test each cyclic component yields a closed cycle."""
+        graph = DependencyGraph(edges=[
+            ("a", "b"), ("b", "c"), ("c", "a"),  # 3-cycle
+            ("c", "d"),
+            ("e", "e"),  # self-dependency
+        ])
+
+        cycles = graph.cycles()
+
+        assert not graph.is_dag()
+        assert len(cycles) == 2
+        assert ["e", "e"] in cycles
+        three = next(c for c in cycles if len(c) == 4)
+        assert three[0] == three[-1]
+        assert set(three) == {"a", "b", "c"}
+        for src, dst in zip(three, three[1:]):
+            assert dst in graph.successors(src)
+
+    def test_deep_graph_does_not_recurse(self):
+        """Test SCC on a long chain (beyond the recursion limit)."""
+        n = 5000
+        graph = DependencyGraph(edges=[(i, i + 1) for i in range(n)] + [(n, 0)])
+        assert len(graph.cycles()) == 1
+        assert len(graph.cycle_members()[0]) == n + 1
+
+
+class TestCriticalPaths:
+    """Test DP longest paths."""
+
+    def test_all_critical_chains(self):
+        """Test both longest chains are found and counted."""
+        critical = _chain_graph().critical_paths()
+
+        assert critical.length == 4
+        assert critical.count == 2
+        assert critical.paths() == [["a", "b", "d", "e"], ["a", "c", "d", "e"]]
+        assert critical.nodes == ["a", "b", "c", "d", "e"]
+
+    def test_weighted(self):
+        """Test node weights pick the heaviest chain."""
+        hours = {"a": 1, "b": 5, "c": 1, "d": 1, "e": 1}
+        graph = _chain_graph()
+
+        critical = graph.critical_paths(weight=hours.get)
+
+        assert critical.length == 8
+        assert graph.longest_path(weight=hours.get) == ["a", "b", "d", "e"]
+
+    def test_wide_dag_is_fast(self):
+        """Test exponentially many chains are counted without enumeration."""
+        # 40 layers of 2 fully connected nodes: 2**40 longest chains
+        edges = []
+        for layer in range(39):
+            for x in range(2):
+                for y in range(2):
+                    edges.append(((layer, x), (layer + 1, y)))
+        graph = DependencyGraph(edges=edges)
+
+        start = time.time()
+        critical = graph.critical_paths()
+        examples = critical.paths(limit=5)
+        elapsed = time.time() - start
+
+        assert critical.length == 40
+        assert critical.count == 2 ** 40
+        assert len(examples) == 5
+        assert elapsed < 1.0
+
+    def test_cycle_edges_are_ignored(self):
+        """Test longest path is still computed when cycles exist."""
+        graph = DependencyGraph(edges=[("a", "b"), ("b", "a"), ("b", "c")])
+
+        assert graph.critical_paths().length == 2
+        assert graph.longest_path() in (["a", "c"], ["b", "c"])
+
+    def test_empty_graph(self):
+        """Test empty graph has no critical path."""
+        critical = DependencyGraph().critical_paths()
+        assert critical.length == 0
+        assert critical.paths() == []
+
+
+class TestDepthAndLevels:
+    """Test memoized depth and dependency levels."""
+
+    def test_depths(self):
+        """Test depth counts tasks on the longest downstream chain."""
+        depths = _chain_graph().depths()
+        assert depths == {"a": 4, "b": 3, "c": 3, "d": 2, "e": 1}
+        assert _chain_graph().max_depth() == 4
+
+    def test_levels(self):
+        """Test nodes are grouped into parallel waves."""
+        assert _chain_graph().levels() == [["a"], ["b", "c"], ["d"], ["e"]]
+
+    def test_levels_subset(self):
+        """Test dependencies outside the subset count as satisfied."""
+        assert _chain_graph().levels(nodes=["b", "c", "e"]) == [["b", "c", "e"]]
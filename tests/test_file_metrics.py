@@ -0,0 +1,110 @@
+"""
+Tests for the persistent per-file metrics cache.
+"""
+
+import json
+import os
+
+from project_management_automation.utils.file_metrics import FileMetricsCache, scan_file
+
+
+class TestScanFile:
+    """Test byte-level line counting."""
+
+    def test_line_counts(self, tmp_path):
+        """Test counts match splitlines() for common endings."""
+        cases = {
+            "empty.txt": "",
+            "one.txt": "single line",
+            "trailing.txt": "a\nb\n",
+            "no_trailing.txt": "a\nb",
+            "blank.txt": "\n\n\n",
+            "crlf.txt": "a\r\nb\r\n",
+        }
+        for name, text in cases.items():
+            path = tmp_path / name
+            path.write_bytes(text.encode())
+            assert scan_file(path)[1] == len(text.splitlines()), name
+
+    def test_large_file_spans_chunks(self, tmp_path, monkeypatch):
+        """Test counting across chunk boundaries."""
+        monkeypatch.setattr("project_management_automation.utils.file_metrics.CHUNK_SIZE", 7)
+        path = tmp_path / "big.txt"
+        path.write_text("line\n" * 100 + "tail")
+
+        assert scan_file(path)[1] == 101
+
+
+class TestFileMetricsCache:
+    """Test incremental re-scanning and persistence."""
+
+    def test_only_changed_files_are_rescanned(self, tmp_path):
+        """Test unchanged files are served from the cache."""
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_text("x = 1\ny = 2\n")
+        b.write_text("z = 3\n")
+        cache = FileMetricsCache(tmp_path)
+
+        assert cache.count_lines([a, b]) == 3
+        assert cache.get_stats()["scanned"] == 2
+
+        b.write_text("z = 3\nw = 4\nv = 5\n")
+        assert cache.count_lines([a, b]) == 5
+        stats = cache.get_stats()
+        assert stats["scanned"] == 3
+        assert stats["hits"] == 1
+
+    def test_touch_only_change_detected_by_hash(self, tmp_path):
+        """Test an mtime-only change is recognised as unchanged content."""
+        path = tmp_path / "a.md"
+        path.write_text("# Title\n")
+        cache = FileMetricsCache(tmp_path)
+        cache.metrics(path)
+
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        entry = cache.metrics(path)
+
+        assert entry["lines"] == 1
+        assert cache.get_stats()["content_unchanged"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test a saved cache is reused by a fresh instance without reading files."""
+        path = tmp_path / "a.py"
+        path.write_text("a\nb\n")
+        first = FileMetricsCache(tmp_path)
+        first.metrics(path)
+        assert first.save() is True
+        assert first.save() is False  # Nothing changed since
+
+        second = FileMetricsCache(tmp_path)
+        assert second.metrics(path)["lines"] == 2
+        assert second.get_stats() == {"hits": 1, "scanned": 0, "content_unchanged": 0, "errors": 0, "entries": 1}
+
+        saved = json.loads((tmp_path / ".exarp" / "file_metrics.json").read_text())
+        assert set(saved["files"]) == {"a.py"}
+
+    def test_save_drops_deleted_files(self, tmp_path):
+        """Test entries for removed files are pruned on save."""
+        keep = tmp_path / "keep.py"
+        gone = tmp_path / "gone.py"
+        keep.write_text("1\n")
+        gone.write_text("2\n")
+        cache = FileMetricsCache(tmp_path)
+        cache.count_lines([keep, gone])
+        gone.unlink()
+
+        cache.save()
+
+        saved = json.loads((tmp_path / ".exarp" / "file_metrics.json").read_text())
+        assert set(saved["files"]) == {"keep.py"}
+
+    def test_missing_and_corrupt(self, tmp_path):
+        """Test missing files count as zero and a corrupt cache file is ignored."""
+        (tmp_path / ".exarp").mkdir()
+        (tmp_path / ".exarp" / "file_metrics.json").write_text("{broken")
+        cache = FileMetricsCache(tmp_path)
+
+        assert cache.metrics(tmp_path / "missing.py") is None
+        assert cache.count_lines([tmp_path / "missing.py"]) == 0
@@ -6,6 +6,7 @@ Tests commit creation, retrieval, filtering, and storage.
 
 import json
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -21,6 +22,7 @@ from project_management_automation.utils.commit_tracking import (
     track_task_status_change,
     track_task_update,
 )
+from project_management_automation.utils.file_lock import FileLock
 
 
 class TestTaskCommit:
@@ -184,6 +186,103 @@ class TestCommitTracker:
         state_after = tracker.get_task_state_at_time("task-123", datetime(2025, 1, 26, 11, 30, 0))
         assert state_after == {"status": "done"}
 
+    def test_create_commit_appends_single_line(self, temp_dir):
+        """Test commits are appended to the log instead of rewriting it."""
+        tracker = CommitTracker(project_root=temp_dir)
+
+        tracker.create_commit("task-1", "Create", new_state={})
+        size_after_first = tracker.commits_file.stat().st_size
+        tracker.create_commit("task-2", "Create", new_state={})
+
+        lines = tracker.commits_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["task_id"] == "task-2"
+        assert tracker.commits_file.read_bytes()[:size_after_first].count(b"\n") == 1
+
+    def test_index_catches_up_across_instances(self, temp_dir):
+        """Test a second tracker sees commits appended after the index was persisted."""
+        writer = CommitTracker(project_root=temp_dir)
+        writer.create_commit("task-1", "Create", new_state={"v": 1})
+        writer.flush()
+        writer.create_commit("task-1", "Update", new_state={"v": 2}, branch="feature-x")
+
+        reader = CommitTracker(project_root=temp_dir)
+        commits = reader.get_commits_for_task("task-1")
+        assert [c.new_state["v"] for c in commits] == [1, 2]
+        assert [c.message for c in reader.get_commits_for_branch("feature-x")] == ["Update"]
+
+    def test_get_commit_by_id(self, temp_dir):
+        """Test direct lookup through the commit ID index."""
+        tracker = CommitTracker(project_root=temp_dir)
+        commit = tracker.create_commit("task-1", "Create", new_state={"a": 1})
+
+        assert tracker.get_commit(commit.id).new_state == {"a": 1}
+        assert tracker.get_task_state_at_commit("task-1", commit.id) == {"a": 1}
+        assert tracker.get_commit("missing") is None
+
+    def test_migrates_legacy_commits_json(self, temp_dir):
+        """Test a legacy commits.json is imported into the log."""
+        legacy = temp_dir / ".todo2" / "commits.json"
+        legacy.parent.mkdir(parents=True)
+        old_commit = TaskCommit(task_id="task-9", message="Create", timestamp=datetime(2025, 1, 1))
+        legacy.write_text(json.dumps({"commits": [old_commit.to_dict()], "version": "1.0"}))
+
+        tracker = CommitTracker(project_root=temp_dir)
+        commits = tracker.get_commits_for_task("task-9")
+
+        assert [c.id for c in commits] == [old_commit.id]
+        assert not legacy.exists()
+
+    def test_compact_sorts_and_deduplicates(self, temp_dir):
+        """Test compaction orders by timestamp and drops duplicate IDs."""
+        tracker = CommitTracker(project_root=temp_dir)
+        late = TaskCommit(commit_id="c-late", task_id="task-1", timestamp=datetime(2025, 1, 2))
+        early = TaskCommit(commit_id="c-early", task_id="task-1", timestamp=datetime(2025, 1, 1))
+        tracker._append_commit(late)
+        tracker._append_commit(early)
+        tracker._append_commit(late)
+
+        assert tracker.compact() == 2
+        lines = [json.loads(line) for line in tracker.commits_file.read_text().splitlines()]
+        assert [line["id"] for line in lines] == ["c-early", "c-late"]
+
+    def test_skips_torn_trailing_record(self, temp_dir):
+        """Test a partially written record does not corrupt later appends."""
+        tracker = CommitTracker(project_root=temp_dir)
+        tracker.create_commit("task-1", "Create", new_state={})
+        with open(tracker.commits_file, "a") as f:
+            f.write('{"id": "torn"')
+
+        tracker.create_commit("task-1", "Update", new_state={})
+
+        assert [c.message for c in tracker.get_commits_for_task("task-1")] == ["Create", "Update"]
+
+    def test_append_waits_for_commit_log_lock(self, temp_dir):
+        """Test an append and its offset bookkeeping do not interleave with another writer."""
+        other = CommitTracker(project_root=temp_dir)
+        other.create_commit("task-1", "Create", new_state={})
+        tracker = CommitTracker(project_root=temp_dir)
+        tracker.get_all_commits()
+        commits = []
+
+        with FileLock(other.lock_file):
+            thread = threading.Thread(
+                target=lambda: commits.append(tracker.create_commit("task-2", "Create", new_state={}))
+            )
+            thread.start()
+            thread.join(0.3)
+            assert thread.is_alive()
+
+            # Another process appends while holding the lock
+            record = TaskCommit(commit_id="c-other", task_id="task-1", message="Update").to_dict()
+            with open(other.commits_file, "a") as f:
+                f.write(json.dumps(record) + "\n")
+
+        thread.join(10)
+        assert tracker.get_commit(commits[0].id).task_id == "task-2"
+        assert tracker.get_commit("c-other").message == "Update"
+        assert len(tracker.commits_file.read_text().splitlines()) == 3
+
 
 class TestCommitTrackingFunctions:
     """Tests for commit tracking helper functions."""
@@ -288,3 +288,115 @@ class TestJsonFileCacheDecorator:
 
         finally:
             temp_path.unlink()
+
+
+class TestJsonFileCacheConcurrency:
+    """Test locking and stale-while-revalidate behavior."""
+
+    def test_get_or_load_concurrent_single_load(self, tmp_path, monkeypatch):
+        """Test concurrent misses are coalesced into one file read."""
+        import threading
+
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps({"n": 1}))
+        cache = JsonFileCache(path)
+
+        loads = []
+        real_load = json.load
+
+        def slow_load(f):
+            loads.append(1)
+            time.sleep(0.05)
+            return real_load(f)
+
+        monkeypatch.setattr("project_management_automation.utils.json_cache.json.load", slow_load)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load())) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert results == [{"n": 1}] * 5
+        assert len(loads) == 1
+
+    def test_stale_while_revalidate(self, tmp_path):
+        """Test a changed file serves the old value once, then the reloaded one."""
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps({"version": 1}))
+        cache = JsonFileCache(path, stale_while_revalidate=True)
+        assert cache.get_or_load() == {"version": 1}
+
+        path.write_text(json.dumps({"version": 2, "padding": "x"}))
+
+        assert cache.get_or_load() == {"version": 1}
+        deadline = time.time() + 5
+        while cache.get() != {"version": 2, "padding": "x"} and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get_or_load() == {"version": 2, "padding": "x"}
+        assert cache.get_stats()["stale_hits"] == 1
+
+
+class TestJsonCacheManagerLimits:
+    """Test LRU eviction and manager-wide stats."""
+
+    def _files(self, tmp_path, count, size=100):
+        paths = []
+        for i in range(count):
+            path = tmp_path / f"f{i}.json"
+            path.write_text(json.dumps({"i": i, "pad": "x" * size}))
+            paths.append(path)
+        return paths
+
+    def test_evicts_least_recently_used_by_count(self, tmp_path):
+        """Test the oldest unused cache is dropped past max_entries."""
+        manager = JsonCacheManager(max_entries=2)
+        a, b, c = self._files(tmp_path, 3)
+
+        cache_a = manager.get_cache(a)
+        cache_a.get_or_load()
+        manager.get_cache(b).get_or_load()
+        cache_a.get_or_load()  # a is now most recently used
+        manager.get_cache(c).get_or_load()
+
+        assert set(manager.get_all_stats()) == {str(a.absolute()), str(c.absolute())}
+        assert manager.get_stats()["evictions"] == 1
+        assert manager.get_cache(a) is cache_a
+
+    def test_evicts_by_bytes(self, tmp_path):
+        """Test combined cached size stays within max_bytes."""
+        paths = self._files(tmp_path, 4, size=1000)
+        manager = JsonCacheManager(max_entries=100, max_bytes=2500)
+
+        for path in paths:
+            manager.get_cache(path).get_or_load()
+
+        stats = manager.get_stats()
+        assert stats["bytes"] <= 2500
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 2
+
+    def test_manager_stats(self, tmp_path):
+        """Test manager-wide hit/miss counts."""
+        (path,) = self._files(tmp_path, 1)
+        manager = JsonCacheManager()
+        cache = manager.get_cache(path, enable_stats=False)
+
+        cache.get_or_load()
+        cache.get_or_load()
+        cache.get_or_load()
+
+        stats = manager.get_stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["bytes"] == path.stat().st_size
+        assert stats["hit_rate"] == pytest.approx(0.667)
+
+    def test_evicted_cache_keeps_working(self, tmp_path):
+        """Test a cache object held by a caller still loads after eviction."""
+        a, b = self._files(tmp_path, 2)
+        manager = JsonCacheManager(max_entries=1)
+        cache_a = manager.get_cache(a)
+        manager.get_cache(b)
+
+        assert cache_a.get_or_load()["i"] == 0
+        assert manager.get_stats()["entries"] == 1
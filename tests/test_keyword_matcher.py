@@ -0,0 +1,106 @@
+"""
+Tests for the compiled multi-keyword matcher.
+"""
+
+import json
+import random
+import re
+
+from project_management_automation.utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
+
+
+class TestKeywordMatcher:
+    """Test matching semantics."""
+
+    def test_substring_hits_overlap(self):
+        """Test every keyword found by `in` is found, including prefixes and overlaps."""
+        matcher = KeywordMatcher(["test", "testing", "sting", "update", "update version"])
+
+        assert matcher.find("Testing the update version bump") == {
+            "test", "testing", "sting", "update", "update version",
+        }
+        assert matcher.find("") == set()
+        assert not matcher.any("nothing here")
+
+    def test_groups_in_declaration_order(self):
+        """Test groups are reported once each, in the order they were declared."""
+        matcher = KeywordMatcher({
+            "docs": ["readme", "guide"],
+            "testing": ["coverage", "test"],
+            "api": ["api"],
+        })
+
+        assert matcher.groups("Add test coverage to the README") == ["docs", "testing"]
+        assert matcher.groups("nothing") == []
+
+    def test_shared_keyword_and_empty_keyword(self):
+        """Test a keyword in two groups hits both and '' always matches, as with `in`."""
+        matcher = KeywordMatcher({"a": ["api"], "b": ["api", "service"], "c": [""]})
+
+        assert matcher.groups("new API") == ["a", "b", "c"]
+        assert matcher.groups("unrelated") == ["c"]
+        assert matcher.any("")
+
+    def test_whole_words(self):
+        """Test whole-word mode matches only complete words."""
+        matcher = KeywordMatcher(["test", "tests", "mcp"], whole_words=True)
+
+        assert matcher.find("Add tests for the MCP server") == {"tests", "mcp"}
+        assert matcher.find("attest test_case test") == {"test"}
+
+    def test_batch_matches_single(self):
+        """Test batch results line up with per-text results."""
+        matcher = KeywordMatcher({"x": ["ab"], "y": ["b"]})
+        texts = ["ab", "", "a\x00b", None, "İb", "cab"]
+
+        assert matcher.groups_batch(texts) == [matcher.groups(t or "") for t in texts]
+        assert matcher.groups_batch([]) == []
+
+    def test_equivalent_to_naive_scans(self):
+        """Test randomized keyword sets agree with `in` and word tokenizing."""
+        rng = random.Random(7)
+        for _ in range(500):
+            keywords = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(5)]
+            texts = ["".join(rng.choice("abc _-") for _ in range(rng.randint(0, 24))) for _ in range(3)]
+            substring = KeywordMatcher(keywords)
+            whole = KeywordMatcher(keywords, whole_words=True)
+
+            for text, found in zip(texts, substring.find_batch(texts)):
+                assert found == {kw for kw in keywords if kw in text}
+                words = set(re.findall(r"\w+", text))
+                assert whole.find(text) == {kw for kw in keywords if kw in words}
+
+
+class TestGetKeywordMatcher:
+    """Test the matcher registry."""
+
+    def test_same_keywords_share_matcher(self):
+        """Test a keyword set is compiled once."""
+        first = get_keyword_matcher({"g": ["alpha", "beta"]})
+
+        assert get_keyword_matcher({"g": ("alpha", "beta")}) is first
+        assert get_keyword_matcher({"g": ["alpha", "beta"]}, whole_words=True) is not first
+        assert get_keyword_matcher(["alpha", "beta"]) is not first
+
+
+class TestCallSites:
+    """Test callers keep their previous results."""
+
+    def test_duration_tiers(self):
+        """Test the first tier with a hit sets the heuristic estimate."""
+        from project_management_automation.tools.task_duration_estimator import TaskDurationEstimator
+
+        estimate = TaskDurationEstimator.__new__(TaskDurationEstimator)._estimate_from_keywords
+        assert estimate("update version and refactor") == 0.5
+        assert estimate("refactor the system") == 3.0
+        assert estimate("redesign architecture") == 4.0
+        assert estimate("nothing matches") == 2.0
+
+    def test_workflow_reasons_keep_keyword_order(self):
+        """Test keyword reasons are listed in indicator order."""
+        from project_management_automation.tools.workflow_recommender import recommend_workflow_mode
+
+        result = json.loads(recommend_workflow_mode(task_description="Deploy and implement, then create it"))
+        assert result["data"]["rationale"] == [
+            "Keyword: 'implement'", "Keyword: 'create'", "Keyword: 'deploy'",
+        ]
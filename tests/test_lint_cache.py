@@ -0,0 +1,179 @@
+"""
+Tests for the incremental lint results store and run_linter integration.
+"""
+
+import json
+import os
+import stat
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from project_management_automation.utils import lint_cache
+from project_management_automation.utils.lint_cache import (
+    LintResultStore,
+    get_lint_result_store,
+    lint_config_key,
+)
+
+# Reports one E501 per line containing "BAD" and logs the files it was given
+# (exit 2, like a ruff configuration error, when FAKE_RUFF_CRASH is set)
+FAKE_RUFF = f"""#!{sys.executable}
+import json, os, sys
+if os.environ.get("FAKE_RUFF_CRASH"):
+    sys.exit(2)
+files = [a for a in sys.argv[1:] if not a.startswith("-") and a != "check"]
+with open(os.environ["FAKE_RUFF_LOG"], "a") as log:
+    log.write(json.dumps(files) + "\\n")
+issues = []
+for path in files:
+    for row, line in enumerate(open(path), 1):
+        if "BAD" in line:
+            issues.append({{"code": "E501", "message": "bad", "filename": path,
+                           "location": {{"row": row, "column": 1}}}})
+print(json.dumps(issues))
+sys.exit(1 if issues else 0)
+"""
+
+
+def _problem(code="E501", severity="error", file="a.py"):
+    return {"code": code, "severity": severity, "file": file, "line": 1, "message": "m"}
+
+
+class TestLintResultStore:
+    """Test the store itself."""
+
+    def test_stale_and_update(self, tmp_path):
+        """Test only files with new content hashes are stale."""
+        store = LintResultStore(tmp_path)
+        assert store.stale("cfg", {"a.py": "h1", "b.py": "h2"}) == ["a.py", "b.py"]
+        store.update("cfg", "a.py", "h1", [_problem()])
+        store.update("cfg", "b.py", "h2", [])
+
+        assert store.stale("cfg", {"a.py": "h1", "b.py": "h3"}) == ["b.py"]
+        assert store.stale("other", {"a.py": "h1"}) == ["a.py"]
+
+    def test_totals_updated_incrementally(self, tmp_path):
+        """Test replacing and pruning files adjusts the aggregates."""
+        store = LintResultStore(tmp_path)
+        store.update("cfg", "a.py", "h1", [_problem(), _problem("W291", "warning")])
+        store.update("cfg", "b.py", "h1", [_problem("F401")])
+        assert store.results("cfg")["by_category"] == {"error": 1, "warning": 1, "fatal": 1}
+
+        store.update("cfg", "a.py", "h2", [])
+        results = store.results("cfg")
+        assert results["by_severity"] == {"error": 1}
+        assert results["by_file"] == {"b.py": 1}
+
+        assert store.prune("cfg", "", keep=["a.py"]) == 1
+        assert store.results("cfg")["problems"] == []
+
+    def test_persistence_and_last_config(self, tmp_path):
+        """Test a new instance reads the store and remembers the last config."""
+        store = LintResultStore(tmp_path)
+        store.update("cfg", "a.py", "h1", [_problem()], linter="ruff")
+        assert store.save()
+        assert not store.save()  # Nothing changed
+
+        reloaded = LintResultStore(tmp_path).results()
+        assert reloaded["linter"] == "ruff"
+        assert reloaded["by_severity"] == {"error": 1}
+        assert LintResultStore(tmp_path / "empty").results() is None
+
+    def test_config_key_tracks_options_and_config_files(self, tmp_path):
+        """Test select/ignore and config file edits change the key."""
+        base = lint_config_key(tmp_path, "ruff")
+        assert lint_config_key(tmp_path, "ruff", select="E") != base
+        (tmp_path / "pyproject.toml").write_text("[tool.ruff]\nline-length = 100\n")
+        assert lint_config_key(tmp_path, "ruff") != base
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project with a fake ruff on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    ruff = bin_dir / "ruff"
+    ruff.write_text(FAKE_RUFF)
+    ruff.chmod(ruff.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_RUFF_LOG", str(tmp_path / "ruff.log"))
+    monkeypatch.setattr(lint_cache, "_stores", {})
+
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "good.py").write_text("x = 1\n")
+    (root / "pkg" / "bad.py").write_text("y = 'BAD'\n")
+    with patch("project_management_automation.utils.find_project_root", return_value=root):
+        yield root, tmp_path / "ruff.log"
+
+
+def _runs(log):
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+class TestIncrementalRunLinter:
+    """Test run_linter only lints changed files."""
+
+    def test_second_run_reuses_results(self, project):
+        """Test unchanged files are not passed to the linter again."""
+        from project_management_automation.tools.linter import run_linter
+
+        root, log = project
+        first = json.loads(run_linter(analyze=False))["data"]
+        second = json.loads(run_linter(analyze=False))["data"]
+
+        assert first["total_issues"] == second["total_issues"] == 1
+        assert second["lint_cache"] == {"files_linted": 0, "files_reused": 2}
+        assert second["by_category"] == {"error": 1}
+        assert len(_runs(log)) == 1
+
+    def test_changed_file_relinted(self, project):
+        """Test an edit re-lints just that file and updates the totals."""
+        from project_management_automation.tools.linter import run_linter
+
+        root, log = project
+        run_linter(analyze=False)
+        (root / "pkg" / "good.py").write_text("x = 'BAD'\nz = 'BAD'\n")
+        (root / "pkg" / "bad.py").unlink()
+
+        data = json.loads(run_linter(analyze=False))["data"]
+
+        assert data["total_issues"] == 2
+        assert data["files_checked"] == 1
+        assert data["lint_cache"]["files_linted"] == 1
+        assert [os.path.basename(f) for f in _runs(log)[-1]] == ["good.py"]
+
+    def test_ruff_respects_excludes_for_explicit_paths(self):
+        """Test ruff is told to apply its excludes to the files it is given."""
+        from project_management_automation.tools.linter import _linter_command
+
+        assert "--force-exclude" in _linter_command("ruff", fix=False, select=None, ignore=None)
+        assert "--force-exclude" not in _linter_command("flake8", fix=False, select=None, ignore=None)
+
+    def test_linter_failure_is_not_cached(self, project, monkeypatch):
+        """Test a crashing linter reports an error instead of a clean result."""
+        from project_management_automation.tools.linter import run_linter
+
+        root, _ = project
+        monkeypatch.setenv("FAKE_RUFF_CRASH", "1")
+
+        assert json.loads(run_linter(analyze=False))["success"] is False
+        assert get_lint_result_store(root).results() is None
+
+    def test_analyze_uses_store(self, project):
+        """Test lint(action="analyze") without problems_json analyzes the last run."""
+        from project_management_automation.tools.consolidated import lint
+
+        root, log = project
+        assert "error" in json.loads(lint(action="analyze"))
+        lint(action="run", analyze=False)
+        runs = len(_runs(log))
+        (root / "pkg" / "bad.py").write_text("y = 'BAD'\nw = 2\n")
+
+        result = json.loads(lint(action="analyze"))
+
+        assert result["lint_cache"]["total_issues"] == 1
+        assert result["lint_cache"]["stale_files"] == ["pkg/bad.py"]
+        assert len(_runs(log)) == runs
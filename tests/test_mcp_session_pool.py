@@ -0,0 +1,179 @@
+"""
+Tests for pooled MCP sessions on the shared session loop.
+
+Uses fake stdio clients/sessions so no MCP server process is needed.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from project_management_automation.scripts.base import mcp_client
+from project_management_automation.scripts.base.mcp_client import MCPLoopThread, MCPSessionPool
+
+MODULE = 'project_management_automation.scripts.base.mcp_client'
+
+
+class FakeSession:
+    """Stands in for mcp.ClientSession."""
+
+    instances = []
+
+    def __init__(self, read, write):
+        self.healthy = True
+        self.closed = False
+        FakeSession.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    async def initialize(self):
+        pass
+
+    async def send_ping(self):
+        if not self.healthy:
+            raise ConnectionError("server gone")
+
+    async def call_tool(self, name, arguments):
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps({"tool": name, **arguments}))])
+
+
+@asynccontextmanager
+async def fake_stdio_client(params):
+    yield (None, None)
+
+
+@pytest.fixture
+def fake_mcp():
+    FakeSession.instances = []
+    with patch(f'{MODULE}.stdio_client', fake_stdio_client, create=True), \
+         patch(f'{MODULE}.ClientSession', FakeSession, create=True):
+        yield
+
+
+@pytest.fixture
+def pool_loop(fake_mcp):
+    pool = MCPSessionPool()
+    loop_thread = MCPLoopThread(pool)
+    yield pool, loop_thread
+    loop_thread.shutdown()
+
+
+async def _call(pool, tool, **arguments):
+    async with pool.get_session('fake', object()) as session:
+        result = await session.call_tool(tool, arguments)
+        return json.loads(result.content[0].text)
+
+
+class TestSessionReuse:
+    """Test sessions survive between synchronous calls."""
+
+    def test_sync_calls_reuse_one_session(self, pool_loop):
+        """Test one spawn serves every call made through the loop thread."""
+        pool, loop_thread = pool_loop
+
+        results = [loop_thread.run(_call(pool, 'list_todos', n=i)) for i in range(5)]
+
+        assert [r['n'] for r in results] == list(range(5))
+        stats = pool.get_stats()
+        assert stats['spawns'] == 1
+        assert stats['reuses'] == 4
+        assert stats['active_sessions'] == 1
+        assert len(FakeSession.instances) == 1
+
+    def test_callable_from_running_loop(self, pool_loop):
+        """Test sync bridge works inside a thread that already runs a loop."""
+        pool, loop_thread = pool_loop
+
+        async def async_caller():
+            return loop_thread.run(_call(pool, 'get_wisdom', score=50))
+
+        assert asyncio.run(async_caller())['score'] == 50
+
+    def test_shutdown_closes_sessions(self, pool_loop):
+        """Test shutdown exits the session contexts."""
+        pool, loop_thread = pool_loop
+        loop_thread.run(_call(pool, 'list_todos'))
+
+        loop_thread.shutdown()
+
+        assert FakeSession.instances[0].closed
+        assert pool.get_stats()['active_sessions'] == 0
+
+
+class TestHealthAndReaping:
+    """Test health checks and idle reaping."""
+
+    def test_failed_health_check_respawns(self, pool_loop):
+        """Test a session failing its ping is replaced."""
+        pool, loop_thread = pool_loop
+        loop_thread.run(_call(pool, 'list_todos'))
+        FakeSession.instances[0].healthy = False
+
+        with patch(f'{MODULE}.HEALTH_CHECK_INTERVAL', -1):
+            loop_thread.run(_call(pool, 'list_todos'))
+
+        stats = pool.get_stats()
+        assert stats['health_check_failures'] == 1
+        assert stats['spawns'] == 2
+        assert FakeSession.instances[0].closed
+
+    def test_idle_sessions_are_reaped(self, pool_loop):
+        """Test reap_idle closes sessions idle past SESSION_TIMEOUT."""
+        pool, loop_thread = pool_loop
+        loop_thread.run(_call(pool, 'list_todos'))
+
+        with patch(f'{MODULE}.SESSION_TIMEOUT', -1):
+            reaped = loop_thread.run(pool.reap_idle())
+
+        assert reaped == 1
+        assert pool.get_stats()['reaped'] == 1
+        assert FakeSession.instances[0].closed
+
+    def test_spawn_failure_is_counted(self, fake_mcp):
+        """Test a failing server start raises and is counted."""
+        @asynccontextmanager
+        async def broken_client(params):
+            raise OSError("command not found")
+            yield
+
+        pool = MCPSessionPool()
+        loop_thread = MCPLoopThread(pool)
+        try:
+            with patch(f'{MODULE}.stdio_client', broken_client, create=True):
+                with pytest.raises(OSError):
+                    loop_thread.run(_call(pool, 'list_todos'))
+        finally:
+            loop_thread.shutdown()
+
+        assert pool.get_stats()['spawn_failures'] == 1
+
+
+class TestClientBridges:
+    """Test client sync wrappers route through the shared loop."""
+
+    def test_todo2_sync_wrapper_reuses_session(self, fake_mcp, tmp_path):
+        """Test repeated _call_todo2_tool_sync calls spawn the server once."""
+        from project_management_automation.utils import todo2_mcp_client
+
+        config = {'todo2': {'command': 'todo2-server'}}
+        before = mcp_client.get_session_pool_stats()['servers'].get('todo2', {}).get('spawns', 0)
+        try:
+            with patch.object(todo2_mcp_client, 'MCP_CLIENT_AVAILABLE', True), \
+                 patch.object(todo2_mcp_client, 'StdioServerParameters', SimpleNamespace, create=True), \
+                 patch.object(todo2_mcp_client, '_load_mcp_config', return_value=config):
+                first = todo2_mcp_client._call_todo2_tool_sync('list_todos', {'a': 1}, tmp_path)
+                second = todo2_mcp_client._call_todo2_tool_sync('list_todos', {'a': 2}, tmp_path)
+        finally:
+            mcp_client.shutdown_mcp_sessions()
+
+        assert (first['a'], second['a']) == (1, 2)
+        server_stats = mcp_client.get_session_pool_stats()['servers']['todo2']
+        assert server_stats['spawns'] - before == 1
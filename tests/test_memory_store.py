@@ -0,0 +1,237 @@
+"""
+Tests for the indexed memory store.
+"""
+
+import json
+import os
+
+from project_management_automation.utils.memory_store import MemoryStore, get_memory_store
+
+
+def _memory(memory_id, title, content="", category="insight", created_at="2025-01-01T00:00:00",
+            linked_tasks=None, session_date="2025-01-01"):
+    return {
+        "id": memory_id,
+        "title": title,
+        "content": content,
+        "category": category,
+        "linked_tasks": linked_tasks or [],
+        "created_at": created_at,
+        "session_date": session_date,
+    }
+
+
+def _write_external(memories_dir, memory):
+    """Write a memory file bypassing the store (another process)."""
+    path = memories_dir / f"{memory['id']}.json"
+    path.write_text(json.dumps(memory))
+    return path
+
+
+class TestSearch:
+    """Test BM25 ranking."""
+
+    def test_title_hits_outrank_content_hits(self, tmp_path):
+        """Test title matches rank above content-only matches."""
+        store = MemoryStore(tmp_path)
+        store.save(_memory("a", "Notes", "the cache was stale after the deploy"))
+        store.save(_memory("b", "Cache invalidation fix", "cleared entries"))
+        store.save(_memory("c", "Unrelated", "nothing to see"))
+
+        results = store.search("cache")
+
+        assert [m["id"] for m in results] == ["b", "a"]
+
+    def test_rare_terms_weigh_more(self, tmp_path):
+        """Test a rare query term dominates a common one."""
+        store = MemoryStore(tmp_path)
+        for i in range(5):
+            store.save(_memory(f"common{i}", "Error report", "error again"))
+        store.save(_memory("rare", "Error report", "deadlock in json cache"))
+
+        results = store.search("error deadlock", limit=3)
+
+        assert results[0]["id"] == "rare"
+        assert len(results) == 3
+
+    def test_prefix_matches_partial_words(self, tmp_path):
+        """Test partial words expand to vocabulary prefixes."""
+        store = MemoryStore(tmp_path)
+        store.save(_memory("m", "Database migration plan"))
+
+        assert [m["id"] for m in store.search("migrat")] == ["m"]
+        assert store.search("zzz") == []
+
+    def test_category_filter(self, tmp_path):
+        """Test search can be restricted to one category."""
+        store = MemoryStore(tmp_path)
+        store.save(_memory("d", "Timeout bug", category="debug"))
+        store.save(_memory("r", "Timeout research", category="research"))
+
+        assert [m["id"] for m in store.search("timeout", category="debug")] == ["d"]
+
+
+class TestSecondaryIndexes:
+    """Test category/task/date filtering."""
+
+    def test_filter_combines_indexes_newest_first(self, tmp_path):
+        """Test filters intersect and results are newest first."""
+        store = MemoryStore(tmp_path)
+        store.save(_memory("old", "A", category="debug", linked_tasks=["T-1"], created_at="2025-01-01T00:00:00"))
+        store.save(_memory("new", "B", category="debug", linked_tasks=["T-1"], created_at="2025-03-01T00:00:00"))
+        store.save(_memory("other", "C", category="research", linked_tasks=["T-1"],
+                           created_at="2025-02-01T00:00:00", session_date="2025-02-01"))
+
+        assert [m["id"] for m in store.filter(task_id="T-1")] == ["new", "other", "old"]
+        assert [m["id"] for m in store.filter(category="debug", task_id="T-1")] == ["new", "old"]
+        assert [m["id"] for m in store.filter(since="2025-02-01T00:00:00")] == ["new", "other"]
+        assert [m["id"] for m in store.filter(session_date="2025-02-01")] == ["other"]
+        assert store.filter(task_id="T-404") == []
+        assert store.category_counts() == {"debug": 2, "research": 1}
+
+
+class TestIncrementalUpdates:
+    """Test the index follows saves, deletes and external changes."""
+
+    def test_resave_reindexes(self, tmp_path):
+        """Test saving a changed memory replaces its old terms and links."""
+        store = MemoryStore(tmp_path)
+        store.save(_memory("m", "Original title", linked_tasks=["T-1"]))
+
+        memory = store.get("m")
+        memory["title"] = "Renamed"
+        memory["linked_tasks"].append("T-2")
+        store.save(memory)
+
+        assert store.search("original") == []
+        assert [m["id"] for m in store.search("renamed")] == ["m"]
+        assert [m["id"] for m in store.filter(task_id="T-2")] == ["m"]
+
+    def test_get_returns_private_copy(self, tmp_path):
+        """Test mutating a fetched memory does not leak into the index."""
+        store = MemoryStore(tmp_path)
+        store.save(_memory("m", "Title", linked_tasks=["T-1"]))
+
+        store.get("m")["linked_tasks"].append("T-2")
+
+        assert store.get("m")["linked_tasks"] == ["T-1"]
+
+    def test_delete_removes_from_indexes(self, tmp_path):
+        """Test delete removes the file and every index entry."""
+        store = MemoryStore(tmp_path)
+        store.save(_memory("m", "Doomed", category="debug", linked_tasks=["T-1"]))
+
+        assert store.delete("m") is True
+        assert store.delete("m") is False
+        assert not (tmp_path / "m.json").exists()
+        assert store.search("doomed") == []
+        assert store.filter(task_id="T-1") == []
+        assert store.count() == 0
+
+    def test_external_files_are_picked_up(self, tmp_path):
+        """Test files added, removed or edited by other writers are reflected."""
+        store = MemoryStore(tmp_path)
+        store.save(_memory("mine", "Local"))
+        assert store.count() == 1
+
+        path = _write_external(tmp_path, _memory("theirs", "External insight"))
+        assert [m["id"] for m in store.search("external")] == ["theirs"]
+
+        # In-place edit keeps the directory mtime; refresh revalidates file signatures
+        path.write_text(json.dumps(_memory("theirs", "Edited externally, longer title")))
+        store.refresh()
+        assert [m["id"] for m in store.search("edited")] == ["theirs"]
+
+        os.remove(path)
+        assert [m["id"] for m in store.all()] == ["mine"]
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        """Test a rescan only parses new or modified files."""
+        for i in range(3):
+            _write_external(tmp_path, _memory(f"m{i}", f"Memory {i}"))
+        store = MemoryStore(tmp_path)
+        assert store.count() == 3
+        parsed = store.get_stats()["files_parsed"]
+
+        _write_external(tmp_path, _memory("m3", "Memory 3"))
+        store.refresh()
+
+        assert store.count() == 4
+        assert store.get_stats()["files_parsed"] == parsed + 1
+
+    def test_invalid_files_are_skipped(self, tmp_path):
+        """Test unreadable memory files are ignored."""
+        (tmp_path / "broken.json").write_text("{not json")
+        (tmp_path / "list.json").write_text("[]")
+        _write_external(tmp_path, _memory("ok", "Fine"))
+
+        store = MemoryStore(tmp_path)
+
+        assert [m["id"] for m in store.all()] == ["ok"]
+
+
+class TestCatalog:
+    """Test ID and category lookups used by the memory:// resource templates."""
+
+    def test_lookup_by_memory_id_and_path(self, tmp_path):
+        """Test memories are found by their own id even if the file is named differently."""
+        (tmp_path / "renamed.json").write_text(json.dumps(_memory("abc-123", "Renamed")))
+        store = MemoryStore(tmp_path)
+
+        assert store.get("abc-123")["title"] == "Renamed"
+        assert store.get("renamed")["id"] == "abc-123"
+        assert store.path("abc-123") == tmp_path / "renamed.json"
+        assert store.path("missing") is None
+
+        store.delete("renamed")
+        assert store.get("abc-123") is None
+
+    def test_category_ignore_case(self, tmp_path):
+        """Test case-insensitive category filtering, newest first."""
+        store = MemoryStore(tmp_path)
+        store.save(_memory("a", "A", category="Debug", created_at="2025-01-01T00:00:00"))
+        store.save(_memory("b", "B", category="debug", created_at="2025-01-02T00:00:00"))
+        store.save(_memory("c", "C", category="insight"))
+
+        assert [m["id"] for m in store.filter(category="DEBUG", ignore_case=True)] == ["b", "a"]
+        assert [m["id"] for m in store.filter(category="debug")] == ["b"]
+
+    def test_resource_templates_use_store(self, tmp_path, monkeypatch):
+        """Test memory:// templates read through the catalog, not by parsing every file."""
+        from project_management_automation.resources import templates
+
+        memories_dir = tmp_path / ".exarp" / "memories"
+        memories_dir.mkdir(parents=True)
+        for i in range(20):
+            _write_external(memories_dir, _memory(f"m{i}", f"Memory {i}", category="research" if i % 2 else "debug"))
+        monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+
+        store = get_memory_store(memories_dir)
+        templates.get_memories_by_category("Research")
+        parsed = store.get_stats()["files_parsed"]
+
+        found = templates.get_memory_by_id("m7")
+        by_category = templates.get_memories_by_category("debug")
+
+        assert found["found"] is True and found["memory"]["title"] == "Memory 7"
+        assert templates.get_memory_by_id("nope")["found"] is False
+        assert by_category["count"] == 10
+        assert store.get_stats()["files_parsed"] == parsed
+
+    def test_resource_templates_without_storage(self, tmp_path, monkeypatch):
+        """Test templates report uninitialized storage."""
+        from project_management_automation.resources import templates
+
+        monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+
+        assert templates.get_memory_by_id("x")["error"] == "Memory storage not initialized"
+        assert templates.get_memories_by_category("debug")["count"] == 0
+
+
+class TestRegistry:
+    """Test shared store lookup."""
+
+    def test_same_directory_shares_store(self, tmp_path):
+        """Test one store per resolved directory."""
+        assert get_memory_store(tmp_path) is get_memory_store(str(tmp_path / "."))
+        assert get_memory_store(tmp_path) is not get_memory_store(tmp_path / "other")
@@ -0,0 +1,147 @@
+"""
+Tests for the near-duplicate detection engine.
+
+Compares indexed search against brute-force all-pairs comparison.
+"""
+
+import random
+import string
+from difflib import SequenceMatcher
+
+import pytest
+
+from project_management_automation.utils.near_duplicates import (
+    find_similar_groups,
+    find_similar_pairs,
+    match_similar,
+)
+
+WORDS = [
+    "implement", "fix", "add", "update", "refactor", "tests", "for", "the",
+    "auth", "module", "api", "cache", "database", "docs", "server", "config",
+]
+
+
+def _corpus(seed: int = 7, base: int = 120, mutated: int = 80) -> list[str]:
+    rng = random.Random(seed)
+    texts = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))) for _ in range(base)]
+    for _ in range(mutated):
+        chars = list(rng.choice(texts[:base]))
+        for _ in range(rng.randint(0, 3)):
+            k = rng.randrange(len(chars))
+            op = rng.random()
+            if op < 0.33:
+                chars[k] = rng.choice(string.ascii_lowercase)
+            elif op < 0.66:
+                chars.insert(k, rng.choice(string.ascii_lowercase))
+            elif len(chars) > 1:
+                del chars[k]
+        texts.append("".join(chars))
+    return texts
+
+
+def _jaccard(a: str, b: str) -> float:
+    wa, wb = set(a.lower().split()), set(b.lower().split())
+    if not wa or not wb:
+        return 0.0
+    return len(wa & wb) / len(wa | wb)
+
+
+class TestFindSimilarPairs:
+    """Test find_similar_pairs()."""
+
+    @pytest.mark.parametrize("threshold", [0.85, 0.7])
+    def test_ratio_matches_brute_force(self, threshold):
+        """Test indexed ratio search finds exactly the brute-force pairs."""
+        texts = _corpus()
+        expected = {
+            (i, j)
+            for i in range(len(texts))
+            for j in range(i + 1, len(texts))
+            if SequenceMatcher(None, texts[i], texts[j]).ratio() >= threshold
+        }
+
+        pairs = find_similar_pairs(texts, threshold)
+
+        assert {(i, j) for i, j, _ in pairs} == expected
+        assert pairs == sorted(pairs, key=lambda p: (p[0], p[1]))
+
+    def test_scores_earlier_text_first(self):
+        """Test scores equal SequenceMatcher(None, texts[i], texts[j]).ratio()."""
+        texts = _corpus(seed=3)
+        for i, j, score in find_similar_pairs(texts, 0.8):
+            assert score == SequenceMatcher(None, texts[i], texts[j]).ratio()
+
+    def test_jaccard_matches_brute_force(self):
+        """Test word-Jaccard search is exact."""
+        texts = _corpus(seed=11)
+        expected = {
+            (i, j)
+            for i in range(len(texts))
+            for j in range(i + 1, len(texts))
+            if _jaccard(texts[i], texts[j]) >= 0.6
+        }
+
+        pairs = find_similar_pairs(texts, 0.6, measure="jaccard")
+
+        assert {(i, j) for i, j, _ in pairs} == expected
+
+    def test_lsh_candidates_are_verified_and_high_recall(self):
+        """Test LSH mode reports only exact matches and finds nearly all of them."""
+        texts = _corpus(seed=17, base=300, mutated=200)
+        exact = find_similar_pairs(texts, 0.85)
+
+        approx = find_similar_pairs(texts, 0.85, exhaustive_limit=0)
+
+        assert set(approx) <= set(exact)
+        assert len(approx) >= 0.9 * len(exact)
+
+    def test_skips_empty_and_short_texts(self):
+        """Test empty and too-short texts never pair."""
+        texts = ["", "", "abc", "abc", "update the api docs", "update the api doc"]
+
+        pairs = find_similar_pairs(texts, 0.85, min_length=4)
+
+        assert [(i, j) for i, j, _ in pairs] == [(4, 5)]
+
+
+class TestFindSimilarGroups:
+    """Test find_similar_groups()."""
+
+    def test_matches_greedy_nested_loop(self):
+        """Test grouping matches the classic greedy nested loop."""
+        texts = _corpus(seed=5)
+        expected = []
+        grouped = set()
+        for i in range(len(texts)):
+            if i in grouped:
+                continue
+            group = [i]
+            grouped.add(i)
+            for j in range(i + 1, len(texts)):
+                if j not in grouped and SequenceMatcher(None, texts[i], texts[j]).ratio() >= 0.85:
+                    group.append(j)
+                    grouped.add(j)
+            if len(group) > 1:
+                expected.append(group)
+
+        assert find_similar_groups(texts, 0.85) == expected
+
+
+class TestMatchSimilar:
+    """Test match_similar()."""
+
+    def test_matches_brute_force(self):
+        """Test query/candidate matching is exact for Jaccard."""
+        texts = _corpus(seed=13)
+        queries, candidates = texts[:90], texts[90:]
+        expected = {
+            (q, c)
+            for q in range(len(queries))
+            for c in range(len(candidates))
+            if _jaccard(queries[q], candidates[c]) >= 0.7
+        }
+
+        matches = match_similar(queries, candidates, 0.7)
+
+        assert {(q, c) for q, c, _ in matches} == expected
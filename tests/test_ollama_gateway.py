@@ -0,0 +1,169 @@
+"""
+Tests for the Ollama generation gateway, against a local fake Ollama server.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from project_management_automation.tools import ollama_integration
+from project_management_automation.tools.ollama_gateway import OllamaGateway, OllamaHTTPClient
+
+
+class _FakeOllama(BaseHTTPRequestHandler):
+    """Answers /api/generate with the reversed prompt; models in server.missing 404."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests.append(body)
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            time.sleep(server.delay)
+            if body["model"] in server.missing:
+                self._send(404, json.dumps({"error": f"model '{body['model']}' not found"}))
+            elif body["stream"]:
+                words = body["prompt"][::-1].split(" ")
+                lines = [json.dumps({"response": w + " ", "done": False}) for w in words]
+                self._send(200, "\n".join(lines + [json.dumps({"done": True})]))
+            else:
+                self._send(200, json.dumps({"response": body["prompt"][::-1], "done": True}))
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _send(self, status, text):
+        data = text.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    """Fake Ollama server; yields (server, host URL)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllama)
+    server.requests, server.missing, server.delay = [], set(), 0.0
+    server.lock, server.active, server.peak = threading.Lock(), 0, 0
+    server.connections = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.delenv("EXARP_DISABLE_OLLAMA_CACHE", raising=False)
+    yield server, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestOllamaGateway:
+    """Test caching, coalescing and limiting."""
+
+    def test_identical_requests_served_from_cache(self, fake_ollama):
+        """Test a repeated request does not reach the server."""
+        server, host = fake_ollama
+        gateway = OllamaGateway()
+
+        first = gateway.generate("llama3.2", "hello world", {"num_ctx": 2048}, host=host, client_class=OllamaHTTPClient)
+        second = gateway.generate("llama3.2", "hello world", {"num_ctx": 2048}, host=host, client_class=OllamaHTTPClient)
+        other = gateway.generate("llama3.2", "hello world", {"num_ctx": 4096}, host=host, client_class=OllamaHTTPClient)
+
+        assert first == ("dlrow olleh", "server")
+        assert second == ("dlrow olleh", "cache")
+        assert other[1] == "server"
+        assert len(server.requests) == 2
+
+    def test_concurrent_identical_requests_coalesced(self, fake_ollama):
+        """Test simultaneous identical requests share one server call."""
+        server, host = fake_ollama
+        server.delay = 0.3
+        gateway = OllamaGateway()
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(pool.map(
+                lambda _: gateway.generate("llama3.2", "same prompt", host=host, client_class=OllamaHTTPClient),
+                range(5),
+            ))
+
+        assert {text for text, _ in results} == {"tpmorp emas"}
+        assert sorted(source for _, source in results).count("coalesced") == 4
+        assert len(server.requests) == 1
+
+    def test_concurrency_limited_per_model(self, fake_ollama, monkeypatch):
+        """Test distinct prompts for one model never exceed the limit in flight."""
+        server, host = fake_ollama
+        server.delay = 0.1
+        monkeypatch.setenv("EXARP_OLLAMA_MAX_CONCURRENCY", "2")
+        gateway = OllamaGateway()
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(
+                lambda i: gateway.generate("llama3.2", f"prompt {i}", host=host, client_class=OllamaHTTPClient),
+                range(6),
+            ))
+
+        assert server.peak == 2
+        assert gateway.get_stats()["throttled"] > 0
+
+    def test_errors_not_cached(self, fake_ollama):
+        """Test a failed request raises and is retried next time."""
+        server, host = fake_ollama
+        server.missing.add("ghost")
+        gateway = OllamaGateway()
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="not found"):
+                gateway.generate("ghost", "hi", host=host, client_class=OllamaHTTPClient)
+        assert len(server.requests) == 2
+
+    def test_client_pooled_and_streaming(self, fake_ollama):
+        """Test one client is reused per host and streamed chunks are joined."""
+        _, host = fake_ollama
+        gateway = OllamaGateway()
+
+        assert gateway.client(host, OllamaHTTPClient) is gateway.client(host, OllamaHTTPClient)
+        text, _ = gateway.generate("llama3.2", "b a", host=host, stream=True, client_class=OllamaHTTPClient)
+        assert text == "a b "
+
+
+class TestGenerateWithOllamaGateway:
+    """Test generate_with_ollama through the gateway."""
+
+    def test_hardware_detected_once(self, fake_ollama, monkeypatch):
+        """Test repeated generations reuse cached results and hardware detection."""
+        server, host = fake_ollama
+        calls = []
+
+        def detect():
+            calls.append(1)
+            return {
+                "platform": "linux", "gpu_type": None, "cpu_cores": 4, "ram_gb": 32.0,
+                "recommended_num_threads": 4, "recommended_num_gpu": None,
+                "recommended_context_size": 4096, "ram_optimizations": {},
+            }
+
+        monkeypatch.setattr(ollama_integration, "OLLAMA_AVAILABLE", True)
+        monkeypatch.setattr(ollama_integration, "ollama", type("ollama", (), {"Client": OllamaHTTPClient}), raising=False)
+        monkeypatch.setattr(ollama_integration, "detect_hardware_config", detect)
+        monkeypatch.setattr(ollama_integration, "get_ollama_gateway", lambda: gateway)
+        gateway = OllamaGateway()
+
+        first = json.loads(ollama_integration.generate_with_ollama("abc", model="llama3.2", host=host))
+        second = json.loads(ollama_integration.generate_with_ollama("abc", model="llama3.2", host=host))
+
+        assert first["data"]["response"] == second["data"]["response"] == "cba"
+        assert (first["data"]["response_source"], second["data"]["response_source"]) == ("server", "cache")
+        assert len(server.requests) == 1
+        assert server.requests[0]["options"]["num_ctx"] == 4096
+        assert len(calls) == 1
@@ -15,6 +15,12 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+@pytest.fixture(autouse=True)
+def disable_pattern_watcher(monkeypatch):
+    """Keep setup from starting a watcher on the (mocked) project root."""
+    monkeypatch.setenv("EXARP_DISABLE_PATTERN_WATCHER", "1")
+
+
 class TestPatternTriggersTool:
     """Tests for pattern triggers tool."""
 
@@ -172,4 +178,4 @@ class TestPatternTriggersTool:
         
         assert '#!/usr/bin/env python3' in script
         assert 'automa_patterns.json' in script
-        assert 'file_patterns' in script
+        assert 'run_pattern_watcher' in script
@@ -0,0 +1,236 @@
+"""
+Tests for the debounced pattern trigger watcher.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from project_management_automation.tools import pattern_watcher
+from project_management_automation.tools.pattern_watcher import PatternTriggerWatcher, normalize_tool_name
+from project_management_automation.utils import tool_executor
+from project_management_automation.utils.tool_executor import ToolExecutor
+
+PATTERNS = {
+    "docs/**/*.md": {"on_change": "check_documentation_health_tool", "on_create": "add_external_tool_hints_tool"},
+    "requirements.txt|pyproject.toml": {"on_change": "scan_dependency_security_tool --quick"},
+}
+
+
+@pytest.fixture(autouse=True)
+def executor(monkeypatch):
+    """Fresh process-wide executor for triggered runs."""
+    executor = ToolExecutor({"cpu": 1, "io": 2, "subprocess": 2, "llm": 1})
+    monkeypatch.setattr(tool_executor, "_executor", executor)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+class Recorder:
+    """Fake trigger actions recording the paths of each run."""
+
+    def __init__(self, duration=0.0):
+        self.runs = []
+        self.duration = duration
+        self.lock = threading.Lock()
+
+    def action(self, tool):
+        def run(paths):
+            time.sleep(self.duration)
+            with self.lock:
+                self.runs.append((tool, paths))
+        return run
+
+    def actions(self, *tools):
+        return {tool: self.action(tool) for tool in tools}
+
+
+def make_watcher(tmp_path, recorder, patterns=PATTERNS, **kwargs):
+    kwargs.setdefault("debounce", 0.05)
+    kwargs.setdefault("min_interval", 0.0)
+    return PatternTriggerWatcher(
+        tmp_path, patterns=patterns,
+        actions=recorder.actions("check_documentation_health", "add_external_tool_hints", "scan_dependency_security"),
+        **kwargs,
+    )
+
+
+def wait_running(watcher, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not watcher.get_stats()["running"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert watcher.get_stats()["running"]
+
+
+class TestMatching:
+    """Test compiled pattern matching."""
+
+    def test_globs_alternatives_and_create(self, tmp_path):
+        """Test '**' globs, '|' alternatives and on_create-only tools."""
+        watcher = make_watcher(tmp_path, Recorder())
+
+        assert watcher.match("docs/guide/setup.md") == ["check_documentation_health"]
+        assert watcher.match("docs/new.md", created=True) == ["check_documentation_health", "add_external_tool_hints"]
+        assert watcher.match("requirements.txt") == ["scan_dependency_security"]
+        assert watcher.match("pyproject.toml") == ["scan_dependency_security"]
+        assert watcher.match("src/docs.md") == []
+        assert watcher.match("docs/image.png") == []
+
+    def test_normalize_tool_name(self):
+        """Test configured tool names map to trigger names."""
+        assert normalize_tool_name("scan_dependency_security_tool --quick") == "scan_dependency_security"
+        assert normalize_tool_name("lint") == "lint"
+
+    def test_excluded_and_outside_paths_ignored(self, tmp_path):
+        """Test events in excluded directories or outside the root schedule nothing."""
+        watcher = make_watcher(tmp_path, Recorder(), patterns={"**/*.md": {"on_change": "check_documentation_health"}})
+
+        assert watcher.notify(tmp_path / ".exarp" / "reports" / "x.md") == []
+        assert watcher.notify(tmp_path / "node_modules" / "pkg" / "README.md") == []
+        assert watcher.notify(tmp_path.parent / "other.md") == []
+        assert watcher.notify(tmp_path / "README.md") == ["check_documentation_health"]
+        assert watcher.wait_idle()
+
+
+class TestTriggering:
+    """Test debouncing, coalescing and loop suppression."""
+
+    def test_burst_coalesced_into_one_run(self, tmp_path):
+        """Test a burst of edits runs each tool once with all changed paths."""
+        recorder = Recorder()
+        watcher = make_watcher(tmp_path, recorder)
+
+        for name in ("a.md", "b.md", "a.md"):
+            watcher.notify(tmp_path / "docs" / name)
+        watcher.notify(tmp_path / "requirements.txt")
+
+        assert watcher.wait_idle()
+        assert sorted(recorder.runs) == [
+            ("check_documentation_health", ["docs/a.md", "docs/b.md"]),
+            ("scan_dependency_security", ["requirements.txt"]),
+        ]
+        stats = watcher.get_stats()
+        assert stats["runs"] == 2
+        assert stats["coalesced"] == 2
+        assert stats["last_runs"]["check_documentation_health"]["status"] == "success"
+
+    def test_own_output_during_run_does_not_retrigger(self, tmp_path):
+        """Test files a tool writes while it runs are not a new trigger."""
+        recorder = Recorder(duration=0.2)
+        watcher = make_watcher(tmp_path, recorder, outputs={"check_documentation_health": ["docs/report.md"]})
+
+        watcher.notify("docs/a.md")
+        wait_running(watcher)
+        assert watcher.notify("docs/report.md") == []
+
+        assert watcher.wait_idle()
+        assert recorder.runs == [("check_documentation_health", ["docs/a.md"])]
+        assert watcher.get_stats()["self_triggered"] == 1
+
+    def test_edit_during_run_queues_follow_up(self, tmp_path):
+        """Test a real edit made while the tool runs is picked up by one more run."""
+        recorder = Recorder(duration=0.2)
+        watcher = make_watcher(tmp_path, recorder, outputs={"check_documentation_health": ["docs/report.md"]})
+
+        watcher.notify("docs/a.md")
+        wait_running(watcher)
+        assert watcher.notify("docs/b.md") == ["check_documentation_health"]
+        assert watcher.notify("docs/c.md") == ["check_documentation_health"]
+
+        assert watcher.wait_idle()
+        assert recorder.runs == [
+            ("check_documentation_health", ["docs/a.md"]),
+            ("check_documentation_health", ["docs/b.md", "docs/c.md"]),
+        ]
+        assert watcher.get_stats()["self_triggered"] == 0
+
+    def test_min_interval_delays_next_run(self, tmp_path, monkeypatch):
+        """Test a tool is not re-run before its minimum interval."""
+        monkeypatch.setattr(pattern_watcher, "SELF_TRIGGER_GRACE", 0.0)
+        recorder = Recorder()
+        watcher = make_watcher(tmp_path, recorder, min_interval=0.3)
+
+        watcher.notify("docs/a.md")
+        assert watcher.wait_idle()
+        first_end = time.monotonic()
+        watcher.notify("docs/b.md")
+        assert watcher.wait_idle()
+
+        assert time.monotonic() - first_end >= 0.25
+        assert [paths for _, paths in recorder.runs] == [["docs/a.md"], ["docs/b.md"]]
+
+    def test_failures_and_unknown_tools_counted(self, tmp_path):
+        """Test a failing action is recorded and unmapped tools are skipped."""
+        def boom(paths):
+            raise RuntimeError("boom")
+
+        watcher = PatternTriggerWatcher(
+            tmp_path, debounce=0.01, min_interval=0.0,
+            patterns={"*.md": {"on_change": ["failing", "unmapped"]}},
+            actions={"failing": boom},
+        )
+        watcher.notify("notes.md")
+        assert watcher.wait_idle()
+
+        stats = watcher.get_stats()
+        assert stats["errors"] == 1
+        assert stats["unknown_tools"] == 1
+        assert stats["last_runs"]["failing"]["error"] == "boom"
+
+
+class TestConfiguration:
+    """Test loading and reloading the pattern file."""
+
+    def test_config_change_reloads_patterns(self, tmp_path):
+        """Test editing automa_patterns.json takes effect without a restart."""
+        config = tmp_path / ".cursor" / "automa_patterns.json"
+        config.parent.mkdir()
+        config.write_text(json.dumps({"file_patterns": {"*.md": {"on_change": "check_documentation_health"}}}))
+        watcher = PatternTriggerWatcher(tmp_path, actions={})
+        assert watcher.match("x.md") == ["check_documentation_health"]
+
+        config.write_text(json.dumps({"file_patterns": {"*.txt": {"on_change": "lint"}}}))
+        assert watcher.notify(config) == []
+
+        assert watcher.match("x.md") == []
+        assert watcher.match("x.txt") == ["lint"]
+
+    def test_start_requires_config_and_enabled(self, tmp_path, monkeypatch):
+        """Test the service is not started when disabled or unconfigured."""
+        config = tmp_path / pattern_watcher.CONFIG_FILE_RELATIVE
+        config.parent.mkdir()
+        config.write_text("{}")
+        monkeypatch.setenv("EXARP_DISABLE_PATTERN_WATCHER", "1")
+        assert pattern_watcher.start_pattern_watcher(tmp_path) is None
+        monkeypatch.delenv("EXARP_DISABLE_PATTERN_WATCHER")
+        config.unlink()
+        assert pattern_watcher.start_pattern_watcher(tmp_path) is None
+        assert pattern_watcher._watchers == {}
+
+
+class TestTodo2Tracking:
+    """Test triggered runs leave Todo2 alone."""
+
+    def test_triggered_run_leaves_todo2_state_unchanged(self, tmp_path, monkeypatch):
+        """Test a built-in action runs without creating or completing an automation task."""
+        state_file = tmp_path / ".todo2" / "state.todo2.json"
+        state_file.parent.mkdir()
+        state_file.write_text(json.dumps({"todos": [
+            {"id": "T-1", "name": "Fix broken documentation links", "status": "Todo", "tags": []},
+            {"id": "T-2", "name": "Fix broken documentation link", "status": "Todo", "tags": []},
+        ]}))
+        before = state_file.read_bytes()
+        monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+        monkeypatch.setattr("project_management_automation.utils.find_project_root", lambda *a, **k: tmp_path)
+
+        watcher = PatternTriggerWatcher(
+            tmp_path, debounce=0.01, min_interval=0.0,
+            patterns={".todo2/state.todo2.json": {"on_change": "detect_duplicate_tasks_tool"}},
+        )
+        watcher.notify(state_file)
+        assert watcher.wait_idle(timeout=30)
+
+        assert watcher.get_stats()["last_runs"]["detect_duplicate_tasks"]["status"] == "success"
+        assert state_file.read_bytes() == before
@@ -0,0 +1,102 @@
+"""
+Tests for the append-only prompt iteration log and its daily summaries.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from project_management_automation.tools.prompt_iteration_tracker import PromptIterationTracker
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    """Tracker for an empty project."""
+    return PromptIterationTracker(tmp_path)
+
+
+def _stamp(day):
+    return day.strftime("%Y%m%d")
+
+
+class TestLogPrompt:
+    """Test appending prompts."""
+
+    def test_appends_one_line_and_updates_summary(self, tracker):
+        """Test each prompt is one JSONL line and the day's summary counts it."""
+        tracker.log_prompt("first", task_id="T-1", mode="AGENT", outcome="failed")
+        tracker.log_prompt("second", task_id="T-1", mode="AGENT", outcome="success", iteration=2)
+        tracker.log_prompt("other", mode="ASK", outcome="success")
+
+        today = _stamp(datetime.now())
+        lines = (tracker.log_dir / f"events_{today}.jsonl").read_text().splitlines()
+        assert [json.loads(line)["prompt"] for line in lines] == ["first", "second", "other"]
+
+        summary = json.loads((tracker.log_dir / f"summary_{today}.json").read_text())
+        assert summary["total"] == 3
+        assert summary["by_mode"] == {"AGENT": 2, "ASK": 1}
+        assert summary["by_outcome"] == {"failed": 1, "success": 2}
+        assert summary["by_iteration"] == {"1": 2, "2": 1}
+        assert summary["task_iterations"] == {"T-1": 2}
+
+    def test_stale_summary_rebuilt_from_log(self, tracker):
+        """Test a summary that lags its event log is rebuilt before use."""
+        tracker.log_prompt("one", mode="ASK")
+        today = datetime.now()
+        with open(tracker.log_dir / f"events_{_stamp(today)}.jsonl", "a") as f:
+            f.write(json.dumps({"prompt": "lost", "mode": "AGENT", "outcome": "success", "iteration": 1}) + "\n")
+
+        tracker.log_prompt("two", mode="ASK")
+
+        assert tracker.analyze_iterations(days=1)["by_mode"] == {"ASK": 2, "AGENT": 1}
+
+
+class TestAnalyzeIterations:
+    """Test window analysis over daily summaries."""
+
+    def test_window_respected(self, tracker):
+        """Test days outside the window are not counted and not read."""
+        old = datetime.now() - timedelta(days=10)
+        (tracker.log_dir / f"events_{_stamp(old)}.jsonl").write_text(
+            json.dumps({"mode": "AGENT", "outcome": "failed", "task_id": "T-9", "iteration": 9}) + "\n"
+        )
+        tracker.log_prompt("recent", task_id="T-1", mode="ASK", outcome="success", iteration=2)
+
+        week = tracker.analyze_iterations(days=7)
+        month = tracker.analyze_iterations(days=30)
+
+        assert week["total_prompts"] == 1
+        assert week["avg_iterations"] == 2
+        assert month["total_prompts"] == 2
+        assert month["avg_iterations"] == 5.5
+        assert month["by_outcome"] == {"failed": 1, "success": 1}
+
+    def test_reads_only_summaries(self, tracker, monkeypatch):
+        """Test analysis does not re-read event logs whose summary is current."""
+        for i in range(5):
+            tracker.log_prompt(f"p{i}", mode="AGENT")
+        monkeypatch.setattr(PromptIterationTracker, "_read_entries", lambda *a: pytest.fail("event log read"))
+
+        assert tracker.analyze_iterations()["total_prompts"] == 5
+
+    def test_legacy_session_files_included(self, tracker):
+        """Test days logged in the old session_*.json format are still analyzed."""
+        yesterday = datetime.now() - timedelta(days=1)
+        (tracker.log_dir / f"session_{_stamp(yesterday)}.json").write_text(json.dumps({"entries": [
+            {"mode": "AGENT", "outcome": "success", "task_id": "T-1", "iteration": 4},
+            {"mode": "AGENT", "outcome": "failed", "task_id": "T-1", "iteration": 3},
+        ]}))
+
+        analysis = tracker.analyze_iterations(days=2)
+
+        assert analysis["total_prompts"] == 2
+        assert analysis["avg_iterations"] == 4
+        assert "High iteration count - consider more detailed initial prompts" in analysis["patterns"]
+
+    def test_empty_history(self, tracker):
+        """Test an empty log yields the no-history recommendation."""
+        analysis = tracker.analyze_iterations()
+
+        assert analysis["total_prompts"] == 0
+        assert analysis["recommendations"][0].startswith("No prompt history found")
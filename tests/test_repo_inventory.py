@@ -0,0 +1,166 @@
+"""
+Tests for the shared repository file inventory.
+
+Tests ignore-file handling, role/extension buckets and incremental revalidation.
+"""
+
+import os
+
+import pytest
+
+from project_management_automation.utils import repo_inventory
+from project_management_automation.utils.repo_inventory import (
+    RepoInventory,
+    classify_file,
+    get_repo_inventory,
+)
+
+
+def _write(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _touch_dir(path):
+    """Force a directory mtime change (filesystems may have coarse timestamps)."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def project(tmp_path):
+    _write(tmp_path / ".gitignore", "*.log\nbuild/\n/generated.py\n!keep.log\n")
+    _write(tmp_path / ".cursorignore", "private/\n")
+    _write(tmp_path / "README.md", "# Readme\n")
+    _write(tmp_path / "app" / "main.py", "print('hi')\n")
+    _write(tmp_path / "app" / "generated.py")  # Not anchored at root: kept
+    _write(tmp_path / "generated.py")
+    _write(tmp_path / "app" / "debug.log")
+    _write(tmp_path / "keep.log")
+    _write(tmp_path / "build" / "out.py")
+    _write(tmp_path / "private" / "secret.py")
+    _write(tmp_path / "tests" / "test_main.py", "def test(): pass\n")
+    _write(tmp_path / "tests" / "helpers.py")
+    _write(tmp_path / "web" / "app.test.ts")
+    _write(tmp_path / "web" / "app.ts")
+    _write(tmp_path / "vendor" / ".gitignore", "*.py\n")
+    _write(tmp_path / "vendor" / "lib.py")
+    _write(tmp_path / "vendor" / "lib.c")
+    _write(tmp_path / "node_modules" / "pkg" / "index.js")
+    _write(tmp_path / "docs" / "guide.md")
+    _write(tmp_path / "docs" / "sub" / "deep.md")
+    return tmp_path
+
+
+class TestIgnoreRules:
+    """Test .gitignore / .cursorignore handling."""
+
+    def test_ignored_paths_are_skipped(self, project):
+        """Test patterns, negation, anchoring, nested ignore files and default excludes."""
+        paths = RepoInventory(project).relpaths()
+
+        assert "app/main.py" in paths
+        assert "app/generated.py" in paths
+        assert "keep.log" in paths
+        assert "vendor/lib.c" in paths
+        for ignored in ("generated.py", "app/debug.log", "build/out.py", "private/secret.py",
+                        "vendor/lib.py", "node_modules/pkg/index.js"):
+            assert ignored not in paths
+
+
+class TestBuckets:
+    """Test extension and role queries."""
+
+    def test_roles(self, project):
+        """Test files are bucketed into source/test/doc."""
+        inventory = RepoInventory(project)
+
+        assert inventory.relpaths(role="test") == ["tests/helpers.py", "tests/test_main.py", "web/app.test.ts"]
+        assert inventory.relpaths(ext=".ts", role="source") == ["web/app.ts"]
+        assert inventory.relpaths(role="doc") == ["README.md", "docs/guide.md", "docs/sub/deep.md"]
+
+    def test_under_and_recursive(self, project):
+        """Test directory scoping."""
+        inventory = RepoInventory(project)
+
+        assert inventory.relpaths(ext=".md", under=project / "docs") == ["docs/guide.md", "docs/sub/deep.md"]
+        assert inventory.relpaths(ext=".md", under="docs", recursive=False) == ["docs/guide.md"]
+        assert inventory.files(ext=".py", under="app") == [project / "app" / "generated.py", project / "app" / "main.py"]
+
+    def test_classify_file(self):
+        """Test role classification by name and location."""
+        assert classify_file("src/foo_test.rs") == "test"
+        assert classify_file("ios/AppTests.swift") == "test"
+        assert classify_file("src/lib.rs") == "source"
+        assert classify_file("docs/a.rst") == "doc"
+        assert classify_file("data.json") == "other"
+
+
+class TestRevalidation:
+    """Test directory-mtime keyed caching."""
+
+    def test_unchanged_tree_is_reused(self, project, monkeypatch):
+        """Test revalidation re-lists nothing when no directory changed."""
+        monkeypatch.setattr(repo_inventory, "VALIDATE_INTERVAL", 0)
+        inventory = RepoInventory(project)
+        inventory.relpaths()
+        listed = inventory.get_stats()["dirs_listed"]
+
+        inventory.relpaths()
+
+        stats = inventory.get_stats()
+        assert stats["dirs_listed"] == listed
+        assert stats["validations"] == 1
+
+    def test_changed_directory_is_relisted(self, project, monkeypatch):
+        """Test a new file is picked up by re-listing only its directory."""
+        monkeypatch.setattr(repo_inventory, "VALIDATE_INTERVAL", 0)
+        inventory = RepoInventory(project)
+        inventory.relpaths()
+        listed = inventory.get_stats()["dirs_listed"]
+
+        _write(project / "app" / "extra.py")
+        _touch_dir(project / "app")
+
+        assert "app/extra.py" in inventory.relpaths(ext=".py")
+        assert inventory.get_stats()["dirs_listed"] == listed + 1
+
+    def test_changed_ignore_file_rescans(self, project, monkeypatch):
+        """Test editing .gitignore applies to already cached directories."""
+        monkeypatch.setattr(repo_inventory, "VALIDATE_INTERVAL", 0)
+        inventory = RepoInventory(project)
+        assert "app/main.py" in inventory.relpaths()
+
+        (project / ".gitignore").write_text("app/\n")
+
+        assert "app/main.py" not in inventory.relpaths()
+
+    def test_within_interval_serves_snapshot(self, project):
+        """Test queries inside VALIDATE_INTERVAL skip the filesystem."""
+        inventory = RepoInventory(project)
+        inventory.relpaths()
+        inventory.relpaths()
+        assert inventory.get_stats()["hits"] == 1
+
+    def test_fingerprint_tracks_file_changes(self, project):
+        """Test the fingerprint changes on edits and is scoped by filters."""
+        inventory = RepoInventory(project)
+        full = inventory.fingerprint()
+        docs = inventory.fingerprint(ext=".md")
+        assert inventory.fingerprint() == full
+
+        main = project / "app" / "main.py"
+        st = os.stat(main)
+        main.write_text("print('changed')\n")
+        os.utime(main, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert inventory.fingerprint() != full
+        assert inventory.fingerprint(ext=".md") == docs
+
+
+class TestRegistry:
+    """Test get_repo_inventory()."""
+
+    def test_shared_per_root(self, tmp_path):
+        """Test the same root yields the same inventory."""
+        assert get_repo_inventory(tmp_path) is get_repo_inventory(str(tmp_path))
@@ -32,6 +32,8 @@ class TestResourceHandlers:
         assert isinstance(result_data['tools'], dict)
         assert 'total' in result_data['tools']
         assert 'available' in result_data['tools']
+        assert 'tool_pools' in result_data
+        assert result_data['mcp_sessions']['spawns'] >= 0
 
     def test_history_resource_handler(self):
         """Test automation://history resource handler."""
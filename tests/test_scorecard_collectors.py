@@ -0,0 +1,173 @@
+"""
+Tests for concurrent, budgeted scorecard collectors.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from project_management_automation.tools import project_scorecard
+from project_management_automation.tools.project_scorecard import (
+    ScorecardCollector,
+    ScorecardContext,
+    register_scorecard_collector,
+    run_scorecard_collectors,
+)
+
+
+@pytest.fixture
+def ctx(tmp_path):
+    """Collector context for an empty project."""
+    return ScorecardContext(tmp_path)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """Isolate registered collectors and remembered results."""
+    collectors = list(project_scorecard._COLLECTORS)
+    project_scorecard._last_results.clear()
+    yield
+    project_scorecard._COLLECTORS[:] = collectors
+    project_scorecard._last_results.clear()
+
+
+def _section(name, score):
+    return {'scores': {name: score}, 'metrics': {name: {'value': score}}}
+
+
+class TestRunScorecardCollectors:
+    """Test the collector runner."""
+
+    def test_collectors_run_concurrently(self, ctx):
+        """Test collectors overlap rather than running back to back."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def collect(name):
+            def run(_ctx):
+                barrier.wait()
+                return _section(name, 50)
+            return run
+
+        collectors = [ScorecardCollector(n, collect(n)) for n in ('a', 'b', 'c')]
+        outcomes = run_scorecard_collectors(ctx, collectors)
+
+        assert {n: o['status'] for n, o in outcomes.items()} == {'a': 'ok', 'b': 'ok', 'c': 'ok'}
+        assert outcomes['a']['scores'] == {'a': 50}
+        assert outcomes['a']['cost'] == 'cheap'
+
+    def test_timeout_marks_unavailable(self, ctx):
+        """Test a slow collector does not block the others."""
+        release = threading.Event()
+
+        def slow(_ctx):
+            release.wait(5)
+            return _section('slow', 10)
+
+        collectors = [
+            ScorecardCollector('slow', slow, cost='external', timeout=0.1),
+            ScorecardCollector('fast', lambda _ctx: _section('fast', 90)),
+        ]
+        start = time.perf_counter()
+        outcomes = run_scorecard_collectors(ctx, collectors)
+        release.set()
+
+        assert time.perf_counter() - start < 2
+        assert outcomes['slow']['status'] == 'timeout'
+        assert 'scores' not in outcomes['slow']
+        assert outcomes['fast']['status'] == 'ok'
+
+    def test_failure_falls_back_to_stale_result(self, ctx):
+        """Test a failing collector reuses its last successful result."""
+        calls = []
+
+        def flaky(_ctx):
+            calls.append(1)
+            if len(calls) > 1:
+                raise RuntimeError("boom")
+            return _section('flaky', 70)
+
+        collector = ScorecardCollector('flaky', flaky)
+        assert run_scorecard_collectors(ctx, [collector])['flaky']['status'] == 'ok'
+
+        outcome = run_scorecard_collectors(ctx, [collector])['flaky']
+
+        assert outcome['status'] == 'stale'
+        assert outcome['stale_reason'] == 'error'
+        assert outcome['error'] == 'boom'
+        assert outcome['scores'] == {'flaky': 70}
+        assert outcome['age_seconds'] >= 0
+
+
+class TestGenerateWithCollectors:
+    """Test scorecard assembly from collector outcomes."""
+
+    def _generate(self, tmp_path, output_format='json', include_recommendations=False):
+        with patch.object(project_scorecard, 'find_project_root', return_value=tmp_path), \
+             patch.object(project_scorecard, '_save_scorecard_memory', return_value={}):
+            return project_scorecard.generate_project_scorecard(output_format, include_recommendations, None)
+
+    def test_reports_per_collector_timing(self, tmp_path):
+        """Test every collector appears in the report with its timing."""
+        result = self._generate(tmp_path)
+
+        assert set(result['collectors']) == {c.name for c in project_scorecard._COLLECTORS}
+        for info in result['collectors'].values():
+            assert info['status'] == 'ok'
+            assert info['seconds'] >= 0
+        assert 'partial' not in result
+
+    def test_unavailable_section_excluded_from_overall(self, tmp_path):
+        """Test a failed section is marked unavailable and the score renormalised."""
+        def broken(_ctx):
+            raise RuntimeError("no data")
+
+        baseline = self._generate(tmp_path)
+        project_scorecard._last_results.clear()  # No stale result to fall back on
+        register_scorecard_collector(ScorecardCollector('dogfooding', broken))
+        result = self._generate(tmp_path, 'markdown')
+
+        assert result['partial'] is True
+        assert result['collectors']['dogfooding']['status'] == 'error'
+        assert result['metrics']['dogfooding'] == {'available': False, 'status': 'error', 'error': 'no data'}
+        assert 'dogfooding' not in result['scores']
+        weights = baseline['weights']
+        expected = sum(baseline['scores'][k] * w for k, w in weights.items() if k != 'dogfooding')
+        expected *= sum(weights.values()) / (sum(weights.values()) - weights['dogfooding'])
+        assert result['overall_score'] == pytest.approx(expected, abs=0.2)
+        assert 'Partial results' in result['formatted_output']
+
+    def test_unavailable_gate_makes_readiness_unknown(self, tmp_path):
+        """Test missing security/testing sections are not read as failing scores."""
+        def broken(_ctx):
+            raise RuntimeError("timed out")
+
+        register_scorecard_collector(ScorecardCollector('security', broken))
+        register_scorecard_collector(ScorecardCollector('testing', broken))
+        result = self._generate(tmp_path, 'text', include_recommendations=True)
+
+        assert result['production_ready'] is None
+        assert result['blockers'] == []
+        assert not {r['area'] for r in result['recommendations']} & {'Security', 'Testing'}
+        assert 'UNKNOWN' in result['formatted_output']
+
+    def test_failing_available_gate_still_blocks(self, tmp_path):
+        """Test an available failing gate decides readiness even if the other is missing."""
+        register_scorecard_collector(ScorecardCollector('testing', lambda _ctx: _section('testing', 10)))
+        register_scorecard_collector(ScorecardCollector('security', lambda _ctx: 1 / 0))
+        result = self._generate(tmp_path, include_recommendations=True)
+
+        assert result['production_ready'] is False
+        assert result['blockers'] == ["Test coverage too low"]
+        assert [r['area'] for r in result['recommendations'] if r['area'] in ('Security', 'Testing')] == ['Testing']
+
+    def test_custom_collector_is_reported(self, tmp_path):
+        """Test registered collectors contribute metrics."""
+        register_scorecard_collector(
+            ScorecardCollector('custom', lambda _ctx: {'scores': {}, 'metrics': {'custom': {'ok': True}}}, cost='scan')
+        )
+        result = self._generate(tmp_path)
+
+        assert result['metrics']['custom'] == {'ok': True}
+        assert result['collectors']['custom']['cost'] == 'scan'
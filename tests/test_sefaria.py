@@ -20,6 +20,12 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+@pytest.fixture(autouse=True)
+def disable_sefaria_fetch(monkeypatch):
+    """Keep wisdom lookups from starting background requests to sefaria.org."""
+    monkeypatch.setenv("EXARP_DISABLE_SEFARIA_FETCH", "1")
+
+
 class TestSefariaWisdom:
     """Tests for Sefaria wisdom integration."""
 
@@ -161,7 +167,7 @@ class TestSefariaWisdom:
 
         assert result is None
 
-    @patch('project_management_automation.tools.wisdom.sefaria.fetch_sefaria_text')
+    @patch('project_management_automation.tools.wisdom.sefaria.lookup_sefaria_text')
     @patch('random.choice')
     def test_get_sefaria_wisdom_success(self, mock_choice, mock_fetch):
         """Test successful wisdom retrieval."""
@@ -182,7 +188,7 @@ class TestSefariaWisdom:
         assert result['aeon_level'] == "Chaos"
         assert result['health_score'] == 25.0
 
-    @patch('project_management_automation.tools.wisdom.sefaria.fetch_sefaria_text')
+    @patch('project_management_automation.tools.wisdom.sefaria.lookup_sefaria_text')
     @patch('random.choice')
     def test_get_sefaria_wisdom_fallback(self, mock_choice, mock_fetch):
         """Test fallback when API fetch fails."""
@@ -196,7 +202,7 @@ class TestSefariaWisdom:
         assert result is not None
         assert "[Read:" in result['quote']  # Fallback format
 
-    @patch('project_management_automation.tools.wisdom.sefaria.fetch_sefaria_text')
+    @patch('project_management_automation.tools.wisdom.sefaria.lookup_sefaria_text')
     @patch('random.choice')
     def test_get_sefaria_wisdom_with_hebrew(self, mock_choice, mock_fetch):
         """Test wisdom retrieval with Hebrew text."""
@@ -222,7 +228,7 @@ class TestSefariaWisdom:
         assert 'hebrew' in result
         assert result['bilingual'] is True
 
-    @patch('project_management_automation.tools.wisdom.sefaria.fetch_sefaria_text')
+    @patch('project_management_automation.tools.wisdom.sefaria.lookup_sefaria_text')
     @patch('random.choice')
     def test_get_sefaria_wisdom_hebrew_only(self, mock_choice, mock_fetch):
         """Test Hebrew-only mode."""
@@ -247,7 +253,7 @@ class TestSefariaWisdom:
         assert result is not None
         assert result['quote'] == "ציטוט בדיקה"  # Hebrew becomes main quote
 
-    @patch('project_management_automation.tools.wisdom.sefaria.fetch_sefaria_text')
+    @patch('project_management_automation.tools.wisdom.sefaria.lookup_sefaria_text')
     @patch('random.choice')
     def test_get_sefaria_wisdom_cleans_html(self, mock_choice, mock_fetch):
         """Test that HTML tags are cleaned from text."""
@@ -269,7 +275,7 @@ class TestSefariaWisdom:
         assert "Bold" in result['quote']
         assert "italic" in result['quote']
 
-    @patch('project_management_automation.tools.wisdom.sefaria.fetch_sefaria_text')
+    @patch('project_management_automation.tools.wisdom.sefaria.lookup_sefaria_text')
     @patch('random.choice')
     def test_get_sefaria_wisdom_different_sources(self, mock_choice, mock_fetch):
         """Test wisdom retrieval from different sources."""
@@ -284,7 +290,7 @@ class TestSefariaWisdom:
         assert result['wisdom_source'] == "Mishlei (Proverbs)"
         assert result['wisdom_icon'] == "📜"
 
-    @patch('project_management_automation.tools.wisdom.sefaria.fetch_sefaria_text')
+    @patch('project_management_automation.tools.wisdom.sefaria.lookup_sefaria_text')
     @patch('random.choice')
     def test_get_sefaria_wisdom_invalid_source(self, mock_choice, mock_fetch):
         """Test that invalid source defaults to pirkei_avot."""
@@ -0,0 +1,150 @@
+"""
+Tests for the offline-first Sefaria text cache, against a local stub server.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from project_management_automation.tools.wisdom import sefaria, sefaria_cache
+from project_management_automation.tools.wisdom.sefaria_cache import SefariaTextCache
+
+
+class _StubSefaria(BaseHTTPRequestHandler):
+    """Serves /api/texts/<ref>; refs listed in server.failing return 500."""
+
+    def do_GET(self):
+        ref = self.path.split("/texts/", 1)[-1].split("?", 1)[0]
+        self.server.requests.append(ref)
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        if ref in self.server.failing:
+            self.send_error(500)
+            return
+        body = json.dumps({"text": f"Text of {ref}", "he": f"טקסט {ref}", "ref": ref, "heRef": "", "book": "Stub"})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    """Local Sefaria stand-in; sefaria.SEFARIA_API points at it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubSefaria)
+    server.requests, server.failing, server.delay = [], set(), 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(sefaria, "SEFARIA_API", f"http://127.0.0.1:{server.server_port}/api")
+    monkeypatch.delenv("EXARP_DISABLE_SEFARIA_FETCH", raising=False)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Fresh cache registry rooted at a temporary project."""
+    monkeypatch.setattr(sefaria_cache, "_caches", {})
+    with patch("project_management_automation.utils.find_project_root", return_value=tmp_path):
+        yield tmp_path
+
+
+class TestSefariaTextCache:
+    """Test cache behaviour."""
+
+    def test_miss_then_background_fill(self, stub_server, tmp_path):
+        """Test a miss returns immediately and the text is cached afterwards."""
+        cache = SefariaTextCache(tmp_path / "texts.json")
+
+        assert cache.lookup("Proverbs.4.7") is None
+        assert cache.wait(5)
+        assert cache.lookup("Proverbs.4.7")["text"] == "Text of Proverbs.4.7"
+        assert stub_server.requests == ["Proverbs.4.7"]
+
+        # Survives a restart without the network
+        stub_server.failing.add("Proverbs.4.7")
+        assert SefariaTextCache(tmp_path / "texts.json").lookup("Proverbs.4.7")["hebrew"] == "טקסט Proverbs.4.7"
+
+    def test_lookup_never_waits_on_network(self, stub_server, tmp_path):
+        """Test a slow server does not slow down lookups."""
+        stub_server.delay = 1.0
+        cache = SefariaTextCache(tmp_path / "texts.json")
+
+        start = time.monotonic()
+        assert cache.lookup("Psalms.23.4") is None
+        assert time.monotonic() - start < 0.5
+        assert cache.wait(5)
+
+    def test_failures_are_negative_cached(self, stub_server, tmp_path):
+        """Test a failed reference is not retried within the negative TTL."""
+        stub_server.failing.add("Psalms.23.4")
+        cache = SefariaTextCache(tmp_path / "texts.json", negative_ttl=60)
+
+        cache.lookup("Psalms.23.4")
+        cache.wait(5)
+        assert cache.lookup("Psalms.23.4") is None
+        assert cache.prefetch(["Psalms.23.4"]) == 0
+        assert stub_server.requests == ["Psalms.23.4"]
+        assert cache.get_stats()["negative"] == 1
+
+    def test_expired_text_served_while_refreshing(self, stub_server, tmp_path):
+        """Test an expired text is returned and kept if the refresh fails."""
+        cache = SefariaTextCache(tmp_path / "texts.json", ttl=0, negative_ttl=60)
+        cache.prefetch(["Ecclesiastes.3.1"])
+        cache.wait(5)
+        stub_server.failing.add("Ecclesiastes.3.1")
+
+        assert cache.lookup("Ecclesiastes.3.1")["text"] == "Text of Ecclesiastes.3.1"
+        cache.wait(5)
+        assert cache.lookup("Ecclesiastes.3.1")["text"] == "Text of Ecclesiastes.3.1"
+        assert len(stub_server.requests) == 2
+
+    def test_disabled_by_environment(self, stub_server, tmp_path, monkeypatch):
+        """Test EXARP_DISABLE_SEFARIA_FETCH keeps the cache offline."""
+        monkeypatch.setenv("EXARP_DISABLE_SEFARIA_FETCH", "1")
+        cache = SefariaTextCache(tmp_path / "texts.json")
+
+        assert cache.lookup("Proverbs.4.7") is None
+        assert cache.prefetch(["Proverbs.4.7"]) == 0
+        assert stub_server.requests == []
+
+
+class TestSefariaWisdomOfflineFirst:
+    """Test get_sefaria_wisdom through the cache."""
+
+    def test_wisdom_falls_back_then_uses_cache(self, stub_server, project):
+        """Test the first request shows the fallback and later ones the text."""
+        first = sefaria.get_sefaria_wisdom(60.0, "proverbs")
+        assert first["quote"].startswith("[Read:")
+
+        assert sefaria_cache.get_sefaria_cache(project).wait(5)
+        second = sefaria.get_sefaria_wisdom(60.0, "proverbs")
+        assert second["quote"].startswith("Text of ")
+        assert "hebrew" not in second
+
+    def test_upcoming_days_prefetched(self, stub_server, project):
+        """Test the next days' seeded references are warmed."""
+        sefaria.get_sefaria_wisdom(40.0, "psalms")
+        sefaria_cache.get_sefaria_cache(project).wait(5)
+
+        today = sefaria.datetime.now().date()
+        upcoming = {
+            sefaria.select_reference(40.0, "psalms", today + sefaria.timedelta(days=i))["ref"]
+            for i in range(sefaria.PREFETCH_DAYS + 1)
+        }
+        assert upcoming <= set(stub_server.requests)
+        assert len(stub_server.requests) == len(set(stub_server.requests))
+
+    def test_daily_selection_is_stable(self):
+        """Test the seeded selection does not depend on the process hash seed."""
+        day = sefaria.datetime(2026, 1, 1).date()
+        picks = {sefaria.select_reference(75.0, "pirkei_avot", day)["ref"] for _ in range(5)}
+        assert len(picks) == 1
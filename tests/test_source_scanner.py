@@ -0,0 +1,159 @@
+"""
+Tests for the cached, parallel line-pattern scanner and task discovery.
+"""
+
+import json
+import os
+import re
+
+import pytest
+
+from project_management_automation.utils import repo_inventory, source_scanner
+from project_management_automation.utils.source_scanner import ScanRule, SourceScanner, match_glob
+
+TODO_RULE = ScanRule("todo", r"#\s*(TODO|FIXME)[\s:]+(.+)", re.IGNORECASE)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Small project with TODOs in code, an ignored directory and a docs checklist."""
+    monkeypatch.setattr(repo_inventory, "_inventories", {})
+    monkeypatch.setattr(source_scanner, "_scanners", {})
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("x = 1  # TODO: handle errors\n# fixme broken\n")
+    (tmp_path / "src" / "ui.ts").write_text("# TODO ts file\n")
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "lib.py").write_text("# TODO vendored\n")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "plan.md").write_text("- [ ] Write tests\n- [x] Ship it\n* [ ] Update docs\n")
+    return tmp_path
+
+
+class TestMatchGlob:
+    """Test glob selection over inventory paths."""
+
+    def test_recursive_and_anchored_patterns(self):
+        """Test '**/' matches any depth and plain segments stay anchored."""
+        paths = ["a.py", "src/b.py", "src/deep/c.py", "src/d.ts", "docs/e.md"]
+
+        assert match_glob(paths, ["**/*.py"]) == ["a.py", "src/b.py", "src/deep/c.py"]
+        assert match_glob(paths, ["src/*.py"]) == ["src/b.py"]
+        assert match_glob(paths, ["**/*.ts", "**/*.py"]) == ["src/d.ts", "a.py", "src/b.py", "src/deep/c.py"]
+
+
+class TestSourceScanner:
+    """Test matching, caching and parallel scanning."""
+
+    def test_matches_lines(self, project):
+        """Test matches carry line numbers and groups."""
+        found = SourceScanner(project).scan([project / "src" / "app.py"], [TODO_RULE], workers=0)
+
+        assert found == {"src/app.py": [
+            {"rule": "todo", "line": 1, "groups": ["TODO", "handle errors"]},
+            {"rule": "todo", "line": 2, "groups": ["fixme", "broken"]},
+        ]}
+
+    def test_unchanged_files_not_reread(self, project, monkeypatch):
+        """Test a second run is served from the persisted cache and only changed files are read."""
+        paths = [project / "src" / "app.py", project / "src" / "ui.ts"]
+        scanner = SourceScanner(project)
+        scanner.scan(paths, [TODO_RULE], workers=0)
+        assert scanner.save()
+
+        (project / "src" / "ui.ts").write_text("# TODO changed\n# TODO again\n")
+        read = []
+        real_scan_file = source_scanner.scan_file
+        monkeypatch.setattr(source_scanner, "scan_file", lambda path, rules: read.append(path) or real_scan_file(path, rules))
+
+        fresh = SourceScanner(project)
+        found = fresh.scan(paths, [TODO_RULE], workers=0)
+
+        assert read == [str(project / "src" / "ui.ts")]
+        assert len(found["src/app.py"]) == 2
+        assert len(found["src/ui.ts"]) == 2
+        assert fresh.get_stats()["hits"] == 1
+
+    def test_touched_file_recognised_by_hash(self, project):
+        """Test a file whose mtime changed but content did not keeps its other rule sets."""
+        path = project / "src" / "app.py"
+        other_rule = ScanRule("assign", r"^(\w+) =")
+        scanner = SourceScanner(project)
+        scanner.scan([path], [TODO_RULE], workers=0)
+        scanner.scan([path], [other_rule], workers=0)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        unchanged_before = scanner.get_stats()["content_unchanged"]
+
+        scanner.scan([path], [other_rule], workers=0)
+        hits_before = scanner.get_stats()["hits"]
+        found = scanner.scan([path], [TODO_RULE], workers=0)
+
+        assert scanner.get_stats()["content_unchanged"] == unchanged_before + 1
+        assert scanner.get_stats()["hits"] == hits_before + 1
+        assert len(found["src/app.py"]) == 2
+
+    def test_parallel_matches_serial(self, project, monkeypatch):
+        """Test the process pool returns the same results as an in-process scan."""
+        monkeypatch.setattr(source_scanner, "MIN_PARALLEL_FILES", 2)
+        monkeypatch.setattr(source_scanner, "BATCH_SIZE", 3)
+        for i in range(10):
+            (project / "src" / f"mod{i}.py").write_text(f"# TODO item {i}\n" * (i % 3))
+        paths = sorted((project / "src").glob("*.py"))
+
+        serial = SourceScanner(project, cache_file=project / "serial.json").scan(paths, [TODO_RULE], workers=0)
+        parallel_scanner = SourceScanner(project, cache_file=project / "parallel.json")
+        try:
+            parallel = parallel_scanner.scan(paths, [TODO_RULE], workers=2)
+        finally:
+            source_scanner.shutdown_scan_pool()
+
+        assert parallel == serial
+        assert list(parallel) == list(serial)
+        assert parallel_scanner.get_stats()["parallel_batches"] == 4
+
+
+class TestTaskDiscovery:
+    """Test task_discovery on the shared scanner."""
+
+    def test_comments_and_markdown(self, project, monkeypatch):
+        """Test ignored directories are skipped and results match the scan rules."""
+        from project_management_automation.tools import consolidated_analysis
+
+        monkeypatch.setenv("PROJECT_ROOT", str(project))
+        monkeypatch.setattr("project_management_automation.utils.find_project_root", lambda *a, **k: project)
+
+        result = json.loads(consolidated_analysis.task_discovery(action="comments"))
+        assert [(d["file"], d["type"], d["text"]) for d in result["discoveries"]] == [
+            ("src/app.py", "TODO", "handle errors"),
+            ("src/app.py", "FIXME", "broken"),
+            ("src/ui.ts", "TODO", "ts file"),
+        ]
+
+        result = json.loads(consolidated_analysis.task_discovery(
+            action="comments", file_patterns=json.dumps(["src/*.py"]), include_fixme=False,
+        ))
+        assert [(d["file"], d["text"]) for d in result["discoveries"]] == [("src/app.py", "handle errors")]
+
+        result = json.loads(consolidated_analysis.task_discovery(action="markdown"))
+        assert [d["text"] for d in result["discoveries"]] == ["Write tests", "Update docs"]
+        assert (project / ".exarp" / "source_scan.json").exists()
+
+    def test_markdown_doc_path_outside_project(self, project, tmp_path_factory, monkeypatch):
+        """Test a doc_path outside the project root (absolute or cwd-relative) is walked directly."""
+        from project_management_automation.tools import consolidated_analysis
+
+        monkeypatch.setattr("project_management_automation.utils.find_project_root", lambda *a, **k: project)
+        outside = tmp_path_factory.mktemp("outdocs")
+        (outside / "notes").mkdir()
+        (outside / "notes" / "todo.md").write_text("- [ ] Outside task\n- [x] Done\n")
+        (outside / "node_modules").mkdir()
+        (outside / "node_modules" / "dep.md").write_text("- [ ] Vendored\n")
+
+        result = json.loads(consolidated_analysis.task_discovery(action="markdown", doc_path=str(outside)))
+        assert [(d["file"], d["text"]) for d in result["discoveries"]] == [
+            (str(outside / "notes" / "todo.md"), "Outside task"),
+        ]
+
+        monkeypatch.chdir(outside)
+        result = json.loads(consolidated_analysis.task_discovery(action="markdown", doc_path="notes"))
+        assert [d["text"] for d in result["discoveries"]] == ["Outside task"]
@@ -0,0 +1,74 @@
+"""
+Tests for stale task cleanup automation.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+from project_management_automation.scripts.automate_stale_task_cleanup import StaleTaskCleanupAutomation
+from project_management_automation.utils.todo2_store import get_todo2_store
+
+
+def _write_state(tmp_path, hours_ago):
+    state_file = tmp_path / ".todo2" / "state.todo2.json"
+    state_file.parent.mkdir()
+    now = datetime.now(timezone.utc)
+    state_file.write_text(json.dumps({"todos": [
+        {"id": f"T-{i}", "name": f"Task {i}", "status": "In Progress",
+         "lastModified": (now - timedelta(hours=hours)).isoformat()}
+        for i, hours in enumerate(hours_ago, 1)
+    ]}))
+    return state_file
+
+
+class TestStaleTaskCleanup:
+    """Test moving stale In Progress tasks back to Todo."""
+
+    def test_moves_stale_tasks(self, tmp_path):
+        """Test only tasks past the threshold are moved, with a change record."""
+        state_file = _write_state(tmp_path, [5, 1])
+
+        result = StaleTaskCleanupAutomation({"stale_threshold_hours": 2}, tmp_path).run()
+
+        assert result["status"] == "success"
+        assert [t["id"] for t in result["moved_tasks"]] == ["T-1"]
+        todos = json.loads(state_file.read_text())["todos"]
+        assert [t["status"] for t in todos] == ["Todo", "In Progress"]
+        assert todos[0]["changes"][0]["newValue"] == "Todo"
+        assert get_todo2_store(tmp_path).get_task("T-1")["status"] == "Todo"
+
+    def test_dry_run_leaves_state_unchanged(self, tmp_path):
+        """Test a dry run reports stale tasks without writing."""
+        state_file = _write_state(tmp_path, [5])
+        before = state_file.read_bytes()
+
+        result = StaleTaskCleanupAutomation({"stale_threshold_hours": 2, "dry_run": True}, tmp_path).run()
+
+        assert result["stale_tasks_found"] == 1
+        assert result["tasks_moved"] == 0
+        assert state_file.read_bytes() == before
+
+    def test_waits_for_todo2_write_lock(self, tmp_path):
+        """Test the read-modify-write cycle does not interleave with another writer."""
+        state_file = _write_state(tmp_path, [5])
+        store = get_todo2_store(tmp_path)
+        results = []
+
+        with store.write_lock():
+            thread = threading.Thread(
+                target=lambda: results.append(StaleTaskCleanupAutomation({}, tmp_path).run())
+            )
+            thread.start()
+            thread.join(0.3)
+            assert thread.is_alive()
+
+            # Concurrent writer adds a task while holding the lock
+            state = store.load_state_for_update()
+            state["todos"].append({"id": "T-9", "name": "New", "status": "Todo"})
+            store.save_state(state)
+
+        thread.join(10)
+        assert results[0]["tasks_moved"] == 1
+        todos = json.loads(state_file.read_text())["todos"]
+        assert [(t["id"], t["status"]) for t in todos] == [("T-1", "Todo"), ("T-9", "Todo")]
@@ -6,7 +6,7 @@ Tests for task_clarification_resolution.py module.
 
 import json
 import pytest
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import sys
 import subprocess
@@ -194,13 +194,11 @@ class TestTaskClarificationResolutionTool:
             assert result['tasks_updated'] == 2
 
     @patch('project_management_automation.tools.task_clarification_resolution.find_project_root')
-    @patch('project_management_automation.tools.task_clarification_resolution.Path.exists')
-    def test_list_tasks_awaiting_clarification_success(self, mock_exists, mock_find_root):
+    def test_list_tasks_awaiting_clarification_success(self, mock_find_root, tmp_path):
         """Test listing tasks awaiting clarification."""
         from project_management_automation.tools.task_clarification_resolution import list_tasks_awaiting_clarification
 
-        mock_find_root.return_value = Path("/test/project")
-        mock_exists.return_value = True
+        mock_find_root.return_value = tmp_path
         
         # Mock state file
         state_data = {
@@ -222,8 +220,9 @@ class TestTaskClarificationResolutionTool:
             ]
         }
         
-        with patch('builtins.open', mock_open(read_data=json.dumps(state_data))):
-            result = list_tasks_awaiting_clarification()
+        (tmp_path / '.todo2').mkdir()
+        (tmp_path / '.todo2' / 'state.todo2.json').write_text(json.dumps(state_data))
+        result = list_tasks_awaiting_clarification()
         
         assert result['status'] == 'success'
         assert result['total_tasks'] == 1
@@ -0,0 +1,152 @@
+"""
+Tests for historical matching in TaskDurationEstimator.
+"""
+
+import json
+import random
+
+from project_management_automation.tools.task_duration_estimator import (
+    HistoryIndex,
+    TaskDurationEstimator,
+)
+
+WORDS = ["api", "cache", "fix", "refactor", "docs", "login", "parser", "test", "deploy", "db"]
+TAGS = ["backend", "frontend", "docs", "infra"]
+PRIORITIES = ["low", "medium", "high"]
+
+
+def _records(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            'name': " ".join(rng.sample(WORDS, rng.randint(1, 3))),
+            'details': " ".join(rng.sample(WORDS, rng.randint(0, 4))),
+            'tags': rng.sample(TAGS, rng.randint(0, 2)),
+            'priority': rng.choice(PRIORITIES),
+            'actual_hours': float(rng.randint(1, 8)),
+        }
+        for _ in range(count)
+    ]
+
+
+def _full_scan(text, tags, priority, records, top_k=10):
+    """Reference implementation: score every record."""
+    matches = []
+    text_words = set(text.split())
+    for i, record in enumerate(records):
+        score = 0.0
+        record_words = set((record['name'] + " " + record['details']).lower().split())
+        if text_words and record_words:
+            score += len(text_words & record_words) / len(text_words | record_words) * 0.5
+        record_tags = [t.lower() for t in record.get('tags', [])]
+        if tags and record_tags:
+            score += len({t.lower() for t in tags} & set(record_tags)) / len(record_tags) * 0.3
+        if priority.lower() == record.get('priority', 'medium').lower():
+            score += 0.2
+        if score > 0.1:
+            matches.append((score, i))
+    matches.sort(key=lambda pair: (-pair[0], pair[1]))
+    return matches[:top_k]
+
+
+def _write_history(project_root, records):
+    todos = [
+        {
+            'id': f'T-{i}',
+            'name': r['name'],
+            'details': r['details'],
+            'tags': r['tags'],
+            'priority': r['priority'],
+            'status': 'Done',
+            'actualHours': r['actual_hours'],
+        }
+        for i, r in enumerate(records)
+    ]
+    state_dir = project_root / '.todo2'
+    state_dir.mkdir()
+    (state_dir / 'state.todo2.json').write_text(json.dumps({'todos': todos}))
+
+
+class TestHistoryIndex:
+    """Test the index matches a full scan."""
+
+    def test_matches_full_scan(self):
+        """Test scores and ordering equal the reference scan for many queries."""
+        records = _records(300)
+        index = HistoryIndex(records)
+        rng = random.Random(1)
+
+        for _ in range(50):
+            text = " ".join(rng.sample(WORDS, rng.randint(0, 3)))
+            tags = rng.sample(TAGS, rng.randint(0, 2))
+            priority = rng.choice(PRIORITIES + ["critical"])
+
+            expected = _full_scan(text, tags, priority, records)
+            actual = index.match(text, tags, priority)
+
+            assert [i for _, i in actual] == [i for _, i in expected]
+            assert [round(s, 9) for s, _ in actual] == [round(s, 9) for s, _ in expected]
+
+    def test_no_matches(self):
+        """Test unrelated queries with an unseen priority return nothing."""
+        index = HistoryIndex(_records(20))
+
+        assert index.match("zebra", [], "critical") == []
+
+
+class TestBatchEstimation:
+    """Test batch APIs on the estimator."""
+
+    def test_batch_equals_single_estimates(self, tmp_path):
+        """Test estimate_batch gives the same results as estimate()."""
+        _write_history(tmp_path, _records(40))
+        estimator = TaskDurationEstimator(tmp_path)
+        tasks = [
+            {'name': 'fix cache', 'details': 'api parser', 'tags': ['backend'], 'priority': 'high'},
+            {'name': 'write docs', 'tags': [], 'priority': 'low'},
+            {'name': 'zebra'},
+        ]
+
+        batch = estimator.estimate_batch(tasks)
+
+        singles = [
+            estimator.estimate(t['name'], t.get('details', ''), t.get('tags'), t.get('priority', 'medium'))
+            for t in tasks
+        ]
+        assert batch == singles
+
+    def test_match_history_batch_returns_top_k(self, tmp_path):
+        """Test top-k similar completed tasks per input task."""
+        records = _records(5)
+        records[2] = {'name': 'migrate login db', 'details': '', 'tags': ['backend'],
+                      'priority': 'medium', 'actual_hours': 6.0}
+        _write_history(tmp_path, records)
+        estimator = TaskDurationEstimator(tmp_path)
+
+        matches = estimator.match_history_batch(
+            [{'name': 'migrate login db', 'tags': ['backend']}, {'name': 'zebra', 'priority': 'critical'}],
+            top_k=2,
+        )
+
+        assert len(matches[0]) == 2
+        assert matches[0][0] == {'name': 'migrate login db', 'actual_hours': 6.0, 'score': 1.0}
+        assert matches[1] == []
+
+    def test_index_is_reused_until_state_changes(self, tmp_path):
+        """Test the history index is built once per state snapshot."""
+        _write_history(tmp_path, _records(10))
+        estimator = TaskDurationEstimator(tmp_path)
+
+        estimator.estimate('fix cache')
+        index = estimator._history_index
+        estimator.estimate('deploy api')
+        assert estimator._history_index is index
+
+        state_file = tmp_path / '.todo2' / 'state.todo2.json'
+        state = json.loads(state_file.read_text())
+        state['todos'].append({'id': 'T-new', 'name': 'new', 'status': 'Done', 'actualHours': 1.0})
+        state_file.write_text(json.dumps(state))
+
+        estimator.estimate('fix cache')
+        assert estimator._history_index is not index
+        assert len(estimator._history_index.records) == 11
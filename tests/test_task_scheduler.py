@@ -0,0 +1,153 @@
+"""
+Tests for the DAG job scheduler and its use by DailyAutomation.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+from project_management_automation.utils.task_scheduler import (
+    ScheduledJob,
+    build_job_graph,
+    run_job_dag,
+)
+
+
+def _sleeper(seconds, log=None, name=None):
+    def run():
+        if log is not None:
+            log.append(('start', name))
+        time.sleep(seconds)
+        if log is not None:
+            log.append(('end', name))
+        return {'status': 'success'}
+    return run
+
+
+class TestBuildJobGraph:
+    """Test conflict and dependency edges."""
+
+    def test_conflicts_follow_submission_order(self):
+        """Test writers are ordered against readers/writers of the same resource."""
+        jobs = [
+            ScheduledJob('cleanup', _sleeper(0), writes=frozenset({'todo2'})),
+            ScheduledJob('docs', _sleeper(0), reads=frozenset({'docs'})),
+            ScheduledJob('duplicates', _sleeper(0), reads=frozenset({'todo2'})),
+            ScheduledJob('inference', _sleeper(0), reads=frozenset({'todo2'})),
+        ]
+
+        graph = build_job_graph(jobs)
+
+        assert graph.adjacency() == {'cleanup': ['duplicates', 'inference']}
+        assert graph.levels() == [['cleanup', 'docs'], ['duplicates', 'inference']]
+
+    def test_cyclic_dependencies_fall_back_to_sequential(self):
+        """Test contradictory dependencies chain jobs in list order."""
+        # 'b' must follow 'a' (shared writes), but 'a' claims to depend on 'b'
+        jobs = [
+            ScheduledJob('a', _sleeper(0), writes=frozenset({'x'}), depends_on=('b',)),
+            ScheduledJob('b', _sleeper(0), writes=frozenset({'x'})),
+        ]
+
+        graph = build_job_graph(jobs)
+
+        assert graph.is_dag()
+        assert graph.adjacency() == {'a': ['b']}
+
+
+class TestRunJobDag:
+    """Test concurrent execution."""
+
+    def test_independent_jobs_overlap(self):
+        """Test independent jobs run concurrently."""
+        jobs = [ScheduledJob(f'job{i}', _sleeper(0.2)) for i in range(4)]
+
+        report = run_job_dag(jobs, max_workers=4)
+
+        assert report['wall_seconds'] < 0.6
+        assert report['serial_seconds'] >= 0.8
+        assert set(report['results']) == {'job0', 'job1', 'job2', 'job3'}
+
+    def test_conflicting_writers_never_overlap(self):
+        """Test writers of the same resource run one at a time, in order."""
+        log = []
+        jobs = [
+            ScheduledJob('first', _sleeper(0.05, log, 'first'), writes=frozenset({'todo2'})),
+            ScheduledJob('second', _sleeper(0.05, log, 'second'), writes=frozenset({'todo2'})),
+            ScheduledJob('third', _sleeper(0.05, log, 'third'), reads=frozenset({'todo2'})),
+        ]
+
+        report = run_job_dag(jobs, max_workers=3)
+
+        assert log == [
+            ('start', 'first'), ('end', 'first'),
+            ('start', 'second'), ('end', 'second'),
+            ('start', 'third'), ('end', 'third'),
+        ]
+        assert report['critical_path'] == ['first', 'second', 'third']
+        assert report['critical_path_seconds'] >= 0.15
+
+    def test_worker_limit_is_respected(self):
+        """Test no more than max_workers jobs run at once."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def job():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            return {'status': 'success'}
+
+        run_job_dag([ScheduledJob(f'j{i}', job) for i in range(6)], max_workers=2)
+
+        assert max(peak) == 2
+
+    def test_failures_are_reported_and_do_not_block(self):
+        """Test a raising job yields an error result and dependents still run."""
+        def boom():
+            raise RuntimeError("broken")
+
+        jobs = [
+            ScheduledJob('broken', boom, writes=frozenset({'todo2'})),
+            ScheduledJob('after', _sleeper(0), reads=frozenset({'todo2'})),
+        ]
+
+        report = run_job_dag(jobs)
+
+        assert report['results']['broken'] == {'status': 'error', 'error': 'broken'}
+        assert report['results']['after']['status'] == 'success'
+        assert set(report['timings']) == {'broken', 'after'}
+
+
+class TestDailyAutomationScheduling:
+    """Test DailyAutomation runs function tasks in-process through the scheduler."""
+
+    def test_function_tasks_run_in_process(self, tmp_path):
+        """Test 'function' entries are called directly and timed."""
+        from project_management_automation.scripts.automate_daily import DailyAutomation
+
+        config = {
+            'tasks': ['tool_count_health', 'handoff_check'],
+            'output_path': str(tmp_path / 'report.md'),
+        }
+        with patch('project_management_automation.tools.tool_count_health.check_tool_count_health',
+                   return_value='{"success": true, "data": {"tool_count": 25}}'), \
+             patch('project_management_automation.tools.session_handoff.get_latest_handoff',
+                   return_value='{"success": false, "error": {"message": "no handoff"}}'), \
+             patch.object(DailyAutomation, '_get_task_recommendations', return_value=None), \
+             patch.object(DailyAutomation, '_get_progress_inference', return_value=None), \
+             patch('subprocess.run') as mock_subprocess:
+            result = DailyAutomation(config, project_root=tmp_path).run()
+
+        mock_subprocess.assert_not_called()
+        runs = {r['task_id']: r for r in result['results']['tasks_run']}
+        assert runs['tool_count_health']['status'] == 'success'
+        assert runs['tool_count_health']['summary'] == {'tool_count': 25}
+        assert runs['handoff_check']['status'] == 'error'
+        assert runs['handoff_check']['error'] == 'no handoff'
+        assert result['results']['schedule']['waves'] == [['tool_count_health', 'handoff_check']]
+        assert '## Schedule' in (tmp_path / 'report.md').read_text()
@@ -0,0 +1,236 @@
+"""
+Tests for test impact analysis and shard balancing.
+"""
+
+import sqlite3
+import subprocess
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from project_management_automation.utils.test_impact import (
+    TestTimings,
+    get_changed_files,
+    load_coverage_map,
+    merge_junit,
+    select_tests,
+    shard_items,
+    testcase_nodeid,
+)
+
+
+def _write_coverage_db(path, root, rows):
+    """Create a minimal coverage.py SQLite file: rows of (source path, context)."""
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        "CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT);"
+        "CREATE TABLE context (id INTEGER PRIMARY KEY, context TEXT);"
+        "CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER, numbits BLOB);"
+    )
+    files, contexts = {}, {}
+    for source, context in rows:
+        fid = files.setdefault(source, len(files) + 1)
+        cid = contexts.setdefault(context, len(contexts) + 1)
+        conn.execute("INSERT OR IGNORE INTO file VALUES (?, ?)", (fid, str(root / source)))
+        conn.execute("INSERT OR IGNORE INTO context VALUES (?, ?)", (cid, context))
+        conn.execute("INSERT INTO line_bits VALUES (?, ?, x'01')", (fid, cid))
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with two source modules and two test modules."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("def a(): return 1\n")
+    (tmp_path / "pkg" / "b.py").write_text("def b(): return 2\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text(
+        "from pkg.a import a\n\nclass TestA:\n    def test_a(self):\n        assert a() == 1\n"
+    )
+    (tmp_path / "tests" / "test_b.py").write_text("from pkg.b import b\n\ndef test_b():\n    assert b() == 2\n")
+    _write_coverage_db(tmp_path / ".coverage", tmp_path, [
+        ("pkg/a.py", "tests/test_a.py::TestA::test_a|run"),
+        ("pkg/b.py", "tests/test_b.py::test_b|run"),
+        ("pkg/b.py", "tests/test_b.py::test_b|setup"),
+        ("pkg/a.py", ""),  # Global context (import time) is not a test
+    ])
+    return tmp_path
+
+
+class TestSelection:
+    """Test select_tests()."""
+
+    def test_coverage_map(self, project):
+        """Test contexts are mapped to node ids per source file."""
+        coverage_map = load_coverage_map(project / ".coverage", project)
+        assert coverage_map == {
+            "pkg/a.py": {"tests/test_a.py::TestA::test_a"},
+            "pkg/b.py": {"tests/test_b.py::test_b"},
+        }
+
+    def test_changed_source_selects_covering_tests(self, project):
+        """Test only tests that executed the changed file are selected."""
+        selection = select_tests(project, ["pkg/a.py", "README.md"], load_coverage_map(project / ".coverage", project))
+        assert not selection.full
+        assert selection.items == ["tests/test_a.py::TestA::test_a"]
+
+    def test_changed_test_module_runs_whole_module(self, project):
+        """Test an edited test module supersedes node ids inside it."""
+        coverage_map = load_coverage_map(project / ".coverage", project)
+        selection = select_tests(project, ["pkg/a.py", "tests/test_a.py"], coverage_map)
+        assert selection.items == ["tests/test_a.py"]
+
+    def test_falls_back_to_full_run(self, project):
+        """Test unmappable changes select the whole test path."""
+        coverage_map = load_coverage_map(project / ".coverage", project)
+        (project / "pkg" / "new.py").write_text("")
+
+        assert select_tests(project, ["pkg/new.py"], coverage_map).full
+        assert select_tests(project, ["tests/conftest.py"], coverage_map).full
+        assert select_tests(project, ["pkg/a.py"], {}).full
+
+    @pytest.mark.parametrize("changed", ["pkg/data/schema.json", "tests/fixtures/state.yaml", "Makefile"])
+    def test_non_python_changes_run_everything(self, project, changed):
+        """Test data, fixture and other non-Python changes are not silently skipped."""
+        selection = select_tests(project, ["pkg/a.py", changed], load_coverage_map(project / ".coverage", project))
+
+        assert selection.full
+        assert changed in selection.reason
+
+    def test_nothing_relevant_changed(self, project):
+        """Test doc-only changes select nothing."""
+        selection = select_tests(project, ["docs/guide.md"], load_coverage_map(project / ".coverage", project))
+        assert selection.items == [] and not selection.full
+
+    def test_changed_files_from_git(self, project):
+        """Test committed, modified and untracked files are reported."""
+        def git(*args):
+            subprocess.run(["git", *args], cwd=project, check=True, capture_output=True)
+        git("init", "-q")
+        git("-c", "user.email=t@example.com", "-c", "user.name=t", "add", "pkg", "tests")
+        git("-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-qm", "init")
+        (project / "pkg" / "a.py").write_text("def a(): return 3\n")
+        (project / "pkg" / "c.py").write_text("")
+
+        assert get_changed_files(project, "HEAD") >= {"pkg/a.py", "pkg/c.py"}
+        with pytest.raises(RuntimeError):
+            get_changed_files(project, "no-such-ref")
+
+
+class TestSharding:
+    """Test shard balancing and JUnit handling."""
+
+    def test_longest_first_balancing(self):
+        """Test recorded timings spread slow tests across shards."""
+        timings = {"t::slow1": 10.0, "t::slow2": 9.0, "t::mid": 5.0, "t::fast": 4.0}
+        shards = shard_items(list(timings), 2, timings)
+
+        loads = sorted(sum(timings[i] for i in shard) for shard in shards)
+        assert loads == [14.0, 14.0]
+
+    def test_module_estimate_sums_node_timings(self):
+        """Test a module's expected duration comes from its tests' timings."""
+        timings = {"tests/test_a.py::test_x": 6.0, "tests/test_a.py::test_y": 6.0, "tests/test_b.py::test_z": 1.0}
+        shards = shard_items(["tests/test_a.py", "tests/test_b.py", "tests/test_c.py"], 2, timings)
+        assert ["tests/test_a.py"] in shards
+
+    def test_never_more_shards_than_items(self):
+        """Test empty shards are not produced."""
+        assert shard_items(["a"], 4, {}) == [["a"]]
+
+    def test_merge_and_record_timings(self, project):
+        """Test shard JUnit files merge and feed the timing history."""
+        for i, (classname, name, seconds) in enumerate([
+            ("tests.test_a.TestA", "test_a", "2.5"),
+            ("tests.test_b", "test_b", "0.5"),
+        ]):
+            suite = ET.Element("testsuite", tests="1", failures=str(i), errors="0", skipped="0", time=seconds)
+            ET.SubElement(suite, "testcase", classname=classname, name=name, time=seconds)
+            root = ET.Element("testsuites")
+            root.append(suite)
+            ET.ElementTree(root).write(project / f"shard{i}.xml")
+
+        totals = merge_junit([project / "shard0.xml", project / "shard1.xml", project / "missing.xml"], project / "junit.xml")
+        assert totals == {"tests": 2, "failures": 1, "errors": 0, "skipped": 0, "time": 2.5}
+
+        timings = TestTimings(project)
+        assert timings.update_from_junit(project / "junit.xml") == 2
+        assert TestTimings(project).durations() == {
+            "tests/test_a.py::TestA::test_a": 2.5,
+            "tests/test_b.py::test_b": 0.5,
+        }
+
+    def test_testcase_nodeid_requires_module(self, project):
+        """Test classnames that match no file are skipped."""
+        testcase = ET.Element("testcase", classname="nowhere.mod", name="test_x")
+        assert testcase_nodeid(testcase, project) is None
+
+
+class TestShardedRunner:
+    """Test TestRunner's impacted, sharded pytest mode end to end."""
+
+    def test_impacted_sharded_run(self, project, monkeypatch):
+        """Test only affected tests run and results are merged."""
+        from project_management_automation.scripts.automate_run_tests import TestRunner
+        from project_management_automation.utils import test_impact
+
+        monkeypatch.setattr(test_impact, "get_changed_files", lambda root, since: {"pkg/a.py", "pkg/b.py"})
+        (project / "conftest.py").write_text(f"import sys\nsys.path.insert(0, {str(project)!r})\n")
+        runner = TestRunner({
+            'test_path': 'tests',
+            'test_framework': 'pytest',
+            'verbose': False,
+            'output_path': str(project / 'results'),
+            'changed_since': 'HEAD',
+            'workers': 2,
+        }, project)
+
+        results = runner._run_pytest()
+
+        assert results['selection']['mode'] == 'impacted'
+        assert results['tests_run'] == 2
+        assert results['tests_failed'] == 0
+        assert len(results['shards']) == 2
+        assert (project / 'results' / 'junit.xml').exists()
+        assert set(TestTimings(project).durations()) == {"tests/test_a.py::TestA::test_a", "tests/test_b.py::test_b"}
+
+    def test_sharded_run_collects_coverage(self, project, monkeypatch):
+        """Test each shard records coverage to its own file and the files are combined."""
+        from project_management_automation.scripts import automate_run_tests
+        from project_management_automation.scripts.automate_run_tests import TestRunner
+        from project_management_automation.utils import test_impact
+
+        calls = []
+
+        def fake_run(cmd, env=None, **kwargs):
+            coverage_file = (env or {}).get('COVERAGE_FILE')
+            calls.append((cmd[2:], coverage_file))
+            if cmd[2] == 'pytest':
+                open(coverage_file, 'w').close()
+            return subprocess.CompletedProcess(cmd, 0, '', '')
+
+        monkeypatch.setattr(test_impact, "get_changed_files", lambda root, since: {"pkg/a.py", "pkg/b.py"})
+        monkeypatch.setattr(automate_run_tests.subprocess, "run", fake_run)
+        runner = TestRunner({
+            'test_path': 'tests',
+            'test_framework': 'pytest',
+            'verbose': False,
+            'coverage': True,
+            'output_path': str(project / 'results'),
+            'changed_since': 'HEAD',
+            'workers': 2,
+        }, project)
+
+        results = runner._run_pytest()
+
+        shards = [(cmd, data) for cmd, data in calls if cmd[0] == 'pytest']
+        assert len(shards) == 2
+        assert all('--cov-context=test' in cmd for cmd, _ in shards)
+        assert len({data for _, data in shards}) == 2
+        combine = next((cmd, data) for cmd, data in calls if cmd[:2] == ['coverage', 'combine'])
+        assert sorted(combine[0][2:]) == sorted(data for _, data in shards)
+        # An impacted run must not replace the per-test coverage map
+        assert combine[1] == str((project / 'results' / '.coverage').resolve())
+        assert [cmd[1] for cmd, _ in calls if cmd[0] == 'coverage'] == ['combine', 'html', 'xml']
+        assert results['coverage_file'] == str(project / 'results' / 'coverage.xml')
@@ -0,0 +1,158 @@
+"""
+Tests for field-level delta sync of Todo2 state between two directories.
+"""
+
+import json
+
+import pytest
+
+from project_management_automation.tools.todo2_delta_sync import sync_with_peer
+from project_management_automation.utils import todo2_store
+
+
+def _write(root, tasks):
+    (root / ".todo2").mkdir(parents=True, exist_ok=True)
+    (root / ".todo2" / "state.todo2.json").write_text(json.dumps({"todos": tasks}))
+
+
+def _tasks(root):
+    data = json.loads((root / ".todo2" / "state.todo2.json").read_text())
+    return {t["id"]: t for t in data["todos"]}
+
+
+def _edit(root, task_id, **fields):
+    data = json.loads((root / ".todo2" / "state.todo2.json").read_text())
+    for task in data["todos"]:
+        if task["id"] == task_id:
+            task.update(fields)
+    (root / ".todo2" / "state.todo2.json").write_text(json.dumps(data))
+
+
+@pytest.fixture
+def peers(tmp_path, monkeypatch):
+    """Two project directories, the first holding two tasks."""
+    monkeypatch.setattr(todo2_store, "_stores", {})
+    a, b = tmp_path / "a", tmp_path / "b"
+    b.mkdir()
+    _write(a, [
+        {"id": "T-1", "name": "Write docs", "status": "Todo", "priority": "low"},
+        {"id": "T-2", "name": "Fix bug", "status": "Todo", "priority": "high"},
+    ])
+    return a, b
+
+
+class TestSyncWithPeer:
+    """Test the exchange protocol."""
+
+    def test_initial_sync_copies_tasks(self, peers):
+        """Test a new peer receives every task."""
+        a, b = peers
+        result = sync_with_peer(a, b)
+
+        assert result["success"]
+        assert result["pushed"]["created"] == 2
+        assert _tasks(b) == _tasks(a)
+
+    def test_only_changed_fields_are_sent(self, peers):
+        """Test later syncs exchange just the edited fields, with no echo."""
+        a, b = peers
+        sync_with_peer(a, b)
+        _edit(a, "T-1", status="Done")
+
+        result = sync_with_peer(a, b)
+
+        assert result["pushed"]["tasks"] == 1
+        assert result["pushed"]["fields"] == 1
+        assert result["pulled"]["tasks"] == 0
+        assert _tasks(b)["T-1"]["status"] == "Done"
+        assert sync_with_peer(a, b)["pushed"]["fields"] == 0
+
+    def test_different_fields_merge(self, peers):
+        """Test edits to different fields of one task on both sides both survive."""
+        a, b = peers
+        sync_with_peer(a, b)
+        _edit(a, "T-2", status="In Progress")
+        _edit(b, "T-2", priority="critical", assignee="bob")
+
+        result = sync_with_peer(a, b)
+
+        assert result["conflicts"] == []
+        expected = {"id": "T-2", "name": "Fix bug", "status": "In Progress", "priority": "critical", "assignee": "bob"}
+        assert _tasks(a)["T-2"] == _tasks(b)["T-2"] == expected
+
+    def test_same_field_conflict_reported(self, peers):
+        """Test concurrent edits of one field converge and are reported once."""
+        a, b = peers
+        sync_with_peer(a, b)
+        _edit(a, "T-1", name="Write user docs")
+        _edit(b, "T-1", name="Write API docs")
+
+        result = sync_with_peer(a, b)
+
+        assert len(result["conflicts"]) == 1
+        assert result["conflicts"][0]["task_id"] == "T-1"
+        assert result["conflicts"][0]["conflict_fields"] == ["name"]
+        assert _tasks(a)["T-1"]["name"] == _tasks(b)["T-1"]["name"]
+
+    def test_deletion_propagates(self, peers):
+        """Test a task removed on one side is removed on the other."""
+        a, b = peers
+        sync_with_peer(a, b)
+        data = json.loads((b / ".todo2" / "state.todo2.json").read_text())
+        data["todos"] = [t for t in data["todos"] if t["id"] != "T-2"]
+        (b / ".todo2" / "state.todo2.json").write_text(json.dumps(data))
+
+        result = sync_with_peer(a, b)
+
+        assert result["pulled"]["deleted"] == 1
+        assert set(_tasks(a)) == {"T-1"}
+
+    def test_pull_only_and_dry_run(self, peers):
+        """Test pull leaves the peer's tasks alone and dry runs write nothing."""
+        a, b = peers
+        assert sync_with_peer(b, a, dry_run=True)["pulled"]["created"] == 2
+        assert not (b / ".todo2").exists()
+
+        result = sync_with_peer(b, a, direction="pull")
+
+        assert "pushed" not in result
+        assert set(_tasks(b)) == {"T-1", "T-2"}
+
+    def test_three_replicas_relay(self, peers, tmp_path):
+        """Test changes received from one peer are forwarded to another."""
+        a, b = peers
+        c = tmp_path / "c"
+        c.mkdir()
+        sync_with_peer(a, b)
+        sync_with_peer(b, c)
+        _edit(a, "T-1", status="Done")
+
+        sync_with_peer(a, b)
+        sync_with_peer(b, c)
+
+        assert _tasks(c)["T-1"]["status"] == "Done"
+
+    def test_invalid_peer(self, peers, tmp_path):
+        """Test a missing peer or an unknown direction is an error."""
+        a, _ = peers
+        assert not sync_with_peer(a, tmp_path / "missing")["success"]
+        assert not sync_with_peer(a, a)["success"]
+        assert not sync_with_peer(a, tmp_path, direction="sideways")["success"]
+
+
+class TestSyncTodo2StatePeer:
+    """Test sync_todo2_state dispatches to delta sync."""
+
+    def test_peer_uses_delta_sync(self, peers, monkeypatch):
+        """Test peer= skips agentic-tools and git."""
+        from project_management_automation.tools import session_handoff
+
+        a, b = peers
+        monkeypatch.setenv("PROJECT_ROOT", str(a))
+        monkeypatch.setattr(session_handoff, "_git_auto_sync", lambda *a, **k: pytest.fail("git used"))
+
+        result = json.loads(session_handoff.sync_todo2_state(peer=str(b)))
+
+        assert result["success"]
+        assert result["final_method"] == "delta"
+        assert set(_tasks(b)) == {"T-1", "T-2"}
@@ -0,0 +1,152 @@
+"""
+Tests for the shared Todo2 state store.
+
+Tests snapshot caching, stat-based invalidation, indexes and write-through saves.
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from project_management_automation.utils import task_locking
+from project_management_automation.utils.todo2_store import (
+    Todo2Store,
+    get_todo2_store,
+)
+
+
+def _write_state(project_root: Path, todos: list[dict]) -> Path:
+    state_file = project_root / ".todo2" / "state.todo2.json"
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    state_file.write_text(json.dumps({"todos": todos}))
+    return state_file
+
+
+SAMPLE_TODOS = [
+    {"id": "T-1", "name": "Auth", "status": "Todo", "tags": ["security", "branch:feature-auth"]},
+    {"id": "T-2", "name": "Docs", "status": "Done", "tags": ["docs"]},
+    {"id": "T-3", "name": "Tests", "status": "in_progress", "tags": ["testing", "security"]},
+]
+
+
+class TestTodo2Store:
+    """Test Todo2Store class."""
+
+    def test_parses_once_until_file_changes(self, tmp_path):
+        """Test repeated reads reuse the same snapshot."""
+        _write_state(tmp_path, SAMPLE_TODOS)
+        store = Todo2Store(tmp_path)
+
+        first = store.get_tasks()
+        second = store.get_tasks()
+
+        assert first is second
+        stats = store.get_stats()
+        assert stats["loads"] == 1
+        assert stats["hits"] >= 1
+
+    def test_invalidates_on_modification(self, tmp_path):
+        """Test snapshot is rebuilt when the file is rewritten."""
+        state_file = _write_state(tmp_path, SAMPLE_TODOS)
+        store = Todo2Store(tmp_path)
+        assert len(store.get_tasks()) == 3
+
+        state_file.write_text(json.dumps({"todos": SAMPLE_TODOS[:1]}))
+        # Force a distinct mtime even on coarse-grained filesystems
+        st = state_file.stat()
+        os.utime(state_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert len(store.get_tasks()) == 1
+        assert store.get_stats()["loads"] == 2
+
+    def test_indexes(self, tmp_path):
+        """Test id, status, tag and branch indexes."""
+        _write_state(tmp_path, SAMPLE_TODOS)
+        store = Todo2Store(tmp_path)
+
+        assert store.get_task("T-2")["name"] == "Docs"
+        assert store.get_task("missing") is None
+        assert [t["id"] for t in store.get_tasks_by_status("todo")] == ["T-1"]
+        assert [t["id"] for t in store.get_tasks_by_status("completed")] == ["T-2"]
+        assert [t["id"] for t in store.get_tasks_by_status("In Progress")] == ["T-3"]
+        assert {t["id"] for t in store.get_tasks_by_tag("security")} == {"T-1", "T-3"}
+        assert [t["id"] for t in store.get_tasks_by_branch("feature-auth")] == ["T-1"]
+        assert {t["id"] for t in store.get_tasks_by_branch("main")} == {"T-2", "T-3"}
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        """Test a missing state file yields an empty snapshot."""
+        store = Todo2Store(tmp_path)
+
+        assert not store.exists()
+        assert store.get_tasks() == []
+        assert store.load_state() == {"todos": []}
+
+    def test_invalid_json_returns_empty(self, tmp_path):
+        """Test invalid JSON is reported but does not raise."""
+        state_file = tmp_path / ".todo2" / "state.todo2.json"
+        state_file.parent.mkdir(parents=True)
+        state_file.write_text("{not json")
+        store = Todo2Store(tmp_path)
+
+        assert store.get_tasks() == []
+        assert store.get_stats()["errors"] == 1
+
+    def test_save_state_primes_snapshot(self, tmp_path):
+        """Test save_state writes the file and serves it without re-parsing."""
+        _write_state(tmp_path, SAMPLE_TODOS)
+        store = Todo2Store(tmp_path)
+        store.get_tasks()
+
+        state = store.load_state_for_update()
+        state["todos"].append({"id": "T-4", "name": "New", "status": "Todo"})
+        store.save_state(state)
+
+        assert store.get_task("T-4")["name"] == "New"
+        assert store.get_stats()["loads"] == 1
+        on_disk = json.loads(store.state_file.read_text())
+        assert len(on_disk["todos"]) == 4
+
+    def test_load_for_update_is_private(self, tmp_path):
+        """Test mutable copies do not leak into the shared snapshot."""
+        _write_state(tmp_path, SAMPLE_TODOS)
+        store = Todo2Store(tmp_path)
+
+        state = store.load_state_for_update()
+        state["todos"][0]["name"] = "Changed"
+
+        assert store.get_task("T-1")["name"] == "Auth"
+
+
+class TestGetTodo2Store:
+    """Test shared store lookup."""
+
+    def test_same_root_shares_store(self, tmp_path):
+        """Test stores are shared per resolved project root."""
+        assert get_todo2_store(tmp_path) is get_todo2_store(str(tmp_path))
+
+    def test_different_roots_have_separate_stores(self, tmp_path):
+        """Test different roots get different stores."""
+        a = tmp_path / "a"
+        b = tmp_path / "b"
+        a.mkdir()
+        b.mkdir()
+        assert get_todo2_store(a) is not get_todo2_store(b)
+
+
+class TestTaskLockingWrites:
+    """Test task assignment writes through the store."""
+
+    def test_assignment_leaves_shared_snapshot_untouched(self, tmp_path):
+        """Test assigning a task saves it without mutating tasks other readers hold."""
+        _write_state(tmp_path, SAMPLE_TODOS)
+        store = get_todo2_store(tmp_path)
+        before = store.get_tasks()
+
+        with patch("project_management_automation.utils.project_root.find_project_root", return_value=tmp_path), \
+                patch.object(task_locking, "find_project_root", return_value=tmp_path):
+            assert task_locking.atomic_assign_task("T-1", "backend-agent") == (True, None)
+            assert task_locking.atomic_assign_task("T-1", "other-agent")[0] is False
+
+        assert "assignee" not in before[0]
+        assert store.get_tasks()[0]["assignee"]["name"] == "backend-agent"
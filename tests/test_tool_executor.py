@@ -0,0 +1,287 @@
+"""
+Tests for the cost-class worker pools that run blocking tools.
+"""
+
+import asyncio
+import inspect
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from unittest import mock
+
+import pytest
+
+from project_management_automation.utils import tool_executor
+from project_management_automation.utils.task_scheduler import ScheduledJob, run_job_dag
+from project_management_automation.utils.tool_executor import (
+    ToolCancelledError,
+    ToolExecutor,
+    check_cancelled,
+    offload,
+    run_subprocess,
+    wait_for,
+)
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    """Fresh process-wide executor with small pools."""
+    monkeypatch.delenv("EXARP_DISABLE_TOOL_OFFLOAD", raising=False)
+    monkeypatch.delenv("EXARP_PATCH_ISAWAITABLE", raising=False)
+    executor = ToolExecutor({"cpu": 1, "io": 2, "subprocess": 2, "llm": 1})
+    monkeypatch.setattr(tool_executor, "_executor", executor)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+class TestToolExecutor:
+    """Test pools, limits and metrics."""
+
+    def test_blocking_tool_does_not_block_loop(self, executor):
+        """Test the event loop keeps serving while an offloaded tool sleeps."""
+        release = threading.Event()
+
+        async def main():
+            slow = asyncio.create_task(executor.run("subprocess", release.wait, 5))
+            ticks = 0
+            while ticks < 5:
+                await asyncio.sleep(0.01)
+                ticks += 1
+            release.set()
+            return ticks, await slow
+
+        assert asyncio.run(main()) == (5, True)
+
+    def test_per_class_concurrency_limit(self, executor):
+        """Test a class never runs more jobs than its pool size, and queues the rest."""
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def job():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+        async def main():
+            await asyncio.gather(*(executor.run("subprocess", job) for _ in range(6)))
+
+        asyncio.run(main())
+        stats = executor.get_stats()["subprocess"]
+        assert peak[0] == 2
+        assert stats["completed"] == 6
+        assert stats["queued"] == stats["running"] == 0
+        assert stats["max_queue_depth"] >= 4
+        assert stats["max_wait_ms"] > 0
+
+    def test_classes_are_isolated(self, executor):
+        """Test a saturated class does not delay another class."""
+        release = threading.Event()
+
+        async def main():
+            blockers = [asyncio.create_task(executor.run("llm", release.wait, 5)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            quick = await asyncio.wait_for(executor.run("io", lambda: "done"), timeout=1)
+            release.set()
+            await asyncio.gather(*blockers)
+            return quick
+
+        assert asyncio.run(main()) == "done"
+
+    def test_errors_propagate_and_count(self, executor):
+        """Test tool exceptions reach the caller and are counted as failures."""
+        def boom():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(executor.run("cpu", boom))
+        assert executor.get_stats()["cpu"]["failed"] == 1
+
+    def test_unknown_class_rejected(self, executor):
+        """Test an undeclared cost class is an error."""
+        with pytest.raises(ValueError):
+            executor.submit("gpu", lambda: None)
+        with pytest.raises(ValueError):
+            offload("gpu")
+
+
+class TestCancellation:
+    """Test cooperative cancellation."""
+
+    def test_running_job_sees_cancellation(self, executor):
+        """Test a cancelled request sets the token the running tool checks."""
+        started, stopped = threading.Event(), threading.Event()
+
+        def loop_until_cancelled():
+            started.set()
+            try:
+                for _ in range(500):
+                    check_cancelled()
+                    time.sleep(0.01)
+            finally:
+                stopped.set()
+
+        async def main():
+            task = asyncio.create_task(executor.run("cpu", loop_until_cancelled))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert stopped.wait(2)
+        time.sleep(0.05)
+        assert executor.get_stats()["cpu"]["cancelled"] == 1
+
+    def test_check_cancelled_raises(self, executor):
+        """Test check_cancelled() raises ToolCancelledError once the token is cancelled."""
+        started = threading.Event()
+
+        def tool():
+            check_cancelled()
+            started.set()
+            while True:
+                check_cancelled()
+                time.sleep(0.01)
+
+        future, token = executor.submit("cpu", tool)
+        assert started.wait(2)
+        token.cancel()
+
+        with pytest.raises(ToolCancelledError):
+            future.result(timeout=5)
+        check_cancelled()  # No-op outside a job
+
+    def test_run_subprocess_terminates_child(self, executor):
+        """Test cancelling a job stops the child process it is waiting on."""
+        procs = []
+        real_popen = subprocess.Popen
+
+        def popen(*args, **kwargs):
+            proc = real_popen(*args, **kwargs)
+            procs.append(proc)
+            return proc
+
+        def tool():
+            with mock.patch.object(tool_executor.subprocess, "Popen", popen):
+                return run_subprocess([sys.executable, "-c", "import time; time.sleep(30)"])
+
+        future, token = executor.submit("subprocess", tool)
+        deadline = time.monotonic() + 5
+        while not procs and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert procs
+        started = time.monotonic()
+        token.cancel()
+
+        with pytest.raises(ToolCancelledError):
+            future.result(timeout=10)
+        assert time.monotonic() - started < 5
+        assert procs[0].poll() is not None
+
+    def test_run_subprocess_outside_job(self):
+        """Test run_subprocess behaves like subprocess.run without a token."""
+        result = run_subprocess([sys.executable, "-c", "print('ok')"], capture_output=True, text=True)
+        assert result.returncode == 0
+        assert result.stdout.strip() == "ok"
+
+    def test_wait_for_raises_on_cancel(self, executor):
+        """Test wait_for stops waiting on an inner future once the job is cancelled."""
+        inner = Future()
+        started = threading.Event()
+
+        def tool():
+            started.set()
+            return wait_for(inner)
+
+        future, token = executor.submit("cpu", tool)
+        assert started.wait(2)
+        token.cancel()
+
+        with pytest.raises(ToolCancelledError):
+            future.result(timeout=5)
+        assert not inner.done()
+
+    def test_queued_job_dropped(self, executor):
+        """Test a job cancelled while queued never runs."""
+        release = threading.Event()
+        ran = []
+
+        async def main():
+            blocker = asyncio.create_task(executor.run("cpu", release.wait, 5))
+            queued = asyncio.create_task(executor.run("cpu", ran.append, 1))
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            await blocker
+
+        asyncio.run(main())
+        stats = executor.get_stats()["cpu"]
+        assert ran == []
+        assert stats["cancelled"] == 1
+        assert stats["queued"] == 0
+
+    def test_scheduler_skips_jobs_after_cancellation(self, executor):
+        """Test run_job_dag inside a cancelled tool call does not start further jobs."""
+        started = threading.Event()
+
+        def first():
+            started.set()
+            time.sleep(0.2)
+            return {"status": "success"}
+
+        def tool():
+            jobs = [
+                ScheduledJob("first", first, writes=frozenset({"todo2"})),
+                ScheduledJob("second", lambda: {"status": "success"}, writes=frozenset({"todo2"})),
+            ]
+            return run_job_dag(jobs, max_workers=2)["results"]
+
+        future, token = executor.submit("subprocess", tool)
+        assert started.wait(2)
+        token.cancel()
+
+        results = future.result(timeout=5)
+        assert results["first"]["status"] == "success"
+        assert results["second"]["status"] == "cancelled"
+
+
+class TestOffloadDecorator:
+    """Test the tool decorator."""
+
+    def test_wrapper_keeps_signature(self, executor):
+        """Test the wrapper is a coroutine function with the tool's signature."""
+        def report(action: str = "overview", output_path: str = None) -> str:
+            """Report tool."""
+            return f"{action}:{threading.current_thread().name}"
+
+        wrapped = offload()(report)
+
+        assert inspect.iscoroutinefunction(wrapped)
+        assert wrapped.cost_class == "io"
+        assert inspect.signature(wrapped) == inspect.signature(report)
+        assert wrapped.__doc__ == "Report tool."
+        assert asyncio.run(wrapped(action="scorecard")).startswith("scorecard:exarp-io")
+
+    def test_disabled_returns_tool_unchanged(self, executor, monkeypatch):
+        """Test offloading can be turned off (also implied by the isawaitable patch)."""
+        def testing() -> str:
+            return "ok"
+
+        monkeypatch.setenv("EXARP_DISABLE_TOOL_OFFLOAD", "1")
+        assert offload()(testing) is testing
+        monkeypatch.delenv("EXARP_DISABLE_TOOL_OFFLOAD")
+        monkeypatch.setenv("EXARP_PATCH_ISAWAITABLE", "1")
+        assert offload()(testing) is testing
+
+    def test_pool_sizes_from_env(self, monkeypatch):
+        """Test per-class limits can be set from the environment."""
+        monkeypatch.setenv("EXARP_TOOL_POOL_SIZES", "cpu=3, llm=1, gpu=9, io=x")
+        sizes = ToolExecutor().pool_sizes
+        assert (sizes["cpu"], sizes["llm"], sizes["io"]) == (3, 1, tool_executor.DEFAULT_POOL_SIZES["io"])
+        assert "gpu" not in sizes
@@ -0,0 +1,133 @@
+"""
+Tests for structured tool results and in-process composition.
+"""
+
+import asyncio
+import inspect
+import json
+from unittest.mock import patch
+
+import pytest
+
+from project_management_automation.utils import tool_result
+from project_management_automation.utils.tool_result import ToolResult, as_result, call_result, structured_tool
+
+
+@structured_tool
+def sample_tool(count: int = 2, fail: bool = False) -> dict:
+    """Sample tool."""
+    if fail:
+        return {"success": False, "error": {"code": "AUTOMATION_ERROR", "message": "broken"}}
+    return {"success": True, "data": {"items": list(range(count))}}
+
+
+class TestStructuredTool:
+    """Test the decorator's two entry points."""
+
+    def test_call_returns_compact_json(self):
+        """Test MCP callers still get a JSON string, without pretty-printing."""
+        output = sample_tool(count=3)
+
+        assert isinstance(output, str)
+        assert output == '{"success":true,"data":{"items":[0,1,2]}}'
+
+    def test_result_skips_serialization(self):
+        """Test .result returns the dict without going through JSON."""
+        with patch.object(tool_result.json, "dumps", side_effect=AssertionError("serialized")):
+            result = sample_tool.result(count=3)
+
+        assert isinstance(result, ToolResult)
+        assert result.ok
+        assert result.data == {"items": [0, 1, 2]}
+
+    def test_metadata_preserved(self):
+        """Test the public tool keeps its name, docs and parameters, returning str."""
+        signature = inspect.signature(sample_tool)
+
+        assert sample_tool.__name__ == "sample_tool"
+        assert sample_tool.__doc__ == "Sample tool."
+        assert list(signature.parameters) == ["count", "fail"]
+        assert signature.return_annotation is str
+
+    def test_async_tool(self):
+        """Test coroutine tools keep both entry points awaitable."""
+        @structured_tool
+        async def async_tool() -> dict:
+            return {"status": "ok"}
+
+        assert inspect.iscoroutinefunction(async_tool)
+        assert asyncio.run(async_tool()) == '{"status":"ok"}'
+        assert asyncio.run(async_tool.result()) == {"status": "ok"}
+
+
+class TestResults:
+    """Test normalizing and inspecting results."""
+
+    def test_error_shapes(self):
+        """Test both error response shapes report failure and a message."""
+        failed = sample_tool.result(fail=True)
+        plain = as_result({"memories": [], "error": "store unavailable"})
+
+        assert not failed.ok and failed.error_message == "broken"
+        assert not plain.ok and plain.error_message == "store unavailable"
+        assert as_result({"status": "success"}).error_message is None
+
+    @pytest.mark.parametrize("value, expected", [
+        ('{"success": true, "data": {"n": 1}}', {"success": True, "data": {"n": 1}}),
+        ("plain text", {"result": "plain text"}),
+        ("[1, 2]", {"result": [1, 2]}),
+        (None, {}),
+    ])
+    def test_as_result(self, value, expected):
+        """Test legacy JSON strings and other values are normalized."""
+        assert as_result(value) == expected
+
+    def test_call_result_uses_structured_entry_point(self):
+        """Test call_result avoids the JSON round trip for structured tools only."""
+        def legacy_tool():
+            return json.dumps({"success": True, "data": {"legacy": True}})
+
+        with patch.object(tool_result.json, "loads", side_effect=AssertionError("parsed")):
+            assert call_result(sample_tool, count=1).data == {"items": [0]}
+        assert call_result(legacy_tool).data == {"legacy": True}
+
+
+class TestComposition:
+    """Test composite tools consume structured results."""
+
+    def test_sprint_analysis_calls_results_directly(self, tmp_path):
+        """Test sprint analysis gets dicts from the tools it composes."""
+        from project_management_automation.scripts.automate_sprint import SprintAutomation
+
+        def fake(name):
+            @structured_tool
+            def tool(**kwargs) -> dict:
+                return {"success": True, "data": {"tool": name}}
+            return tool
+
+        automation = SprintAutomation.__new__(SprintAutomation)
+        automation.sprint_results = {}
+        modules = {
+            "docs_health.check_documentation_health": "docs",
+            "todo2_alignment.analyze_todo2_alignment": "alignment",
+            "duplicate_detection.detect_duplicate_tasks": "duplicates",
+            "automation_opportunities.find_automation_opportunities": "opportunities",
+        }
+        patches = [
+            patch(f"project_management_automation.tools.{target}", fake(name)) for target, name in modules.items()
+        ]
+        for p in patches:
+            p.start()
+        try:
+            with patch.object(tool_result.json, "loads", side_effect=AssertionError("parsed")):
+                automation._run_analysis_tools()
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert automation.sprint_results["analysis_results"] == {
+            "documentation_health": {"tool": "docs"},
+            "task_alignment": {"tool": "alignment"},
+            "duplicate_detection": {"tool": "duplicates"},
+            "automation_opportunities": {"tool": "opportunities"},
+        }
@@ -0,0 +1,193 @@
+"""
+Tests for the persistent tool result cache.
+"""
+
+import json
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+
+from project_management_automation.utils import tool_result_cache
+from project_management_automation.utils.tool_result_cache import (
+    ToolResultCache,
+    cached_tool,
+    get_tool_result_cache,
+)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Enable the cache for a temporary project with one tracked input."""
+    monkeypatch.delenv("EXARP_DISABLE_TOOL_CACHE", raising=False)
+    state = {"version": 1}
+    monkeypatch.setitem(tool_result_cache.INPUT_FINGERPRINTS, "state", lambda root: state["version"])
+    with patch.object(tool_result_cache, "find_project_root", return_value=tmp_path):
+        yield tmp_path, state
+
+
+def _make_tool(calls):
+    @cached_tool("demo", inputs={"read": ("state",)})
+    def demo(action: str = "read", value: int = 1, output_path: Optional[str] = None) -> str:
+        calls.append((action, value))
+        return json.dumps({"action": action, "value": value, "calls": len(calls)}, indent=2)
+    return demo
+
+
+class TestToolResultCache:
+    """Test the on-disk store."""
+
+    def test_put_get_and_persistence(self, tmp_path):
+        """Test entries survive a new instance (server restart)."""
+        cache = ToolResultCache(tmp_path / "cache")
+        cache.put("k1", '{"a": 1}')
+
+        assert cache.get("k1") == '{"a": 1}'
+        assert cache.get("missing") is None
+        assert ToolResultCache(tmp_path / "cache").get("k1") == '{"a": 1}'
+
+    def test_lru_eviction_by_count(self, tmp_path):
+        """Test the least recently used entry is evicted first."""
+        cache = ToolResultCache(tmp_path, max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.get_stats()["evictions"] == 1
+        assert not (tmp_path / "b.json").exists()
+
+    def test_eviction_by_bytes(self, tmp_path):
+        """Test the byte budget bounds the cache."""
+        cache = ToolResultCache(tmp_path, max_bytes=300)
+        for i in range(5):
+            cache.put(f"k{i}", "x" * 100)
+
+        stats = cache.get_stats()
+        assert stats["size_bytes"] <= 300
+        assert stats["entries"] < 5
+
+    def test_corrupt_entry_is_dropped(self, tmp_path):
+        """Test an unreadable entry counts as a miss and is removed."""
+        cache = ToolResultCache(tmp_path)
+        cache.put("k", "v")
+        (tmp_path / "k.json").write_text("{broken")
+
+        assert cache.get("k") is None
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestCachedTool:
+    """Test the tool decorator."""
+
+    def test_hit_after_miss(self, project):
+        """Test a repeated call is served from the cache."""
+        calls = []
+        demo = _make_tool(calls)
+
+        first = json.loads(demo())
+        second = json.loads(demo(action="read"))
+
+        assert first["cache_status"] == "miss"
+        assert second["cache_status"] == "hit"
+        assert second["calls"] == 1
+        assert len(calls) == 1
+
+    def test_input_change_invalidates(self, project):
+        """Test a changed input fingerprint forces recomputation."""
+        _, state = project
+        calls = []
+        demo = _make_tool(calls)
+        demo()
+        state["version"] = 2
+
+        assert json.loads(demo())["cache_status"] == "miss"
+        assert len(calls) == 2
+
+    def test_arguments_are_part_of_key(self, project):
+        """Test different arguments do not share an entry."""
+        calls = []
+        demo = _make_tool(calls)
+        demo(value=1)
+
+        assert json.loads(demo(value=2))["cache_status"] == "miss"
+
+    def test_bypass_for_undeclared_action_and_output_path(self, project):
+        """Test uncached actions and side-effecting calls always run."""
+        calls = []
+        demo = _make_tool(calls)
+
+        assert json.loads(demo(action="write"))["cache_status"] == "bypass"
+        assert json.loads(demo(output_path="out.json"))["cache_status"] == "bypass"
+        assert json.loads(demo(output_path="out.json"))["cache_status"] == "bypass"
+        assert len(calls) == 3
+
+    def test_persists_across_restart(self, project):
+        """Test a fresh cache instance still hits."""
+        tmp_path, _ = project
+        calls = []
+        demo = _make_tool(calls)
+        demo()
+        tool_result_cache._caches.clear()
+
+        assert json.loads(demo())["cache_status"] == "hit"
+        assert get_tool_result_cache(tmp_path).get_stats()["hits"] == 1
+
+    def test_errors_and_self_mutation_not_stored(self, project):
+        """Test error results and tools that change their inputs are not cached."""
+        _, state = project
+
+        @cached_tool("failing", inputs=("state",))
+        def failing() -> str:
+            return json.dumps({"error": "boom"})
+
+        @cached_tool("mutating", inputs=("state",))
+        def mutating() -> str:
+            state["version"] += 1
+            return json.dumps({"ok": True})
+
+        failing()
+        assert json.loads(failing())["cache_status"] == "miss"
+        mutating()
+        assert json.loads(mutating())["cache_status"] == "miss"
+
+    @pytest.mark.parametrize("result", [
+        {"overall_score": 70.0, "partial": True},
+        {"overall_score": 70.0, "collectors": {"tests": {"status": "ok"}, "security": {"status": "timeout"}}},
+        {"success": True, "data": {"collectors": {"security": {"status": "error", "error": "boom"}}}},
+        {"collectors": {"tests": {"status": "ok"}, "security": {"status": "stale", "age_seconds": 40}}},
+    ])
+    def test_partial_results_not_stored(self, project, result):
+        """Test partial scorecards (flagged, or with failed or stale collectors) are recomputed."""
+        calls = []
+
+        @cached_tool("scorecard", inputs=("state",))
+        def scorecard() -> str:
+            calls.append(1)
+            return json.dumps(result)
+
+        scorecard()
+        assert json.loads(scorecard())["cache_status"] == "miss"
+        assert len(calls) == 2
+
+    def test_complete_scorecard_stored(self, project):
+        """Test a scorecard whose collectors all finished is cached."""
+        @cached_tool("scorecard", inputs=("state",))
+        def scorecard() -> str:
+            return json.dumps({"collectors": {"tests": {"status": "ok"}, "security": {"status": "ok"}}})
+
+        scorecard()
+        assert json.loads(scorecard())["cache_status"] == "hit"
+
+    def test_disabled_by_environment(self, project, monkeypatch):
+        """Test EXARP_DISABLE_TOOL_CACHE returns results untouched."""
+        monkeypatch.setenv("EXARP_DISABLE_TOOL_CACHE", "1")
+        calls = []
+        demo = _make_tool(calls)
+        demo()
+
+        assert "cache_status" not in json.loads(demo())
+        assert len(calls) == 2
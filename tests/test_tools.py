@@ -75,6 +75,26 @@ class TestDocumentationHealthTool:
         # Assertions using helper
         assert_error_response(result, "Test error")
 
+    @patch('project_management_automation.scripts.automate_docs_health_v2.DocumentationHealthAnalyzerV2')
+    def test_check_documentation_health_writes_report(self, mock_analyzer_class, tmp_path):
+        """Test the report is written to report_path under the project root."""
+        from project_management_automation.tools.docs_health import check_documentation_health
+
+        mock_analyzer_class.return_value.run.return_value = {
+            'status': 'success',
+            'results': {'health_score': 90},
+            'report': '# Documentation Health\n',
+        }
+
+        with patch('project_management_automation.utils.find_project_root', return_value=tmp_path):
+            data = check_documentation_health.result(create_tasks=False).data
+            check_documentation_health.result(output_path='docs/other.md', write_report=False)
+
+        report = tmp_path / 'docs' / 'DOCUMENTATION_HEALTH_REPORT.md'
+        assert data['report_path'] == str(report)
+        assert report.read_text() == '# Documentation Health\n'
+        assert not (tmp_path / 'docs' / 'other.md').exists()
+
 
 class TestTodo2AlignmentTool:
     """Tests for analyze_todo2_alignment tool."""